@@ -37,4 +37,115 @@ DOCTENA_CALENDAR_ID = os.getenv("DOCTENA_CALENDAR_ID")
 
 ASSISTANT_WHATSAPP_ID = os.getenv("ASSISTANT_WHATSAPP_ID")
 ASSISTANT_SMS_ID = os.getenv("ASSISTANT_SMS_ID")
-ASSISTANT_CHAT_ID = os.getenv("ASSISTANT_CHAT_ID")
\ No newline at end of file
+ASSISTANT_CHAT_ID = os.getenv("ASSISTANT_CHAT_ID")
+
+# Auth token cache
+TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TOKEN_CACHE_PATH = os.getenv("TOKEN_CACHE_PATH", ".auth/token_cache.json")
+TOKEN_REFRESH_MARGIN = int(os.getenv("TOKEN_REFRESH_MARGIN", "120"))
+TOKEN_FALLBACK_TTL = int(os.getenv("TOKEN_FALLBACK_TTL", "900"))
+STORAGE_STATE_DIR = os.getenv("STORAGE_STATE_DIR", ".auth/storage_state")
+
+# Parallel execution
+PLAYWRIGHT_WS_ENDPOINT = os.getenv("PLAYWRIGHT_WS_ENDPOINT")
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "0"))  # 0 = one per CPU core
+TEST_HISTORY_PATH = os.getenv("TEST_HISTORY_PATH", ".test-history/durations.json")
+# Pinned durations snapshot --shard plans from (unset = split by node id only)
+SHARD_HISTORY_PATH = os.getenv("SHARD_HISTORY_PATH", "")
+
+# Video capture (see core/playwright/video.py for modes)
+VIDEO_MODE = os.getenv("VIDEO_MODE", "retain-on-failure").lower()
+VIDEO_WIDTH = int(os.getenv("VIDEO_WIDTH", "1280"))
+VIDEO_HEIGHT = int(os.getenv("VIDEO_HEIGHT", "720"))
+
+# Background artifact uploads
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "4"))
+UPLOAD_MAX_RETRIES = int(os.getenv("UPLOAD_MAX_RETRIES", "3"))
+UPLOAD_BACKOFF_SECONDS = float(os.getenv("UPLOAD_BACKOFF_SECONDS", "1.0"))
+REPORT_UPLOAD_WORKERS = int(os.getenv("REPORT_UPLOAD_WORKERS", "16"))
+
+# Published report retention (0 disables a rule)
+REPORT_KEEP_LAST = int(os.getenv("REPORT_KEEP_LAST", "5"))
+REPORT_KEEP_DAYS = int(os.getenv("REPORT_KEEP_DAYS", "0"))
+REPORT_CLEANUP_WORKERS = int(os.getenv("REPORT_CLEANUP_WORKERS", "8"))
+
+# Test runner API jobs (0 = half the CPU cores)
+RUNNER_MAX_CONCURRENT_JOBS = int(os.getenv("RUNNER_MAX_CONCURRENT_JOBS", "0"))
+RUNNER_JOB_HISTORY = int(os.getenv("RUNNER_JOB_HISTORY", "200"))
+# Run jobs on pre-warmed worker processes (browser already launched), recycled after N jobs
+# (1 = a fresh process per job; more reuse module state and test modules across jobs)
+RUNNER_WARM_WORKERS = os.getenv("RUNNER_WARM_WORKERS", "true").lower() in ("1", "true", "yes")
+RUNNER_WORKER_MAX_JOBS = int(os.getenv("RUNNER_WORKER_MAX_JOBS", "1"))
+
+# Navigation: "ready" = domcontentloaded + per-page ready condition, "networkidle" = legacy behaviour
+NAVIGATION_MODE = os.getenv("NAVIGATION_MODE", "ready").lower()
+NAVIGATION_TIMINGS_PATH = os.getenv("NAVIGATION_TIMINGS_PATH", ".test-history/navigation.json")
+
+# Timing ledger (core/utils/timing_ledger.py): one JSON line per step / fixture / navigation / login
+TIMING_LEDGER = os.getenv("TIMING_LEDGER", "true").lower() in ("1", "true", "yes")
+TIMING_LEDGER_PATH = os.getenv("TIMING_LEDGER_PATH", "timings/timing_ledger.jsonl")
+# Set by run_parallel.py so all workers write the same run id
+TIMING_RUN_ID = os.getenv("TIMING_RUN_ID", "")
+# Backend latency from the browser's API requests (core/playwright/network_latency.py), recorded in the ledger
+NETWORK_LATENCY = os.getenv("NETWORK_LATENCY", "true").lower() in ("1", "true", "yes")
+# An endpoint regressed if its p95 is this much above earlier runs (0.25 = 25 %), given enough samples
+LATENCY_REGRESSION_THRESHOLD = float(os.getenv("LATENCY_REGRESSION_THRESHOLD", "0.25"))
+LATENCY_MIN_SAMPLES = int(os.getenv("LATENCY_MIN_SAMPLES", "5"))
+
+# Web Vitals per navigation (core/playwright/web_vitals.py): off | collect | enforce (fail budgets fail the test)
+WEB_VITALS_MODE = os.getenv("WEB_VITALS_MODE", "off").lower()
+WEB_VITALS_PATH = os.getenv("WEB_VITALS_PATH", "timings/web_vitals.jsonl")
+WEB_VITALS_BUDGETS = os.getenv("WEB_VITALS_BUDGETS", "config/web_vitals_budgets.json")
+
+# Request routing: abort assets and third-party traffic the tests don't need
+ROUTING_ENABLED = os.getenv("ROUTING_ENABLED", "true").lower() in ("1", "true", "yes")
+ROUTING_BLOCK_RESOURCE_TYPES = os.getenv("ROUTING_BLOCK_RESOURCE_TYPES", "image,font,media")
+ROUTING_BLOCK_HOSTS = os.getenv(
+    "ROUTING_BLOCK_HOSTS",
+    "*google-analytics.com,*googletagmanager.com,*doubleclick.net,*hotjar.com,*hotjar.io,"
+    "*segment.com,*segment.io,*sentry.io,*intercom.io,*intercomcdn.com,*facebook.net,"
+    "*clarity.ms,*mixpanel.com,*posthog.com",
+)
+ROUTING_ALLOW_HOSTS = os.getenv("ROUTING_ALLOW_HOSTS", "")
+ROUTING_SIZES_PATH = os.getenv("ROUTING_SIZES_PATH", ".test-history/asset_sizes.json")
+
+# HAR record/replay of API traffic (mode is set with pytest --har-mode, HAR_MODE is the default)
+HAR_MODE = os.getenv("HAR_MODE", "off").lower()
+HAR_DIR = os.getenv("HAR_DIR", "har")
+HAR_URL_PATTERN = os.getenv("HAR_URL_PATTERN", "")  # empty = everything under BASE_API
+HAR_MUTATIONS = os.getenv("HAR_MUTATIONS", "passthrough").lower()  # passthrough | stub
+
+# REST data layer for test setup (core/api): pooled connections per process
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+API_TIMEOUT = float(os.getenv("API_TIMEOUT", "30"))
+API_RETRIES = int(os.getenv("API_RETRIES", "2"))
+
+# Assistant pool (core/api/assistant_pool.py): assistants per type, lease expiry, orphan cleanup
+ASSISTANT_POOL_PATH = os.getenv("ASSISTANT_POOL_PATH", ".test-history/assistant_pool.json")
+ASSISTANT_POOL_SIZE = int(os.getenv("ASSISTANT_POOL_SIZE", "2"))
+ASSISTANT_POOL_TYPES = os.getenv("ASSISTANT_POOL_TYPES", "voice,chatbot,sms,whatsapp")
+ASSISTANT_LEASE_TTL = int(os.getenv("ASSISTANT_LEASE_TTL", "1800"))
+ASSISTANT_GC_ENABLED = os.getenv("ASSISTANT_GC_ENABLED", "false").lower() in ("1", "true", "yes")
+ASSISTANT_GC_PREFIX = os.getenv("ASSISTANT_GC_PREFIX", "Auto-")
+ASSISTANT_GC_MIN_AGE = int(os.getenv("ASSISTANT_GC_MIN_AGE", "3600"))
+
+# Local mock API (core/mock_api): BASE_API points at it and browser API calls are routed to it
+MOCK_API = os.getenv("MOCK_API", "false").lower() in ("1", "true", "yes")
+MOCK_API_URL = os.getenv("MOCK_API_URL", "http://127.0.0.1:8090").rstrip("/")
+MOCK_API_UPSTREAM = os.getenv("MOCK_API_UPSTREAM") or BASE_API or ""  # API base URL the frontend calls
+MOCK_API_LATENCY_MS = int(os.getenv("MOCK_API_LATENCY_MS", "0"))
+MOCK_API_LATENCY_JITTER_MS = int(os.getenv("MOCK_API_LATENCY_JITTER_MS", "0"))
+MOCK_API_TOKEN_TTL = int(os.getenv("MOCK_API_TOKEN_TTL", "3600"))
+MOCK_API_LOGIN_CODE = os.getenv("MOCK_API_LOGIN_CODE", "")  # empty = any code is accepted
+if MOCK_API:
+    BASE_API = MOCK_API_URL
+
+# Browser load mode (core/runner/load.py): virtual users, seconds, scenario weights, pause between scenarios
+LOAD_USERS = int(os.getenv("LOAD_USERS", "5"))
+LOAD_DURATION = float(os.getenv("LOAD_DURATION", "300"))
+LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", "60"))
+LOAD_MIX = os.getenv("LOAD_MIX", "browse=4,edit_contact=2,edit_kb_entry=2,update_assistant=1,login=1")
+LOAD_THINK_TIME_MS = int(os.getenv("LOAD_THINK_TIME_MS", "2000"))
+
+# Concurrent parametrizations (@pytest.mark.concurrent, core/runner/concurrent.py): cases of one group run at once
+CONCURRENT_CASES = int(os.getenv("CONCURRENT_CASES", "8"))
@@ -4,82 +4,101 @@ import os
 import time
 from pathlib import Path
 from core.playwright.browser import browser
+from core.playwright.context import storage_state_for
+from core.playwright.har import HAR_MODES, HarSession
+from core.playwright.mock_api import redirect_api
+from core.playwright.navigation_timing import get_navigation_timings
+from core.playwright.network_latency import NetworkRecorder
+from core.playwright.routing import get_asset_sizes, install_router, session_stats
+from core.playwright.video import VideoCapture, check_video_mode
+from core.playwright.web_vitals import get_web_vitals
+from core.runner.async_tests import install_async_tests
+from core.runner.concurrent import install_concurrent
+from core.runner.shards import get_duration_history, load_shard_history, parse_shard, plan_shards
+from core.mock_api.server import MockApiServer
+from config.env import HAR_MODE, MOCK_API, NETWORK_LATENCY, SHARD_HISTORY_PATH, TIMING_LEDGER, TIMING_RUN_ID
 from core.utils.gcs_uploader import get_gcs_uploader
-from config.env import DELETE_LOCAL_AFTER_GCS_UPLOAD
+from core.utils.timing_ledger import get_timing_ledger, install_timing
+from core.utils.upload_queue import allure_result_file, drain_upload_queue, get_upload_queue
 
 # Import page fixtures
 from fixtures.page_fixtures import login_page, otp_page, login_flow
+from fixtures.async_fixtures import (
+    async_browser, async_context, async_login_flow, async_loop, async_page, async_pages, concurrent_page,
+)
+from fixtures.api_fixtures import (
+    api_client, api_data, assistant_pool, contact, lease_assistant, make_assistant, make_contact, make_kb_article,
+    make_kb_url, make_user, user, voice_assistant,
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_api():
+    """MOCK_API=true: make sure the local mock API is up (reuses one started by run_parallel.py)"""
+    if not MOCK_API:
+        yield None
+        return
+    with MockApiServer() as server:
+        yield server
 
 @pytest.fixture
 def context(browser, request):
 
-    video_dir = Path("videos").absolute()
-    video_dir.mkdir(exist_ok=True)
-
-
-    existing_videos = set(video_dir.glob("*.webm"))
+    video = VideoCapture(request.node)
 
     ctx = browser.new_context(
-        record_video_dir=str(video_dir),
-        record_video_size={"width": 1280, "height": 720},
+        storage_state=storage_state_for(request.node),
+        **video.context_options(),
     )
+    video.track(ctx)
+    router = install_router(ctx, request.node)
+    har = HarSession(request.node, mode=request.config.getoption("--har-mode"))
+    har.install(ctx)
+    if MOCK_API:
+        redirect_api(ctx)
+    elif NETWORK_LATENCY and TIMING_LEDGER and har.mode != "replay":
+        NetworkRecorder().install(ctx)
 
     yield ctx
 
     test_failed = hasattr(request.node, "rep_call") and request.node.rep_call.failed
 
+    router.uninstall()
+    session_stats.add(router.stats)
+    if router.stats.blocked_requests:
+        allure.attach(router.stats.summary(), name="Blocked requests", attachment_type=allure.attachment_type.TEXT)
+
+    # Closing the context writes the HAR recording
     ctx.close()
+    if har.enabled:
+        print(har.summary())
 
-    all_videos = set(video_dir.glob("*.webm"))
-    new_videos = all_videos - existing_videos
-    
-    # Get GCS uploader
-    gcs = get_gcs_uploader()
+    # Only kept recordings come back (failures, or every test with VIDEO_MODE=on)
+    kept_videos = video.finalize(test_failed)
+    if not kept_videos:
+        return
 
-    for video_path in new_videos:
+    # Uploads run side by side on the background queue
+    uploads = get_upload_queue()
+    queued = []
+
+    for video_path in kept_videos:
         if not video_path.exists() or os.path.getsize(video_path) == 0:
             print(f"⚠ Skipping empty video: {video_path}")
             continue
 
-        if test_failed:
-            try:
-                # Upload to GCS first
-                video_url = gcs.upload_video(str(video_path), request.node.name)
-                
-                if video_url and gcs.enabled:
-                    # Attach GCS URL as link instead of embedding video
-                    allure.attach(
-                        video_url,
-                        name="Video (GCS)",
-                        attachment_type=allure.attachment_type.URI_LIST,
-                    )
-                    print(f"✓ Video URL attached to Allure: {video_url}")
-                    
-                    # Delete local file after successful upload (if configured)
-                    if DELETE_LOCAL_AFTER_GCS_UPLOAD:
-                        try:
-                            os.remove(video_path)
-                            print(f"✓ Deleted local video (uploaded to GCS)")
-                        except Exception as del_error:
-                            print(f"⚠ Could not delete local video: {del_error}")
-                else:
-                    # Fallback: embed video if GCS upload failed
-                    with open(video_path, "rb") as vf:
-                        allure.attach(
-                            vf.read(),
-                            name=f"{request.node.name}_video",
-                            attachment_type=allure.attachment_type.WEBM,
-                        )
-                    print(f"✓ Video embedded in Allure: {video_path} ({os.path.getsize(video_path)} bytes)")
-                    
-            except Exception as e:
-                print(f"✗ Failed to process video: {e}")
-        else:
-            try:
-                os.remove(video_path)
-                print(f"✓ Deleted video: {video_path}")
-            except Exception as e:
-                print(f"✗ Failed to delete video: {e}")
+        try:
+            queued.append((uploads.submit_video(str(video_path), request.node.name), video_path))
+        except Exception as e:
+            print(f"✗ Failed to process video: {e}")
+
+    # Link a video only once its object exists; a failed upload is embedded from disk instead.
+    # Uploads still running are attached to this test's result when the queue drains
+    result_file = allure_result_file(request.config)
+    for upload, video_path in queued:
+        try:
+            uploads.attach_video(upload, str(video_path), request.node.name, result_file)
+        except Exception as e:
+            print(f"✗ Failed to attach video: {e}")
 
 @pytest.fixture
 def page(context, request):
@@ -138,4 +157,71 @@ def pytest_runtest_makereport(item, call):
     setattr(item, f"rep_{rep.when}", rep)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard",
+        default=None,
+        help="Run only shard i of K (e.g. 2/4), balanced using the durations in --shard-history",
+    )
+    parser.addoption(
+        "--shard-history",
+        default=SHARD_HISTORY_PATH,
+        help="Pinned durations snapshot every shard of a run plans from (default: SHARD_HISTORY_PATH; "
+             "none = split by node id)",
+    )
+    parser.addoption(
+        "--har-mode",
+        default=HAR_MODE,
+        choices=HAR_MODES,
+        help="Record API traffic to per-test HAR files, or replay GETs from them (default: HAR_MODE)",
+    )
+
+
+def pytest_configure(config):
+    check_video_mode(config)
+    install_async_tests(config)
+    install_concurrent(config)
+    if TIMING_LEDGER:
+        install_timing(config)
+
+
+def pytest_collection_modifyitems(config, items):
+    shard = config.getoption("--shard")
+    if not shard:
+        return
+    index, total = parse_shard(shard)
+    # Not the live history: other shards of this run may already have rewritten it
+    history_path = config.getoption("--shard-history")
+    history, digest = load_shard_history(history_path)
+    if digest:
+        print(f"✓ Shard {shard} planned from {history_path} (sha256 {digest})")
+    else:
+        if history_path:
+            print(f"⚠ Shard history {history_path} not found")
+        print(f"✓ Shard {shard} split by node id (no duration snapshot)")
+    selected_ids = set(plan_shards([item.nodeid for item in items], total, history)[index - 1])
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    items[:] = [item for item in items if item.nodeid in selected_ids]
+    config.hook.pytest_deselected(items=deselected)
+
+
+def pytest_runtest_logreport(report):
+    # setup + call + teardown all count towards a test's wall time
+    get_duration_history().record(report.nodeid, report.duration)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    get_duration_history().flush()
+    get_navigation_timings().flush()
+    get_asset_sizes().flush()
+    get_web_vitals().flush()
+    ledger = get_timing_ledger()
+    # Parallel workers share a run id; run_parallel.py reports the whole run
+    if ledger.flush() and not TIMING_RUN_ID:
+        print(f"\n✓ Timing ledger: run {ledger.run_id} → {ledger.path} (python scripts/timing_report.py)")
+    if session_stats.blocked_requests:
+        print(f"\n✓ Routing: {session_stats.summary()}")
+    drain_upload_queue()
+
+
 __all__ = ["browser", "context", "page"]
@@ -0,0 +1,255 @@
+# core/api/assistant_pool.py
+"""
+Pool of pre-provisioned assistants leased to tests exclusively.
+
+Creating an assistant through the UI takes seconds and leaves an `Auto-*`
+record behind, so tests that only need an assistant to exist lease one from
+this pool instead:
+
+    assistant = pool.lease("voice")
+    ...
+    pool.release(assistant)      # reset to its baseline, free for the next test
+
+The pool lives in a locked JSON file (ASSISTANT_POOL_PATH), so parallel
+workers never hold the same assistant. Each entry keeps the assistant's
+API representation right after creation; release PUTs it back, so every
+lease starts from the same configuration. Leases of dead processes (same
+host) or older than ASSISTANT_LEASE_TTL are taken over.
+
+collect_garbage() deletes orphaned `Auto-*` assistants left by UI creation
+tests that never reached cleanup. Assistants younger than ASSISTANT_GC_MIN_AGE
+(or without a creation time) are left alone, so runs in progress elsewhere keep
+theirs. It is meant to run by hand or from a scheduled job; with
+ASSISTANT_GC_ENABLED the assistant_pool fixture also runs it once per session:
+
+    python scripts/assistant_pool.py gc | provision | status
+"""
+import os
+import socket
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.env import (
+    ASSISTANT_GC_MIN_AGE,
+    ASSISTANT_GC_PREFIX,
+    ASSISTANT_LEASE_TTL,
+    ASSISTANT_POOL_PATH,
+    ASSISTANT_POOL_SIZE,
+    ASSISTANT_POOL_TYPES,
+)
+from core.api.client import ApiClient, ApiError, get_api_client
+from core.api.resources import Assistant, unique_suffix
+from core.utils.file_lock import locked_json, read_json
+
+POOL_PREFIX = "Pool-"
+# Server-managed fields that are not part of the baseline configuration
+_VOLATILE_FIELDS = ("ID", "id", "_id", "CreatedAt", "UpdatedAt", "created_at", "updated_at", "createdAt", "updatedAt")
+
+
+def current_holder() -> str:
+    """Identifies this process in lease records"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def pool_types() -> List[str]:
+    return [t.strip() for t in ASSISTANT_POOL_TYPES.split(",") if t.strip()]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _created_at(record: dict) -> Optional[float]:
+    """Creation time of an API record as epoch seconds, if it carries one"""
+    for key in ("CreatedAt", "created_at", "createdAt"):
+        value = record.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+            except ValueError:
+                continue
+    return None
+
+
+class AssistantPool:
+    """Lease, reset and recycle assistants shared by all workers on this machine"""
+
+    def __init__(
+        self,
+        client: Optional[ApiClient] = None,
+        path: str = ASSISTANT_POOL_PATH,
+        size: int = ASSISTANT_POOL_SIZE,
+        lease_ttl: int = ASSISTANT_LEASE_TTL,
+    ):
+        self.client = client or get_api_client()
+        self.path = path
+        self.size = size
+        self.lease_ttl = lease_ttl
+
+    def _is_free(self, entry: dict) -> bool:
+        lease = entry.get("lease")
+        if not lease:
+            return True
+        if time.time() - lease["since"] > self.lease_ttl:
+            return True
+        host, _, pid = lease["holder"].rpartition(":")
+        return host == socket.gethostname() and pid.isdigit() and not _pid_alive(int(pid))
+
+    def _create(self, assistant_type: str) -> Tuple[str, dict]:
+        """Create a pool assistant and return (id, entry)"""
+        name = f"{POOL_PREFIX}{assistant_type}-{unique_suffix()}"
+        created = Assistant.from_api(self.client.post("assistants", json=Assistant(name, assistant_type).to_payload()))
+        baseline = self.client.get(f"assistants/{created.id}") or {}
+        baseline = {key: value for key, value in baseline.items() if key not in _VOLATILE_FIELDS}
+        return created.id, {"type": assistant_type, "name": name, "baseline": baseline, "lease": None}
+
+    def _create_reserved(self, placeholder: str, assistant_type: str, lease: dict) -> Assistant:
+        """Create an assistant for a reserved slot and record it in the pool, leased"""
+        try:
+            assistant_id, entry = self._create(assistant_type)
+        except Exception:
+            with locked_json(self.path) as pool:
+                pool.setdefault("assistants", {}).pop(placeholder, None)
+            raise
+        with locked_json(self.path) as pool:
+            entries = pool.setdefault("assistants", {})
+            entries.pop(placeholder, None)
+            entries[assistant_id] = {**entry, "lease": lease}
+        return Assistant(name=entry["name"], type=assistant_type, id=assistant_id)
+
+    def lease(self, assistant_type: str = "voice", holder: Optional[str] = None) -> Assistant:
+        """Take a free assistant of a type (creating one if none is free)"""
+        holder = holder or current_holder()
+        while True:
+            with locked_json(self.path) as pool:
+                entries = pool.setdefault("assistants", {})
+                # Placeholders of creations whose process died or timed out
+                for key in [k for k, entry in entries.items() if entry.get("pending") and self._is_free(entry)]:
+                    del entries[key]
+                free = [
+                    assistant_id for assistant_id, entry in entries.items()
+                    if entry["type"] == assistant_type and not entry.get("pending") and self._is_free(entry)
+                ]
+                lease = {"holder": holder, "since": time.time()}
+                if not free:
+                    # Reserve a slot; creating takes two round trips, so it happens outside the lock
+                    placeholder = f"pending-{unique_suffix()}"
+                    entries[placeholder] = {"type": assistant_type, "pending": True, "lease": lease}
+                else:
+                    assistant_id = free[0]
+                    entries[assistant_id]["lease"] = lease
+                    name = entries[assistant_id]["name"]
+
+            if not free:
+                return self._create_reserved(placeholder, assistant_type, lease)
+
+            # Someone may have deleted it outside the pool: forget it and try the next one
+            try:
+                self.client.get(f"assistants/{assistant_id}")
+            except ApiError as e:
+                if e.status_code != 404:
+                    raise
+                self._forget(assistant_id)
+                continue
+            return Assistant(name=name, type=assistant_type, id=assistant_id)
+
+    def release(self, assistant: Assistant, reset: bool = True, holder: Optional[str] = None):
+        """
+        Give an assistant back, restoring its baseline configuration first.
+
+        Only the lease holder releases: a lease taken over after it expired
+        belongs to someone else now, and is left alone.
+        """
+        holder = holder or current_holder()
+        with locked_json(self.path) as pool:
+            entry = pool.get("assistants", {}).get(assistant.id)
+            if entry is None or (entry.get("lease") or {}).get("holder") != holder:
+                return
+        if reset:
+            try:
+                self.client.put(f"assistants/{assistant.id}", json=entry["baseline"])
+            except ApiError as e:
+                # Deleted by the test (404) or stuck in a state we can't undo: never hand it out again
+                if e.status_code != 404:
+                    print(f"⚠ Could not reset assistant {assistant.id}, dropping it from the pool: {e}")
+                    self._delete(assistant.id)
+                self._forget(assistant.id)
+                return
+        with locked_json(self.path) as pool:
+            entry = pool.get("assistants", {}).get(assistant.id)
+            if entry and (entry.get("lease") or {}).get("holder") == holder:
+                entry["lease"] = None
+
+    def provision(self, types: Optional[List[str]] = None):
+        """Top up every type to `size` assistants"""
+        for assistant_type in types or pool_types():
+            with locked_json(self.path) as pool:
+                entries = pool.setdefault("assistants", {})
+                missing = self.size - sum(1 for entry in entries.values() if entry["type"] == assistant_type)
+                for _ in range(max(0, missing)):
+                    assistant_id, entry = self._create(assistant_type)
+                    entries[assistant_id] = entry
+                    print(f"✓ Provisioned {assistant_type} assistant {entry['name']}")
+
+    def status(self) -> Dict[str, Dict[str, int]]:
+        """Free / leased assistants per type"""
+        counts: Dict[str, Dict[str, int]] = {}
+        for entry in read_json(self.path, {}).get("assistants", {}).values():
+            type_counts = counts.setdefault(entry["type"], {"free": 0, "leased": 0})
+            type_counts["free" if self._is_free(entry) else "leased"] += 1
+        return counts
+
+    def collect_garbage(self, prefix: str = ASSISTANT_GC_PREFIX, min_age: int = ASSISTANT_GC_MIN_AGE) -> int:
+        """
+        Delete assistants named `prefix*` that are not in the pool and older than `min_age`
+        seconds. Assistants without a creation time are kept: their age is unknown, and they
+        may belong to a run in progress. Returns how many were deleted.
+        """
+        pooled = set(read_json(self.path, {}).get("assistants", {}))
+        deleted = 0
+        for record in self.client.get("assistants") or []:
+            assistant = Assistant.from_api(record)
+            if not assistant.name.startswith(prefix) or assistant.id in pooled:
+                continue
+            created = _created_at(record)
+            if created is None or time.time() - created < min_age:
+                continue
+            if self._delete(assistant.id):
+                deleted += 1
+        if deleted:
+            print(f"✓ Deleted {deleted} orphaned '{prefix}*' assistants")
+        return deleted
+
+    def _delete(self, assistant_id: str) -> bool:
+        try:
+            self.client.delete(f"assistants/{assistant_id}")
+            return True
+        except ApiError as e:
+            if e.status_code != 404:
+                print(f"⚠ Could not delete assistant {assistant_id}: {e}")
+            return False
+
+    def _forget(self, assistant_id: str):
+        with locked_json(self.path) as pool:
+            pool.get("assistants", {}).pop(assistant_id, None)
+
+
+# Global singleton instance
+_assistant_pool = None
+
+
+def get_assistant_pool() -> AssistantPool:
+    """Get or create assistant pool singleton"""
+    global _assistant_pool
+    if _assistant_pool is None:
+        _assistant_pool = AssistantPool()
+    return _assistant_pool
@@ -0,0 +1,123 @@
+# core/api/client.py
+"""
+Authenticated REST client for the FlowVoice API.
+
+One pooled requests.Session per process: connections to BASE_API are kept
+alive and reused, so creating test data costs a round trip, not a TLS
+handshake. The bearer token comes from AuthService (and therefore the shared
+token cache). A 401 drops the cached token and retries once with a new one.
+Responses are unwrapped from the API's {"data": ...} envelope.
+"""
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.env import (
+    API_POOL_SIZE,
+    API_RETRIES,
+    API_TIMEOUT,
+    BASE_API,
+    LOGIN_CODE,
+    LOGIN_COMPANY_ID,
+    LOGIN_EMAIL,
+)
+from core.playwright.auth import AuthService
+
+
+class ApiError(Exception):
+    """Non-2xx response from the API"""
+
+    def __init__(self, method: str, path: str, status_code: int, body: str):
+        super().__init__(f"{method} {path} failed ({status_code}): {body[:500]}")
+        self.status_code = status_code
+        self.body = body
+
+
+class ApiClient:
+    """JSON requests against BASE_API as the configured login user"""
+
+    def __init__(
+        self,
+        base_url: str = BASE_API,
+        email: str = LOGIN_EMAIL,
+        code: str = LOGIN_CODE,
+        company_id: str = LOGIN_COMPANY_ID,
+        auth: Optional[AuthService] = None,
+        pool_size: int = API_POOL_SIZE,
+        timeout: float = API_TIMEOUT,
+    ):
+        self.base_url = (base_url or "").rstrip("/")
+        self.email = email
+        self.code = code
+        self.company_id = company_id
+        self.auth = auth or AuthService()
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        # Retry connection errors and gateway hiccups; only idempotent methods are retried
+        retries = Retry(
+            total=API_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "PUT", "DELETE"),
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _token(self) -> str:
+        return self.auth.login(email=self.email, code=self.code, company_id=self.company_id)
+
+    def request(self, method: str, path: str, json: Any = None, params: Optional[dict] = None) -> Any:
+        """Send a request and return the unwrapped `data` of the response"""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        for attempt in range(2):
+            res = self.session.request(
+                method,
+                url,
+                json=json,
+                params=params,
+                headers={"Authorization": f"Bearer {self._token()}"},
+                timeout=self.timeout,
+            )
+            if res.status_code == 401 and attempt == 0:
+                # Token revoked or expired early: log in again once
+                self.auth.invalidate(self.email, self.company_id)
+                continue
+            break
+
+        if res.status_code >= 400:
+            raise ApiError(method, path, res.status_code, res.text)
+        if not res.content:
+            return None
+        body = res.json()
+        return body.get("data", body) if isinstance(body, dict) else body
+
+    def get(self, path: str, params: Optional[dict] = None) -> Any:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, json: Any = None) -> Any:
+        return self.request("POST", path, json=json)
+
+    def put(self, path: str, json: Any = None) -> Any:
+        return self.request("PUT", path, json=json)
+
+    def delete(self, path: str) -> Any:
+        return self.request("DELETE", path)
+
+    def close(self):
+        self.session.close()
+
+
+# Global singleton instance
+_api_client = None
+
+
+def get_api_client() -> ApiClient:
+    """Get or create API client singleton"""
+    global _api_client
+    if _api_client is None:
+        _api_client = ApiClient()
+    return _api_client
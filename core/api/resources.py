@@ -0,0 +1,204 @@
+# core/api/resources.py
+"""
+Typed records and CRUD endpoints for test data.
+
+Each record is a dataclass whose `_fields` map attributes to the API's field
+names, so tests work with `contact.first_name` while the payload carries
+`FirstName`. Contact and user names are the `name` attributes of the app's own
+forms (pages/contacts/contact_form_page.py, pages/users/user_detail_page.py),
+which post them unchanged; tests/api/test_data_factory.py pins them. The
+knowledge base and assistant names have no form to pin them to, so the data
+fixtures skip a test whose records the API refuses to create. Resource wraps one collection endpoint (/contacts, /users,
+/knowledgebase, /assistants). DataFactory creates records with unique
+defaults and deletes everything it created on cleanup:
+
+    factory = DataFactory(get_api_client())
+    contact = factory.contact(first_name="Ada")
+    ...
+    factory.cleanup()
+"""
+import uuid
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Type, TypeVar
+
+from core.api.client import ApiClient, ApiError
+
+
+def unique_suffix() -> str:
+    return uuid.uuid4().hex[:6]
+
+
+@dataclass
+class Record:
+    """Base for API records; `id` is set once the record exists"""
+    _fields: ClassVar[Dict[str, str]] = {}
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {api_name: getattr(self, attr) for attr, api_name in self._fields.items()}
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]):
+        values = {attr: data[api_name] for attr, api_name in cls._fields.items() if api_name in data}
+        record_id = data.get("ID") or data.get("id") or data.get("_id")
+        return cls(**values, id=record_id)
+
+
+@dataclass
+class Contact(Record):
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    phone: str = ""
+    id: Optional[str] = None
+    _fields: ClassVar[Dict[str, str]] = {
+        "first_name": "FirstName",
+        "last_name": "LastName",
+        "email": "Email",
+        "phone": "PhoneNumber",
+    }
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+
+@dataclass
+class User(Record):
+    """Roles are left to the API's default: the form picks them from a list, not by value"""
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    id: Optional[str] = None
+    _fields: ClassVar[Dict[str, str]] = {
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "email": "email",
+    }
+
+
+@dataclass
+class KnowledgeBaseEntry(Record):
+    title: str = ""
+    type: str = "article"  # article | url
+    sections: List[Dict[str, str]] = field(default_factory=list)  # [{"Name": ..., "Content": ...}]
+    url: str = ""
+    frequency: str = "24"
+    prompt: str = ""
+    id: Optional[str] = None
+    _fields: ClassVar[Dict[str, str]] = {
+        "title": "Title",
+        "type": "Type",
+        "sections": "Sections",
+        "url": "URL",
+        "frequency": "Frequency",
+        "prompt": "Prompt",
+    }
+
+    def to_payload(self) -> Dict[str, Any]:
+        payload = super().to_payload()
+        # Article and URL entries only accept their own fields
+        drop = ("URL", "Frequency", "Prompt") if self.type == "article" else ("Sections",)
+        return {key: value for key, value in payload.items() if key not in drop}
+
+
+@dataclass
+class Assistant(Record):
+    name: str = ""
+    type: str = "voice"  # voice | chatbot | sms | whatsapp
+    id: Optional[str] = None
+    _fields: ClassVar[Dict[str, str]] = {
+        "name": "Name",
+        "type": "Type",
+    }
+
+
+R = TypeVar("R", bound=Record)
+
+
+class Resource(Generic[R]):
+    """CRUD on one collection endpoint, returning typed records"""
+
+    def __init__(self, client: ApiClient, path: str, model: Type[R]):
+        self.client = client
+        self.path = path.strip("/")
+        self.model = model
+
+    def list(self) -> List[R]:
+        return [self.model.from_api(item) for item in self.client.get(self.path) or []]
+
+    def get(self, record_id: str) -> R:
+        return self.model.from_api(self.client.get(f"{self.path}/{record_id}"))
+
+    def create(self, record: R) -> R:
+        created = self.model.from_api(self.client.post(self.path, json=record.to_payload()) or {})
+        # Keep what we sent for fields the API does not echo back
+        values = {f.name: getattr(created, f.name) or getattr(record, f.name) for f in fields(record)}
+        return replace(record, **values)
+
+    def update(self, record_id: str, **changes) -> R:
+        updated = replace(self.get(record_id), **changes)
+        return self.model.from_api(self.client.put(f"{self.path}/{record_id}", json=updated.to_payload()))
+
+    def delete(self, record_id: str):
+        self.client.delete(f"{self.path}/{record_id}")
+
+
+class DataFactory:
+    """Create test records through the API and remove them again"""
+
+    def __init__(self, client: ApiClient):
+        self.contacts = Resource(client, "contacts", Contact)
+        self.users = Resource(client, "users", User)
+        self.knowledgebase = Resource(client, "knowledgebase", KnowledgeBaseEntry)
+        self.assistants = Resource(client, "assistants", Assistant)
+        self._created: List[tuple] = []
+
+    def _create(self, resource: Resource[R], record: R) -> R:
+        created = resource.create(record)
+        if not created.id:
+            raise ApiError("POST", resource.path, 200, "response carried no record ID")
+        self._created.append((resource, created.id))
+        return created
+
+    def contact(self, **overrides) -> Contact:
+        suffix = unique_suffix()
+        defaults = dict(
+            first_name="TestContact",
+            last_name=f"Api{suffix}",
+            phone=f"+49151{int(suffix, 16) % 10 ** 7:07d}",
+        )
+        return self._create(self.contacts, Contact(**{**defaults, **overrides}))
+
+    def user(self, **overrides) -> User:
+        suffix = unique_suffix()
+        defaults = dict(first_name="TestUser", last_name=f"Api{suffix}", email=f"test.api.{suffix}@example.com")
+        return self._create(self.users, User(**{**defaults, **overrides}))
+
+    def kb_article(self, **overrides) -> KnowledgeBaseEntry:
+        defaults = dict(
+            title=f"Test Article {unique_suffix()}",
+            sections=[{"Name": "Introduction", "Content": "Created through the API for a test."}],
+        )
+        return self._create(self.knowledgebase, KnowledgeBaseEntry(type="article", **{**defaults, **overrides}))
+
+    def kb_url(self, **overrides) -> KnowledgeBaseEntry:
+        defaults = dict(title=f"Test URL Entry {unique_suffix()}", url="https://example.com")
+        return self._create(self.knowledgebase, KnowledgeBaseEntry(type="url", **{**defaults, **overrides}))
+
+    def assistant(self, **overrides) -> Assistant:
+        defaults = dict(name=f"Auto-{unique_suffix()}")
+        return self._create(self.assistants, Assistant(**{**defaults, **overrides}))
+
+    def adopt(self, resource: Resource, record_id: str):
+        """Delete a record created elsewhere (e.g. through the UI) on cleanup"""
+        self._created.append((resource, record_id))
+
+    def cleanup(self):
+        """Delete everything created, newest first; records the test already deleted are fine"""
+        while self._created:
+            resource, record_id = self._created.pop()
+            try:
+                resource.delete(record_id)
+            except ApiError as e:
+                if e.status_code != 404:
+                    print(f"⚠ Could not delete {resource.path}/{record_id}: {e}")
@@ -0,0 +1,178 @@
+# core/mock_api/app.py
+"""
+Local stand-in for the FlowVoice API, for offline, loopback-speed runs.
+
+    uvicorn core.mock_api.app:app --port 8090
+    MOCK_API=true pytest                    (starts it on demand, see conftest.py)
+
+Endpoints:
+    POST /auth/email/finish                 {"data": {"token": <JWT with exp>}}
+    GET  /{resource}                        list
+    GET  /{resource}/{id}                   one record
+    POST /{resource}                        create
+    PUT | PATCH | POST /{resource}/{id}     merge the body into the record
+    DELETE /{resource}/{id}
+for resource in assistants, contacts, users, knowledgebase. Responses use the
+same {"data": ...} envelope as the login call.
+
+Control endpoints (not part of the real API):
+    GET  /_mock/health
+    POST /_mock/reset                       back to the seed data
+    PUT  /_mock/latency                     {"latency_ms": 200, "jitter_ms": 50}
+
+Latency injection: every API response is delayed by MOCK_API_LATENCY_MS plus
+up to MOCK_API_LATENCY_JITTER_MS, or by the X-Mock-Latency-Ms request header.
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import random
+import time
+from typing import Optional
+
+from fastapi import Body, FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from config.env import (
+    MOCK_API_LATENCY_JITTER_MS,
+    MOCK_API_LATENCY_MS,
+    MOCK_API_LOGIN_CODE,
+    MOCK_API_TOKEN_TTL,
+)
+from core.mock_api.store import RESOURCES, MockStore
+
+TOKEN_SECRET = b"flowvoice-mock-api"
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def issue_token(email: str, company_id: str, ttl: int = MOCK_API_TOKEN_TTL) -> str:
+    """HS256 JWT with the claims the framework reads (exp)"""
+    now = int(time.time())
+    header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    claims = _b64(json.dumps({"sub": email, "company_id": company_id, "iat": now, "exp": now + ttl}).encode())
+    signature = hmac.new(TOKEN_SECRET, f"{header}.{claims}".encode(), hashlib.sha256).digest()
+    return f"{header}.{claims}.{_b64(signature)}"
+
+
+def verify_token(token: str) -> bool:
+    """True if the token was issued by this mock and has not expired"""
+    try:
+        header, claims, signature = token.split(".")
+        expected = _b64(hmac.new(TOKEN_SECRET, f"{header}.{claims}".encode(), hashlib.sha256).digest())
+        payload = json.loads(base64.urlsafe_b64decode(claims + "=" * (-len(claims) % 4)))
+    except ValueError:
+        return False
+    return hmac.compare_digest(signature, expected) and payload.get("exp", 0) > time.time()
+
+
+def _request_token(request: Request) -> Optional[str]:
+    auth = request.headers.get("authorization", "")
+    if auth.lower().startswith("bearer "):
+        return auth[7:].strip()
+    return request.cookies.get("ACCESS_TOKEN")
+
+
+def create_app(
+    store: Optional[MockStore] = None,
+    latency_ms: int = MOCK_API_LATENCY_MS,
+    jitter_ms: int = MOCK_API_LATENCY_JITTER_MS,
+) -> FastAPI:
+    app = FastAPI(title="FlowVoice mock API")
+    app.state.store = store or MockStore()
+    app.state.latency = {"latency_ms": latency_ms, "jitter_ms": jitter_ms}
+
+    @app.middleware("http")
+    async def inject_latency(request: Request, call_next):
+        if not request.url.path.startswith("/_mock/"):
+            override = request.headers.get("x-mock-latency-ms")
+            if override is not None and override.isdigit():
+                delay = int(override)
+            else:
+                delay = app.state.latency["latency_ms"] + random.uniform(0, app.state.latency["jitter_ms"])
+            if delay:
+                await asyncio.sleep(delay / 1000)
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def check_token(request: Request, call_next):
+        # The frontend's auth scheme is not mirrored exactly: no token is fine,
+        # but a token that is expired or not ours gets the real API's 401
+        if not request.url.path.startswith(("/_mock/", "/auth/")):
+            token = _request_token(request)
+            if token and not verify_token(token):
+                return JSONResponse({"detail": "Invalid or expired token"}, status_code=401)
+        return await call_next(request)
+
+    # Added last so it wraps the others: 401s and preflights get CORS headers too.
+    # The frontend calls the API cross-origin (directly, or fulfilled through a route)
+    app.add_middleware(
+        CORSMiddleware, allow_origin_regex=".*", allow_credentials=True, allow_methods=["*"], allow_headers=["*"]
+    )
+
+    @app.get("/_mock/health")
+    def health():
+        return {"status": "ok", "records": app.state.store.counts()}
+
+    @app.post("/_mock/reset")
+    def reset():
+        app.state.store.reset()
+        return {"status": "reset", "records": app.state.store.counts()}
+
+    @app.put("/_mock/latency")
+    def set_latency(latency_ms: int = Body(0, embed=True), jitter_ms: int = Body(0, embed=True)):
+        app.state.latency = {"latency_ms": latency_ms, "jitter_ms": jitter_ms}
+        return app.state.latency
+
+    @app.post("/auth/email/finish")
+    def email_finish(payload: dict = Body(...)):
+        email = payload.get("Email")
+        code = payload.get("Code")
+        if not email or not code:
+            raise HTTPException(status_code=400, detail="Email and Code are required")
+        if MOCK_API_LOGIN_CODE and code != MOCK_API_LOGIN_CODE:
+            raise HTTPException(status_code=401, detail="Invalid code")
+        return {"data": {"token": issue_token(email, payload.get("CompanyID", ""))}}
+
+    def _resource(resource: str) -> str:
+        if resource not in RESOURCES:
+            raise HTTPException(status_code=404, detail=f"Unknown resource '{resource}'")
+        return resource
+
+    def _found(record: Optional[dict], resource: str, record_id: str) -> dict:
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"{resource} '{record_id}' not found")
+        return {"data": record}
+
+    @app.get("/{resource}")
+    def list_records(resource: str):
+        records = app.state.store.list(_resource(resource))
+        return {"data": records, "total": len(records)}
+
+    @app.get("/{resource}/{record_id}")
+    def get_record(resource: str, record_id: str):
+        return _found(app.state.store.get(_resource(resource), record_id), resource, record_id)
+
+    @app.post("/{resource}")
+    def create_record(resource: str, payload: dict = Body(default_factory=dict)):
+        return {"data": app.state.store.create(_resource(resource), payload)}
+
+    @app.api_route("/{resource}/{record_id}", methods=["PUT", "PATCH", "POST"])
+    def update_record(resource: str, record_id: str, payload: dict = Body(default_factory=dict)):
+        return _found(app.state.store.update(_resource(resource), record_id, payload), resource, record_id)
+
+    @app.delete("/{resource}/{record_id}")
+    def delete_record(resource: str, record_id: str):
+        if not app.state.store.delete(_resource(resource), record_id):
+            raise HTTPException(status_code=404, detail=f"{resource} '{record_id}' not found")
+        return {"data": {"ID": record_id, "deleted": True}}
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,75 @@
+# core/mock_api/server.py
+"""
+Run the mock API (core/mock_api/app.py) as a uvicorn subprocess.
+
+One server holds the state for the whole run: scripts/run_parallel.py starts
+it before the workers, a plain pytest session starts it itself when nothing
+is listening on MOCK_API_URL yet.
+"""
+import json
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Optional
+from urllib.parse import urlsplit
+
+from config.env import MOCK_API_URL
+
+
+def is_running(url: str = MOCK_API_URL) -> bool:
+    """True if a mock API answers its health check at `url`"""
+    try:
+        with urllib.request.urlopen(f"{url}/_mock/health", timeout=1) as response:
+            return json.load(response).get("status") == "ok"
+    except (OSError, ValueError):
+        return False
+
+
+class MockApiServer:
+    """Start the mock API on MOCK_API_URL, unless one is already running there"""
+
+    def __init__(self, url: str = MOCK_API_URL, startup_timeout: float = 15.0):
+        self.url = url.rstrip("/")
+        self.startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self) -> str:
+        if is_running(self.url):
+            print(f"✓ Using running mock API: {self.url}")
+            return self.url
+
+        parts = urlsplit(self.url)
+        self._process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "core.mock_api.app:app",
+                "--host", parts.hostname or "127.0.0.1",
+                "--port", str(parts.port or 80),
+                "--log-level", "warning",
+            ],
+        )
+        deadline = time.time() + self.startup_timeout
+        while not is_running(self.url):
+            if self._process.poll() is not None or time.time() > deadline:
+                self.stop()
+                raise RuntimeError(f"Mock API failed to start on {self.url}")
+            time.sleep(0.1)
+        print(f"✓ Mock API started: {self.url}")
+        return self.url
+
+    def stop(self):
+        """Terminate the server if this instance started it"""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,135 @@
+# core/mock_api/store.py
+"""
+In-memory state of the mock FlowVoice API.
+
+Every resource is a dict of records keyed by ID. Records use the API's
+PascalCase field names (`Name`, `Keywords`, `Forwarders`, ...), and updates
+merge the request body into the stored record. The store is seeded with the
+assistant IDs from .env, so tests that open ASSISTANT_VOICE_ID & co. find them,
+plus a few users, contacts and knowledge base entries for the list pages.
+"""
+import copy
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from config.env import (
+    ASSISTANT_CHAT_ID,
+    ASSISTANT_NAME,
+    ASSISTANT_SMS_ID,
+    ASSISTANT_TYPE_VOICE_ID,
+    ASSISTANT_VOICE_ID,
+    ASSISTANT_WHATSAPP_ID,
+    LOGIN_COMPANY_ID,
+    LOGIN_EMAIL,
+)
+
+RESOURCES = ("assistants", "contacts", "users", "knowledgebase")
+
+
+def new_id() -> str:
+    return uuid.uuid4().hex[:24]
+
+
+def _assistant(assistant_id: str, name: str, assistant_type: str) -> dict:
+    return {
+        "ID": assistant_id,
+        "Name": name,
+        "Type": assistant_type,
+        "Language": "en",
+        "Greeting": f"Hello, this is {name}.",
+        "Knowledge": "",
+        "Knowledges": [],
+        "Keywords": [],
+        "Forwarders": [],
+        "Calendars": [],
+    }
+
+
+def seed_records() -> Dict[str, Dict[str, dict]]:
+    """Initial records for every resource"""
+    assistants = [
+        _assistant(ASSISTANT_VOICE_ID or new_id(), ASSISTANT_NAME or "Voice Assistant", "voice"),
+        _assistant(ASSISTANT_TYPE_VOICE_ID or new_id(), "Voice Type Assistant", "voice"),
+        _assistant(ASSISTANT_SMS_ID or new_id(), "SMS Assistant", "sms"),
+        _assistant(ASSISTANT_WHATSAPP_ID or new_id(), "WhatsApp Assistant", "whatsapp"),
+        _assistant(ASSISTANT_CHAT_ID or new_id(), "Chatbot Assistant", "chatbot"),
+    ]
+    users = [
+        {"ID": new_id(), "first_name": "Test", "last_name": "Admin", "email": LOGIN_EMAIL or "admin@example.com",
+         "Role": "admin", "CompanyID": LOGIN_COMPANY_ID},
+        {"ID": new_id(), "first_name": "Jane", "last_name": "Doe", "email": "jane.doe@example.com",
+         "Role": "member", "CompanyID": LOGIN_COMPANY_ID},
+    ]
+    contacts = [
+        {"ID": new_id(), "FirstName": "John", "LastName": "Smith", "Email": "john.smith@example.com",
+         "PhoneNumber": "+491234567890", "Company": "Example GmbH"},
+        {"ID": new_id(), "FirstName": "Erika", "LastName": "Mustermann", "Email": "erika@example.com",
+         "PhoneNumber": "+491111111111", "Company": "Muster AG"},
+    ]
+    knowledgebase = [
+        {"ID": new_id(), "Title": "Opening hours", "Sections": [
+            {"Title": "Weekdays", "Content": "Monday to Friday, 9:00 - 18:00"},
+        ]},
+        {"ID": new_id(), "Title": "Pricing", "Sections": [
+            {"Title": "Plans", "Content": "Starter, Business and Enterprise"},
+        ]},
+    ]
+    records = {
+        "assistants": assistants,
+        "users": users,
+        "contacts": contacts,
+        "knowledgebase": knowledgebase,
+    }
+    return {
+        resource: {record["ID"]: record for record in items}
+        for resource, items in records.items()
+    }
+
+
+class MockStore:
+    """Thread-safe CRUD over the mock API's records"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop every change and go back to the seed data"""
+        with self._lock:
+            self._records = seed_records()
+
+    def list(self, resource: str) -> List[dict]:
+        with self._lock:
+            return copy.deepcopy(list(self._records[resource].values()))
+
+    def get(self, resource: str, record_id: str) -> Optional[dict]:
+        with self._lock:
+            record = self._records[resource].get(record_id)
+            return copy.deepcopy(record) if record else None
+
+    def create(self, resource: str, data: dict) -> dict:
+        record = {**copy.deepcopy(data), "ID": new_id(), "CreatedAt": time.time()}
+        with self._lock:
+            self._records[resource][record["ID"]] = record
+            return copy.deepcopy(record)
+
+    def update(self, resource: str, record_id: str, data: dict) -> Optional[dict]:
+        """Merge `data` into a record; None if it does not exist"""
+        with self._lock:
+            record = self._records[resource].get(record_id)
+            if record is None:
+                return None
+            record.update(copy.deepcopy(data))
+            record["ID"] = record_id
+            record["UpdatedAt"] = time.time()
+            return copy.deepcopy(record)
+
+    def delete(self, resource: str, record_id: str) -> bool:
+        with self._lock:
+            return self._records[resource].pop(record_id, None) is not None
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {resource: len(records) for resource, records in self._records.items()}
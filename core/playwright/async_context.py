@@ -0,0 +1,30 @@
+# core/playwright/async_context.py
+"""
+Browser contexts for the asyncio page objects (pages/aio, flows/aio).
+
+Set up like the sync `context` fixture where the feature works on the async
+API: the saved login session, the mock API redirect (MOCK_API=true) and
+backend latency recording. Video, HAR and request routing stay sync-only.
+"""
+from typing import Optional
+
+from config.env import HEADLESS, MOCK_API, NETWORK_LATENCY, PLAYWRIGHT_WS_ENDPOINT, SLOW_MO, TIMING_LEDGER
+from core.playwright.mock_api import redirect_api_async
+from core.playwright.network_latency import NetworkRecorder
+
+
+async def launch_async_browser(playwright):
+    """Chromium for the async API (attaches to the shared server in parallel runs)"""
+    if PLAYWRIGHT_WS_ENDPOINT:
+        return await playwright.chromium.connect(PLAYWRIGHT_WS_ENDPOINT, slow_mo=SLOW_MO)
+    return await playwright.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+
+
+async def new_async_context(browser, storage_state: Optional[str] = None, **options):
+    """New context on an async browser; storage_state=None starts logged out"""
+    context = await browser.new_context(storage_state=storage_state, **options)
+    if MOCK_API:
+        await redirect_api_async(context)
+    elif NETWORK_LATENCY and TIMING_LEDGER:
+        NetworkRecorder().install(context)
+    return context
@@ -2,12 +2,30 @@ import requests
 import json
 from playwright.sync_api import Page
 from config.env import BASE_API, DOMAIN
+from core.playwright.token_cache import TokenCache, get_token_cache
 
 class AuthService:
     BASE_API = BASE_API
 
+    def __init__(self, token_cache: TokenCache = None):
+        self.token_cache = token_cache or get_token_cache()
+
     def login(self, email: str, code: str, company_id: str):
-        """Login using auth/email/finish API"""
+        """
+        Return an access token for the credential.
+
+        Tokens are cached per (email, company_id, BASE_API) and shared across workers,
+        so the auth API is only called when there is no token or it is about
+        to expire.
+        """
+        return self.token_cache.get_or_refresh(
+            email,
+            company_id,
+            lambda: self.request_token(email, code, company_id),
+        )
+
+    def request_token(self, email: str, code: str, company_id: str):
+        """Login using auth/email/finish API (always hits the backend)"""
 
         url = f"{BASE_API}/auth/email/finish"
         payload = {
@@ -16,32 +34,30 @@ class AuthService:
             "CompanyID": company_id,
         }
 
-        print("Login URL:", url)
-        print("Payload:", payload)
+        print(f"Login API: {url} (email={email}, company={company_id})")
 
         res = requests.post(url, json=payload)
 
-        print("Status:", res.status_code)
-        print("Raw Response:", res.text)
-
         if res.status_code != 200:
-            raise Exception(f"Login failed: {res.text}")
+            raise Exception(f"Login failed ({res.status_code}): {res.text}")
 
         try:
             data = res.json()
         except json.JSONDecodeError:
             raise Exception("API did not return valid JSON")
 
-        # UPDATED EXTRACTION
-        print("Parsed Response JSON:", data)
         token = data.get("data", {}).get("token")
 
         if not token:
             raise Exception("Access token not found in API response")
 
-        print("\n✅ Token extracted successfully")
+        print("✅ Token extracted successfully")
         return token
-    
+
+    def invalidate(self, email: str, company_id: str):
+        """Forget the cached token so the next login() hits the API again"""
+        self.token_cache.invalidate(email, company_id)
+
     def inject_token(self, page: Page, token: str):
         domain = DOMAIN
         # domain = "app.dev.getflowvoice.com"
@@ -57,4 +73,3 @@ class AuthService:
                 "sameSite": "Lax",
             }
         ])
-
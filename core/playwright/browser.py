@@ -1,14 +1,41 @@
 import pytest
 import os
 from playwright.sync_api import sync_playwright
-from config.env import HEADLESS, SLOW_MO
+from config.env import HEADLESS, SLOW_MO, PLAYWRIGHT_WS_ENDPOINT
+
+# Browser owned by a long-lived process (warm runner worker) and reused by every pytest session in it
+_shared_browser = None
+
+
+def set_shared_browser(browser):
+    """Register a browser for the browser fixture to reuse (None to clear)"""
+    global _shared_browser
+    _shared_browser = browser
+
+
+def get_shared_browser():
+    """The registered shared browser, if it is still connected"""
+    if _shared_browser is not None and _shared_browser.is_connected():
+        return _shared_browser
+    return None
+
 
 @pytest.fixture(scope="session")
 def browser():
+    shared = get_shared_browser()
+    if shared:
+        # Warm worker: the browser outlives this session, its owner closes it
+        yield shared
+        return
+
     p = sync_playwright().start()
-    browser = p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+    if PLAYWRIGHT_WS_ENDPOINT:
+        # Parallel worker: attach to the shared browser server
+        browser = p.chromium.connect(PLAYWRIGHT_WS_ENDPOINT, slow_mo=SLOW_MO)
+    else:
+        browser = p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
     try:
         yield browser
     finally:
         browser.close()
-        p.stop()
\ No newline at end of file
+        p.stop()
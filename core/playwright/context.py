@@ -0,0 +1,138 @@
+# core/playwright/context.py
+"""
+Pre-authenticated storage_state snapshots.
+
+One snapshot is written per (credential, backend, domain) under
+STORAGE_STATE_DIR and holds the ACCESS_TOKEN cookie in Playwright's
+storage_state format. The `context` fixture passes it to
+`browser.new_context(storage_state=...)`, so pages start logged in without
+any per-test login or cookie injection. Snapshots are regenerated once their
+token is close to expiry; a token without an `exp` claim is trusted for
+TOKEN_FALLBACK_TTL seconds after the snapshot was written, as in the token
+cache.
+"""
+import time
+from pathlib import Path
+from typing import Optional
+
+from config.env import (
+    DOMAIN,
+    LOGIN_CODE,
+    LOGIN_COMPANY_ID,
+    LOGIN_EMAIL,
+    STORAGE_STATE_DIR,
+    TOKEN_FALLBACK_TTL,
+    TOKEN_REFRESH_MARGIN,
+)
+from core.playwright.auth import AuthService
+from core.playwright.token_cache import cache_key, decode_jwt_exp
+from core.utils.file_lock import file_lock, read_json, write_json_atomic
+from core.utils.timing_ledger import get_timing_ledger
+
+ACCESS_TOKEN_COOKIE = "ACCESS_TOKEN"
+
+
+def build_storage_state(token: str, domain: str = DOMAIN) -> dict:
+    """Build a Playwright storage_state dict carrying the ACCESS_TOKEN cookie"""
+    expires = decode_jwt_exp(token) or -1
+    return {
+        "cookies": [
+            {
+                "name": ACCESS_TOKEN_COOKIE,
+                "value": token,
+                "domain": domain,
+                "path": "/",
+                "expires": expires,
+                "httpOnly": False,
+                "secure": True,
+                "sameSite": "Lax",
+            }
+        ],
+        "origins": [],
+    }
+
+
+class StorageStateManager:
+    """Create and refresh storage_state snapshots per credential/domain"""
+
+    def __init__(
+        self,
+        state_dir: str = STORAGE_STATE_DIR,
+        auth: Optional[AuthService] = None,
+        refresh_margin: int = TOKEN_REFRESH_MARGIN,
+        fallback_ttl: int = TOKEN_FALLBACK_TTL,
+    ):
+        self.state_dir = Path(state_dir)
+        self.auth = auth or AuthService()
+        self.refresh_margin = refresh_margin
+        self.fallback_ttl = fallback_ttl
+
+    def path_for(self, email: str, company_id: str, domain: str = DOMAIN) -> Path:
+        """Snapshot location for a credential on a domain (keyed by BASE_API too, like the token cache)"""
+        return self.state_dir / f"{cache_key(email, company_id)}_{domain}.json"
+
+    def _is_fresh(self, path: Path) -> bool:
+        state = read_json(path)
+        for cookie in state.get("cookies", []):
+            if cookie.get("name") == ACCESS_TOKEN_COOKIE:
+                exp = decode_jwt_exp(cookie.get("value", ""))
+                if exp is None:
+                    # No expiry to go by: trust it for the fallback TTL, counted from when it was written
+                    exp = path.stat().st_mtime + self.fallback_ttl
+                return exp - self.refresh_margin > time.time()
+        return False
+
+    def create(
+        self,
+        email: str = LOGIN_EMAIL,
+        code: str = LOGIN_CODE,
+        company_id: str = LOGIN_COMPANY_ID,
+        domain: str = DOMAIN,
+    ) -> Path:
+        """Log in (through the token cache) and write a fresh snapshot"""
+        path = self.path_for(email, company_id, domain)
+        # The token cache only hands out tokens outside the refresh margin
+        with get_timing_ledger().timed("login", "storage_state"):
+            token = self.auth.login(email, code, company_id)
+        write_json_atomic(path, build_storage_state(token, domain), mode=0o600)
+        print(f"✓ Storage state written: {path}")
+        return path
+
+    def get_state_path(
+        self,
+        email: str = LOGIN_EMAIL,
+        code: str = LOGIN_CODE,
+        company_id: str = LOGIN_COMPANY_ID,
+        domain: str = DOMAIN,
+    ) -> str:
+        """Return a valid snapshot path, regenerating it if missing or expired"""
+        path = self.path_for(email, company_id, domain)
+        if self._is_fresh(path):
+            return str(path)
+        with file_lock(path):
+            if not self._is_fresh(path):
+                self.create(email, code, company_id, domain)
+        return str(path)
+
+
+# Global singleton instance
+_storage_state_manager = None
+
+def get_storage_state_manager() -> StorageStateManager:
+    """Get or create storage state manager singleton"""
+    global _storage_state_manager
+    if _storage_state_manager is None:
+        _storage_state_manager = StorageStateManager()
+    return _storage_state_manager
+
+
+def storage_state_for(node) -> Optional[str]:
+    """
+    storage_state to use for a test item.
+
+    Tests marked `unauthenticated` (e.g. the UI login tests) get a clean
+    context; everything else starts from the default credential's snapshot.
+    """
+    if node.get_closest_marker("unauthenticated"):
+        return None
+    return get_storage_state_manager().get_state_path()
@@ -0,0 +1,133 @@
+# core/playwright/har.py
+"""
+HAR record-and-replay of backend API traffic.
+
+    pytest tests/assistants/updates/voice --har-mode record
+    pytest tests/assistants/updates/voice --har-mode replay
+
+record  every API call of a test is captured into its own HAR file
+        (HAR_DIR/<test file>/<test name>.har) when the context closes
+replay  GET calls are answered from the test's HAR file; calls missing from
+        it fall through to the live API. Mutating calls (POST/PUT/PATCH/DELETE)
+        go to the live API (HAR_MUTATIONS=passthrough) or get a 200 echoing
+        their payload (HAR_MUTATIONS=stub) so a replayed run changes nothing
+
+HAR_MUTATIONS is the default; a test overrides it for all its mutating calls
+or only for URLs matching glob patterns (fnmatch, checked closest mark first):
+
+    @pytest.mark.har_mutations("stub")
+    @pytest.mark.har_mutations("passthrough", "**/assistants/*/publish")
+
+Replay serves the recorded responses as they are, so a GET repeated after a
+save returns the recorded (post-save) answer only if the save was part of the
+recording. Re-record when the frontend's API usage changes.
+"""
+import json
+import re
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config.env import BASE_API, HAR_DIR, HAR_MUTATIONS, HAR_URL_PATTERN
+
+HAR_MODES = ("off", "record", "replay")
+MUTATION_MODES = ("passthrough", "stub")
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def api_url_pattern() -> str:
+    """Glob of the URLs to record / replay (HAR_URL_PATTERN, else everything under BASE_API)"""
+    if HAR_URL_PATTERN:
+        return HAR_URL_PATTERN
+    if BASE_API:
+        return f"{BASE_API.rstrip('/')}/**"
+    return "**/api/**"
+
+
+def har_path_for(node, har_dir: str = HAR_DIR) -> Path:
+    """Per-test HAR file: one directory per test module, one file per test (params included)"""
+    module = Path(node.nodeid.split("::")[0]).with_suffix("")
+    name = re.sub(r"[^\w.-]+", "_", node.name)
+    return Path(har_dir) / module / f"{name}.har"
+
+
+class HarSession:
+    """Record or replay the API traffic of one test's browser context"""
+
+    def __init__(self, node, mode: str = "off", mutations: str = HAR_MUTATIONS, har_dir: str = HAR_DIR):
+        if mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode '{mode}', expected one of {HAR_MODES}")
+        if mutations not in MUTATION_MODES:
+            raise ValueError(f"Unknown HAR_MUTATIONS '{mutations}', expected one of {MUTATION_MODES}")
+        self.mode = mode
+        self.mutations = mutations
+        self.mutation_rules = _mutation_rules(node)
+        self.path = har_path_for(node, har_dir)
+        self.url = api_url_pattern()
+        self.stubbed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def install(self, context):
+        """Call right after the context is created, before any page opens"""
+        if self.mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            context.route_from_har(
+                self.path, url=self.url, update=True, update_content="embed", update_mode="minimal"
+            )
+        elif self.mode == "replay":
+            if not self.path.exists():
+                print(f"⚠ No HAR recording at {self.path}, using the live API")
+                self.mode = "off"
+                return
+            context.route_from_har(self.path, url=self.url, not_found="fallback")
+            # Registered last so it runs first: mutations never reach the HAR handler
+            context.route(self.url, self._handle_mutation)
+
+    def mutation_mode(self, url: str) -> str:
+        """How a mutating call to `url` is replayed: the first matching har_mutations mark, else the default"""
+        for patterns, mode in self.mutation_rules:
+            if not patterns or any(fnmatch(url, pattern) for pattern in patterns):
+                return mode
+        return self.mutations
+
+    def _handle_mutation(self, route):
+        request = route.request
+        if request.method not in MUTATING_METHODS:
+            route.fallback()
+        elif self.mutation_mode(request.url) == "stub":
+            self.stubbed += 1
+            route.fulfill(status=200, content_type="application/json", body=_echo_body(request))
+        else:
+            # Straight to the live API, skipping the recorded answers
+            route.continue_()
+
+    def summary(self) -> Optional[str]:
+        """One line for the report, after the context is closed"""
+        if self.mode == "record":
+            return f"✓ Recorded API traffic to {self.path}"
+        if self.mode == "replay":
+            stubbed = f", {self.stubbed} mutating calls stubbed" if self.stubbed else ""
+            return f"✓ Replayed API traffic from {self.path}{stubbed}"
+        return None
+
+
+def _mutation_rules(node) -> List[Tuple[Tuple[str, ...], str]]:
+    """(URL patterns, mode) of the node's har_mutations marks, closest first; no patterns = every URL"""
+    rules = []
+    for marker in node.iter_markers("har_mutations"):
+        if not marker.args or marker.args[0] not in MUTATION_MODES:
+            raise ValueError(f"har_mutations needs a mode out of {MUTATION_MODES} first, got {marker.args}")
+        rules.append((tuple(marker.args[1:]), marker.args[0]))
+    return rules
+
+
+def _echo_body(request) -> str:
+    # Echo a JSON payload back so code reading fields of the saved object still finds them
+    try:
+        payload = request.post_data_json
+    except Exception:
+        payload = None
+    return json.dumps(payload if isinstance(payload, dict) else {})
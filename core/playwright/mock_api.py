@@ -0,0 +1,39 @@
+# core/playwright/mock_api.py
+"""
+Route the browser's API calls to the local mock API (MOCK_API=true).
+
+The frontend is built against the real API host, so its calls are
+intercepted on the context and answered by the mock instead:
+MOCK_API_UPSTREAM/assistants/42 -> MOCK_API_URL/assistants/42.
+"""
+from config.env import MOCK_API_UPSTREAM, MOCK_API_URL
+
+
+def redirect_api(context, upstream: str = MOCK_API_UPSTREAM, target: str = MOCK_API_URL):
+    """Serve every request under `upstream` from `target`"""
+    if not upstream:
+        print("⚠ MOCK_API_UPSTREAM / BASE_API not set, browser API calls are not redirected")
+        return
+    prefix = upstream.rstrip("/")
+
+    def handle(route):
+        url = route.request.url
+        response = route.fetch(url=target + url[len(prefix):])
+        route.fulfill(response=response)
+
+    context.route(f"{prefix}/**", handle)
+
+
+async def redirect_api_async(context, upstream: str = MOCK_API_UPSTREAM, target: str = MOCK_API_URL):
+    """redirect_api for a context of the async API"""
+    if not upstream:
+        print("⚠ MOCK_API_UPSTREAM / BASE_API not set, browser API calls are not redirected")
+        return
+    prefix = upstream.rstrip("/")
+
+    async def handle(route):
+        url = route.request.url
+        response = await route.fetch(url=target + url[len(prefix):])
+        await route.fulfill(response=response)
+
+    await context.route(f"{prefix}/**", handle)
@@ -0,0 +1,70 @@
+# core/playwright/navigation_timing.py
+"""
+Navigation timings per page object and navigation mode.
+
+BasePage.navigate records how long each navigation took until the page was
+ready. At session end the totals are merged into a shared JSON file keyed by
+mode ("ready" or the legacy "networkidle"), so one run in each mode shows
+the time saved per navigation:
+
+    python scripts/navigation_report.py
+"""
+from pathlib import Path
+from typing import Dict
+
+from config.env import NAVIGATION_TIMINGS_PATH
+from core.utils.file_lock import locked_json, read_json
+
+
+class NavigationTimings:
+    """Collect navigation durations and merge them into the shared store"""
+
+    def __init__(self, path: str = NAVIGATION_TIMINGS_PATH):
+        self.path = Path(path)
+        # mode -> page class -> [count, total_ms]
+        self._pending: Dict[str, Dict[str, list]] = {}
+
+    def record(self, mode: str, page_name: str, elapsed_ms: float):
+        entry = self._pending.setdefault(mode, {}).setdefault(page_name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed_ms
+
+    def flush(self):
+        """Merge pending timings into the store (safe across parallel workers)"""
+        if not self._pending:
+            return
+        with locked_json(self.path) as store:
+            for mode, pages in self._pending.items():
+                stored_pages = store.setdefault(mode, {})
+                for page_name, (count, total_ms) in pages.items():
+                    stored = stored_pages.setdefault(page_name, {"count": 0, "total_ms": 0.0})
+                    stored["count"] += count
+                    stored["total_ms"] = round(stored["total_ms"] + total_ms, 1)
+        self._pending = {}
+
+    def report(self) -> Dict[str, dict]:
+        """Average ms per page object for each mode, plus the saving of "ready" over "networkidle\""""
+        store = read_json(self.path, {})
+        report = {}
+        for page_name in sorted({name for pages in store.values() for name in pages}):
+            row = {}
+            for mode, pages in store.items():
+                stats = pages.get(page_name)
+                if stats and stats["count"]:
+                    row[mode] = round(stats["total_ms"] / stats["count"], 1)
+            if "ready" in row and "networkidle" in row:
+                row["saved_ms"] = round(row["networkidle"] - row["ready"], 1)
+            report[page_name] = row
+        return report
+
+
+# Global singleton instance
+_navigation_timings = None
+
+
+def get_navigation_timings() -> NavigationTimings:
+    """Get or create navigation timings singleton"""
+    global _navigation_timings
+    if _navigation_timings is None:
+        _navigation_timings = NavigationTimings()
+    return _navigation_timings
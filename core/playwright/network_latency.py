@@ -0,0 +1,196 @@
+# core/playwright/network_latency.py
+"""
+Backend latency recorded from the browser's own API traffic.
+
+NetworkRecorder listens to a context's `response` / `requestfinished`
+events and writes one "request" record per fetch/XHR into the timing ledger:
+method + URL template ("PUT /assistants/{id}"), status, timing phases from
+`request.timing` and the `Server-Timing` header. No extra round trips: the
+response is captured from its event, the timing is already on the request.
+
+After a run, per-endpoint percentiles show where the backend is slow, and
+comparing the last run to earlier ones flags regressions:
+
+    python scripts/latency_report.py
+    python scripts/latency_report.py --regressions     # exit 1 if an endpoint got slower
+"""
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from config.env import LATENCY_MIN_SAMPLES, LATENCY_REGRESSION_THRESHOLD
+from core.utils.timing_ledger import TimingLedger, get_timing_ledger, percentile
+
+# Path segments that identify a record rather than an endpoint
+_ID_SEGMENT = re.compile(
+    r"^(\d+"                                        # numeric
+    r"|[0-9a-f]{24}"                                # Mongo ObjectId
+    r"|[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}"   # UUID
+    r"|(?=.*\d)[A-Za-z0-9_-]{16,})$",               # other long opaque tokens
+    re.I,
+)
+_SERVER_TIMING_DUR = re.compile(r"dur=([\d.]+)")
+
+
+def url_template(url: str) -> str:
+    """Path with record IDs replaced by {id}: /assistants/65f0.../keywords -> /assistants/{id}/keywords"""
+    path = urlsplit(url).path.rstrip("/") or "/"
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    """`db;dur=53, app;desc="App";dur=47.2` -> {"db": 53.0, "app": 47.2} (metrics without dur are skipped)"""
+    metrics = {}
+    for metric in (header or "").split(","):
+        name = metric.split(";")[0].strip()
+        duration = _SERVER_TIMING_DUR.search(metric)
+        if name and duration:
+            metrics[name] = float(duration.group(1))
+    return metrics
+
+
+def timing_phases(timing: dict) -> Dict[str, float]:
+    """
+    Phases in ms from Playwright's request.timing (fields are relative to startTime, -1 = not applicable):
+    dns, connect, tls, wait (request sent -> first byte, i.e. server time), download, total
+    """
+    def span(start: str, end: str) -> Optional[float]:
+        if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+            return None
+        return round(timing[end] - timing[start], 1)
+
+    phases = {
+        "dns": span("domainLookupStart", "domainLookupEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "tls": span("secureConnectionStart", "connectEnd"),
+        "wait": span("requestStart", "responseStart"),
+        "download": span("responseStart", "responseEnd"),
+        "total": round(timing["responseEnd"], 1) if timing.get("responseEnd", -1) >= 0 else None,
+    }
+    return {name: value for name, value in phases.items() if value is not None}
+
+
+class NetworkRecorder:
+    """Record every API request of a browser context into the timing ledger"""
+
+    def __init__(self, ledger: Optional[TimingLedger] = None):
+        self.ledger = ledger or get_timing_ledger()
+        self._responses = {}
+        self.recorded = 0
+
+    def install(self, context):
+        context.on("response", self._on_response)
+        context.on("requestfinished", self._on_finished)
+        context.on("requestfailed", self._on_failed)
+        return self
+
+    @staticmethod
+    def _is_api(request) -> bool:
+        return request.resource_type in ("fetch", "xhr")
+
+    def _on_response(self, response):
+        if self._is_api(response.request):
+            self._responses[response.request] = response
+
+    def _on_failed(self, request):
+        self._responses.pop(request, None)
+
+    def _on_finished(self, request):
+        response = self._responses.pop(request, None)
+        if response is None:
+            return
+        phases = timing_phases(request.timing)
+        if "total" not in phases:
+            return  # No network timing (e.g. fulfilled by a route)
+        self.ledger.record(
+            "request",
+            f"{request.method} {url_template(request.url)}",
+            phases["total"],
+            status=response.status,
+            phases=phases,
+            server_timing=parse_server_timing(response.headers.get("server-timing")) or None,
+        )
+        self.recorded += 1
+
+
+def _endpoint_samples(entries: List[dict]) -> Dict[str, Dict[str, List[float]]]:
+    """endpoint -> {"total": [...], "wait": [...]}"""
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for entry in entries:
+        endpoint = samples.setdefault(entry["name"], {"total": [], "wait": []})
+        endpoint["total"].append(entry["ms"])
+        if "wait" in entry.get("phases", {}):
+            endpoint["wait"].append(entry["phases"]["wait"])
+    return samples
+
+
+def _request_entries(ledger: TimingLedger, run: Optional[str]) -> List[dict]:
+    return [
+        entry for entry in ledger.entries()
+        if entry.get("kind") == "request" and (run is None or entry.get("run") == run)
+    ]
+
+
+def _last_run(ledger: TimingLedger) -> Optional[str]:
+    runs = [entry["run"] for entry in ledger.entries() if entry.get("kind") == "request"]
+    return runs[-1] if runs else None
+
+
+def latency_report(ledger: Optional[TimingLedger] = None, run: Optional[str] = "last") -> List[dict]:
+    """
+    p50/p95/p99 per endpoint (total request time) plus p50/p95 of the server wait,
+    slowest p95 first. run: a run id, "last", or None for every run
+    """
+    ledger = ledger or get_timing_ledger()
+    if run == "last":
+        run = _last_run(ledger)
+        if run is None:
+            return []
+    rows = []
+    for endpoint, samples in _endpoint_samples(_request_entries(ledger, run)).items():
+        total, wait = samples["total"], samples["wait"]
+        rows.append({
+            "endpoint": endpoint,
+            "count": len(total),
+            "p50_ms": percentile(total, 50),
+            "p95_ms": percentile(total, 95),
+            "p99_ms": percentile(total, 99),
+            "wait_p50_ms": percentile(wait, 50) if wait else None,
+            "wait_p95_ms": percentile(wait, 95) if wait else None,
+        })
+    rows.sort(key=lambda row: row["p95_ms"], reverse=True)
+    return rows
+
+
+def latency_regressions(
+    ledger: Optional[TimingLedger] = None,
+    threshold: float = LATENCY_REGRESSION_THRESHOLD,
+    min_samples: int = LATENCY_MIN_SAMPLES,
+) -> List[dict]:
+    """
+    Endpoints whose p95 in the last run exceeds the p95 of all earlier runs by more
+    than `threshold` (0.25 = 25 %). Endpoints with fewer than `min_samples` requests
+    on either side are skipped.
+    """
+    ledger = ledger or get_timing_ledger()
+    run = _last_run(ledger)
+    if run is None:
+        return []
+    entries = [entry for entry in ledger.entries() if entry.get("kind") == "request"]
+    current = _endpoint_samples([entry for entry in entries if entry["run"] == run])
+    baseline = _endpoint_samples([entry for entry in entries if entry["run"] != run])
+    regressions = []
+    for endpoint, samples in current.items():
+        before = baseline.get(endpoint, {}).get("total", [])
+        if len(samples["total"]) < min_samples or len(before) < min_samples:
+            continue
+        p95, baseline_p95 = percentile(samples["total"], 95), percentile(before, 95)
+        if baseline_p95 > 0 and p95 > baseline_p95 * (1 + threshold):
+            regressions.append({
+                "endpoint": endpoint,
+                "p95_ms": p95,
+                "baseline_p95_ms": baseline_p95,
+                "change": round(p95 / baseline_p95 - 1, 2),
+            })
+    regressions.sort(key=lambda row: row["p95_ms"] - row["baseline_p95_ms"], reverse=True)
+    return regressions
@@ -0,0 +1,215 @@
+# core/playwright/routing.py
+"""
+Request routing layer for test contexts.
+
+A RequestRouter is installed on every context created by the `context`
+fixture. It aborts requests the assertions never need: resource types such
+as images, fonts and media, and third-party hosts (analytics, tag managers,
+error trackers). Everything else falls through to the next route handler or
+the network.
+
+Tests that do need assets opt back in per page object (class attributes
+`allow_resources` / `allow_hosts` on BasePage subclasses) or per test with
+`@pytest.mark.allow_resources("image", "font")`.
+
+Blocked requests are counted per test. Bytes saved are estimated from
+content-length values seen whenever the same URL was allowed (routing
+disabled, or an override), kept in a shared size cache across runs.
+"""
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config.env import (
+    ROUTING_ALLOW_HOSTS,
+    ROUTING_BLOCK_HOSTS,
+    ROUTING_BLOCK_RESOURCE_TYPES,
+    ROUTING_ENABLED,
+    ROUTING_SIZES_PATH,
+)
+from core.utils.file_lock import locked_json, read_json
+
+
+def _split(value: str) -> Tuple[str, ...]:
+    return tuple(item.strip().lower() for item in value.split(",") if item.strip())
+
+
+def _url_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+@dataclass(frozen=True)
+class RoutingRules:
+    """Which requests to abort"""
+    block_resource_types: FrozenSet[str] = frozenset()
+    block_hosts: Tuple[str, ...] = ()
+    # Host patterns never blocked by host rules (resource type rules still apply)
+    allow_hosts: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_env(cls) -> "RoutingRules":
+        return cls(
+            block_resource_types=frozenset(_split(ROUTING_BLOCK_RESOURCE_TYPES)),
+            block_hosts=_split(ROUTING_BLOCK_HOSTS),
+            allow_hosts=_split(ROUTING_ALLOW_HOSTS),
+        )
+
+    def allowing(self, resource_types: Iterable[str] = (), hosts: Iterable[str] = ()) -> "RoutingRules":
+        """Copy of these rules with some resource types / hosts let through"""
+        return replace(
+            self,
+            block_resource_types=self.block_resource_types - {t.lower() for t in resource_types},
+            allow_hosts=self.allow_hosts + tuple(h.lower() for h in hosts),
+        )
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """Why a request should be aborted, or None to let it through"""
+        if resource_type in self.block_resource_types:
+            return resource_type
+        host = (urlsplit(url).hostname or "").lower()
+        if any(fnmatch(host, pattern) for pattern in self.allow_hosts):
+            return None
+        if any(fnmatch(host, pattern) for pattern in self.block_hosts):
+            return host
+        return None
+
+
+class AssetSizes:
+    """URL -> content-length cache, used to estimate the bytes a blocked request saved"""
+
+    def __init__(self, path: str = ROUTING_SIZES_PATH):
+        self.path = Path(path)
+        self._sizes: Optional[Dict[str, int]] = None
+        self._pending: Dict[str, int] = {}
+
+    def get(self, url: str) -> Optional[int]:
+        if self._sizes is None:
+            self._sizes = read_json(self.path, {})
+        key = _url_key(url)
+        return self._pending.get(key, self._sizes.get(key))
+
+    def record(self, url: str, size: int):
+        self._pending[_url_key(url)] = size
+
+    def flush(self):
+        """Merge newly seen sizes into the cache (safe across parallel workers)"""
+        if not self._pending:
+            return
+        with locked_json(self.path) as sizes:
+            sizes.update(self._pending)
+            self._sizes = dict(sizes)
+        self._pending = {}
+
+
+@dataclass
+class RoutingStats:
+    """What the router blocked for one test"""
+    blocked: Counter = field(default_factory=Counter)  # reason -> requests
+    bytes_saved: int = 0
+    unknown_size: int = 0
+
+    @property
+    def blocked_requests(self) -> int:
+        return sum(self.blocked.values())
+
+    def summary(self) -> str:
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in self.blocked.most_common())
+        size = f"~{self.bytes_saved / 1024:.0f} KB saved"
+        if self.unknown_size:
+            size += f" ({self.unknown_size} of unknown size)"
+        return f"{self.blocked_requests} requests blocked, {size}" + (f" [{reasons}]" if reasons else "")
+
+    def add(self, other: "RoutingStats"):
+        self.blocked.update(other.blocked)
+        self.bytes_saved += other.bytes_saved
+        self.unknown_size += other.unknown_size
+
+
+class RequestRouter:
+    """Abort non-essential requests on a browser context and count what was saved"""
+
+    def __init__(self, rules: Optional[RoutingRules] = None, sizes: Optional[AssetSizes] = None):
+        self.rules = rules or RoutingRules.from_env()
+        self.default_rules = self.rules
+        self.sizes = sizes or get_asset_sizes()
+        self.stats = RoutingStats()
+        self._context = None
+
+    def install(self, context, block: bool = True) -> "RequestRouter":
+        """Route the context's requests; with block=False only learn asset sizes"""
+        self._context = context
+        if block:
+            context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+        _routers[id(context)] = self
+        return self
+
+    def uninstall(self):
+        if self._context is not None:
+            _routers.pop(id(self._context), None)
+            self._context = None
+
+    def allow(self, resource_types: Iterable[str] = (), hosts: Iterable[str] = ()):
+        """Let some resource types / hosts through for the rest of the test"""
+        self.rules = self.rules.allowing(resource_types, hosts)
+
+    def _handle(self, route):
+        request = route.request
+        reason = self.rules.block_reason(request.resource_type, request.url)
+        if reason is None:
+            # Not ours to decide: next handler (HAR replay, mocks) or the network
+            route.fallback()
+            return
+        self.stats.blocked[reason] += 1
+        size = self.sizes.get(request.url)
+        if size is None:
+            self.stats.unknown_size += 1
+        else:
+            self.stats.bytes_saved += size
+        route.abort("blockedbyclient")
+
+    def _on_response(self, response):
+        # Learn sizes of requests that would be blocked under the default rules
+        request = response.request
+        if self.default_rules.block_reason(request.resource_type, request.url) is None:
+            return
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.sizes.record(request.url, int(length))
+
+
+# Routers by context, so page objects can apply their overrides
+_routers: Dict[int, RequestRouter] = {}
+
+# Totals over the whole session
+session_stats = RoutingStats()
+
+
+def router_for(context) -> Optional[RequestRouter]:
+    """The router installed on a context, if any"""
+    return _routers.get(id(context))
+
+
+def install_router(context, node=None) -> RequestRouter:
+    """Install the router on a new context (ROUTING_ENABLED=false: only learn asset sizes)"""
+    router = RequestRouter().install(context, block=ROUTING_ENABLED)
+    marker = node.get_closest_marker("allow_resources") if node is not None else None
+    if marker:
+        router.allow(resource_types=marker.args, hosts=marker.kwargs.get("hosts", ()))
+    return router
+
+
+# Global singleton instance
+_asset_sizes = None
+
+
+def get_asset_sizes() -> AssetSizes:
+    """Get or create asset size cache singleton"""
+    global _asset_sizes
+    if _asset_sizes is None:
+        _asset_sizes = AssetSizes()
+    return _asset_sizes
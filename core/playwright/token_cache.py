@@ -0,0 +1,123 @@
+# core/playwright/token_cache.py
+"""
+Session-wide JWT cache for AuthService.
+
+Tokens are keyed by (email, company_id, BASE_API) and reused until they are within
+TOKEN_REFRESH_MARGIN seconds of their `exp` claim. The cache lives in memory
+for the current process and in a locked JSON file on disk so parallel
+workers share one token per credential instead of logging in separately.
+The backend is part of the key: toggling MOCK_API never hands the mock's
+tokens to the real API or the other way round.
+"""
+import base64
+import hashlib
+import json
+import time
+from typing import Callable, Optional
+
+from config.env import BASE_API, TOKEN_CACHE_ENABLED, TOKEN_CACHE_PATH, TOKEN_FALLBACK_TTL, TOKEN_REFRESH_MARGIN
+from core.utils.file_lock import file_lock, read_json, write_json_atomic
+
+
+def decode_jwt_exp(token: str) -> Optional[float]:
+    """Return the `exp` claim of a JWT (epoch seconds) without verifying it"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def cache_key(email: str, company_id: str, backend: Optional[str] = None) -> str:
+    """Stable key for a credential on a backend (default BASE_API); hashed so emails don't end up as JSON keys"""
+    backend = (backend if backend is not None else BASE_API or "").rstrip("/").lower()
+    raw = f"{(email or '').strip().lower()}|{company_id or ''}|{backend}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class TokenCache:
+    """Expiry-aware token cache shared across processes through a locked file"""
+
+    def __init__(
+        self,
+        path: str = TOKEN_CACHE_PATH,
+        refresh_margin: int = TOKEN_REFRESH_MARGIN,
+        fallback_ttl: int = TOKEN_FALLBACK_TTL,
+        enabled: bool = TOKEN_CACHE_ENABLED,
+    ):
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self.fallback_ttl = fallback_ttl
+        self.enabled = enabled
+        self._memory = {}
+
+    def _is_fresh(self, entry: Optional[dict]) -> bool:
+        return bool(entry) and entry.get("expires_at", 0) - self.refresh_margin > time.time()
+
+    def get(self, email: str, company_id: str) -> Optional[dict]:
+        """Return the cached entry ({token, expires_at}) if it is still fresh"""
+        key = cache_key(email, company_id)
+        entry = self._memory.get(key)
+        if self._is_fresh(entry):
+            return entry
+        entry = read_json(self.path).get(key)
+        if self._is_fresh(entry):
+            self._memory[key] = entry
+            return entry
+        return None
+
+    def get_or_refresh(self, email: str, company_id: str, fetch: Callable[[], str]) -> str:
+        """
+        Return a fresh token for the credential, calling `fetch` at most once.
+
+        The disk lock is held while fetching, so concurrent workers asking for
+        the same credential wait for the first one and then reuse its token.
+        """
+        if not self.enabled:
+            return fetch()
+
+        entry = self.get(email, company_id)
+        if entry:
+            return entry["token"]
+
+        key = cache_key(email, company_id)
+        with file_lock(self.path):
+            entries = read_json(self.path)
+            entry = entries.get(key)
+            if not self._is_fresh(entry):
+                token = fetch()
+                expires_at = decode_jwt_exp(token) or time.time() + self.fallback_ttl
+                entry = {"token": token, "expires_at": expires_at}
+                entries = {k: v for k, v in entries.items() if v.get("expires_at", 0) > time.time()}
+                entries[key] = entry
+                write_json_atomic(self.path, entries, mode=0o600)
+            self._memory[key] = entry
+        return entry["token"]
+
+    def expires_at(self, email: str, company_id: str) -> Optional[float]:
+        """Expiry (epoch seconds) of the cached token for a credential, if any"""
+        entry = self.get(email, company_id)
+        return entry["expires_at"] if entry else None
+
+    def invalidate(self, email: str, company_id: str):
+        """Drop a credential's token, e.g. after the backend rejected it"""
+        key = cache_key(email, company_id)
+        self._memory.pop(key, None)
+        with file_lock(self.path):
+            entries = read_json(self.path)
+            if entries.pop(key, None) is not None:
+                write_json_atomic(self.path, entries, mode=0o600)
+
+
+# Global singleton instance
+_token_cache = None
+
+def get_token_cache() -> TokenCache:
+    """Get or create token cache singleton"""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache()
+    return _token_cache
@@ -0,0 +1,103 @@
+# core/playwright/video.py
+"""
+Per-test video capture.
+
+VIDEO_MODE decides which tests record at all and which recordings are kept:
+    off               never record
+    on                record and keep every test
+    retain-on-failure record every test, keep only failures (default)
+    on-first-retry    record only when a test is re-run (pytest-rerunfailures
+                      --reruns); first attempts, and so passing tests, pay nothing.
+                      Rejected at startup when the plugin is not loaded
+
+Video files are taken straight from `page.video` of the pages the context
+opened, so teardown never scans the videos directory.
+"""
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from config.env import PLAYWRIGHT_WS_ENDPOINT, VIDEO_HEIGHT, VIDEO_MODE, VIDEO_WIDTH, VIDEOS_DIR
+
+VIDEO_MODES = ("off", "on", "retain-on-failure", "on-first-retry")
+
+
+def check_video_mode(config, mode: str = VIDEO_MODE):
+    """Fail the session at startup on a VIDEO_MODE it cannot honour"""
+    if mode not in VIDEO_MODES:
+        raise pytest.UsageError(f"Unknown VIDEO_MODE '{mode}', expected one of {VIDEO_MODES}")
+    # execution_count comes from pytest-rerunfailures; without it nothing would ever be recorded
+    if mode == "on-first-retry" and not config.pluginmanager.hasplugin("rerunfailures"):
+        raise pytest.UsageError(
+            "VIDEO_MODE=on-first-retry needs the pytest-rerunfailures plugin (pip install -r requirements.txt)"
+        )
+
+
+class VideoCapture:
+    """Decide whether a test records video and collect the resulting files"""
+
+    def __init__(self, node, mode: str = VIDEO_MODE, video_dir: str = VIDEOS_DIR or "videos"):
+        if mode not in VIDEO_MODES:
+            raise ValueError(f"Unknown VIDEO_MODE '{mode}', expected one of {VIDEO_MODES}")
+        self.node = node
+        self.mode = mode
+        self.video_dir = Path(video_dir).absolute()
+        self._videos = []
+
+    @property
+    def enabled(self) -> bool:
+        if self.mode == "off":
+            return False
+        if self.mode == "on-first-retry":
+            # Set by pytest-rerunfailures; 1 on the first attempt
+            return getattr(self.node, "execution_count", 1) > 1
+        return True
+
+    def context_options(self) -> dict:
+        """Keyword arguments for browser.new_context()"""
+        if not self.enabled:
+            return {}
+        self.video_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            "record_video_dir": str(self.video_dir),
+            "record_video_size": {"width": VIDEO_WIDTH, "height": VIDEO_HEIGHT},
+        }
+
+    def track(self, context):
+        """Remember the video of every page the context opens"""
+        if self.enabled:
+            context.on("page", self._on_page)
+
+    def _on_page(self, page):
+        if page.video:
+            self._videos.append(page.video)
+
+    def keep(self, test_failed: bool) -> bool:
+        return self.mode == "on" or test_failed
+
+    def finalize(self, test_failed: bool) -> List[Path]:
+        """
+        Call after the context is closed. Deletes unwanted recordings and
+        returns local paths of the ones to keep.
+        """
+        kept = []
+        for i, video in enumerate(self._videos):
+            try:
+                if not self.keep(test_failed):
+                    video.delete()
+                    continue
+                if PLAYWRIGHT_WS_ENDPOINT:
+                    # Remote browser: the file lives on the server, stream a local copy
+                    name = re.sub(r"[^\w.-]+", "_", self.node.name)
+                    path = self.video_dir / f"{name}-{i}.webm"
+                    video.save_as(path)
+                    video.delete()
+                else:
+                    path = Path(video.path())
+                kept.append(path)
+            except Exception as e:
+                print(f"✗ Failed to finalize video: {e}")
+        self._videos = []
+        return kept
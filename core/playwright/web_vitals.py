@@ -0,0 +1,218 @@
+# core/playwright/web_vitals.py
+"""
+Frontend render metrics per page object.
+
+With WEB_VITALS_MODE=collect (or enforce), BasePage.navigate measures every
+navigation once the page object is ready:
+
+    ttfb_ms, dom_content_loaded_ms, load_ms   Navigation Timing
+    first_paint_ms, fcp_ms                    paint timing
+    lcp_ms, cls                               PerformanceObserver (buffered entries)
+    heap_used_mb                              JS heap through CDP (Chromium only)
+    ready_ms                                  wall time of navigate() itself
+
+Each measurement is attached to the Allure step and appended, tagged with the
+run id, to WEB_VITALS_PATH. Budgets in WEB_VITALS_BUDGETS set warn / fail
+limits per page class (falling back to "default"):
+
+    {"default": {"lcp_ms": {"warn": 2500, "fail": 4000}},
+     "KnowledgeBaseListPage": {"lcp_ms": {"warn": 3000}}}
+
+Exceeding `warn` prints a warning; exceeding `fail` fails the test in
+enforce mode (and warns in collect mode).
+
+    python scripts/web_vitals_report.py       # p75 per page of the last run
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import allure
+from playwright.sync_api import Error
+
+from config.env import WEB_VITALS_BUDGETS, WEB_VITALS_MODE, WEB_VITALS_PATH
+from core.utils.file_lock import append_jsonl, read_json, read_jsonl
+from core.utils.timing_ledger import get_timing_ledger, percentile
+
+METRICS = (
+    "ttfb_ms", "dom_content_loaded_ms", "load_ms", "first_paint_ms", "fcp_ms",
+    "lcp_ms", "cls", "heap_used_mb", "ready_ms",
+)
+
+# Navigation Timing, paint timing and the buffered LCP / layout-shift entries in one call
+_WEB_VITALS_JS = """
+() => {
+    const metrics = {};
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        metrics.ttfb_ms = nav.responseStart;
+        metrics.dom_content_loaded_ms = nav.domContentLoadedEventEnd || null;
+        metrics.load_ms = nav.loadEventEnd || null;
+    }
+    for (const paint of performance.getEntriesByType('paint')) {
+        metrics[paint.name === 'first-paint' ? 'first_paint_ms' : 'fcp_ms'] = paint.startTime;
+    }
+    const buffered = type => {
+        try {
+            const observer = new PerformanceObserver(() => {});
+            observer.observe({ type, buffered: true });
+            const entries = observer.takeRecords();
+            observer.disconnect();
+            return entries;
+        } catch (e) {
+            return null;  // Entry type not supported by this browser
+        }
+    };
+    const lcp = buffered('largest-contentful-paint');
+    if (lcp && lcp.length) metrics.lcp_ms = lcp[lcp.length - 1].startTime;
+    const shifts = buffered('layout-shift');
+    if (shifts) metrics.cls = shifts.filter(s => !s.hadRecentInput).reduce((sum, s) => sum + s.value, 0);
+    return metrics;
+}
+"""
+
+
+def load_budgets(path: str = WEB_VITALS_BUDGETS) -> Dict[str, Dict[str, dict]]:
+    return read_json(path, {}) if path else {}
+
+
+def budget_for(budgets: Dict[str, Dict[str, dict]], page_name: str) -> Dict[str, dict]:
+    """Default limits overridden metric by metric by the page's own"""
+    return {**budgets.get("default", {}), **budgets.get(page_name, {})}
+
+
+def check_budget(metrics: Dict[str, float], budget: Dict[str, dict]) -> List[dict]:
+    """Metrics over their limit: [{"metric", "value", "limit", "level": "warn" | "fail"}]"""
+    violations = []
+    for metric, limits in budget.items():
+        value = metrics.get(metric)
+        if value is None:
+            continue
+        for level in ("fail", "warn"):
+            if level in limits and value > limits[level]:
+                violations.append({"metric": metric, "value": value, "limit": limits[level], "level": level})
+                break
+    return violations
+
+
+def _heap_used_mb(page) -> Optional[float]:
+    """JS heap in use through a CDP session; None where CDP is unavailable"""
+    try:
+        session = page.context.new_cdp_session(page)
+        try:
+            return round(session.send("Runtime.getHeapUsage")["usedSize"] / 1024 / 1024, 2)
+        finally:
+            session.detach()
+    except Error:
+        return None
+
+
+async def _heap_used_mb_async(page) -> Optional[float]:
+    try:
+        session = await page.context.new_cdp_session(page)
+        try:
+            return round((await session.send("Runtime.getHeapUsage"))["usedSize"] / 1024 / 1024, 2)
+        finally:
+            await session.detach()
+    except Error:
+        return None
+
+
+class WebVitals:
+    """Measure navigations, check budgets and buffer results for the metrics file"""
+
+    def __init__(self, path: str = WEB_VITALS_PATH, mode: str = WEB_VITALS_MODE, budgets: Optional[dict] = None):
+        self.path = Path(path)
+        self.mode = mode
+        self.budgets = load_budgets() if budgets is None else budgets
+        self._pending: List[dict] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode in ("collect", "enforce")
+
+    def measure(self, page, page_name: str, url: str, ready_ms: float) -> Dict[str, float]:
+        """Read the metrics of the current document; raises AssertionError on a `fail` budget in enforce mode"""
+        try:
+            metrics = page.evaluate(_WEB_VITALS_JS)
+        except Error as e:
+            print(f"⚠ Could not read Web Vitals for {page_name}: {e}")
+            return {}
+        return self._record(page_name, url, metrics, _heap_used_mb(page), ready_ms)
+
+    async def measure_async(self, page, page_name: str, url: str, ready_ms: float) -> Dict[str, float]:
+        """measure() for a page of the async API"""
+        try:
+            metrics = await page.evaluate(_WEB_VITALS_JS)
+        except Error as e:
+            print(f"⚠ Could not read Web Vitals for {page_name}: {e}")
+            return {}
+        return self._record(page_name, url, metrics, await _heap_used_mb_async(page), ready_ms)
+
+    def _record(
+        self, page_name: str, url: str, metrics: Dict[str, float], heap: Optional[float], ready_ms: float
+    ) -> Dict[str, float]:
+        metrics = {name: round(value, 3 if name == "cls" else 1) for name, value in metrics.items() if value is not None}
+        if heap is not None:
+            metrics["heap_used_mb"] = heap
+        metrics["ready_ms"] = round(ready_ms, 1)
+
+        ledger = get_timing_ledger()
+        violations = check_budget(metrics, budget_for(self.budgets, page_name))
+        self._pending.append({
+            "run": ledger.run_id, "page": page_name, "url": url, "test": ledger.current_test,
+            "metrics": metrics, "violations": violations,
+        })
+        allure.attach(
+            json.dumps({"url": url, "metrics": metrics, "violations": violations}, indent=2),
+            name=f"Web Vitals: {page_name}",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        failures = []
+        for violation in violations:
+            message = f"{violation['metric']} {violation['value']} > {violation['limit']}"
+            if violation["level"] == "fail" and self.mode == "enforce":
+                failures.append(message)
+            else:
+                print(f"⚠ {page_name} over {violation['level']} budget: {message}")
+        if failures:
+            raise AssertionError(f"{page_name} exceeded its performance budget: {', '.join(failures)}")
+        return metrics
+
+    def flush(self) -> int:
+        """Append buffered measurements (safe across parallel workers)"""
+        written = append_jsonl(self.path, self._pending)
+        self._pending = []
+        return written
+
+    def report(self, run: Optional[str] = "last", pct: float = 75) -> Dict[str, Dict[str, float]]:
+        """Percentile (p75, as Web Vitals are usually judged) of every metric per page, plus the sample count"""
+        entries = read_jsonl(self.path)
+        if run == "last" and entries:
+            run = entries[-1]["run"]
+        samples: Dict[str, Dict[str, List[float]]] = {}
+        for entry in entries:
+            if run and entry.get("run") != run:
+                continue
+            page_samples = samples.setdefault(entry["page"], {})
+            for metric, value in entry["metrics"].items():
+                page_samples.setdefault(metric, []).append(value)
+        report = {}
+        for page_name, page_samples in sorted(samples.items()):
+            row = {metric: percentile(values, pct) for metric, values in page_samples.items()}
+            row["count"] = max(len(values) for values in page_samples.values())
+            report[page_name] = row
+        return report
+
+
+# Global singleton instance
+_web_vitals = None
+
+
+def get_web_vitals() -> WebVitals:
+    """Get or create Web Vitals collector singleton"""
+    global _web_vitals
+    if _web_vitals is None:
+        _web_vitals = WebVitals()
+    return _web_vitals
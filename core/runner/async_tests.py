@@ -0,0 +1,212 @@
+# core/runner/async_tests.py
+"""
+`async def` tests and the async fixtures, on an event loop of their own.
+
+Sync Playwright registers its loop as the main thread's running loop while it
+is started, and the session-wide `browser` fixture keeps it started. After any
+sync browser test, no other loop can run on the main thread: pytest-asyncio
+and asyncio.run() both fail. So async tests and fixtures run on one event
+loop in a worker thread, started on first use and kept for the session:
+
+    async def test_edit_contacts(async_pages, make_contact):    # no mark needed
+        pages = await async_pages(5)
+        ...
+
+Fixtures hand coroutines to the loop with `get_async_loop().run(coro)` (see
+fixtures/async_fixtures.py).
+
+Allure keeps its step stack per thread, and the loop thread would attach steps
+to whatever test it first saw. The body's steps and attachments are therefore
+captured per asyncio task (ContextVars) and written into the test's own result
+when it finishes. Coroutines run side by side with asyncio.gather get sibling
+steps instead of nesting inside each other.
+"""
+import asyncio
+import inspect
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import allure_commons
+import pytest
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment, Parameter, TestStepResult
+from allure_commons.types import AttachmentType
+from allure_commons.utils import now
+from allure_pytest.utils import get_status, get_status_details
+
+# The test (or concurrent case) whose coroutine is running, and its innermost open step in this task
+_current_case: ContextVar[Optional["CaseRecord"]] = ContextVar("async_case", default=None)
+_current_step: ContextVar[Optional[TestStepResult]] = ContextVar("async_step", default=None)
+
+
+class CaseRecord:
+    """One async test body (or concurrent case): its outcome and the Allure steps it produced"""
+
+    def __init__(self, item):
+        self.item = item
+        self.steps: List[TestStepResult] = []
+        self.attachments: List[Attachment] = []
+        self.error: Optional[BaseException] = None
+        self._open_steps: Dict[str, Tuple[TestStepResult, object]] = {}
+
+    def _innermost(self):
+        return _current_step.get() or self
+
+    def start_step(self, uuid: str, step: TestStepResult):
+        self._innermost().steps.append(step)
+        self._open_steps[uuid] = (step, _current_step.set(step))
+
+    def stop_step(self, uuid: str, exc_type, exc_val, exc_tb):
+        step, token = self._open_steps.pop(uuid, (None, None))
+        if step is None:
+            return
+        step.stop = now()
+        step.status = get_status(exc_val)
+        step.statusDetails = get_status_details(exc_type, exc_val, exc_tb)
+        try:
+            _current_step.reset(token)
+        except ValueError:
+            # Stopped from another task than the one that started it
+            _current_step.set(None)
+
+    def attach(self, name, attachment_type, extension) -> str:
+        """Record an attachment on the innermost open step; returns the file name to write it to"""
+        mime_type = attachment_type
+        extension = extension or "attach"
+        if isinstance(attachment_type, AttachmentType):
+            extension = attachment_type.extension
+            mime_type = attachment_type.mime_type
+        file_name = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=extension)
+        self._innermost().attachments.append(Attachment(source=file_name, name=name, type=mime_type))
+        return file_name
+
+
+class StepCapture:
+    """allure_commons plugin: routes steps and attachments to the case that produced them"""
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        case = _current_case.get()
+        if case is not None:
+            parameters = [Parameter(name=name, value=value) for name, value in params.items()]
+            case.start_step(uuid, TestStepResult(name=title, start=now(), parameters=parameters))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        case = _current_case.get()
+        if case is not None:
+            case.stop_step(uuid, exc_type, exc_val, exc_tb)
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        case = _current_case.get()
+        if case is not None:
+            file_name = case.attach(name, attachment_type, extension)
+            allure_commons.plugin_manager.hook.report_attached_data(body=body, file_name=file_name)
+
+    @allure_commons.hookimpl
+    def attach_file(self, source, name, attachment_type, extension):
+        case = _current_case.get()
+        if case is not None:
+            file_name = case.attach(name, attachment_type, extension)
+            allure_commons.plugin_manager.hook.report_attached_file(source=source, file_name=file_name)
+
+
+@contextmanager
+def capture_steps(config):
+    """Route Allure steps to CaseRecords instead of the current test while the block runs"""
+    listener = config.pluginmanager.get_plugin("allure_listener")
+    if listener is None:
+        yield
+        return
+    capture = StepCapture()
+    allure_commons.plugin_manager.unregister(listener)
+    allure_commons.plugin_manager.register(capture)
+    try:
+        yield
+    finally:
+        allure_commons.plugin_manager.unregister(capture)
+        allure_commons.plugin_manager.register(listener)
+
+
+def attach_case(item, case: CaseRecord):
+    """Write a case's captured steps and attachments into the item's Allure result"""
+    listener = item.config.pluginmanager.get_plugin("allure_listener")
+    if listener is None:
+        return
+    test_result = listener.allure_logger.get_test(None)
+    if test_result is not None:
+        test_result.steps.extend(case.steps)
+        test_result.attachments.extend(case.attachments)
+
+
+class AsyncLoop:
+    """An event loop running in a daemon thread; run() blocks the caller until a coroutine is done"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="async-tests", daemon=True)
+        self._thread.start()
+
+    def run(self, coro, case: Optional[CaseRecord] = None):
+        """Run a coroutine on the loop and return its result; `case` collects its Allure steps"""
+        async def in_case():
+            _current_case.set(case)
+            return await coro
+
+        return asyncio.run_coroutine_threadsafe(in_case(), self.loop).result()
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+
+class AsyncTests:
+    """pytest plugin: runs `async def` tests on the session's async loop"""
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        # `concurrent` tests are run by their group (core/runner/concurrent.py)
+        if not inspect.iscoroutinefunction(pyfuncitem.obj) or pyfuncitem.get_closest_marker("concurrent"):
+            return None
+        kwargs = {arg: pyfuncitem.funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames}
+        case = CaseRecord(pyfuncitem)
+        try:
+            with capture_steps(pyfuncitem.config):
+                get_async_loop().run(pyfuncitem.obj(**kwargs), case)
+        finally:
+            attach_case(pyfuncitem, case)
+        return True
+
+    def pytest_unconfigure(self, config):
+        close_async_loop()
+
+
+def install_async_tests(config) -> AsyncTests:
+    """Register the async test runner with pytest"""
+    plugin = AsyncTests()
+    config.pluginmanager.register(plugin, "async_tests")
+    return plugin
+
+
+# Global singleton instance
+_async_loop = None
+
+def get_async_loop() -> AsyncLoop:
+    """Get or create the async loop singleton"""
+    global _async_loop
+    if _async_loop is None:
+        _async_loop = AsyncLoop()
+    return _async_loop
+
+
+def close_async_loop():
+    """Stop the loop thread if it was ever started"""
+    global _async_loop
+    if _async_loop is not None:
+        _async_loop.close()
+        _async_loop = None
@@ -0,0 +1,72 @@
+# core/runner/browser_server.py
+"""
+Shared Chromium browser server for parallel workers.
+
+The Python API has no `launch_server`, so this drives the bundled Playwright
+driver's `launch-server` command (the same code path as Node's
+`browserType.launchServer`). Workers attach with `chromium.connect(ws_endpoint)`.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Optional
+
+from config.env import HEADLESS
+
+
+class BrowserServer:
+    """Start one Chromium server process and expose its websocket endpoint"""
+
+    def __init__(self, headless: bool = HEADLESS):
+        self.headless = headless
+        self.ws_endpoint: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._config_path: Optional[str] = None
+
+    def start(self) -> str:
+        """Launch the server and return its ws endpoint"""
+        fd, self._config_path = tempfile.mkstemp(prefix="browser-server-", suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"headless": self.headless}, f)
+
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server", "--browser", "chromium", "--config", self._config_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+
+        # The driver prints the endpoint as its first line of output
+        line = self._process.stdout.readline().strip()
+        if not line.startswith("ws://"):
+            self.stop()
+            raise RuntimeError(f"Browser server failed to start: {line or 'no output'}")
+
+        self.ws_endpoint = line
+        # Keep draining driver output so the pipe never fills up
+        threading.Thread(target=self._process.stdout.read, daemon=True).start()
+        print(f"✓ Browser server started: {self.ws_endpoint}")
+        return self.ws_endpoint
+
+    def stop(self):
+        """Terminate the server process"""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        if self._config_path and os.path.exists(self._config_path):
+            os.remove(self._config_path)
+        self._config_path = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
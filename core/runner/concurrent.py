@@ -0,0 +1,142 @@
+# core/runner/concurrent.py
+"""
+Concurrent parametrizations within one pytest session.
+
+`@pytest.mark.concurrent` on a parametrized `async def` test declares its cases
+independent: they run at the same time, each in its own context of one
+browser, so a homogeneous matrix takes about as long as its slowest case:
+
+    @pytest.mark.concurrent
+    @pytest.mark.parametrize("type_name", ["voice", "whatsapp", "chatbot", "sms"])
+    async def test_create_assistant_all_types(concurrent_page, api_data, type_name):
+        ...
+
+The first case of a group to reach its call phase runs every remaining case
+of the group on the session's async loop (core/runner/async_tests.py). Each
+case then reports its own outcome when pytest gets to it. Allure steps and
+attachments are captured per case while the group runs and written into that
+case's result, so the report keeps one result per parameter.
+
+Per case the test gets its own parameters and `concurrent_page`, a page in a
+fresh context with the test's storage_state (no browser is started when no
+case asks for it). Every other fixture is set up for the case that runs the
+group and shared by all of them: api_data and the data factories are safe to
+share, the sync `page` / `context` fixtures cannot be used. Video, HAR and
+routing are not recorded for concurrent cases. CONCURRENT_CASES caps how many
+cases of a group run at once (1 = one after another).
+"""
+import asyncio
+import inspect
+from typing import Dict, List
+
+import pytest
+from playwright.async_api import async_playwright
+
+from config.env import CONCURRENT_CASES
+from core.playwright.async_context import launch_async_browser, new_async_context
+from core.playwright.context import storage_state_for
+from core.runner.async_tests import CaseRecord, _current_case, attach_case, capture_steps, get_async_loop
+
+PAGE_ARG = "concurrent_page"
+
+
+class ConcurrentGroup:
+    """The collected cases of one `concurrent` test function"""
+
+    def __init__(self, items: list):
+        self.items = items
+        self.cases: Dict[str, CaseRecord] = {}
+
+    def outcome(self, item) -> CaseRecord:
+        """The item's case, running it (with every later case not run yet) first if needed"""
+        if item.nodeid not in self.cases:
+            pending = [CaseRecord(i) for i in self.items[self.items.index(item):] if i.nodeid not in self.cases]
+            self.run(item, pending)
+        return self.cases.pop(item.nodeid)
+
+    def run(self, leader, cases: List[CaseRecord]):
+        """Run the cases concurrently, sharing the leader's fixtures"""
+        # Keep steps off the leader's Allure result while the group runs
+        with capture_steps(leader.config):
+            get_async_loop().run(self._run_cases(leader, cases))
+        for case in cases:
+            self.cases[case.item.nodeid] = case
+        print(f"✓ Ran {len(cases)} cases of {leader.originalname} concurrently")
+
+    async def _run_cases(self, leader, cases: List[CaseRecord]):
+        limit = asyncio.Semaphore(max(1, CONCURRENT_CASES))
+        if not any(PAGE_ARG in case.item._fixtureinfo.argnames for case in cases):
+            await asyncio.gather(*(self._run_case(leader, case, limit) for case in cases))
+            return
+        async with async_playwright() as p:
+            browser = await launch_async_browser(p)
+            try:
+                await asyncio.gather(*(self._run_case(leader, case, limit, browser) for case in cases))
+            finally:
+                await browser.close()
+
+    async def _run_case(self, leader, case: CaseRecord, limit: asyncio.Semaphore, browser=None):
+        item = case.item
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        kwargs = {
+            arg: params[arg] if arg in params else leader.funcargs[arg]
+            for arg in item._fixtureinfo.argnames
+        }
+        async with limit:
+            context = None
+            token = _current_case.set(case)
+            try:
+                if PAGE_ARG in kwargs:
+                    context = await new_async_context(browser, storage_state_for(item))
+                    kwargs[PAGE_ARG] = await context.new_page()
+                await item.obj(**kwargs)
+            except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
+                raise
+            except BaseException as e:
+                # pytest.fail / pytest.skip raise BaseException subclasses
+                case.error = e
+            finally:
+                _current_case.reset(token)
+                if context is not None:
+                    await context.close()
+
+
+class ConcurrentGroups:
+    """pytest plugin: groups `concurrent` tests by function and reports each case from its group"""
+
+    def __init__(self):
+        self._groups: Dict[str, ConcurrentGroup] = {}
+
+    # After -k / -m selection and sharding: a group only holds cases this session runs
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        members: Dict[tuple, list] = {}
+        for item in items:
+            if item.get_closest_marker("concurrent") is None:
+                continue
+            if not inspect.iscoroutinefunction(item.obj):
+                raise pytest.UsageError(f"{item.nodeid}: concurrent tests must be `async def`")
+            members.setdefault((item.parent.nodeid, item.originalname), []).append(item)
+        self._groups = {}
+        for group_items in members.values():
+            group = ConcurrentGroup(group_items)
+            for item in group_items:
+                self._groups[item.nodeid] = group
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        group = self._groups.get(pyfuncitem.nodeid)
+        if group is None:
+            return None
+        case = group.outcome(pyfuncitem)
+        attach_case(pyfuncitem, case)
+        if case.error is not None:
+            raise case.error
+        return True
+
+
+def install_concurrent(config) -> ConcurrentGroups:
+    """Register the `concurrent` mark's plugin with pytest"""
+    plugin = ConcurrentGroups()
+    config.pluginmanager.register(plugin, "concurrent_groups")
+    return plugin
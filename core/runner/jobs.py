@@ -0,0 +1,139 @@
+# core/runner/jobs.py
+"""
+Job queue for the test runner API.
+
+Every run request becomes a Job with an ID and a state machine
+(queued -> running -> passed | failed). A fixed number of dispatcher threads
+caps how many pytest runs execute at once; extra jobs wait in the queue.
+Each job writes Allure results into its own directory so concurrent runs
+never mix their files.
+"""
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from config.env import RUNNER_JOB_HISTORY, RUNNER_MAX_CONCURRENT_JOBS
+
+QUEUED = "queued"
+RUNNING = "running"
+PASSED = "passed"
+FAILED = "failed"
+FINISHED_STATES = (PASSED, FAILED)
+
+
+@dataclass
+class Job:
+    """One pytest run requested through the API"""
+    id: str
+    test_path: str
+    args: List[str]
+    results_dir: str
+    state: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        if self.started_at:
+            data["duration_seconds"] = round((self.finished_at or time.time()) - self.started_at, 1)
+        return data
+
+
+def default_max_concurrent() -> int:
+    """RUNNER_MAX_CONCURRENT_JOBS, or half the CPU cores when unset"""
+    return max(1, RUNNER_MAX_CONCURRENT_JOBS or (os.cpu_count() or 2) // 2)
+
+
+def run_in_subprocess(job: Job) -> int:
+    """Default job runner: a fresh pytest process"""
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", job.test_path, f"--alluredir={job.results_dir}", *job.args]
+    ).returncode
+
+
+class JobManager:
+    """Queue jobs and run at most `max_concurrent` of them at a time"""
+
+    def __init__(
+        self,
+        results_root: str = "allure-results",
+        max_concurrent: Optional[int] = None,
+        runner: Callable[[Job], int] = run_in_subprocess,
+        history: int = RUNNER_JOB_HISTORY,
+    ):
+        self.results_root = results_root
+        self.max_concurrent = max(1, max_concurrent or default_max_concurrent())
+        self.runner = runner
+        self.history = history
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: "queue.Queue[Job]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._dispatchers = [
+            threading.Thread(target=self._dispatch, name=f"job-dispatcher-{i}", daemon=True)
+            for i in range(self.max_concurrent)
+        ]
+        for thread in self._dispatchers:
+            thread.start()
+
+    def submit(self, test_path: str, args: Optional[List[str]] = None) -> Job:
+        """Queue a pytest run and return its Job"""
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(
+            id=job_id,
+            test_path=test_path,
+            args=list(args or []),
+            results_dir=str(Path(self.results_root) / job_id),
+        )
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune()
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def counts(self) -> dict:
+        """Number of jobs per state"""
+        counts = {state: 0 for state in (QUEUED, RUNNING, PASSED, FAILED)}
+        for job in self.list():
+            counts[job.state] += 1
+        return counts
+
+    def _prune(self):
+        # Forget the oldest finished jobs beyond the history limit
+        finished = [job_id for job_id, job in self._jobs.items() if job.state in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def _dispatch(self):
+        while True:
+            job = self._queue.get()
+            job.state = RUNNING
+            job.started_at = time.time()
+            try:
+                Path(job.results_dir).mkdir(parents=True, exist_ok=True)
+                job.exit_code = self.runner(job)
+                job.state = PASSED if job.exit_code == 0 else FAILED
+            except Exception as e:
+                job.error = str(e)
+                job.state = FAILED
+            finally:
+                job.finished_at = time.time()
+                self._queue.task_done()
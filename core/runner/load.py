@@ -0,0 +1,332 @@
+# core/runner/load.py
+"""
+Browser-based load generation from the regression flows.
+
+N virtual users run concurrently against one shared browser server, each in
+its own browser context (its own Playwright connection, since the sync API
+is per thread). Every user picks scenarios from a weighted mix until the
+duration is up; users start staggered over the ramp-up period:
+
+    python scripts/load_test.py -u 10 -d 300 --ramp-up 60 --mix browse=4,edit_contact=2
+
+Scenarios drive the same flows as the tests (LoginFlow, ContactFormFlow,
+KnowledgeBaseFormFlow, UpdateAssistantFlow, list flows). Their Allure steps
+are timed through allure-python-commons hooks, so the report shows
+throughput, scenario latency and per-step latency percentiles. Records a
+scenario needs are created through the API once per user and deleted at the
+end; assistants are leased from the pool.
+
+With MOCK_API=true the browsers talk to the local mock API instead of the
+real backend.
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import allure_commons
+from playwright.sync_api import sync_playwright
+
+from config.env import (
+    BASE_URL,
+    LOAD_DURATION,
+    LOAD_MIX,
+    LOAD_RAMP_UP,
+    LOAD_THINK_TIME_MS,
+    LOAD_USERS,
+    LOGIN_CODE,
+    LOGIN_EMAIL,
+    MOCK_API,
+    TIMING_LEDGER_PATH,
+)
+from core.api.assistant_pool import AssistantPool
+from core.api.client import ApiClient
+from core.api.resources import DataFactory, unique_suffix
+from core.mock_api.server import MockApiServer
+from core.playwright.context import get_storage_state_manager
+from core.playwright.mock_api import redirect_api
+from core.runner.browser_server import BrowserServer
+from core.utils.timing_ledger import new_run_id, percentile
+from flows.assistant.update_assistant_flow import UpdateAssistantFlow
+from flows.contacts.contact_form_flow import ContactFormFlow
+from flows.contacts.contacts_list_flow import ContactsListFlow
+from flows.knowledgebase.knowledgebase_form_flow import KnowledgeBaseFormFlow
+from flows.knowledgebase.knowledgebase_list_flow import KnowledgeBaseListFlow
+from flows.login_flow import LoginFlow
+from flows.users.users_list_flow import UsersListFlow
+from pages.assistant.assistants_page import AssistantsPage
+
+
+# --- Scenarios: one user action sequence each, built from the flows ---
+
+def browse_lists(user: "VirtualUser"):
+    ContactsListFlow(user.page).navigate_to_contacts(BASE_URL)
+    UsersListFlow(user.page).navigate_to_users(BASE_URL)
+    KnowledgeBaseListFlow(user.page).navigate_and_wait()
+
+
+def edit_contact(user: "VirtualUser"):
+    contact = user.record("contact", user.data.contact)
+    flow = ContactFormFlow(user.page)
+    flow.navigate_to_edit_contact(BASE_URL, contact.id)
+    flow.edit_contact(last_name=f"Load{unique_suffix()}")
+
+
+def edit_kb_entry(user: "VirtualUser"):
+    entry = user.record("kb_article", user.data.kb_article)
+    KnowledgeBaseFormFlow(user.page).edit_entry_title(entry.id, f"Load Article {unique_suffix()}")
+
+
+def update_assistant(user: "VirtualUser"):
+    assistant = user.record("assistant", lambda: user.pool.lease("voice", holder=user.holder))
+    AssistantsPage(user.page).open_detail(BASE_URL, assistant.id)
+    UpdateAssistantFlow(user.page).update_basic_fields(f"{assistant.name}-{unique_suffix()}", "Updated under load")
+
+
+def login(user: "VirtualUser"):
+    """The full email + OTP login, in a fresh context without the user's session"""
+    context = user.browser.new_context()
+    try:
+        if MOCK_API:
+            redirect_api(context)
+        if not LoginFlow(context.new_page()).complete_login(LOGIN_EMAIL, LOGIN_CODE):
+            raise AssertionError("Login did not complete")
+    finally:
+        context.close()
+
+
+SCENARIOS: Dict[str, Callable[["VirtualUser"], None]] = {
+    "browse": browse_lists,
+    "edit_contact": edit_contact,
+    "edit_kb_entry": edit_kb_entry,
+    "update_assistant": update_assistant,
+    "login": login,
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """"browse=4,login=1" -> {"browse": 4.0, "login": 1.0}; unknown scenarios raise ValueError"""
+    weights = {}
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}' (available: {', '.join(SCENARIOS)})")
+        weights[name] = float(weight or 1)
+    if not weights or not any(weights.values()):
+        raise ValueError("The scenario mix is empty")
+    return weights
+
+
+def start_delays(users: int, ramp_up: float) -> List[float]:
+    """Linear ramp: user i starts at i / users of the ramp-up period"""
+    return [ramp_up * i / users for i in range(users)]
+
+
+class LoadStats:
+    """Thread-safe scenario and step timings; registered as an allure_commons plugin"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Dict[str, Tuple[str, float]] = {}
+        self.step_ms: Dict[str, List[float]] = {}
+        self.scenario_ms: Dict[str, List[float]] = {}
+        self.errors: Dict[str, List[str]] = {}
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        with self._lock:
+            self._steps[uuid] = (title, time.perf_counter())
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        with self._lock:
+            started = self._steps.pop(uuid, None)
+            if started:
+                title, start = started
+                # "Navigate to edit contact page: <id>" -> one name for every id
+                name = title.split(":")[0]
+                self.step_ms.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+
+    def record(self, scenario: str, elapsed_ms: float, error: Optional[str] = None):
+        with self._lock:
+            if error:
+                self.errors.setdefault(scenario, []).append(error)
+            else:
+                self.scenario_ms.setdefault(scenario, []).append(elapsed_ms)
+
+    def report(self) -> dict:
+        elapsed = (self.finished or time.monotonic()) - self.started
+
+        def latencies(values: List[float]) -> dict:
+            return {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+            }
+
+        with self._lock:
+            completed = sum(len(values) for values in self.scenario_ms.values())
+            failed = sum(len(values) for values in self.errors.values())
+            return {
+                "duration_s": round(elapsed, 1),
+                "iterations": completed,
+                "errors": failed,
+                "throughput_per_min": round(completed / elapsed * 60, 1) if elapsed else 0.0,
+                "scenarios": {
+                    name: {**latencies(values), "errors": len(self.errors.get(name, []))}
+                    for name, values in sorted(self.scenario_ms.items())
+                },
+                "failed_scenarios": {
+                    name: {"errors": len(errors), "last_error": errors[-1]}
+                    for name, errors in self.errors.items() if name not in self.scenario_ms
+                },
+                "steps": dict(sorted(
+                    ((name, latencies(values)) for name, values in self.step_ms.items()),
+                    key=lambda item: item[1]["p95_ms"],
+                    reverse=True,
+                )),
+            }
+
+
+class VirtualUser(threading.Thread):
+    """One simulated user: own Playwright connection and context, weighted scenario loop"""
+
+    def __init__(
+        self,
+        index: int,
+        ws_endpoint: str,
+        mix: Dict[str, float],
+        stats: LoadStats,
+        stop_at: float,
+        start_delay: float = 0.0,
+        think_time_ms: int = LOAD_THINK_TIME_MS,
+        stop_event: Optional[threading.Event] = None,
+    ):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.index = index
+        self.ws_endpoint = ws_endpoint
+        self.mix = mix
+        self.stats = stats
+        self.stop_at = stop_at
+        self.start_delay = start_delay
+        self.think_time_ms = think_time_ms
+        self.stop_event = stop_event or threading.Event()
+        self.holder = f"load-{uuid.uuid4().hex[:8]}:{index}"
+        self.browser = None
+        self.page = None
+        self.data: Optional[DataFactory] = None
+        self.pool: Optional[AssistantPool] = None
+        self._records: Dict[str, object] = {}
+
+    def record(self, key: str, create: Callable[[], object]):
+        """A record this user's scenarios reuse, created on first use"""
+        if key not in self._records:
+            self._records[key] = create()
+        return self._records[key]
+
+    def _running(self) -> bool:
+        return time.monotonic() < self.stop_at and not self.stop_event.is_set()
+
+    def run(self):
+        if self.stop_event.wait(self.start_delay):
+            return
+        client = ApiClient()
+        self.data = DataFactory(client)
+        self.pool = AssistantPool(client)
+        rng = random.Random(self.index)
+        names, weights = list(self.mix), list(self.mix.values())
+        with sync_playwright() as playwright:
+            self.browser = playwright.chromium.connect(self.ws_endpoint)
+            context = self.browser.new_context(storage_state=get_storage_state_manager().get_state_path())
+            if MOCK_API:
+                redirect_api(context)
+            self.page = context.new_page()
+            try:
+                while self._running():
+                    scenario = rng.choices(names, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        SCENARIOS[scenario](self)
+                        self.stats.record(scenario, (time.perf_counter() - start) * 1000)
+                    except Exception as e:
+                        self.stats.record(scenario, 0, error=f"{type(e).__name__}: {e}"[:300])
+                    self.stop_event.wait(rng.uniform(0.5, 1.5) * self.think_time_ms / 1000)
+            finally:
+                context.close()
+                self.browser.close()
+                self._cleanup()
+        client.close()
+
+    def _cleanup(self):
+        assistant = self._records.get("assistant")
+        if assistant is not None:
+            self.pool.release(assistant)
+        self.data.cleanup()
+
+
+class LoadRunner:
+    """Run virtual users over a shared browser server and report the results"""
+
+    def __init__(
+        self,
+        users: int = LOAD_USERS,
+        duration: float = LOAD_DURATION,
+        ramp_up: float = LOAD_RAMP_UP,
+        mix: str = LOAD_MIX,
+        think_time_ms: int = LOAD_THINK_TIME_MS,
+    ):
+        self.users = users
+        self.duration = duration
+        self.ramp_up = min(ramp_up, duration)
+        self.mix = parse_mix(mix)
+        self.think_time_ms = think_time_ms
+        self.run_id = new_run_id()
+
+    def run(self) -> dict:
+        stats = LoadStats()
+        stop_event = threading.Event()
+        allure_commons.plugin_manager.register(stats)
+        print(
+            f"Load run {self.run_id}: {self.users} users, {self.duration:g}s "
+            f"(ramp-up {self.ramp_up:g}s), mix {self.mix}"
+        )
+        try:
+            with BrowserServer() as server, (MockApiServer() if MOCK_API else nullcontext()):
+                # Write the storage state once instead of every user logging in at the same moment
+                get_storage_state_manager().get_state_path()
+                stop_at = time.monotonic() + self.duration
+                users = [
+                    VirtualUser(i, server.ws_endpoint, self.mix, stats, stop_at, delay, self.think_time_ms, stop_event)
+                    for i, delay in enumerate(start_delays(self.users, self.ramp_up))
+                ]
+                for user in users:
+                    user.start()
+                try:
+                    for user in users:
+                        # Let users finish their current scenario, but not forever
+                        user.join(timeout=max(0.0, stop_at - time.monotonic()) + 120)
+                except KeyboardInterrupt:
+                    print("⚠ Interrupted, stopping users")
+                    stop_event.set()
+                    for user in users:
+                        user.join(timeout=60)
+        finally:
+            stats.finished = time.monotonic()
+            allure_commons.plugin_manager.unregister(stats)
+
+        report = {"run": self.run_id, "users": self.users, "mix": self.mix, **stats.report()}
+        path = Path(TIMING_LEDGER_PATH).parent / f"load-{self.run_id}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+        report["path"] = str(path)
+        return report
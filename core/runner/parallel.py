@@ -0,0 +1,121 @@
+# core/runner/parallel.py
+"""
+Parallel multi-worker pytest executor.
+
+Collects the selected tests once, splits them across N worker processes
+(balanced by historical durations, see core/runner/shards.py) and
+runs each worker as its own pytest session connected to one shared browser
+server. Every worker writes Allure results to a private directory; they are
+merged into a single results directory when the run finishes.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import nullcontext
+from pathlib import Path
+from typing import List, Optional
+
+from config.env import MOCK_API, PARALLEL_WORKERS, TIMING_LEDGER
+from core.mock_api.server import MockApiServer
+from core.runner.browser_server import BrowserServer
+from core.runner.shards import plan_shards
+from core.utils.timing_ledger import get_timing_ledger, new_run_id
+
+RESULTS_DIR = "allure-results"
+
+
+def default_worker_count() -> int:
+    """PARALLEL_WORKERS if set, otherwise one worker per CPU core"""
+    return PARALLEL_WORKERS or os.cpu_count() or 1
+
+
+def collect_node_ids(pytest_args: List[str]) -> List[str]:
+    """Return the node ids pytest would run for the given arguments"""
+    # Drop pytest.ini's addopts: its -q on top of ours prints per-file counts instead of node ids
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-o", "addopts=", "-p", "no:cacheprovider", *pytest_args],
+        capture_output=True,
+        text=True,
+    )
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    if result.returncode not in (0, 5) and not node_ids:
+        raise RuntimeError(f"Test collection failed:\n{result.stdout}\n{result.stderr}")
+    return node_ids
+
+
+def merge_results(worker_dirs: List[Path], results_dir: str = RESULTS_DIR):
+    """Move every worker's Allure files into one results directory"""
+    target = Path(results_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    for worker_dir in worker_dirs:
+        if not worker_dir.exists():
+            continue
+        # Allure names result/attachment files by UUID, so they never collide
+        for file in worker_dir.iterdir():
+            shutil.move(str(file), target / file.name)
+        worker_dir.rmdir()
+
+
+def print_slowest_steps(run_id: str, top: int = 10):
+    """Slowest Allure steps of a run, by total time across all workers"""
+    rows = get_timing_ledger().report(kind="step", run=run_id, top=top)
+    if not rows:
+        return
+    print(f"Slowest steps (run {run_id}, python scripts/timing_report.py --run {run_id} for more):")
+    for row in rows:
+        print(f"  {row['total_ms']:>10.0f} ms  {row['count']:>4}x  {row['name']}")
+
+
+class ParallelExecutor:
+    """Run a pytest selection across N workers sharing one browser server"""
+
+    def __init__(self, workers: Optional[int] = None, results_dir: str = RESULTS_DIR):
+        self.workers = workers or default_worker_count()
+        self.results_dir = results_dir
+
+    def plan(self, node_ids: List[str]) -> List[List[str]]:
+        """Assign node ids to workers, balanced by historical durations"""
+        return [shard for shard in plan_shards(node_ids, self.workers) if shard]
+
+    def run(self, pytest_args: List[str]) -> int:
+        """Run the selection and return the combined pytest exit code"""
+        node_ids = collect_node_ids(pytest_args)
+        if not node_ids:
+            print("No tests collected")
+            return 5
+
+        buckets = self.plan(node_ids)
+        print(f"Running {len(node_ids)} tests on {len(buckets)} workers")
+
+        staging = Path(tempfile.mkdtemp(prefix=".workers-", dir="."))
+        run_id = new_run_id()
+        worker_dirs = [staging / f"worker-{i}" for i in range(len(buckets))]
+
+        # With MOCK_API every worker talks to this one mock, so they share its state
+        with BrowserServer() as server, (MockApiServer() if MOCK_API else nullcontext()):
+            processes = []
+            for i, (bucket, worker_dir) in enumerate(zip(buckets, worker_dirs)):
+                args_file = staging / f"worker-{i}.args"
+                args_file.write_text("\n".join(bucket))
+                env = dict(
+                    os.environ,
+                    PLAYWRIGHT_WS_ENDPOINT=server.ws_endpoint,
+                    FLOWVOICE_WORKER_ID=str(i),
+                    TIMING_RUN_ID=run_id,
+                )
+                processes.append(subprocess.Popen(
+                    [sys.executable, "-m", "pytest", f"@{args_file}", f"--alluredir={worker_dir}", "-p", "no:cacheprovider"],
+                    env=env,
+                ))
+            exit_codes = [process.wait() for process in processes]
+
+        merge_results(worker_dirs, self.results_dir)
+        shutil.rmtree(staging, ignore_errors=True)
+
+        for i, code in enumerate(exit_codes):
+            print(f"  worker-{i}: exit code {code} ({len(buckets[i])} tests)")
+        if TIMING_LEDGER:
+            print_slowest_steps(run_id)
+        return next((code for code in exit_codes if code not in (0, 5)), 0)
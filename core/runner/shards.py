@@ -0,0 +1,124 @@
+# core/runner/shards.py
+"""
+Duration-aware shard planning.
+
+Per-test wall times from past runs are kept in a small JSON history store.
+Tests are bin-packed into K shards with longest-processing-time-first (LPT):
+the slowest remaining test always goes to the currently lightest shard, so a
+few long voice-assistant flows no longer end up sharing one shard.
+
+Every session rewrites the live history when it finishes, so shards of one
+run that start at different times would plan from different durations and
+could skip or repeat tests. `--shard` therefore plans from a pinned snapshot
+(--shard-history / SHARD_HISTORY_PATH, e.g. a copy of the history taken
+before the run) that nobody writes to. Without a snapshot every test weighs
+the same, which splits by node id alone and is the same in every container.
+"""
+import hashlib
+import heapq
+import os
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+from config.env import TEST_HISTORY_PATH
+from core.utils.file_lock import locked_json, read_json
+
+# Weight of the newest sample in the moving average
+SMOOTHING = 0.5
+# Used when there is no history at all
+DEFAULT_DURATION = 10.0
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse 'i/K' (1-based) into (index, total)"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected 'i/K' e.g. '2/4'")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {total}")
+    return index, total
+
+
+class DurationHistory:
+    """Historical per-test durations (seconds) keyed by pytest node id"""
+
+    def __init__(self, path: str = TEST_HISTORY_PATH, durations: Optional[Dict[str, float]] = None):
+        self.path = path
+        self._durations: Dict[str, float] = read_json(path) if durations is None else dict(durations)
+        self._pending: Dict[str, float] = {}
+
+    def record(self, node_id: str, seconds: float):
+        """Queue a measured duration; written out by flush()"""
+        self._pending[node_id] = self._pending.get(node_id, 0.0) + seconds
+
+    def flush(self):
+        """Merge queued durations into the store (safe across parallel workers)"""
+        if not self._pending:
+            return
+        with locked_json(self.path) as durations:
+            for node_id, seconds in self._pending.items():
+                previous = durations.get(node_id)
+                durations[node_id] = seconds if previous is None else (
+                    SMOOTHING * seconds + (1 - SMOOTHING) * previous
+                )
+            self._durations = dict(durations)
+        self._pending = {}
+
+    def estimate(self, node_id: str) -> float:
+        """Known duration, else the median of the same file, else the global median"""
+        if node_id in self._durations:
+            return self._durations[node_id]
+        module = node_id.split("::")[0]
+        same_file = [d for n, d in self._durations.items() if n.split("::")[0] == module]
+        if same_file:
+            return statistics.median(same_file)
+        if self._durations:
+            return statistics.median(self._durations.values())
+        return DEFAULT_DURATION
+
+
+def load_shard_history(path: Optional[str]) -> Tuple[DurationHistory, Optional[str]]:
+    """
+    The pinned snapshot shards plan from, and its content hash (to compare across containers).
+
+    A missing snapshot gives an empty history: every test weighs the same.
+    """
+    if not path or not os.path.exists(path):
+        return DurationHistory(path or TEST_HISTORY_PATH, durations={}), None
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    return DurationHistory(path), digest
+
+
+def plan_shards(node_ids: List[str], total: int, history: Optional[DurationHistory] = None) -> List[List[str]]:
+    """Bin-pack node ids into `total` shards using LPT scheduling"""
+    history = history or DurationHistory()
+    shards: List[List[str]] = [[] for _ in range(total)]
+    # (load, shard index) min-heap; index breaks ties deterministically
+    loads = [(0.0, i) for i in range(total)]
+    heapq.heapify(loads)
+
+    # Sort by duration, then node id, so every container computes the same plan
+    for node_id in sorted(node_ids, key=lambda n: (-history.estimate(n), n)):
+        load, i = heapq.heappop(loads)
+        shards[i].append(node_id)
+        heapq.heappush(loads, (load + history.estimate(node_id), i))
+    return shards
+
+
+def shard_loads(shards: List[List[str]], history: Optional[DurationHistory] = None) -> List[float]:
+    """Estimated wall time of each shard"""
+    history = history or DurationHistory()
+    return [sum(history.estimate(n) for n in shard) for shard in shards]
+
+
+# Global singleton instance
+_duration_history = None
+
+def get_duration_history() -> DurationHistory:
+    """Get or create duration history singleton"""
+    global _duration_history
+    if _duration_history is None:
+        _duration_history = DurationHistory()
+    return _duration_history
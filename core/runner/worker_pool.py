@@ -0,0 +1,150 @@
+# core/runner/worker_pool.py
+"""
+Pool of pre-warmed pytest worker processes for the test runner API.
+
+Each worker imports pytest, playwright, allure and the GCS client once,
+launches a browser and registers it as the shared browser, then waits for
+jobs. A job runs in-process through `pytest.main`, so a request skips
+interpreter start-up, imports and browser launch. Workers are replaced
+after `max_jobs` jobs (or when they die); the replacement warms up in the
+background, while the other workers take the next jobs.
+
+`max_jobs` defaults to 1: every job gets a process of its own, warmed up
+before the job arrived. A second `pytest.main` in the same process would
+see the first one's module state (the routing, navigation-timing,
+duration-history and web-vitals singletons keep accumulating) and the test
+modules as first imported, not as edited since. Raise RUNNER_WORKER_MAX_JOBS
+only for a fixed test tree.
+
+`WorkerPool.run` has the JobManager runner signature and can be plugged
+straight into it.
+"""
+import multiprocessing
+import queue
+from typing import Optional
+
+from config.env import RUNNER_WORKER_MAX_JOBS
+
+# pytest.ExitCode.INTERNAL_ERROR, without importing pytest into the API process
+INTERNAL_ERROR = 3
+
+
+def _launch_browser(playwright):
+    from config.env import HEADLESS, PLAYWRIGHT_WS_ENDPOINT, SLOW_MO
+
+    if PLAYWRIGHT_WS_ENDPOINT:
+        return playwright.chromium.connect(PLAYWRIGHT_WS_ENDPOINT, slow_mo=SLOW_MO)
+    return playwright.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
+
+
+def _worker_main(conn, worker_id: int):
+    """Worker process: warm up, then run jobs until told to stop"""
+    # Pay the import cost once, before the first job arrives
+    import allure  # noqa: F401
+    import pytest
+    from google.cloud import storage  # noqa: F401
+    from playwright.sync_api import sync_playwright
+
+    from core.playwright.browser import set_shared_browser
+
+    playwright = sync_playwright().start()
+    browser = None
+    try:
+        while True:
+            if browser is None or not browser.is_connected():
+                browser = _launch_browser(playwright)
+                set_shared_browser(browser)
+                print(f"✓ Runner worker {worker_id} ready")
+
+            message = conn.recv()
+            if message is None:
+                break
+            test_path, results_dir, args = message
+            try:
+                exit_code = int(pytest.main([test_path, f"--alluredir={results_dir}", *args]))
+            except Exception as e:
+                print(f"✗ Runner worker {worker_id} job failed: {e}")
+                exit_code = INTERNAL_ERROR
+            conn.send(exit_code)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        set_shared_browser(None)
+        if browser is not None:
+            try:
+                browser.close()
+            except Exception:
+                pass
+        playwright.stop()
+
+
+class _Worker:
+    """Handle on one worker process"""
+
+    def __init__(self, mp_context, worker_id: int, target):
+        self.id = worker_id
+        self.jobs = 0
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=target,
+            args=(child_conn, worker_id),
+            name=f"runner-worker-{worker_id}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def run(self, job) -> int:
+        self.jobs += 1
+        self.conn.send((job.test_path, job.results_dir, list(job.args)))
+        return self.conn.recv()
+
+    def stop(self, timeout: float = 30):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(5)
+        self.conn.close()
+
+
+class WorkerPool:
+    """Fixed number of warm pytest workers, recycled after `max_jobs` jobs each"""
+
+    def __init__(self, size: int, max_jobs: int = RUNNER_WORKER_MAX_JOBS, target=_worker_main):
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        # The worker process's main function: _worker_main, or a stand-in in tests
+        self._target = target
+        # spawn: a fresh interpreter, never a fork of the API's threads and event loop
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._spawned = 0
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        self._spawned += 1
+        return _Worker(self._mp_context, self._spawned, self._target)
+
+    def run(self, job) -> int:
+        """Run a job on the next idle worker and return pytest's exit code"""
+        worker = self._idle.get()
+        try:
+            return worker.run(job)
+        except (EOFError, BrokenPipeError, OSError) as e:
+            print(f"✗ Runner worker {worker.id} died during job {job.id}: {e}")
+            return INTERNAL_ERROR
+        finally:
+            if worker.jobs >= self.max_jobs or not worker.process.is_alive():
+                worker.stop()
+                worker = self._spawn()
+            self._idle.put(worker)
+
+    def close(self, timeout: Optional[float] = 30):
+        """Stop idle workers (busy ones finish their job first)"""
+        for _ in range(self.size):
+            self._idle.get().stop(timeout)
@@ -0,0 +1,34 @@
+# core/utils/async_step.py
+"""
+`allure.step` for coroutines.
+
+allure.step as a decorator wraps the call, not the awaited work, so on an
+`async def` the step would close before anything ran. `async_step` keeps the
+step open across the await and formats the title the same way:
+
+    @async_step("Fill title: {title}")
+    async def fill_title(self, title: str):
+        ...
+
+Coroutines gathered in an async test keep sibling steps: the test's steps are
+tracked per asyncio task (core/runner/async_tests.py).
+"""
+import functools
+import inspect
+
+import allure
+
+
+def async_step(title: str):
+    """Decorator: run the coroutine inside an Allure step titled `title.format(**arguments)`"""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            with allure.step(title.format(*args, **bound.arguments)):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+# core/utils/file_lock.py
+"""
+Cross-process file locking and locked JSON stores.
+
+Parallel pytest workers share small pieces of state on disk (token cache,
+duration history, ...). Every read-modify-write goes through an exclusive
+lock on a sibling ".lock" file so workers never see a half-written file.
+"""
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive lock on `<path>.lock` for the duration of the block"""
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_json(path, default=None):
+    """Read a JSON file, returning `default` if it is missing or corrupt"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {} if default is None else default
+
+
+def write_json_atomic(path, data, mode: int = 0o644):
+    """Write JSON to a temp file and rename it over `path`"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@contextmanager
+def locked_json(path, mode: int = 0o644):
+    """
+    Lock a JSON file and yield its contents as a dict.
+
+    Changes made to the dict inside the block are written back atomically
+    when the block exits without an exception.
+    """
+    with file_lock(path):
+        data = read_json(path)
+        yield data
+        write_json_atomic(path, data, mode=mode)
+
+
+def append_jsonl(path, entries) -> int:
+    """Append entries as compact JSON lines under the lock; returns how many were written"""
+    if not entries:
+        return 0
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+    with file_lock(path):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+    return len(entries)
+
+
+def read_jsonl(path) -> list:
+    """Every entry of a JSON lines file (missing file = none, unreadable lines are skipped)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return entries
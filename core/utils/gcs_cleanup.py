@@ -0,0 +1,113 @@
+# core/utils/gcs_cleanup.py
+"""
+Batched cleanup of published Allure reports in GCS.
+
+Objects are listed per report folder on a thread pool and deleted through
+GCS batch requests (up to `batch_size` deletes per HTTP call) instead of one
+request per object. A retention policy decides which report folders go:
+everything beyond the newest `keep_last`, and everything older than
+`keep_days`.
+
+Only a bucket object is needed (`list_blobs`, `blob`, `client.batch`), so the
+cleaner can be exercised against an in-memory fake bucket.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+from config.env import REPORT_CLEANUP_WORKERS, REPORT_KEEP_DAYS, REPORT_KEEP_LAST
+from core.utils.report_publisher import REPORTS_PREFIX, list_report_folders
+
+# GCS accepts at most 100 calls per batch request
+MAX_BATCH_SIZE = 100
+FOLDER_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def folder_timestamp(folder: str) -> Optional[datetime]:
+    """Timestamp encoded in a report folder name, or None if it has none"""
+    try:
+        return datetime.strptime(folder.rstrip("/").rsplit("/", 1)[-1], FOLDER_TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def select_expired(
+    folders: Iterable[str],
+    keep_last: Optional[int] = None,
+    keep_days: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Folders a retention policy would delete.
+
+    A folder expires if it is not among the newest `keep_last` folders, or if
+    its timestamp is older than `keep_days`. None / 0 disables a rule.
+    Folders without a timestamp are never expired by age.
+    """
+    now = now or datetime.now()
+    ordered = sorted(folders, key=lambda f: (folder_timestamp(f) or datetime.max, f))
+    expired = set()
+    if keep_last:
+        expired.update(ordered[:-keep_last])
+    if keep_days:
+        cutoff = now - timedelta(days=keep_days)
+        expired.update(f for f in ordered if (folder_timestamp(f) or now) < cutoff)
+    return [f for f in ordered if f in expired]
+
+
+class ReportCleaner:
+    """Delete report folders with batched requests and a retention policy"""
+
+    def __init__(
+        self,
+        bucket,
+        reports_prefix: str = REPORTS_PREFIX,
+        batch_size: int = MAX_BATCH_SIZE,
+        workers: int = REPORT_CLEANUP_WORKERS,
+    ):
+        self.bucket = bucket
+        self.reports_prefix = reports_prefix.rstrip("/")
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.workers = workers
+
+    def _list_names(self, prefix: str) -> List[str]:
+        return [blob.name for blob in self.bucket.list_blobs(prefix=prefix)]
+
+    def list_objects(self, prefixes: Iterable[str]) -> List[str]:
+        """Object names under several prefixes, listed concurrently"""
+        prefixes = [p if p.endswith("/") else f"{p}/" for p in prefixes]
+        if not prefixes:
+            return []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return [name for names in pool.map(self._list_names, prefixes) for name in names]
+
+    def delete_objects(self, names: List[str]) -> int:
+        """
+        Delete objects in batch requests. Batches run one after another: the
+        client keeps a single batch stack, so it can't be shared across threads.
+        """
+        client = self.bucket.client
+        for start in range(0, len(names), self.batch_size):
+            # raise_exception=False: objects already gone (404) must not abort the cleanup
+            with client.batch(raise_exception=False):
+                for name in names[start:start + self.batch_size]:
+                    self.bucket.blob(name).delete()
+        return len(names)
+
+    def delete_folders(self, folders: Iterable[str]) -> int:
+        """Delete every object of the given folders; returns the object count"""
+        return self.delete_objects(self.list_objects(folders))
+
+    def apply_retention(
+        self,
+        keep_last: Optional[int] = REPORT_KEEP_LAST,
+        keep_days: Optional[int] = REPORT_KEEP_DAYS,
+        protect: Iterable[str] = (),
+    ) -> dict:
+        """Delete expired report folders, never touching the `protect`ed ones"""
+        protected = {p.rstrip("/") for p in protect}
+        folders = list_report_folders(self.bucket, self.reports_prefix)
+        expired = [f for f in select_expired(folders, keep_last, keep_days) if f not in protected]
+        deleted = self.delete_folders(expired)
+        print(f"✓ Report cleanup: {len(expired)} folders / {deleted} objects deleted, {len(folders) - len(expired)} kept")
+        return {"deleted_folders": expired, "deleted_objects": deleted}
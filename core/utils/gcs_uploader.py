@@ -9,6 +9,7 @@ Setup:
 3. Set GCS_BUCKET_NAME in .env file
 """
 import os
+import uuid
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -103,10 +104,9 @@ class GCSUploader:
                 blob_name = f"{timestamp}_{local_path.name}"
             
             # Add folder prefix (GCS automatically creates "folders")
-            if folder:
-                blob_name = f"{folder}/{blob_name}"
+            blob_name = self.blob_path(blob_name, folder)
             
-            # Upload file
+            # Upload file (streamed from disk, resumable for large files)
             blob = self._bucket.blob(blob_name)
             blob.upload_from_filename(str(local_path))
             
@@ -124,7 +124,7 @@ class GCSUploader:
             # Return gs:// URL for uniform bucket-level access buckets
             # Users with proper IAM permissions can access via console or gsutil
             gs_url = f"gs://{self.bucket_name}/{blob_name}"
-            public_url = f"https://storage.googleapis.com/{self.bucket_name}/{blob_name}"
+            public_url = self.public_url(blob_name)
             
             print(f"✓ Uploaded to GCS: {gs_url}")
             print(f"  Console: https://console.cloud.google.com/storage/browser/{self.bucket_name}/{blob_name.split('/')[0]}")
@@ -135,6 +135,25 @@ class GCSUploader:
             print(f"✗ Failed to upload to GCS: {e}")
             return None
     
+    @property
+    def bucket(self):
+        """Underlying google.cloud.storage Bucket (None when GCS is disabled)"""
+        return self._bucket
+    
+    @staticmethod
+    def blob_path(blob_name: str, folder: str = "test-artifacts") -> str:
+        """Full object name for a blob inside a folder prefix"""
+        return f"{folder}/{blob_name}" if folder else blob_name
+    
+    def public_url(self, blob_path: str) -> str:
+        """HTTPS URL an object will have once uploaded"""
+        return f"https://storage.googleapis.com/{self.bucket_name}/{blob_path}"
+    
+    @staticmethod
+    def video_blob_name(test_name: str) -> str:
+        """Blob name for a test's video; unique per upload so later runs don't overwrite older reports' videos"""
+        return f"videos/{test_name}-{uuid.uuid4().hex[:12]}.webm"
+    
     def upload_screenshot(self, screenshot_path: str, test_name: str) -> Optional[str]:
         """Upload screenshot with test-specific naming"""
         blob_name = f"screenshots/{test_name}.png"
@@ -142,8 +161,7 @@ class GCSUploader:
     
     def upload_video(self, video_path: str, test_name: str) -> Optional[str]:
         """Upload video with test-specific naming"""
-        blob_name = f"videos/{test_name}.webm"
-        return self.upload_file(video_path, blob_name)
+        return self.upload_file(video_path, self.video_blob_name(test_name))
     
     def upload_test_artifacts(
         self, 
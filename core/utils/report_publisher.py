@@ -0,0 +1,133 @@
+# core/utils/report_publisher.py
+"""
+Incremental Allure report publisher for GCS.
+
+Every published report folder gets a manifest of relative path -> MD5 of
+its files. When a new report is published, files whose hash already exists
+in the previous report (app.js, styles, plugins, unchanged widgets) are
+server-side copied inside the bucket instead of uploaded again, files
+already present in the target folder are skipped, and only new content is
+uploaded. All transfers run on a bounded thread pool.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config.env import REPORT_UPLOAD_WORKERS
+
+MANIFEST_NAME = ".publish-manifest.json"
+REPORTS_PREFIX = "allure-reports"
+
+
+def file_md5(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """MD5 of a file, read in chunks"""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(report_dir: Path) -> Dict[str, str]:
+    """Relative path -> MD5 for every file of a local report"""
+    return {
+        file.relative_to(report_dir).as_posix(): file_md5(file)
+        for file in sorted(report_dir.rglob("*"))
+        if file.is_file()
+    }
+
+
+def list_report_folders(bucket, reports_prefix: str = REPORTS_PREFIX) -> list:
+    """Report folders under a prefix (e.g. 'allure-reports/20250101_120000'), oldest first"""
+    iterator = bucket.list_blobs(prefix=f"{reports_prefix.rstrip('/')}/", delimiter="/")
+    # Prefixes are only populated once every page has been fetched
+    for _ in iterator.pages:
+        pass
+    return sorted(prefix.rstrip("/") for prefix in iterator.prefixes)
+
+
+class ReportPublisher:
+    """Publish a local Allure report into a GCS folder, transferring only what changed"""
+
+    def __init__(self, bucket, reports_prefix: str = REPORTS_PREFIX, workers: int = REPORT_UPLOAD_WORKERS):
+        self.bucket = bucket
+        self.reports_prefix = reports_prefix.rstrip("/")
+        self.workers = workers
+
+    def list_report_folders(self) -> list:
+        """Published report folders, oldest first"""
+        return list_report_folders(self.bucket, self.reports_prefix)
+
+    def load_manifest(self, report_folder: str) -> Dict[str, str]:
+        """Manifest of a published report, or {} if it has none"""
+        blob = self.bucket.blob(f"{report_folder}/{MANIFEST_NAME}")
+        try:
+            return json.loads(blob.download_as_bytes())
+        except Exception:
+            return {}
+
+    def _previous_report(self, report_folder: str) -> Tuple[Optional[str], Dict[str, str]]:
+        folders = [f for f in self.list_report_folders() if f != report_folder]
+        for folder in reversed(folders):
+            manifest = self.load_manifest(folder)
+            if manifest:
+                return folder, manifest
+        return None, {}
+
+    def _transfer(self, local_path: Path, target: str, source: Optional[str]) -> str:
+        if source:
+            try:
+                self.bucket.copy_blob(self.bucket.blob(source), self.bucket, target)
+                return "copied"
+            except Exception as e:
+                print(f"⚠ Server-side copy failed for {source}, uploading instead: {e}")
+        self.bucket.blob(target).upload_from_filename(str(local_path))
+        return "uploaded"
+
+    def publish(self, report_dir: str, report_folder: str) -> dict:
+        """
+        Publish `report_dir` into `report_folder`.
+
+        Returns counts of uploaded / copied / skipped / failed files.
+        """
+        report_path = Path(report_dir)
+        report_folder = report_folder.rstrip("/")
+        manifest = build_manifest(report_path)
+
+        existing = self.load_manifest(report_folder)
+        previous_folder, previous = self._previous_report(report_folder)
+        # MD5 -> object that already holds that content
+        known = {md5: f"{previous_folder}/{rel}" for rel, md5 in previous.items()} if previous_folder else {}
+
+        summary = {"uploaded": 0, "copied": 0, "skipped": 0, "failed": []}
+        jobs = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for rel, md5 in manifest.items():
+                if existing.get(rel) == md5:
+                    summary["skipped"] += 1
+                    continue
+                target = f"{report_folder}/{rel}"
+                jobs[pool.submit(self._transfer, report_path / rel, target, known.get(md5))] = rel
+
+            for future in as_completed(jobs):
+                try:
+                    summary[future.result()] += 1
+                except Exception as e:
+                    print(f"✗ Failed to publish {jobs[future]}: {e}")
+                    summary["failed"].append(jobs[future])
+
+        if not summary["failed"]:
+            # Written last: a folder only gets a manifest once it is complete
+            self.bucket.blob(f"{report_folder}/{MANIFEST_NAME}").upload_from_string(
+                json.dumps(manifest), content_type="application/json"
+            )
+
+        print(
+            f"✓ Report published to {report_folder}: "
+            f"{summary['uploaded']} uploaded, {summary['copied']} copied, "
+            f"{summary['skipped']} unchanged, {len(summary['failed'])} failed"
+        )
+        return summary
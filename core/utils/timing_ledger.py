@@ -0,0 +1,186 @@
+# core/utils/timing_ledger.py
+"""
+Wall-time ledger of steps, fixtures, navigations and logins.
+
+Every Allure step (`allure.step` in flows and pages), fixture setup and
+teardown, page navigation, API login and test phase becomes one JSON line
+in TIMING_LEDGER_PATH (API requests too, see core/playwright/network_latency.py):
+
+    {"run": "20261017-101500-4242", "kind": "step", "name": "Click save button",
+     "test": "tests/knowledgebase/test_knowledgebase_form.py::...", "ms": 812.4}
+
+Workers of one run_parallel.py run share its run id (TIMING_RUN_ID), so the
+slowest steps can be aggregated across processes:
+
+    python scripts/timing_report.py                  # slowest steps of the last run
+    python scripts/timing_report.py --kind fixture --all
+"""
+import math
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import allure_commons
+import pytest
+
+from config.env import TIMING_LEDGER, TIMING_LEDGER_PATH, TIMING_RUN_ID
+from core.utils.file_lock import append_jsonl, read_jsonl
+
+KINDS = ("step", "fixture", "navigation", "login", "test", "request")
+
+
+def new_run_id() -> str:
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class TimingLedger:
+    """Buffer timing records and append them to the shared JSONL ledger"""
+
+    def __init__(self, path: str = TIMING_LEDGER_PATH, run_id: Optional[str] = None, enabled: bool = TIMING_LEDGER):
+        self.path = Path(path)
+        self.run_id = run_id or TIMING_RUN_ID or new_run_id()
+        self.enabled = enabled
+        self.current_test = ""
+        self._pending: List[dict] = []
+
+    def record(self, kind: str, name: str, elapsed_ms: float, **extra):
+        if not self.enabled:
+            return
+        entry = {"run": self.run_id, "kind": kind, "name": name, "test": self.current_test, "ms": round(elapsed_ms, 1)}
+        entry.update({key: value for key, value in extra.items() if value is not None})
+        self._pending.append(entry)
+
+    @contextmanager
+    def timed(self, kind: str, name: str, **extra):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(kind, name, (time.perf_counter() - start) * 1000, **extra)
+
+    def flush(self) -> int:
+        """Append pending records (safe across parallel workers); returns how many were written"""
+        written = append_jsonl(self.path, self._pending)
+        self._pending = []
+        return written
+
+    def entries(self) -> List[dict]:
+        """Every record in the ledger"""
+        return read_jsonl(self.path)
+
+    def report(self, kind: Optional[str] = "step", run: Optional[str] = "last", top: int = 20) -> List[dict]:
+        """
+        Slowest names by total time: count, total, mean, p95 and max ms
+
+        kind: "step", "fixture", ... (None = all kinds)
+        run: a run id, "last" for the most recent run, None for every run
+        """
+        entries = self.entries()
+        if run == "last" and entries:
+            run = entries[-1]["run"]
+        groups: Dict[tuple, List[float]] = {}
+        for entry in entries:
+            if run and entry.get("run") != run:
+                continue
+            if kind and entry.get("kind") != kind:
+                continue
+            groups.setdefault((entry["kind"], entry["name"]), []).append(entry["ms"])
+        rows = [
+            {
+                "kind": group_kind,
+                "name": name,
+                "count": len(values),
+                "total_ms": round(sum(values), 1),
+                "mean_ms": round(sum(values) / len(values), 1),
+                "p95_ms": percentile(values, 95),
+                "max_ms": max(values),
+            }
+            for (group_kind, name), values in groups.items()
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:top] if top else rows
+
+
+class TimingPlugin:
+    """
+    Feeds the ledger from pytest and allure-python-commons hooks:
+    Allure steps, fixture setup/teardown and test phases
+    """
+
+    def __init__(self, ledger: TimingLedger):
+        self.ledger = ledger
+        self._steps: Dict[str, tuple] = {}
+        self._teardowns: Dict[int, float] = {}
+
+    # allure_commons hooks: every `allure.step` block or decorated call
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._steps[uuid] = (title, time.perf_counter(), len(self._steps))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        started = self._steps.pop(uuid, None)
+        if started:
+            title, start, depth = started
+            failed = True if exc_type is not None else None
+            self.ledger.record("step", title, (time.perf_counter() - start) * 1000, depth=depth, failed=failed)
+
+    # pytest hooks
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.ledger.current_test = item.nodeid
+        yield
+        self.ledger.current_test = ""
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        self.ledger.record(
+            "fixture", fixturedef.argname, (time.perf_counter() - start) * 1000, scope=fixturedef.scope, phase="setup"
+        )
+        # Registered after the fixture's own teardown, so it runs right before it
+        fixturedef.addfinalizer(lambda: self._teardowns.__setitem__(id(fixturedef), time.perf_counter()))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        start = self._teardowns.pop(id(fixturedef), None)
+        if start is not None:
+            self.ledger.record(
+                "fixture", fixturedef.argname, (time.perf_counter() - start) * 1000,
+                scope=fixturedef.scope, phase="teardown",
+            )
+
+    def pytest_runtest_logreport(self, report):
+        self.ledger.record("test", report.nodeid, report.duration * 1000, phase=report.when)
+
+
+def install_timing(config) -> TimingLedger:
+    """Register the timing hooks with pytest and Allure; returns the session's ledger"""
+    ledger = get_timing_ledger()
+    # A warm runner worker runs many sessions in one process: each is its own run
+    ledger.run_id = TIMING_RUN_ID or new_run_id()
+    plugin = TimingPlugin(ledger)
+    config.pluginmanager.register(plugin, "timing_ledger")
+    allure_commons.plugin_manager.register(plugin)
+    config.add_cleanup(lambda: allure_commons.plugin_manager.unregister(plugin))
+    return ledger
+
+
+# Global singleton instance
+_timing_ledger = None
+
+
+def get_timing_ledger() -> TimingLedger:
+    """Get or create timing ledger singleton"""
+    global _timing_ledger
+    if _timing_ledger is None:
+        _timing_ledger = TimingLedger()
+    return _timing_ledger
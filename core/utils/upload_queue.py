@@ -0,0 +1,210 @@
+# core/utils/upload_queue.py
+"""
+Background upload queue for test artifacts.
+
+Test teardown hands a file to the queue and returns immediately; a small
+thread pool uploads it to GCS (streamed from disk) with retries and
+exponential backoff. The queue is drained at session end so no upload is
+lost when pytest exits.
+
+Uploads start at hand-off and run side by side; teardown never waits for
+them. attach_video attaches right away when the upload is already done (or
+GCS is off) and otherwise records the test's Allure result file. drain()
+then writes the link into that file once the object exists, or embeds the
+kept local file when every retry failed.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+from uuid import uuid4
+
+import allure
+from allure_commons.model2 import ATTACHMENT_PATTERN
+
+from config.env import (
+    DELETE_LOCAL_AFTER_GCS_UPLOAD,
+    UPLOAD_BACKOFF_SECONDS,
+    UPLOAD_MAX_RETRIES,
+    UPLOAD_WORKERS,
+)
+from core.utils.gcs_uploader import GCSUploader, get_gcs_uploader
+
+
+class PendingVideo(NamedTuple):
+    """A video whose upload was still running when its test finished"""
+    upload: Future
+    video_path: str
+    test_name: str
+    result_file: Path
+
+
+def allure_result_file(config) -> Optional[Path]:
+    """The file the running test's Allure result will be written to (None without --alluredir)"""
+    listener = config.pluginmanager.get_plugin("allure_listener")
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if listener is None or not report_dir:
+        return None
+    test_result = listener.allure_logger.get_test(None)
+    if test_result is None:
+        return None
+    return Path(report_dir) / f"{test_result.uuid}-result.json"
+
+
+class UploadQueue:
+    """Thread-pool backed artifact uploader with retry and backoff"""
+
+    def __init__(
+        self,
+        uploader: Optional[GCSUploader] = None,
+        workers: int = UPLOAD_WORKERS,
+        max_retries: int = UPLOAD_MAX_RETRIES,
+        backoff: float = UPLOAD_BACKOFF_SECONDS,
+    ):
+        self.uploader = uploader or get_gcs_uploader()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifact-upload")
+        self._futures: List[Future] = []
+        self._failed: List[str] = []
+        self._pending: List[PendingVideo] = []
+        self._lock = threading.Lock()
+
+    def submit_video(self, video_path: str, test_name: str) -> Optional[Future]:
+        """
+        Queue a kept video for upload to GCS.
+
+        Returns the upload's future (resolving to the URL, or None if every
+        retry failed), or None when GCS is disabled. Pass it to attach_video.
+        """
+        if not self.uploader.enabled:
+            return None
+
+        blob_name = self.uploader.video_blob_name(test_name)
+        future = self._executor.submit(self._upload, video_path, blob_name, DELETE_LOCAL_AFTER_GCS_UPLOAD)
+        with self._lock:
+            self._futures.append(future)
+        print(f"✓ Video queued for upload: {blob_name}")
+        return future
+
+    def attach_video(
+        self, upload: Optional[Future], video_path: str, test_name: str, result_file: Optional[Path] = None,
+    ) -> Optional[str]:
+        """
+        Attach a video to the current Allure test without waiting for its upload.
+
+        A finished upload is attached now: its GCS URL if it succeeded,
+        otherwise (failed, or GCS disabled) the local file. A running one is
+        attached to `result_file` by drain(). Returns the URL, if attached now.
+        """
+        if upload is not None and not upload.done():
+            if result_file is not None:
+                with self._lock:
+                    self._pending.append(PendingVideo(upload, video_path, test_name, result_file))
+            return None
+
+        url = upload.result() if upload is not None else None
+        if url:
+            allure.attach(url, name="Video (GCS)", attachment_type=allure.attachment_type.URI_LIST)
+            return url
+
+        allure.attach.file(
+            video_path,
+            name=f"{test_name}_video",
+            attachment_type=allure.attachment_type.WEBM,
+        )
+        print(f"✓ Video embedded in Allure: {video_path} ({os.path.getsize(video_path)} bytes)")
+        return None
+
+    def _attach_pending(self, pending: PendingVideo):
+        """Add a finished upload's link (or the local file) to an already written Allure result"""
+        if not pending.result_file.exists():
+            print(f"⚠ No Allure result to attach the video to: {pending.result_file}")
+            return
+        url = pending.upload.result() if pending.upload.done() else None
+        report_dir = pending.result_file.parent
+        if url:
+            attachment_type = allure.attachment_type.URI_LIST
+            name = "Video (GCS)"
+            source = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=attachment_type.extension)
+            (report_dir / source).write_text(url)
+        elif os.path.exists(pending.video_path):
+            attachment_type = allure.attachment_type.WEBM
+            name = f"{pending.test_name}_video"
+            source = ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=attachment_type.extension)
+            shutil.copyfile(pending.video_path, report_dir / source)
+        else:
+            return
+        result = json.loads(pending.result_file.read_text())
+        result.setdefault("attachments", []).append(
+            {"name": name, "source": source, "type": attachment_type.mime_type}
+        )
+        pending.result_file.write_text(json.dumps(result))
+
+    def _upload(self, local_path: str, blob_name: str, delete_after: bool) -> Optional[str]:
+        for attempt in range(1, self.max_retries + 1):
+            url = self.uploader.upload_file(local_path, blob_name)
+            if url:
+                if delete_after:
+                    try:
+                        os.remove(local_path)
+                    except OSError as e:
+                        print(f"⚠ Could not delete local file {local_path}: {e}")
+                return url
+            if attempt < self.max_retries:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+
+        # Keep the local copy so the artifact is not lost
+        print(f"✗ Upload failed after {self.max_retries} attempts, kept locally: {local_path}")
+        with self._lock:
+            self._failed.append(local_path)
+        return None
+
+    def drain(self, timeout: Optional[float] = None) -> dict:
+        """Wait for all queued uploads to finish, attach the pending videos and shut the pool down"""
+        with self._lock:
+            futures = list(self._futures)
+        start = time.time()
+        for future in futures:
+            remaining = None if timeout is None else max(0.0, timeout - (time.time() - start))
+            try:
+                future.result(timeout=remaining)
+            except Exception as e:
+                print(f"✗ Upload did not complete: {e}")
+        self._executor.shutdown(wait=timeout is None)
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for video in pending:
+            try:
+                self._attach_pending(video)
+            except Exception as e:
+                print(f"✗ Failed to attach video: {e}")
+        summary = {"queued": len(futures), "failed": list(self._failed)}
+        if futures:
+            print(f"✓ Artifact uploads drained: {len(futures) - len(self._failed)}/{len(futures)} succeeded")
+        return summary
+
+
+# Global singleton instance
+_upload_queue = None
+
+def get_upload_queue() -> UploadQueue:
+    """Get or create upload queue singleton"""
+    global _upload_queue
+    if _upload_queue is None:
+        _upload_queue = UploadQueue()
+    return _upload_queue
+
+
+def drain_upload_queue(timeout: Optional[float] = None) -> Optional[dict]:
+    """Drain the queue if anything was ever queued (called at session end)"""
+    global _upload_queue
+    if _upload_queue is None:
+        return None
+    summary = _upload_queue.drain(timeout)
+    _upload_queue = None
+    return summary
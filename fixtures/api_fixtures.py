@@ -0,0 +1,127 @@
+"""
+API-backed test data fixtures
+
+Records are created through the REST API (milliseconds instead of clicking
+through forms) and deleted again when the test ends:
+
+    def test_edit_contact(page, contact):              # one ready-made contact
+    def test_contacts(page, make_contact):             # factory, any number
+        make_contact(first_name="Ada", email="ada@example.com")
+
+Tests that only need an assistant to exist lease one from the shared pool
+instead of creating it; it is reset and handed back at teardown:
+
+    def test_rename(page, voice_assistant):            # exclusive for this test
+    def test_types(page, lease_assistant):             # lease_assistant("sms")
+
+When the API refuses to create a record (an environment without the
+permission, or a payload it does not accept), the make_* fixtures skip the
+test with the API's answer instead of failing it.
+"""
+import functools
+
+import pytest
+from config.env import ASSISTANT_GC_ENABLED
+from core.api.assistant_pool import AssistantPool
+from core.api.client import ApiError, get_api_client
+from core.api.resources import DataFactory
+
+
+def skip_if_refused(create):
+    """Wrap a factory method: an ApiError while creating skips the test"""
+    @functools.wraps(create)
+    def wrapper(**overrides):
+        try:
+            return create(**overrides)
+        except ApiError as e:
+            pytest.skip(f"Could not create test data through the API: {e}")
+    return wrapper
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Pooled, authenticated API client shared by the session"""
+    return get_api_client()
+
+
+@pytest.fixture
+def api_data(api_client):
+    """Data factory; everything it creates is deleted at teardown"""
+    factory = DataFactory(api_client)
+    yield factory
+    factory.cleanup()
+
+
+@pytest.fixture
+def make_contact(api_data):
+    """Factory fixture: make_contact(**fields) -> Contact"""
+    return skip_if_refused(api_data.contact)
+
+
+@pytest.fixture
+def make_user(api_data):
+    """Factory fixture: make_user(**fields) -> User"""
+    return skip_if_refused(api_data.user)
+
+
+@pytest.fixture
+def make_kb_article(api_data):
+    """Factory fixture: make_kb_article(**fields) -> KnowledgeBaseEntry"""
+    return skip_if_refused(api_data.kb_article)
+
+
+@pytest.fixture
+def make_kb_url(api_data):
+    """Factory fixture: make_kb_url(**fields) -> KnowledgeBaseEntry"""
+    return skip_if_refused(api_data.kb_url)
+
+
+@pytest.fixture
+def make_assistant(api_data):
+    """Factory fixture: make_assistant(name=..., type="voice") -> Assistant"""
+    return skip_if_refused(api_data.assistant)
+
+
+@pytest.fixture
+def contact(make_contact):
+    """A contact that exists for the duration of the test"""
+    return make_contact()
+
+
+@pytest.fixture
+def user(make_user):
+    """A user that exists for the duration of the test"""
+    return make_user()
+
+
+@pytest.fixture(scope="session")
+def assistant_pool(api_client):
+    """Shared assistant pool; with ASSISTANT_GC_ENABLED orphaned Auto-* assistants are cleaned up first"""
+    pool = AssistantPool(api_client)
+    if ASSISTANT_GC_ENABLED:
+        try:
+            pool.collect_garbage()
+        except Exception as e:
+            print(f"⚠ Assistant cleanup failed: {e}")
+    return pool
+
+
+@pytest.fixture
+def lease_assistant(assistant_pool):
+    """Factory fixture: lease_assistant(type="voice") -> Assistant, released at teardown"""
+    leased = []
+
+    def lease(assistant_type: str = "voice"):
+        assistant = assistant_pool.lease(assistant_type)
+        leased.append(assistant)
+        return assistant
+
+    yield lease
+    for assistant in leased:
+        assistant_pool.release(assistant)
+
+
+@pytest.fixture
+def voice_assistant(lease_assistant):
+    """A voice assistant leased exclusively for the duration of the test"""
+    return lease_assistant("voice")
@@ -0,0 +1,91 @@
+"""
+Fixtures for the asyncio page objects (pages/aio, flows/aio)
+
+Async tests and these fixtures run on the session's async loop, a thread of
+its own (core/runner/async_tests.py), so they can share a session with the
+sync browser. The async browser starts once per session like the sync one.
+One test can drive many pages at once, each in its own context:
+
+    async def test_edit_contacts(async_pages, make_contact):
+        contacts = [make_contact() for _ in range(5)]
+        pages = await async_pages(len(contacts))
+        await asyncio.gather(*(AsyncContactFormFlow(p).navigate_to_edit_contact(BASE_URL, c.id)
+                               for p, c in zip(pages, contacts)))
+
+Async tests use these fixtures only; the sync `page` / `context` fixtures
+belong to the main thread's loop. Tests marked `concurrent` take
+`concurrent_page` instead (see core/runner/concurrent.py).
+"""
+import asyncio
+
+import pytest
+from playwright.async_api import async_playwright
+
+from core.playwright.async_context import launch_async_browser, new_async_context
+from core.playwright.context import storage_state_for
+from core.runner.async_tests import get_async_loop
+from flows.aio.login_flow import AsyncLoginFlow
+
+
+@pytest.fixture(scope="session")
+def async_loop():
+    """The event loop async tests run on; `async_loop.run(coro)` waits for a coroutine on it"""
+    return get_async_loop()
+
+
+@pytest.fixture(scope="session")
+def async_browser(async_loop):
+    """Browser driven through the async API (attaches to the shared server in parallel runs)"""
+    p = async_loop.run(async_playwright().start())
+    try:
+        browser = async_loop.run(launch_async_browser(p))
+        try:
+            yield browser
+        finally:
+            async_loop.run(browser.close())
+    finally:
+        async_loop.run(p.stop())
+
+
+@pytest.fixture
+def async_context(async_loop, async_browser, request):
+    context = async_loop.run(new_async_context(async_browser, storage_state_for(request.node)))
+    yield context
+    async_loop.run(context.close())
+
+
+@pytest.fixture
+def async_page(async_loop, async_context):
+    page = async_loop.run(async_context.new_page())
+    yield page
+    async_loop.run(page.close())
+
+
+@pytest.fixture
+def async_pages(async_loop, async_browser, request):
+    """Factory: `await async_pages(n)` opens n pages, each in a context of its own"""
+    contexts = []
+
+    async def open_pages(count: int = 1):
+        storage_state = storage_state_for(request.node)
+        opened = await asyncio.gather(*(new_async_context(async_browser, storage_state) for _ in range(count)))
+        contexts.extend(opened)
+        return list(await asyncio.gather(*(context.new_page() for context in opened)))
+
+    async def close_contexts():
+        await asyncio.gather(*(context.close() for context in contexts))
+
+    yield open_pages
+    async_loop.run(close_contexts())
+
+
+@pytest.fixture
+def async_login_flow(async_page):
+    """Fixture to provide AsyncLoginFlow instance"""
+    return AsyncLoginFlow(async_page)
+
+
+@pytest.fixture
+def concurrent_page():
+    """Page of one case of a `concurrent` test; the group runner passes the real page in"""
+    return None
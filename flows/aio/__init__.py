@@ -0,0 +1,4 @@
+"""Flow objects for the asyncio Playwright API"""
+from flows.aio.login_flow import AsyncLoginFlow
+from flows.aio.create_assistant_flow import AsyncCreateAssistantFlow
+__all__ = ["AsyncLoginFlow", "AsyncCreateAssistantFlow"]
@@ -0,0 +1,80 @@
+# flows/aio/contact_form_flow.py
+from playwright.async_api import Page
+from core.utils.async_step import async_step
+from pages.aio.contact_form_page import AsyncContactFormPage
+
+
+class AsyncContactFormFlow:
+    """High-level flow for contact form page (new/edit), async API"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.contact_form_page = AsyncContactFormPage(page)
+
+    @async_step("Navigate to new contact page")
+    async def navigate_to_new_contact(self, base_url: str):
+        """Navigate to new contact page"""
+        await self.contact_form_page.navigate_to_new_contact(base_url)
+        return self
+
+    @async_step("Navigate to edit contact page: {contact_id}")
+    async def navigate_to_edit_contact(self, base_url: str, contact_id: str):
+        """Navigate to edit contact page"""
+        await self.contact_form_page.navigate_to_edit_contact(base_url, contact_id)
+        await self.contact_form_page.wait_for_contact_to_load()
+        return self
+
+    @async_step("Create contact: {first_name} {last_name}")
+    async def create_contact(self, first_name: str, last_name: str, email: str = "", phone: str = ""):
+        """Fill and submit new contact form"""
+        await self.contact_form_page.fill_first_name(first_name)
+        await self.contact_form_page.fill_last_name(last_name)
+        if email:
+            await self.contact_form_page.fill_email(email)
+        if phone:
+            await self.contact_form_page.fill_phone(phone)
+
+        async with self.contact_form_page.wait_for_api_response():
+            await self.contact_form_page.save()
+        return self
+
+    @async_step("Edit contact")
+    async def edit_contact(self, first_name: str = None, last_name: str = None, email: str = None, phone: str = None):
+        """Edit contact details and save"""
+        if first_name is not None:
+            await self.contact_form_page.fill_first_name(first_name)
+        if last_name is not None:
+            await self.contact_form_page.fill_last_name(last_name)
+        if email is not None:
+            await self.contact_form_page.fill_email(email)
+        if phone is not None:
+            await self.contact_form_page.fill_phone(phone)
+
+        async with self.contact_form_page.wait_for_api_response():
+            await self.contact_form_page.save()
+        return self
+
+    @async_step("Delete contact")
+    async def delete_contact(self):
+        """Delete contact and confirm"""
+        await self.contact_form_page.delete()
+
+        if await self.contact_form_page.wait_for_delete_alert():
+            async with self.contact_form_page.wait_for_api_response():
+                await self.contact_form_page.confirm_delete()
+
+        return self
+
+    @async_step("Verify contact details loaded")
+    async def verify_contact_details_loaded(self) -> bool:
+        """Verify that contact details are loaded on the page"""
+        return (
+            await self.contact_form_page.get_first_name_value() != "" and
+            await self.contact_form_page.get_last_name_value() != ""
+        )
+
+    @async_step("Go back to contacts list")
+    async def go_back(self):
+        """Click back button to return to contacts list"""
+        await self.contact_form_page.click_back()
+        return self
@@ -0,0 +1,47 @@
+# flows/aio/contacts_list_flow.py
+from playwright.async_api import Page
+from core.utils.async_step import async_step
+from pages.aio.contacts_list_page import AsyncContactsListPage
+
+
+class AsyncContactsListFlow:
+    """High-level flow for contacts list page (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.contacts_list_page = AsyncContactsListPage(page)
+
+    @async_step("Navigate to contacts page")
+    async def navigate_to_contacts(self, base_url: str):
+        """Navigate to contacts page"""
+        await self.contacts_list_page.navigate_to_contacts(base_url)
+        await self.contacts_list_page.wait_for_contacts_to_load()
+        return self
+
+    @async_step("Click add contact button")
+    async def click_add_contact(self):
+        """Click add contact button to navigate to new contact page"""
+        await self.contacts_list_page.click_add_contact()
+        return self
+
+    @async_step("Click contact by index: {index}")
+    async def click_contact_by_index(self, index: int):
+        """Click on a contact row by index to navigate to edit page"""
+        await self.contacts_list_page.click_contact_by_index(index)
+        return self
+
+    @async_step("Verify contacts are displayed")
+    async def verify_contacts_displayed(self) -> bool:
+        """Verify that contacts are displayed on the page"""
+        return await self.contacts_list_page.get_contact_count() > 0
+
+    @async_step("Verify empty state is shown")
+    async def verify_empty_state(self) -> bool:
+        """Verify that empty state message is shown"""
+        return await self.contacts_list_page.is_empty_state_visible()
+
+    @async_step("Wait for page to load")
+    async def wait_for_page_load(self):
+        """Wait for contacts page to fully load"""
+        await self.contacts_list_page.wait_for_contacts_to_load()
+        return self
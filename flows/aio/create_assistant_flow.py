@@ -0,0 +1,35 @@
+# flows/aio/create_assistant_flow.py
+import uuid
+from playwright.async_api import expect
+from pages.aio.assistants_page import AsyncAssistantsPage
+
+
+class AsyncCreateAssistantFlow:
+    """Flow for creating a new assistant (async API)"""
+
+    def __init__(self, page):
+        self.page = page
+        self.assistants_page = AsyncAssistantsPage(page)
+        self.created_id = None
+
+    async def create_assistant(self, base_url: str, type_name: str = "voice"):
+        """Complete end-to-end assistant creation; returns the generated name"""
+        await self.assistants_page.open(base_url)
+
+        await self.assistants_page.click_create_new()
+        await self.assistants_page.wait_for_create_modal()
+
+        await self.page.locator(AsyncAssistantsPage.DIALOG_TYPE_OPTION.format(type_name=type_name)).click()
+        random_name = f"Auto-{uuid.uuid4().hex[:6]}"
+        await self.assistants_page.enter_name(random_name)
+
+        await self.assistants_page.submit_create()
+
+        # Wait for SPA navigation to assistant detail page
+        await self.page.wait_for_url(AsyncAssistantsPage.DETAIL_URL, timeout=10000)
+
+        await expect(self.page).to_have_url(AsyncAssistantsPage.DETAIL_URL)
+        self.created_id = self.page.url.rstrip("/").rsplit("/", 1)[-1]
+
+        print(f"Created assistant with name: {random_name}")
+        return random_name
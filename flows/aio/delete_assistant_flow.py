@@ -0,0 +1,22 @@
+# flows/aio/delete_assistant_flow.py
+from playwright.async_api import expect
+from pages.assistant.assistants_page import AssistantsSelectors
+
+
+class AsyncDeleteAssistantFlow:
+    """Delete an assistant (async API)"""
+
+    def __init__(self, page):
+        self.page = page
+
+    async def delete_assistant(self, assistant_name):
+        """Delete an assistant from its details page"""
+        await self.page.get_by_role("button", name="Delete").click()
+
+        await expect(self.page.get_by_text("Are you absolutely sure?")).to_be_visible()
+        await self.page.get_by_role("button", name="Continue").click()
+
+        # Redirect back to assistant list
+        await self.page.wait_for_url(AssistantsSelectors.LIST_URL, timeout=10000)
+
+        await expect(self.page).to_have_url(AssistantsSelectors.LIST_URL)
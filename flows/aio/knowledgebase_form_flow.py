@@ -0,0 +1,112 @@
+# flows/aio/knowledgebase_form_flow.py
+from playwright.async_api import Page
+from config.env import BASE_URL
+from core.utils.async_step import async_step
+from pages.aio.knowledgebase_form_page import AsyncKnowledgeBaseFormPage
+
+
+class AsyncKnowledgeBaseFormFlow:
+    """Flow object for knowledge base form operations (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.form_page = AsyncKnowledgeBaseFormPage(page)
+
+    @async_step("Create article entry with title: {title}")
+    async def create_article_entry(self, title: str, sections: list, base_url: str = None):
+        """
+        Create a new article entry
+        sections: list of dicts with 'name' and 'content' keys
+        """
+        await self.form_page.navigate_to_create(base_url=base_url or BASE_URL, type="article")
+        await self.form_page.wait_for_page_load()
+
+        await self.form_page.fill_title(title)
+
+        for i, section in enumerate(sections):
+            if i > 0:  # Add section if not the first one
+                await self.form_page.click_add_section_button()
+
+            await self.form_page.fill_section_name(section['name'], i)
+            await self.form_page.fill_section_content(section['content'], i)
+
+        await self.form_page.click_save_button()
+        await self.form_page.wait_for_dom_stable()  # Let the app settle after the save
+
+    @async_step("Create URL entry with title: {title}")
+    async def create_url_entry(self, title: str, url: str, frequency: str = "24", prompt: str = "", base_url: str = None):
+        """Create a new URL entry"""
+        await self.form_page.navigate_to_create(base_url=base_url or BASE_URL, type="url")
+        await self.form_page.wait_for_page_load()
+
+        await self.form_page.fill_title(title)
+        await self.form_page.fill_url(url)
+        await self.form_page.select_frequency(frequency)
+        if prompt:
+            await self.form_page.fill_prompt(prompt)
+
+        await self.form_page.click_save_button()
+        await self.form_page.wait_for_dom_stable()  # Let the app settle after the save
+
+    @async_step("Edit entry title to: {new_title}")
+    async def edit_entry_title(self, entry_id: str, new_title: str, base_url: str = None):
+        """Edit an entry's title"""
+        await self.form_page.navigate_to_edit(entry_id, base_url=base_url or BASE_URL)
+        await self.form_page.wait_for_page_load()
+
+        await self.form_page.fill_title(new_title)
+        await self.form_page.click_save_button()
+        await self.form_page.wait_for_dom_stable()  # Let the app settle after the save
+
+    @async_step("Edit entry and add section")
+    async def edit_and_add_section(self, entry_id: str, section_name: str, section_content: str, base_url: str = None):
+        """Edit an entry and add a new section"""
+        await self.form_page.navigate_to_edit(entry_id, base_url=base_url or BASE_URL)
+        await self.form_page.wait_for_page_load()
+
+        current_count = await self.form_page.get_section_count()
+        await self.form_page.click_add_section_button()
+
+        await self.form_page.fill_section_name(section_name, current_count)
+        await self.form_page.fill_section_content(section_content, current_count)
+
+        await self.form_page.click_save_button()
+        await self.form_page.wait_for_dom_stable()  # Let the app settle after the save
+
+    @async_step("Delete entry")
+    async def delete_entry(self, entry_id: str, base_url: str = None):
+        """Delete a knowledge base entry"""
+        await self.form_page.navigate_to_edit(entry_id, base_url=base_url or BASE_URL)
+        await self.form_page.wait_for_page_load()
+
+        await self.form_page.click_delete_button()
+        await self.form_page.confirm_delete()
+        await self.form_page.wait_for_dom_stable()
+
+    @async_step("Verify entry details match")
+    async def verify_entry_details(
+        self, entry_id: str, expected_title: str, expected_section_count: int = None, base_url: str = None
+    ):
+        """Verify entry details on edit page"""
+        await self.form_page.navigate_to_edit(entry_id, base_url=base_url or BASE_URL)
+        await self.form_page.wait_for_page_load()
+
+        actual_title = await self.form_page.get_title_value()
+        assert actual_title == expected_title, f"Expected title '{expected_title}', got '{actual_title}'"
+
+        if expected_section_count is not None:
+            actual_count = await self.form_page.get_section_count()
+            assert actual_count == expected_section_count, f"Expected {expected_section_count} sections, got {actual_count}"
+
+    @async_step("Verify validation errors are shown")
+    async def verify_validation_errors(self):
+        """Verify that validation errors are shown when required fields are empty"""
+        await self.form_page.click_save_button(wait_for_save=False)
+        return await self.form_page.wait_for_validation_errors()
+
+    @async_step("Navigate back to list")
+    async def navigate_back_to_list(self):
+        """Navigate back to the knowledge base list page"""
+        await self.form_page.click_back_button()
+        await self.page.wait_for_load_state("domcontentloaded")
+        await self.form_page.wait_for_dom_stable()
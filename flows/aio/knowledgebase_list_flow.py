@@ -0,0 +1,65 @@
+# flows/aio/knowledgebase_list_flow.py
+import re
+from playwright.async_api import Page
+from config.env import BASE_URL
+from core.utils.async_step import async_step
+from pages.aio.knowledgebase_list_page import AsyncKnowledgeBaseListPage
+
+
+class AsyncKnowledgeBaseListFlow:
+    """Flow object for knowledge base list operations (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.list_page = AsyncKnowledgeBaseListPage(page)
+
+    @async_step("Navigate to knowledge base list and wait for load")
+    async def navigate_and_wait(self, base_url: str = None):
+        """Navigate to knowledge base list page and wait for it to load"""
+        await self.list_page.navigate(base_url or BASE_URL)
+        await self.list_page.wait_for_page_load()
+
+    @async_step("Create new article entry")
+    async def start_create_article(self):
+        """Start creating a new article entry"""
+        await self.list_page.click_create_button()
+        await self.list_page.select_article_option()
+        await self.list_page.wait_for_dom_stable()  # Create form opens
+
+    @async_step("Create new web content entry")
+    async def start_create_web_content(self):
+        """Start creating a new dynamic web content entry"""
+        await self.list_page.click_create_button()
+        await self.list_page.select_web_content_option()
+        await self.list_page.wait_for_dom_stable()  # Create form opens
+
+    @async_step("Create new URL entry")
+    async def start_create_url(self):
+        """Start creating a new URL entry"""
+        await self.list_page.click_create_button()
+        await self.list_page.select_url_option()
+        await self.list_page.wait_for_dom_stable()  # Create form opens
+
+    @async_step("Search and verify entry: {title}")
+    async def search_and_verify(self, title: str):
+        """Search for an entry and verify it exists"""
+        await self.list_page.search(title)
+        return await self.list_page.verify_entry_exists(title)
+
+    @async_step("Verify entry count is {expected_count}")
+    async def verify_entry_count(self, expected_count: int):
+        """Verify the number of knowledge base entries"""
+        actual_count = await self.list_page.get_row_count()
+        assert actual_count == expected_count, f"Expected {expected_count} entries, found {actual_count}"
+
+    @async_step("Verify entry with title exists: {title}")
+    async def verify_entry_with_title_exists(self, title: str):
+        """Verify that an entry with the given title exists in the list"""
+        titles = await self.list_page.get_entry_titles()
+        assert title in titles, f"Entry with title '{title}' not found in list"
+
+    @async_step("Open entry by title: {title}")
+    async def open_entry_by_title(self, title: str):
+        """Open a knowledge base entry by clicking on its title"""
+        await self.list_page.click_entry_by_title(title)
+        await self.page.wait_for_url(re.compile(r".*/knowledgebase/edit/"))
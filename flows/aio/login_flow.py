@@ -0,0 +1,71 @@
+# flows/aio/login_flow.py
+from playwright.async_api import Page
+from core.utils.async_step import async_step
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.otp_page import AsyncOTPPage
+import allure
+
+
+class AsyncLoginFlow:
+    """High-level flow for login process (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.login_page = AsyncLoginPage(page)
+        self.otp_page = AsyncOTPPage(page)
+
+    @async_step("Complete login flow with email and OTP")
+    async def complete_login(self, email: str, otp_code: str = "1111") -> bool:
+        """Complete the full login flow; raises AssertionError if a step fails"""
+        with allure.step("Navigate to login page"):
+            await self.login_page.navigate()
+
+        with allure.step(f"Submit email: {email}"):
+            await self.login_page.submit_email(email)
+
+        with allure.step("Check for email errors"):
+            has_error, error_text = await self.login_page.check_for_errors()
+            if has_error:
+                raise AssertionError(f"❌ Login failed: {error_text}")
+
+        with allure.step("Verify navigation to OTP page"):
+            if not await self.login_page.verify_navigation_to_otp():
+                raise AssertionError("❌ Failed to navigate to OTP page")
+
+        with allure.step(f"Submit OTP: {otp_code}"):
+            await self.otp_page.submit_otp(otp_code)
+
+        with allure.step("Wait for dashboard"):
+            await self.otp_page.wait_for_dashboard()
+
+        with allure.step("Verify successful login"):
+            if not await self.otp_page.verify_left_otp_page():
+                raise AssertionError("❌ Still on OTP page after submission")
+
+        return True
+
+    @async_step("Login with email only (stop at OTP page)")
+    async def login_email_only(self, email: str) -> bool:
+        """Login with email and stop at OTP page; False on the OTP rate limit"""
+        await self.login_page.navigate()
+        await self.login_page.submit_email(email)
+
+        has_error, error_text = await self.login_page.check_for_errors()
+        if has_error:
+            if error_text and "Please wait 3 minutes before requesting a new code" in error_text:
+                print("INFO: OTP rate limit detected, returning False from login_email_only.")
+                return False
+            raise AssertionError(f"❌ Email validation failed: {error_text}")
+
+        return await self.login_page.verify_navigation_to_otp()
+
+    @async_step("Submit OTP on already loaded OTP page")
+    async def submit_otp_only(self, otp_code: str = "1111") -> bool:
+        """Submit OTP when already on OTP page"""
+        if not self.otp_page.is_on_otp_page():
+            raise AssertionError("❌ Not on OTP page")
+
+        await self.otp_page.submit_otp(otp_code)
+        await self.otp_page.wait_for_dashboard()
+
+        return await self.otp_page.verify_left_otp_page()
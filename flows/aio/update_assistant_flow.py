@@ -0,0 +1,29 @@
+# flows/aio/update_assistant_flow.py
+from playwright.async_api import expect
+from pages.aio.base_page import AsyncBasePage
+from pages.assistant.assistants_page import AssistantsSelectors
+
+
+class AsyncUpdateAssistantFlow:
+    """Update an assistant's basic fields (async API)"""
+
+    def __init__(self, page):
+        self.page = page
+        self.base_page = AsyncBasePage(page)
+
+    async def update_basic_fields(self, new_name, new_description):
+        """Update name and description fields on assistant detail page"""
+        await self.page.locator(AssistantsSelectors.DETAIL_NAME_INPUT).fill(new_name)
+        await self.page.locator(AssistantsSelectors.DETAIL_DESCRIPTION_INPUT).fill(new_description)
+
+        # Save and wait for the API to accept it
+        async with self.base_page.wait_for_api_response("/assistants/"):
+            await self.page.get_by_role("button", name="Save").click()
+
+        # Reload the page to confirm persistence
+        await self.page.reload()
+
+        await expect(self.page.locator(AssistantsSelectors.DETAIL_NAME_INPUT)).to_have_value(new_name)
+        await expect(self.page.locator(AssistantsSelectors.DETAIL_DESCRIPTION_INPUT)).to_have_value(new_description)
+
+        return True
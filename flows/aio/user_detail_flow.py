@@ -0,0 +1,59 @@
+# flows/aio/user_detail_flow.py
+from playwright.async_api import Page
+from core.utils.async_step import async_step
+from pages.aio.user_detail_page import AsyncUserDetailPage
+
+
+class AsyncUserDetailFlow:
+    """High-level flow for user detail page (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.user_detail_page = AsyncUserDetailPage(page)
+
+    @async_step("Navigate to user detail page: {user_id}")
+    async def navigate_to_user_detail(self, base_url: str, user_id: str):
+        """Navigate to user detail page"""
+        await self.user_detail_page.navigate_to_user_detail(base_url, user_id)
+        await self.user_detail_page.wait_for_user_to_load()
+        return self
+
+    @async_step("Edit user: {first_name} {last_name}")
+    async def edit_user(self, first_name: str = None, last_name: str = None, email: str = None):
+        """Edit user details and save"""
+        if first_name:
+            await self.user_detail_page.fill_first_name(first_name)
+        if last_name:
+            await self.user_detail_page.fill_last_name(last_name)
+        if email:
+            await self.user_detail_page.fill_email(email)
+
+        async with self.user_detail_page.wait_for_api_response():
+            await self.user_detail_page.save()
+        return self
+
+    @async_step("Delete user")
+    async def delete_user(self):
+        """Delete user and confirm"""
+        await self.user_detail_page.delete()
+
+        if await self.user_detail_page.wait_for_delete_alert():
+            async with self.user_detail_page.wait_for_api_response():
+                await self.user_detail_page.confirm_delete()
+
+        return self
+
+    @async_step("Verify user details loaded")
+    async def verify_user_details_loaded(self) -> bool:
+        """Verify that user details are loaded on the page"""
+        return (
+            await self.user_detail_page.get_first_name_value() != "" and
+            await self.user_detail_page.get_last_name_value() != "" and
+            await self.user_detail_page.get_email_value() != ""
+        )
+
+    @async_step("Go back to users list")
+    async def go_back(self):
+        """Click back button to return to users list"""
+        await self.user_detail_page.click_back()
+        return self
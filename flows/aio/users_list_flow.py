@@ -0,0 +1,48 @@
+# flows/aio/users_list_flow.py
+from playwright.async_api import Page
+from core.utils.async_step import async_step
+from pages.aio.users_list_page import AsyncUsersListPage
+
+
+class AsyncUsersListFlow:
+    """High-level flow for users list page (async API)"""
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.users_list_page = AsyncUsersListPage(page)
+
+    @async_step("Navigate to users page")
+    async def navigate_to_users(self, base_url: str):
+        """Navigate to users page"""
+        await self.users_list_page.navigate_to_users(base_url)
+        await self.users_list_page.wait_for_users_to_load()
+        return self
+
+    @async_step("Open add user modal")
+    async def open_add_user_modal(self):
+        """Click create new button to open add user modal"""
+        await self.users_list_page.click_create_new()
+        await self.users_list_page.wait_for_add_user_modal()
+        return self
+
+    @async_step("Click user by index: {index}")
+    async def click_user_by_index(self, index: int):
+        """Click on a user card by index to navigate to detail page"""
+        await self.users_list_page.click_user_by_index(index)
+        return self
+
+    @async_step("Verify users are displayed")
+    async def verify_users_displayed(self) -> bool:
+        """Verify that users are displayed on the page"""
+        return await self.users_list_page.get_user_count() > 0
+
+    @async_step("Verify empty state is shown")
+    async def verify_empty_state(self) -> bool:
+        """Verify that empty state message is shown"""
+        return await self.users_list_page.is_empty_state_visible()
+
+    @async_step("Wait for page to load")
+    async def wait_for_page_load(self):
+        """Wait for users page to fully load"""
+        await self.users_list_page.wait_for_users_to_load()
+        return self
@@ -8,6 +8,7 @@ class CreateAssistantFlow:
     def __init__(self, page):
         self.page = page
         self.assistants_page = AssistantsPage(page)
+        self.created_id = None
 
     def create_assistant(self, base_url: str, type_name: str = "voice"):
         """Complete end-to-end assistant creation"""
@@ -20,7 +21,7 @@ class CreateAssistantFlow:
         self.assistants_page.wait_for_create_modal()
 
         # Step 3: Select type
-        self.page.locator(f"div[role='dialog'] #{type_name}").click()
+        self.page.locator(AssistantsPage.DIALOG_TYPE_OPTION.format(type_name=type_name)).click()
         # self.page.locator(f"#{type_name}").click()
         # Step 4: Enter random name
         random_name = f"Auto-{uuid.uuid4().hex[:6]}"
@@ -30,10 +31,10 @@ class CreateAssistantFlow:
         self.assistants_page.submit_create()
 
         # Step 6: Wait for SPA navigation to assistant detail page
-        pattern = re.compile(r".*/assistants/[A-Za-z0-9]+$")
-        self.page.wait_for_url(pattern, timeout=10000)
+        self.page.wait_for_url(AssistantsPage.DETAIL_URL, timeout=10000)
 
-        expect(self.page).to_have_url(pattern)
+        expect(self.page).to_have_url(AssistantsPage.DETAIL_URL)
+        self.created_id = self.page.url.rstrip("/").rsplit("/", 1)[-1]
 
         print(f"Created assistant with name: {random_name}")
         return random_name
@@ -1,5 +1,6 @@
 import re
 from playwright.sync_api import expect
+from pages.assistant.assistants_page import AssistantsSelectors
 
 class DeleteAssistantFlow:
 
@@ -20,6 +21,6 @@ class DeleteAssistantFlow:
         self.page.get_by_role("button", name="Continue").click()
 
         # Step 4: Wait for redirect back to assistant list
-        self.page.wait_for_url(re.compile(r".*/assistants$"), timeout=10000)
+        self.page.wait_for_url(AssistantsSelectors.LIST_URL, timeout=10000)
 
-        expect(self.page).to_have_url(re.compile(r".*/assistants$"))
+        expect(self.page).to_have_url(AssistantsSelectors.LIST_URL)
@@ -35,8 +35,8 @@ class ContactFormFlow:
         if phone:
             self.contact_form_page.fill_phone(phone)
         
-        self.contact_form_page.save()
-        self.page.wait_for_timeout(1500)  # Wait for save to complete
+        with self.contact_form_page.wait_for_api_response():
+            self.contact_form_page.save()
         return self
     
     @allure.step("Edit contact")
@@ -51,19 +51,18 @@ class ContactFormFlow:
         if phone is not None:
             self.contact_form_page.fill_phone(phone)
         
-        self.contact_form_page.save()
-        self.page.wait_for_timeout(1500)  # Wait for save to complete
+        with self.contact_form_page.wait_for_api_response():
+            self.contact_form_page.save()
         return self
     
     @allure.step("Delete contact")
     def delete_contact(self):
         """Delete contact and confirm"""
         self.contact_form_page.delete()
-        self.page.wait_for_timeout(500)  # Wait for alert to appear
         
-        if self.contact_form_page.is_delete_alert_visible():
-            self.contact_form_page.confirm_delete()
-            self.page.wait_for_timeout(1500)  # Wait for deletion to complete
+        if self.contact_form_page.wait_for_delete_alert():
+            with self.contact_form_page.wait_for_api_response():
+                self.contact_form_page.confirm_delete()
         
         return self
     
@@ -33,14 +33,13 @@ class KnowledgeBaseFormFlow:
         for i, section in enumerate(sections):
             if i > 0:  # Add section if not the first one
                 self.form_page.click_add_section_button()
-                self.page.wait_for_timeout(500)
                 
             self.form_page.fill_section_name(section['name'], i)
             self.form_page.fill_section_content(section['content'], i)
             
         # Save
         self.form_page.click_save_button()
-        self.page.wait_for_timeout(2000)  # Wait for save to complete
+        self.form_page.wait_for_dom_stable()  # Let the app settle after the save
         
     @allure.step("Create URL entry with title: {title}")
     def create_url_entry(self, title: str, url: str, frequency: str = "24", prompt: str = "", base_url: str = None):
@@ -61,7 +60,7 @@ class KnowledgeBaseFormFlow:
             
         # Save
         self.form_page.click_save_button()
-        self.page.wait_for_timeout(2000)  # Wait for save to complete
+        self.form_page.wait_for_dom_stable()  # Let the app settle after the save
         
     @allure.step("Edit entry title to: {new_title}")
     def edit_entry_title(self, entry_id: str, new_title: str, base_url: str = None):
@@ -73,7 +72,7 @@ class KnowledgeBaseFormFlow:
         
         self.form_page.fill_title(new_title)
         self.form_page.click_save_button()
-        self.page.wait_for_timeout(2000)
+        self.form_page.wait_for_dom_stable()  # Let the app settle after the save
         
     @allure.step("Edit entry and add section")
     def edit_and_add_section(self, entry_id: str, section_name: str, section_content: str, base_url: str = None):
@@ -88,7 +87,6 @@ class KnowledgeBaseFormFlow:
         
         # Add new section
         self.form_page.click_add_section_button()
-        self.page.wait_for_timeout(500)
         
         # Fill new section
         self.form_page.fill_section_name(section_name, current_count)
@@ -96,7 +94,7 @@ class KnowledgeBaseFormFlow:
         
         # Save
         self.form_page.click_save_button()
-        self.page.wait_for_timeout(2000)
+        self.form_page.wait_for_dom_stable()  # Let the app settle after the save
         
     @allure.step("Delete entry")
     def delete_entry(self, entry_id: str, base_url: str = None):
@@ -108,7 +106,7 @@ class KnowledgeBaseFormFlow:
         
         self.form_page.click_delete_button()
         self.form_page.confirm_delete()
-        self.page.wait_for_timeout(2000)
+        self.form_page.wait_for_dom_stable()
         
     @allure.step("Verify entry details match")
     def verify_entry_details(self, entry_id: str, expected_title: str, expected_section_count: int = None, base_url: str = None):
@@ -131,20 +129,14 @@ class KnowledgeBaseFormFlow:
     def verify_validation_errors(self):
         """Verify that validation errors are shown when required fields are empty"""
         # Try to save without filling required fields
-        self.form_page.click_save_button()
-        self.page.wait_for_timeout(500)
-        
-        # Check for validation errors
-        has_errors = (
-            self.form_page.is_title_error_visible() or
-            self.form_page.is_section_name_error_visible() or
-            self.form_page.is_content_error_visible()
-        )
+        self.form_page.click_save_button(wait_for_save=False)
         
-        return has_errors
+        # Any of the validation errors, probed in one browser-side check
+        return self.form_page.wait_for_validation_errors()
         
     @allure.step("Navigate back to list")
     def navigate_back_to_list(self):
         """Navigate back to the knowledge base list page"""
         self.form_page.click_back_button()
-        self.page.wait_for_timeout(1000)
+        self.page.wait_for_load_state("domcontentloaded")
+        self.form_page.wait_for_dom_stable()
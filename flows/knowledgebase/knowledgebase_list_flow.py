@@ -5,6 +5,7 @@ Combines page actions into complete user workflows
 from pages.knowledgebase.knowledgebase_list_page import KnowledgeBaseListPage
 from playwright.sync_api import Page
 import allure
+import re
 from config.env import BASE_URL
 
 
@@ -28,21 +29,21 @@ class KnowledgeBaseListFlow:
         """Start creating a new article entry"""
         self.list_page.click_create_button()
         self.list_page.select_article_option()
-        self.page.wait_for_timeout(1000)
+        self.list_page.wait_for_dom_stable()  # Create form opens
         
     @allure.step("Create new web content entry")
     def start_create_web_content(self):
         """Start creating a new dynamic web content entry"""
         self.list_page.click_create_button()
         self.list_page.select_web_content_option()
-        self.page.wait_for_timeout(1000)
+        self.list_page.wait_for_dom_stable()  # Create form opens
         
     @allure.step("Create new URL entry")
     def start_create_url(self):
         """Start creating a new URL entry"""
         self.list_page.click_create_button()
         self.list_page.select_url_option()
-        self.page.wait_for_timeout(1000)
+        self.list_page.wait_for_dom_stable()  # Create form opens
         
     @allure.step("Search and verify entry: {title}")
     def search_and_verify(self, title: str):
@@ -66,4 +67,4 @@ class KnowledgeBaseListFlow:
     def open_entry_by_title(self, title: str):
         """Open a knowledge base entry by clicking on its title"""
         self.list_page.click_entry_by_title(title)
-        self.page.wait_for_timeout(1000)
+        self.page.wait_for_url(re.compile(r".*/knowledgebase/edit/"))
@@ -3,7 +3,6 @@ from playwright.sync_api import Page
 from pages.login_page import LoginPage
 from pages.otp_page import OTPPage
 import allure
-import time
 
 class LoginFlow:
     """High-level flow for login process"""
@@ -44,7 +43,6 @@ class LoginFlow:
         
         # Step 4: Verify navigation to OTP page
         with allure.step("Verify navigation to OTP page"):
-            time.sleep(0.5)  # Small delay to ensure URL is updated
             if not self.login_page.verify_navigation_to_otp():
                 raise AssertionError("❌ Failed to navigate to OTP page")
         
@@ -29,19 +29,18 @@ class UserDetailFlow:
         if email:
             self.user_detail_page.fill_email(email)
         
-        self.user_detail_page.save()
-        self.page.wait_for_timeout(1000)  # Wait for save to complete
+        with self.user_detail_page.wait_for_api_response():
+            self.user_detail_page.save()
         return self
     
     @allure.step("Delete user")
     def delete_user(self):
         """Delete user and confirm"""
         self.user_detail_page.delete()
-        self.page.wait_for_timeout(500)  # Wait for alert to appear
         
-        if self.user_detail_page.is_delete_alert_visible():
-            self.user_detail_page.confirm_delete()
-            self.page.wait_for_timeout(1000)  # Wait for deletion to complete
+        if self.user_detail_page.wait_for_delete_alert():
+            with self.user_detail_page.wait_for_api_response():
+                self.user_detail_page.confirm_delete()
         
         return self
     
@@ -23,7 +23,7 @@ class UsersListFlow:
     def open_add_user_modal(self):
         """Click create new button to open add user modal"""
         self.users_list_page.click_create_new()
-        self.page.wait_for_timeout(500)  # Wait for modal animation
+        self.users_list_page.wait_for_add_user_modal()
         return self
     
     @allure.step("Click user by index: {index}")
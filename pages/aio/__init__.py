@@ -0,0 +1,6 @@
+"""Page Object Models for the asyncio Playwright API"""
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.otp_page import AsyncOTPPage
+
+__all__ = ["AsyncBasePage", "AsyncLoginPage", "AsyncOTPPage"]
@@ -0,0 +1,29 @@
+# pages/aio/assistants_page.py
+from playwright.async_api import expect
+from pages.aio.base_page import AsyncBasePage
+from pages.assistant.assistants_page import AssistantsSelectors
+
+
+class AsyncAssistantsPage(AssistantsSelectors, AsyncBasePage):
+    """Async page object for the Assistants listing page"""
+
+    async def open(self, base_url: str):
+        await self.navigate(f"{base_url}/assistants")
+
+    async def open_detail(self, base_url: str, assistant_id: str, tab: str = "general"):
+        await self.navigate(f"{base_url}/assistants/{assistant_id}?tab={tab}")
+
+    async def click_create_new(self):
+        await self.page.click(self.CREATE_NEW_BUTTON)
+
+    async def wait_for_create_modal(self):
+        await expect(self.page.locator(self.MODAL_TITLE)).to_be_visible()
+
+    async def select_type(self, type_name: str):
+        await self.page.get_by_text(type_name, exact=True).click()
+
+    async def enter_name(self, name: str):
+        await self.page.fill(self.NAME_INPUT, name)
+
+    async def submit_create(self):
+        await self.page.click(self.CREATE_BUTTON)
@@ -0,0 +1,216 @@
+# pages/aio/base_page.py
+"""
+BasePage for the asyncio Playwright API.
+
+Same methods as pages.base_page.BasePage, as coroutines, so one process can
+drive many pages concurrently:
+
+    pages = [AsyncContactFormPage(await context.new_page()) for context in contexts]
+    await asyncio.gather(*(p.navigate_to_edit_contact(BASE_URL, id) for p, id in zip(pages, ids)))
+
+Selectors, readiness strategies and the browser-side scripts are shared with
+the sync page objects; only the I/O is async. Request routing (allow_resources)
+is installed by the sync context fixture only and does not apply here.
+"""
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+import re
+from playwright.async_api import Error, Page, TimeoutError as PlaywrightTimeoutError, expect
+import allure
+from config.env import NAVIGATION_MODE
+from core.playwright.navigation_timing import get_navigation_timings
+from core.playwright.web_vitals import get_web_vitals
+from core.utils.timing_ledger import get_timing_ledger
+from pages.base_page import (
+    MUTATING_METHODS,
+    TOAST_SELECTOR,
+    _DOM_STABLE_JS,
+    _EXTRACT_ROWS_JS,
+    _FIRST_MATCH_JS,
+    _selector_spec,
+)
+from pages.readiness import SPINNER_SELECTOR, ReadyStrategy, SpinnerHidden
+
+
+class AsyncBasePage:
+    """Base page class with common methods for all async pages"""
+
+    # Readiness after navigation; page classes override these defaults
+    wait_until = "domcontentloaded"
+    ready: ReadyStrategy = SpinnerHidden()
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def navigate(self, url: str, wait_until: Optional[str] = None):
+        """Navigate to a URL and wait until the page object is ready"""
+        start = time.perf_counter()
+        if NAVIGATION_MODE == "networkidle":
+            await self.page.goto(url, wait_until=wait_until or "networkidle")
+        else:
+            async with self.ready.around_async(self):
+                await self.page.goto(url, wait_until=wait_until or self.wait_until)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        get_navigation_timings().record(NAVIGATION_MODE, type(self).__name__, elapsed_ms)
+        get_timing_ledger().record("navigation", type(self).__name__, elapsed_ms, url=url)
+        web_vitals = get_web_vitals()
+        if web_vitals.enabled:
+            await web_vitals.measure_async(self.page, type(self).__name__, url, elapsed_ms)
+
+    async def wait_for_url(self, pattern: str, timeout: int = 5000):
+        """Wait for URL to match a pattern"""
+        await expect(self.page).to_have_url(re.compile(pattern), timeout=timeout)
+
+    async def take_screenshot(self, name: str):
+        """Take and attach screenshot to Allure"""
+        screenshot_bytes = await self.page.screenshot()
+        allure.attach(screenshot_bytes, name, allure.attachment_type.PNG)
+        return screenshot_bytes
+
+    async def wait_for_timeout(self, timeout: int):
+        """Wait for a specific timeout (prefer the event-driven waits below)"""
+        await self.page.wait_for_timeout(timeout)
+
+    async def wait_for_load_state(self, state: str = "networkidle"):
+        """Wait for page load state"""
+        await self.page.wait_for_load_state(state)
+
+    def get_current_url(self) -> str:
+        """Get current page URL"""
+        return self.page.url
+
+    @asynccontextmanager
+    async def wait_for_api_response(
+        self,
+        url: Optional[Union[str, Pattern]] = None,
+        methods: Union[str, Iterable[str]] = MUTATING_METHODS,
+        timeout: int = 15000,
+    ):
+        """
+        Wait for the API response triggered by the actions inside the block
+
+            async with self.wait_for_api_response("/contacts") as response:
+                await self.save()
+            (await response.value).status
+        """
+        methods = {methods.upper()} if isinstance(methods, str) else {m.upper() for m in methods}
+
+        def matches(response) -> bool:
+            request = response.request
+            if request.resource_type not in ("fetch", "xhr"):
+                return False
+            if methods and request.method not in methods:
+                return False
+            if url is None:
+                return True
+            if isinstance(url, str):
+                return url in response.url
+            return bool(url.search(response.url))
+
+        async with self.page.expect_response(matches, timeout=timeout) as response_info:
+            yield response_info
+
+    async def wait_for_dom_stable(self, selector: str = "body", quiet_ms: int = 300, timeout: int = 5000) -> bool:
+        """
+        Wait until `selector` (default: whole page) stops changing for `quiet_ms`
+        Returns False if it was still changing after `timeout`
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                return False
+            try:
+                return await self.page.evaluate(_DOM_STABLE_JS, [selector, quiet_ms, remaining])
+            except Error as e:
+                # A navigation replaced the document mid-wait: watch the new one instead
+                if "context was destroyed" not in str(e) and "navigat" not in str(e):
+                    raise
+                await self.page.wait_for_load_state("domcontentloaded")
+
+    async def wait_for_spinner_hidden(self, selector: str = SPINNER_SELECTOR, timeout: int = 10000) -> bool:
+        """Wait for loading spinners to go away (returns immediately if none is shown)"""
+        try:
+            await self.page.wait_for_selector(selector, state="hidden", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def wait_for_toast(self, text: Optional[Union[str, Pattern]] = None, timeout: int = 5000) -> str:
+        """Wait for a toast notification (optionally containing `text`) and return its text"""
+        toast = self.page.locator(TOAST_SELECTOR)
+        if text is not None:
+            toast = toast.filter(has_text=text)
+        await toast.first.wait_for(state="visible", timeout=timeout)
+        return (await toast.first.text_content() or "").strip()
+
+    async def wait_for_any_visible(self, selectors: Iterable[str], timeout: int = 5000) -> bool:
+        """Wait until any of the selectors is visible; False on timeout"""
+        selectors = list(selectors)
+        locator = self.page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.page.locator(selector))
+        try:
+            await locator.first.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def first_match(
+        self, selectors: Iterable[str], timeout: int = 5000, stop_selectors: Iterable[str] = ()
+    ) -> Optional[Tuple[str, str]]:
+        """Wait for the first of `selectors` to show visible text and return (selector, text), see BasePage"""
+        specs: List[dict] = [_selector_spec(s) for s in selectors]
+        stops: List[dict] = [_selector_spec(s) for s in stop_selectors]
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                if timeout <= 0:
+                    match = await self.page.evaluate(_FIRST_MATCH_JS, [specs, stops])
+                else:
+                    remaining = int((deadline - time.monotonic()) * 1000)
+                    if remaining <= 0:
+                        return None
+                    handle = await self.page.wait_for_function(_FIRST_MATCH_JS, arg=[specs, stops], timeout=remaining)
+                    match = await handle.json_value()
+            except PlaywrightTimeoutError:
+                return None
+            except Error as e:
+                # A navigation replaced the document mid-wait: probe the new one instead
+                if "context was destroyed" not in str(e) and "navigat" not in str(e):
+                    raise
+                await self.page.wait_for_load_state("domcontentloaded")
+                continue
+            if not match or match["selector"] is None:
+                return None
+            return match["selector"], match["text"]
+
+    async def extract_rows(
+        self,
+        row_selector: str,
+        cells: Dict[str, Union[str, List[str]]],
+        model: Callable[..., Any] = dict,
+        start: int = 0,
+        count: Optional[int] = None,
+    ) -> list:
+        """Read a whole table / card list in one browser call, see BasePage.extract_rows"""
+        rows = await self.page.locator(row_selector).evaluate_all(_EXTRACT_ROWS_JS, [cells, start, count])
+        return [model(**row) for row in rows]
+
+    async def stream_rows(
+        self,
+        row_selector: str,
+        cells: Dict[str, Union[str, List[str]]],
+        model: Callable[..., Any] = dict,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[Any]:
+        """extract_rows in chunks of `chunk_size` rows, for lists too long to pull at once"""
+        start = 0
+        while True:
+            chunk = await self.extract_rows(row_selector, cells, model, start, chunk_size)
+            for row in chunk:
+                yield row
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
@@ -0,0 +1,119 @@
+# pages/aio/contact_form_page.py
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.contacts.contact_form_page import ContactFormSelectors
+
+
+class AsyncContactFormPage(ContactFormSelectors, AsyncBasePage):
+    """Async Page Object for Contact Form Page (both new and edit)"""
+
+    async def navigate_to_new_contact(self, base_url: str):
+        """Navigate to new contact page"""
+        await self.navigate(f"{base_url}/contacts/new")
+        return self
+
+    async def navigate_to_edit_contact(self, base_url: str, contact_id: str):
+        """Navigate to edit contact page"""
+        await self.navigate(f"{base_url}/contacts/edit?id={contact_id}")
+        return self
+
+    async def is_new_page_loaded(self) -> bool:
+        """Check if new contact page is loaded"""
+        try:
+            await expect(self.page.locator(self._page_title_new)).to_be_visible(timeout=5000)
+            return True
+        except AssertionError:
+            return False
+
+    async def is_edit_page_loaded(self) -> bool:
+        """Check if edit contact page is loaded"""
+        try:
+            await expect(self.page.locator(self._page_title_edit)).to_be_visible(timeout=5000)
+            return True
+        except AssertionError:
+            return False
+
+    async def click_back(self):
+        """Click back button"""
+        await self.page.locator(self._back_button).click()
+        return self
+
+    async def fill_first_name(self, first_name: str):
+        """Fill first name field"""
+        await self.get_first_name_input().fill(first_name)
+        return self
+
+    async def fill_last_name(self, last_name: str):
+        """Fill last name field"""
+        await self.get_last_name_input().fill(last_name)
+        return self
+
+    async def fill_email(self, email: str):
+        """Fill email field"""
+        await self.get_email_input().fill(email)
+        return self
+
+    async def fill_phone(self, phone: str):
+        """Fill phone field"""
+        await self.get_phone_input().fill(phone)
+        return self
+
+    async def save(self):
+        """Click save button"""
+        await self.get_save_button().click()
+        return self
+
+    async def cancel(self):
+        """Click cancel button"""
+        await self.page.locator(self._cancel_button).click()
+        return self
+
+    async def delete(self):
+        """Click delete button"""
+        await self.get_delete_button().click()
+        return self
+
+    async def confirm_delete(self):
+        """Confirm delete in alert dialog"""
+        await self.page.locator(self._confirm_delete).click(force=True)
+        return self
+
+    async def wait_for_delete_alert(self, timeout: int = 3000) -> bool:
+        """Wait for the delete alert dialog; False if it doesn't open"""
+        return await self.wait_for_any_visible([self._delete_alert], timeout=timeout)
+
+    async def is_delete_alert_visible(self) -> bool:
+        """Check if delete alert dialog is visible"""
+        return await self.page.locator(self._delete_alert).is_visible()
+
+    async def is_loading(self) -> bool:
+        """Check if loading spinner is visible"""
+        return await self.page.locator(self._loading_spinner).is_visible()
+
+    async def wait_for_contact_to_load(self, timeout: int = 10000):
+        """Wait for contact data to load (spinner to disappear)"""
+        try:
+            await self.page.wait_for_selector(self._loading_spinner, state='hidden', timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass  # Spinner might not appear if loading is fast
+        return self
+
+    async def get_first_name_value(self) -> str:
+        """Get current first name value"""
+        return await self.get_first_name_input().input_value()
+
+    async def get_last_name_value(self) -> str:
+        """Get current last name value"""
+        return await self.get_last_name_input().input_value()
+
+    async def get_email_value(self) -> str:
+        """Get current email value"""
+        return await self.get_email_input().input_value()
+
+    async def get_phone_value(self) -> str:
+        """Get current phone value"""
+        return await self.get_phone_input().input_value()
+
+    async def is_delete_button_visible(self) -> bool:
+        """Check if delete button is visible (only on edit page)"""
+        return await self.get_delete_button().is_visible()
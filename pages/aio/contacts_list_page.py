@@ -0,0 +1,79 @@
+# pages/aio/contacts_list_page.py
+from typing import AsyncIterator, List
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.contacts.contacts_list_page import ContactRow, ContactsListSelectors
+
+
+class AsyncContactsListPage(ContactsListSelectors, AsyncBasePage):
+    """Async Page Object for Contacts List Page"""
+
+    async def navigate_to_contacts(self, base_url: str):
+        """Navigate to contacts page"""
+        await self.navigate(f"{base_url}/contacts")
+        return self
+
+    async def is_page_loaded(self) -> bool:
+        """Check if contacts page is loaded"""
+        try:
+            await expect(self.page.locator(self._page_title)).to_be_visible(timeout=5000)
+            return True
+        except AssertionError:
+            return False
+
+    async def click_add_contact(self):
+        """Click add contact button"""
+        await self.get_add_contact_button().click()
+        return self
+
+    async def get_contact_count(self) -> int:
+        """Get number of contacts in the table"""
+        await self.wait_for_spinner_hidden(self._loading_spinner)
+        await self.wait_for_dom_stable()  # Rows render right after the spinner goes away
+        return await self.get_table_rows().count()
+
+    async def click_contact_by_index(self, index: int):
+        """Click on a contact row by index to navigate to edit page"""
+        await self.get_table_rows().nth(index).click()
+        return self
+
+    async def is_empty_state_visible(self) -> bool:
+        """Check if empty state message is visible"""
+        return await self.page.locator(self._empty_state).is_visible()
+
+    async def is_loading(self) -> bool:
+        """Check if loading spinner is visible"""
+        return await self.page.locator(self._loading_spinner).is_visible()
+
+    async def wait_for_contacts_to_load(self, timeout: int = 10000):
+        """Wait for contacts to load (spinner to disappear)"""
+        try:
+            await self.page.wait_for_selector(self._loading_spinner, state='hidden', timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass  # Spinner might not appear if loading is fast
+        return self
+
+    async def get_contacts(self) -> List[ContactRow]:
+        """Get name, email and phone of every listed contact in one browser call"""
+        return await self.extract_rows(self._table_rows, self._row_cells, ContactRow)
+
+    def iter_contacts(self, chunk_size: int = 100) -> AsyncIterator[ContactRow]:
+        """Stream contacts in chunks (for very long lists)"""
+        return self.stream_rows(self._table_rows, self._row_cells, ContactRow, chunk_size)
+
+    async def get_contact_name_by_index(self, index: int) -> str:
+        """Get contact name by index"""
+        return await self.get_table_rows().nth(index).locator('td').nth(1).text_content() or ""
+
+    async def get_contact_email_by_index(self, index: int) -> str:
+        """Get contact email by index"""
+        return await self.get_table_rows().nth(index).locator('td').nth(2).text_content() or ""
+
+    async def get_contact_phone_by_index(self, index: int) -> str:
+        """Get contact phone by index"""
+        return await self.get_table_rows().nth(index).locator('td').nth(3).text_content() or ""
+
+    async def click_call_button_by_index(self, index: int):
+        """Click the call button for a contact by index"""
+        await self.get_table_rows().nth(index).locator('button').first.click()
+        return self
@@ -0,0 +1,196 @@
+# pages/aio/knowledgebase_form_page.py
+import re
+from typing import Optional, Tuple
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError, expect
+from config.env import BASE_URL
+from core.utils.async_step import async_step
+from pages.aio.base_page import AsyncBasePage
+from pages.knowledgebase.knowledgebase_form_page import KnowledgeBaseFormSelectors
+
+
+class AsyncKnowledgeBaseFormPage(KnowledgeBaseFormSelectors, AsyncBasePage):
+    """Async page object for knowledge base create/edit form page"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.base_url = BASE_URL
+
+    @async_step("Navigate to create knowledge base page")
+    async def navigate_to_create(self, base_url: str = None, type: str = "article"):
+        """Navigate to the create knowledge base page"""
+        await self.navigate(f"{base_url or self.base_url}/knowledgebase/create?type={type}")
+
+    @async_step("Navigate to edit knowledge base page: {entry_id}")
+    async def navigate_to_edit(self, entry_id: str, base_url: str = None):
+        """Navigate to the edit knowledge base page"""
+        await self.navigate(f"{base_url or self.base_url}/knowledgebase/edit/{entry_id}")
+
+    @async_step("Wait for page to load")
+    async def wait_for_page_load(self):
+        """Wait for the page to finish loading"""
+        try:
+            await self.page.wait_for_selector(self._loading_indicator, state="hidden", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass  # Loading indicator might not appear for create page
+
+    @async_step("Fill title: {title}")
+    async def fill_title(self, title: str):
+        """Fill the title field"""
+        await self.page.fill(self._title_input, title)
+
+    @async_step("Get title value")
+    async def get_title_value(self):
+        """Get the current title value"""
+        return await self.page.input_value(self._title_input)
+
+    @async_step("Fill section name at index {index}: {name}")
+    async def fill_section_name(self, name: str, index: int = 0):
+        """Fill a section name field"""
+        section_inputs = await self.page.locator(self._section_name_inputs).all()
+        if len(section_inputs) > index:
+            await section_inputs[index].fill(name)
+
+    @async_step("Get section name at index {index}")
+    async def get_section_name(self, index: int = 0):
+        """Get a section name value"""
+        section_inputs = await self.page.locator(self._section_name_inputs).all()
+        if len(section_inputs) > index:
+            return await section_inputs[index].input_value()
+        return ""
+
+    @async_step("Fill section content at index {index}")
+    async def fill_section_content(self, content: str, index: int = 0):
+        """Fill section content in the editor"""
+        editors = await self.page.locator(self._editor).all()
+        if len(editors) > index:
+            await editors[index].click()
+            await editors[index].fill(content)
+
+    @async_step("Click save button")
+    async def click_save_button(self, wait_for_save: bool = True):
+        """Click the save button and wait for the API to store the entry"""
+        if not wait_for_save:
+            await self.page.click(self._save_button)
+            return
+        async with self.wait_for_api_response():
+            await self.page.click(self._save_button)
+
+    @async_step("Click back button")
+    async def click_back_button(self):
+        """Click the back button"""
+        await self.page.click(self._back_button)
+
+    @async_step("Click add section button")
+    async def click_add_section_button(self):
+        """Click the add new section button and wait for the new section"""
+        sections = self.page.locator(self._section_name_inputs)
+        count = await sections.count()
+        await self.page.click(self._add_section_button)
+        await expect(sections).to_have_count(count + 1)
+
+    @async_step("Click remove section button at index {index}")
+    async def click_remove_section_button(self, index: int = 0):
+        """Click remove section button and wait for the section to go away"""
+        sections = self.page.locator(self._section_name_inputs)
+        remove_buttons = await self.page.locator(self._remove_section_buttons).all()
+        if len(remove_buttons) > index:
+            count = await sections.count()
+            await remove_buttons[index].click()
+            await expect(sections).to_have_count(count - 1)
+
+    @async_step("Get section count")
+    async def get_section_count(self):
+        """Get the number of sections"""
+        return await self.page.locator(self._sections).count()
+
+    @async_step("Click delete button")
+    async def click_delete_button(self):
+        """Click the delete button (edit page only)"""
+        await self.page.click(self._delete_button)
+
+    @async_step("Confirm delete")
+    async def confirm_delete(self):
+        """Confirm deletion in the alert dialog"""
+        await self.page.wait_for_selector(self._confirm_delete, state="visible", timeout=5000)
+        async with self.wait_for_api_response():
+            await self.page.click(self._confirm_delete, force=True)
+
+    @async_step("Cancel delete")
+    async def cancel_delete(self):
+        """Cancel deletion in the alert dialog"""
+        await self.page.click(self._cancel_delete)
+
+    @async_step("Wait for validation errors")
+    async def wait_for_validation_errors(self, timeout: int = 3000) -> bool:
+        """Wait for any validation error to show up; False if none does"""
+        return await self.first_validation_error(timeout=timeout) is not None
+
+    async def first_validation_error(self, timeout: int = 3000) -> Optional[Tuple[str, str]]:
+        """Wait for the first visible validation error; returns (selector, text) or None"""
+        return await self.first_match([self._title_error, self._section_name_error, self._content_error], timeout=timeout)
+
+    @async_step("Check if title error is visible")
+    async def is_title_error_visible(self):
+        """Check if title validation error is visible"""
+        return await self.page.locator(self._title_error).is_visible()
+
+    @async_step("Check if section name error is visible")
+    async def is_section_name_error_visible(self):
+        """Check if section name validation error is visible"""
+        return await self.page.locator(self._section_name_error).is_visible()
+
+    @async_step("Check if content error is visible")
+    async def is_content_error_visible(self):
+        """Check if content validation error is visible"""
+        return await self.page.locator(self._content_error).is_visible()
+
+    # URL type specific methods
+    @async_step("Fill URL: {url}")
+    async def fill_url(self, url: str):
+        """Fill the URL field (URL type only)"""
+        await self.page.fill(self._url_input, url)
+
+    @async_step("Get URL value")
+    async def get_url_value(self):
+        """Get the current URL value"""
+        return await self.page.input_value(self._url_input)
+
+    @async_step("Select frequency: {frequency}")
+    async def select_frequency(self, frequency: str):
+        """Select scrape frequency (URL type only)"""
+        await self.page.select_option(self._frequency_select, frequency)
+
+    @async_step("Get selected frequency")
+    async def get_selected_frequency(self):
+        """Get the selected frequency value"""
+        return await self.page.input_value(self._frequency_select)
+
+    @async_step("Fill prompt: {prompt}")
+    async def fill_prompt(self, prompt: str):
+        """Fill the ChatGPT prompt field (URL type only)"""
+        await self.page.fill(self._prompt_textarea, prompt)
+
+    @async_step("Get prompt value")
+    async def get_prompt_value(self):
+        """Get the current prompt value"""
+        return await self.page.input_value(self._prompt_textarea)
+
+    @async_step("Check if last checked badge is visible")
+    async def is_last_checked_visible(self):
+        """Check if last checked badge is visible (URL type only)"""
+        return await self.page.locator(self._last_checked_badge).is_visible()
+
+    @async_step("Verify URL is on create page")
+    async def verify_on_create_page(self):
+        """Verify that we're on the create page"""
+        await expect(self.page).to_have_url(re.compile(r".*/knowledgebase/create.*"))
+
+    @async_step("Verify URL is on edit page")
+    async def verify_on_edit_page(self):
+        """Verify that we're on the edit page"""
+        await expect(self.page).to_have_url(re.compile(r".*/knowledgebase/edit/[A-Za-z0-9\-_]+$"))
+
+    @async_step("Verify URL is on list page")
+    async def verify_on_list_page(self):
+        """Verify that we navigated back to the list page"""
+        await expect(self.page).to_have_url(re.compile(r".*/knowledgebase$"))
@@ -0,0 +1,107 @@
+# pages/aio/knowledgebase_list_page.py
+from typing import AsyncIterator, List
+from playwright.async_api import Page
+from config.env import BASE_URL
+from core.utils.async_step import async_step
+from pages.aio.base_page import AsyncBasePage
+from pages.knowledgebase.knowledgebase_list_page import KnowledgeBaseListSelectors, KnowledgeBaseRow
+
+
+class AsyncKnowledgeBaseListPage(KnowledgeBaseListSelectors, AsyncBasePage):
+    """Async page object for knowledge base list page"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.base_url = BASE_URL
+
+    @async_step("Navigate to knowledge base list page")
+    async def navigate(self, base_url: str = None):
+        """Navigate to the knowledge base list page"""
+        await super().navigate(f"{base_url or self.base_url}/knowledgebase")
+
+    @async_step("Wait for page to load")
+    async def wait_for_page_load(self):
+        """Wait for the page to finish loading"""
+        await self.page.wait_for_selector(self._loading_indicator, state="hidden", timeout=10000)
+
+    @async_step("Click create button")
+    async def click_create_button(self):
+        """Click the create new knowledge base entry button"""
+        await self.page.click(self._create_dropdown_trigger)
+
+    @async_step("Select article option from dropdown")
+    async def select_article_option(self):
+        """Select article option from create dropdown"""
+        await self.page.click(self._article_option)
+
+    @async_step("Select web content option from dropdown")
+    async def select_web_content_option(self):
+        """Select dynamic web content option from create dropdown"""
+        await self.page.click(self._web_content_option)
+
+    @async_step("Select URL option from dropdown")
+    async def select_url_option(self):
+        """Select URL option from create dropdown"""
+        await self.page.click(self._url_option)
+
+    @async_step("Get all table rows")
+    async def get_all_rows(self):
+        """Get all knowledge base entries from the table"""
+        return await self.page.locator(self._table_rows).all()
+
+    @async_step("Get row count")
+    async def get_row_count(self):
+        """Get the count of knowledge base entries"""
+        return await self.page.locator(self._table_rows).count()
+
+    @async_step("Check if empty state is visible")
+    async def is_empty_state_visible(self):
+        """Check if the empty state message is displayed"""
+        return await self.page.locator(self._empty_state).is_visible()
+
+    @async_step("Check if loading indicator is visible")
+    async def is_loading(self):
+        """Check if the loading indicator is visible"""
+        return await self.page.locator(self._loading_indicator).is_visible()
+
+    @async_step("Search for knowledge base entry: {search_text}")
+    async def search(self, search_text: str):
+        """Search for knowledge base entries"""
+        if await self.page.locator(self._search_input).is_visible():
+            await self.page.fill(self._search_input, search_text)
+            await self.wait_for_spinner_hidden(self._loading_indicator)
+            await self.wait_for_dom_stable(self._table)  # Wait for search to filter
+
+    @async_step("Get entries")
+    async def get_entries(self) -> List[KnowledgeBaseRow]:
+        """Get title and type of every entry in one browser call"""
+        return await self.extract_rows(self._table_rows, self._row_cells, KnowledgeBaseRow)
+
+    def iter_entries(self, chunk_size: int = 100) -> AsyncIterator[KnowledgeBaseRow]:
+        """Stream entries in chunks (for very long lists)"""
+        return self.stream_rows(self._table_rows, self._row_cells, KnowledgeBaseRow, chunk_size)
+
+    @async_step("Get entry titles")
+    async def get_entry_titles(self):
+        """Get all entry titles from the table"""
+        return [entry.title for entry in await self.get_entries() if entry.title]
+
+    @async_step("Get entry types")
+    async def get_entry_types(self):
+        """Get all entry types from the table"""
+        return [entry.type for entry in await self.get_entries() if entry.type]
+
+    @async_step("Click on entry with title: {title}")
+    async def click_entry_by_title(self, title: str):
+        """Click on a knowledge base entry by its title (row is clickable)"""
+        await self.page.locator(f'table tbody tr:has(.font-medium:has-text("{title}"))').click()
+
+    @async_step("Verify entry exists with title: {title}")
+    async def verify_entry_exists(self, title: str):
+        """Verify that an entry with the given title exists"""
+        return await self.page.locator(f'.font-medium:has-text("{title}")').is_visible()
+
+    @async_step("Wait for table to be visible")
+    async def wait_for_table(self):
+        """Wait for the table to be visible"""
+        await self.page.wait_for_selector(self._table, state="visible", timeout=10000)
@@ -0,0 +1,55 @@
+# pages/aio/login_page.py
+from playwright.async_api import Page, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginSelectors
+from pages.otp_page import OTP_FIELD_SELECTOR
+from config.env import BASE_URL
+
+
+class AsyncLoginPage(LoginSelectors, AsyncBasePage):
+    """Async Page Object for Login Page"""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{BASE_URL}/login"
+
+    async def navigate(self):
+        """Navigate to login page"""
+        await super().navigate(self.url)
+        return self
+
+    async def fill_email(self, email: str):
+        """Fill email field"""
+        email_field = self.get_email_field()
+        await expect(email_field).to_be_visible(timeout=5000)
+        await email_field.fill(email)
+        return self
+
+    async def click_submit(self):
+        """Click submit button"""
+        await self.get_submit_button().click()
+        return self
+
+    async def check_for_errors(self) -> tuple[bool, str]:
+        """
+        Check if any error messages are visible on the page
+        Returns: (has_error: bool, error_text: str)
+        """
+        match = await self.first_match(self._error_selectors, timeout=5000, stop_selectors=[OTP_FIELD_SELECTOR])
+        if match is None:
+            return False, ""
+        return True, match[1]
+
+    async def submit_email(self, email: str):
+        """Complete email submission flow"""
+        await self.fill_email(email)
+        await self.click_submit()
+        return self
+
+    async def verify_navigation_to_otp(self, timeout: int = 7000):
+        """Verify that page navigated to OTP page"""
+        try:
+            await self.wait_for_url(r".*/login/otp.*", timeout=timeout)
+            return True
+        except AssertionError:
+            return False
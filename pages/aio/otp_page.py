@@ -0,0 +1,57 @@
+# pages/aio/otp_page.py
+import re
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.otp_page import OTPSelectors
+from config.env import NAVIGATION_MODE
+
+
+class AsyncOTPPage(OTPSelectors, AsyncBasePage):
+    """Async Page Object for OTP Page"""
+
+    async def fill_otp(self, otp_code: str):
+        """Fill OTP field"""
+        otp_field = self.get_otp_field()
+        await expect(otp_field).to_be_visible(timeout=5000)
+        await otp_field.fill(otp_code)
+        return self
+
+    async def click_submit(self):
+        """Click submit button if visible"""
+        submit_btn = self.get_submit_button()
+        if await submit_btn.is_visible():
+            await submit_btn.click()
+        return self
+
+    async def submit_otp(self, otp_code: str, auto_submit_wait: int = 1500):
+        """Fill the OTP and submit it unless the form auto-submits within `auto_submit_wait` ms"""
+        await self.fill_otp(otp_code)
+
+        # Done as soon as an auto-submit leaves the OTP page
+        try:
+            await self.page.wait_for_url(lambda url: "/login/otp" not in url, timeout=auto_submit_wait)
+            return self
+        except PlaywrightTimeoutError:
+            pass
+
+        # Submit if button is still visible
+        await self.click_submit()
+        return self
+
+    async def verify_left_otp_page(self) -> bool:
+        """Verify that user has left the OTP page (successful login)"""
+        try:
+            await expect(self.page).not_to_have_url(re.compile(r".*/login/otp.*"))
+            return True
+        except AssertionError:
+            return False
+
+    async def wait_for_dashboard(self):
+        """Wait for dashboard to load after successful OTP"""
+        if NAVIGATION_MODE == "networkidle":
+            await self.wait_for_load_state("networkidle")
+            return self
+        await self.page.wait_for_url(lambda url: "/login/otp" not in url)
+        await self.wait_for_load_state("domcontentloaded")
+        await self.wait_for_spinner_hidden()
+        return self
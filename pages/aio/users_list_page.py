@@ -0,0 +1,83 @@
+# pages/aio/users_list_page.py
+from typing import AsyncIterator, List
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, expect
+from pages.aio.base_page import AsyncBasePage
+from pages.users.users_list_page import UserRow, UsersListSelectors
+
+
+class AsyncUsersListPage(UsersListSelectors, AsyncBasePage):
+    """Async Page Object for Users List Page"""
+
+    async def navigate_to_users(self, base_url: str):
+        """Navigate to users page"""
+        await self.navigate(f"{base_url}/users")
+        return self
+
+    async def is_page_loaded(self) -> bool:
+        """Check if users page is loaded"""
+        try:
+            await expect(self.page.locator(self._page_title)).to_be_visible(timeout=5000)
+            return True
+        except AssertionError:
+            return False
+
+    async def click_create_new(self):
+        """Click create new button"""
+        await self.get_create_new_button().click()
+        return self
+
+    async def wait_for_add_user_modal(self, timeout: int = 5000):
+        """Wait for the add user modal to open"""
+        await self.page.locator(self._add_user_modal).wait_for(state="visible", timeout=timeout)
+        return self
+
+    async def is_add_user_modal_visible(self) -> bool:
+        """Check if add user modal is visible"""
+        return await self.page.locator(self._add_user_modal).is_visible()
+
+    async def get_user_count(self) -> int:
+        """Get number of user cards"""
+        await self.wait_for_spinner_hidden(self._loading_spinner)
+        await self.wait_for_dom_stable()  # Cards render right after the spinner goes away
+        return await self.get_user_cards().count()
+
+    async def click_user_by_index(self, index: int):
+        """Click on a user card by index"""
+        await self.get_user_cards().nth(index).click()
+        return self
+
+    async def is_empty_state_visible(self) -> bool:
+        """Check if empty state message is visible"""
+        return await self.page.locator(self._empty_state).is_visible()
+
+    async def is_loading(self) -> bool:
+        """Check if loading spinner is visible"""
+        return await self.page.locator(self._loading_spinner).is_visible()
+
+    async def wait_for_users_to_load(self, timeout: int = 10000):
+        """Wait for users to load (spinner to disappear)"""
+        try:
+            await self.page.wait_for_selector(self._loading_spinner, state='hidden', timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass  # Spinner might not appear if loading is fast
+        return self
+
+    async def get_users(self) -> List[UserRow]:
+        """Get name, email and roles of every user card in one browser call"""
+        return await self.extract_rows(self._user_cards, self._card_cells, UserRow)
+
+    def iter_users(self, chunk_size: int = 100) -> AsyncIterator[UserRow]:
+        """Stream user cards in chunks (for very long lists)"""
+        return self.stream_rows(self._user_cards, self._card_cells, UserRow, chunk_size)
+
+    async def get_user_name_by_index(self, index: int) -> str:
+        """Get user name by index"""
+        return await self.get_user_cards().nth(index).locator(self._user_name).text_content()
+
+    async def get_user_email_by_index(self, index: int) -> str:
+        """Get user email by index"""
+        return await self.get_user_cards().nth(index).locator(self._user_email).text_content()
+
+    async def get_user_roles_by_index(self, index: int) -> list:
+        """Get user roles by index"""
+        return await self.get_user_cards().nth(index).locator(self._role_badge).all_text_contents()
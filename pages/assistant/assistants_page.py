@@ -1,18 +1,36 @@
+import re
 from pages.base_page import BasePage
+from pages.readiness import ApiResponse, SpinnerHidden
 from playwright.sync_api import expect
 
-class AssistantsPage(BasePage):
-    """Page object for the Assistants listing page"""
+class AssistantsSelectors:
+    """Selectors of the Assistants pages, shared by AssistantsPage and AsyncAssistantsPage"""
+
+    ready = ApiResponse("/assistants") & SpinnerHidden()
 
     CREATE_NEW_BUTTON = "button:has-text('Create New')"  # or use data-testid if available
     MODAL_TITLE = "text=Create New Assistant"
     TYPE_OPTION = "div[role='button']"   # You should replace with better selector! (e.g. data-testid)
     NAME_INPUT = "input[name=\"name\"]"
     CREATE_BUTTON = "button:has-text('Create New Assistant')"
+    DIALOG_TYPE_OPTION = "div[role='dialog'] #{type_name}"
+    DETAIL_URL = re.compile(r".*/assistants/[A-Za-z0-9]+$")
+    LIST_URL = re.compile(r".*/assistants$")
+
+    # Assistant detail page
+    DETAIL_NAME_INPUT = "input[name='name']"
+    DETAIL_DESCRIPTION_INPUT = "input[name='description']"
+
+
+class AssistantsPage(AssistantsSelectors, BasePage):
+    """Page object for the Assistants listing page"""
 
     def open(self, base_url: str):
         self.navigate(f"{base_url}/assistants")
 
+    def open_detail(self, base_url: str, assistant_id: str, tab: str = "general"):
+        self.navigate(f"{base_url}/assistants/{assistant_id}?tab={tab}")
+
     def click_create_new(self):
         self.page.click(self.CREATE_NEW_BUTTON)
 
@@ -1,18 +1,154 @@
 # pages/base_page.py
-from playwright.sync_api import Page, expect
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+import re
+import time
+from playwright.sync_api import Error, Page, TimeoutError as PlaywrightTimeoutError, expect
 from pathlib import Path
 import allure
+from config.env import NAVIGATION_MODE
+from core.playwright.navigation_timing import get_navigation_timings
+from core.playwright.routing import router_for
+from core.playwright.web_vitals import get_web_vitals
+from core.utils.timing_ledger import get_timing_ledger
+from pages.readiness import SPINNER_SELECTOR, ReadyStrategy, SpinnerHidden
+
+# Requests that change server state (saves, deletes)
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+TOAST_SELECTOR = '.Toastify__toast'
+
+# Resolves true once `selector` has seen no DOM mutation for `quietMs`, false after `timeoutMs`
+_DOM_STABLE_JS = """
+([selector, quietMs, timeoutMs]) => new Promise(resolve => {
+    const root = document.querySelector(selector) || document.body;
+    let quietTimer = null;
+    let deadline = null;
+    const done = stable => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(stable);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => done(true), quietMs);
+    });
+    observer.observe(root, { childList: true, subtree: true, attributes: true, characterData: true });
+    quietTimer = setTimeout(() => done(true), quietMs);
+    deadline = setTimeout(() => done(false), timeoutMs);
+})
+"""
+
+# First visible, non-empty match among selector specs (see _selector_spec) as {selector, text};
+# {selector: null} if a stop selector is visible instead; null if nothing matches yet
+_FIRST_MATCH_JS = """
+([specs, stops]) => {
+    if (!document.body) return null;
+    const visible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    const textOf = el => (el.innerText || el.textContent || '').trim();
+    const candidates = spec => {
+        if (spec.css !== undefined) {
+            try {
+                return Array.from(document.querySelectorAll(spec.css));
+            } catch (e) {
+                // Fail the wait: a selector that can never match would just time out as "no match"
+                throw new Error(`first_match: invalid CSS selector ${JSON.stringify(spec.css)}: ${e.message}`);
+            }
+        }
+        const re = new RegExp(spec.pattern, spec.flags);
+        const found = new Set();
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const el = walker.currentNode.parentElement;
+            if (el && !found.has(el) && re.test(el.textContent)) found.add(el);
+        }
+        return Array.from(found);
+    };
+    for (const spec of specs) {
+        for (const el of candidates(spec)) {
+            const text = textOf(el);
+            if (text && visible(el)) return { selector: spec.selector, text };
+        }
+    }
+    for (const spec of stops) {
+        if (candidates(spec).some(visible)) return { selector: null, text: '' };
+    }
+    return null;
+}
+"""
+
+# Text of each row's cells for rows[start:start+count]; a cell given as [selector] collects every match
+_EXTRACT_ROWS_JS = """
+(rows, [cells, start, count]) => {
+    const text = el => (el.textContent || '').trim();
+    return rows.slice(start, count === null ? undefined : start + count).map(row => {
+        const values = {};
+        for (const [name, selector] of Object.entries(cells)) {
+            if (Array.isArray(selector)) {
+                values[name] = Array.from(row.querySelectorAll(selector[0])).map(text);
+            } else {
+                const el = selector === ':scope' ? row : row.querySelector(selector);
+                values[name] = el ? text(el) : '';
+            }
+        }
+        return values;
+    });
+}
+"""
+
+
+# Playwright selector syntax that document.querySelectorAll rejects
+_PLAYWRIGHT_ONLY = re.compile(r">>|:(has-text|text|text-is|text-matches|visible|nth-match|left-of|right-of|above|below|near)\b")
+
+
+def _selector_spec(selector: str) -> dict:
+    """CSS selectors pass through; Playwright `text=` selectors become regex specs"""
+    if not selector.startswith("text="):
+        if _PLAYWRIGHT_ONLY.search(selector):
+            raise ValueError(f"first_match takes CSS or text= selectors, not Playwright-only syntax: {selector!r}")
+        return {"selector": selector, "css": selector}
+    body = selector[len("text="):]
+    regex = re.fullmatch(r"/(.*)/([a-z]*)", body, re.S)
+    if regex:
+        return {"selector": selector, "pattern": regex.group(1), "flags": regex.group(2)}
+    if len(body) > 1 and body[0] == body[-1] and body[0] in "'\"":
+        # Quoted: the whole text, case-sensitive
+        return {"selector": selector, "pattern": rf"^\s*{re.escape(body[1:-1])}\s*$", "flags": ""}
+    return {"selector": selector, "pattern": re.escape(body), "flags": "i"}
 
 
 class BasePage:
     """Base page class with common methods for all pages"""
     
+    # Readiness after navigation; page classes override these defaults
+    wait_until = "domcontentloaded"
+    ready: ReadyStrategy = SpinnerHidden()
+    
+    # Resource types / host patterns this page needs although the router blocks them by default
+    allow_resources: Tuple[str, ...] = ()
+    allow_hosts: Tuple[str, ...] = ()
+    
     def __init__(self, page: Page):
         self.page = page
+        if self.allow_resources or self.allow_hosts:
+            router = router_for(page.context)
+            if router:
+                router.allow(self.allow_resources, self.allow_hosts)
     
-    def navigate(self, url: str, wait_until: str = "networkidle"):
-        """Navigate to a URL"""
-        self.page.goto(url, wait_until=wait_until)
+    def navigate(self, url: str, wait_until: Optional[str] = None):
+        """Navigate to a URL and wait until the page object is ready"""
+        start = time.perf_counter()
+        if NAVIGATION_MODE == "networkidle":
+            self.page.goto(url, wait_until=wait_until or "networkidle")
+        else:
+            with self.ready.around(self):
+                self.page.goto(url, wait_until=wait_until or self.wait_until)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        get_navigation_timings().record(NAVIGATION_MODE, type(self).__name__, elapsed_ms)
+        get_timing_ledger().record("navigation", type(self).__name__, elapsed_ms, url=url)
+        web_vitals = get_web_vitals()
+        if web_vitals.enabled:
+            web_vitals.measure(self.page, type(self).__name__, url, elapsed_ms)
     
     def wait_for_url(self, pattern: str, timeout: int = 5000):
         """Wait for URL to match a pattern"""
@@ -26,7 +162,7 @@ class BasePage:
         return screenshot_bytes
     
     def wait_for_timeout(self, timeout: int):
-        """Wait for a specific timeout"""
+        """Wait for a specific timeout (prefer the event-driven waits below)"""
         self.page.wait_for_timeout(timeout)
     
     def wait_for_load_state(self, state: str = "networkidle"):
@@ -36,3 +172,157 @@ class BasePage:
     def get_current_url(self) -> str:
         """Get current page URL"""
         return self.page.url
+    
+    @contextmanager
+    def wait_for_api_response(
+        self,
+        url: Optional[Union[str, Pattern]] = None,
+        methods: Union[str, Iterable[str]] = MUTATING_METHODS,
+        timeout: int = 15000,
+    ):
+        """
+        Wait for the API response triggered by the actions inside the block
+
+        url: substring or compiled regex of the request URL (None = any API call)
+        methods: HTTP method(s) to match (default: any request that changes data)
+
+            with self.wait_for_api_response("/contacts") as response:
+                self.save()
+            response.value.status
+        """
+        methods = {methods.upper()} if isinstance(methods, str) else {m.upper() for m in methods}
+
+        def matches(response) -> bool:
+            request = response.request
+            if request.resource_type not in ("fetch", "xhr"):
+                return False
+            if methods and request.method not in methods:
+                return False
+            if url is None:
+                return True
+            if isinstance(url, str):
+                return url in response.url
+            return bool(url.search(response.url))
+
+        with self.page.expect_response(matches, timeout=timeout) as response_info:
+            yield response_info
+
+    def wait_for_dom_stable(self, selector: str = "body", quiet_ms: int = 300, timeout: int = 5000) -> bool:
+        """
+        Wait until `selector` (default: whole page) stops changing for `quiet_ms`
+        Returns False if it was still changing after `timeout`
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            if remaining <= 0:
+                return False
+            try:
+                return self.page.evaluate(_DOM_STABLE_JS, [selector, quiet_ms, remaining])
+            except Error as e:
+                # A navigation replaced the document mid-wait: watch the new one instead
+                if "context was destroyed" not in str(e) and "navigat" not in str(e):
+                    raise
+                self.page.wait_for_load_state("domcontentloaded")
+
+    def wait_for_spinner_hidden(self, selector: str = SPINNER_SELECTOR, timeout: int = 10000) -> bool:
+        """Wait for loading spinners to go away (returns immediately if none is shown)"""
+        try:
+            self.page.wait_for_selector(selector, state="hidden", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def wait_for_toast(self, text: Optional[Union[str, Pattern]] = None, timeout: int = 5000) -> str:
+        """Wait for a toast notification (optionally containing `text`) and return its text"""
+        toast = self.page.locator(TOAST_SELECTOR)
+        if text is not None:
+            toast = toast.filter(has_text=text)
+        toast.first.wait_for(state="visible", timeout=timeout)
+        return (toast.first.text_content() or "").strip()
+
+    def wait_for_any_visible(self, selectors: Iterable[str], timeout: int = 5000) -> bool:
+        """Wait until any of the selectors is visible; False on timeout"""
+        selectors = list(selectors)
+        locator = self.page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.page.locator(selector))
+        try:
+            locator.first.wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def first_match(
+        self, selectors: Iterable[str], timeout: int = 5000, stop_selectors: Iterable[str] = ()
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Wait for the first of `selectors` to show visible text and return (selector, text)
+
+        All selectors are checked in one browser-side call per animation frame instead
+        of a count()/text_content() round trip each; earlier selectors win ties.
+        Selectors are CSS or Playwright `text=` selectors (`text=/regex/i` included);
+        Playwright-only syntax (`:has-text()`, `>>`, ...) raises ValueError and CSS the
+        browser rejects raises playwright's Error. Returns None on timeout, or as soon as any `stop_selectors` is visible
+        (e.g. the next step of the flow showed up instead of an error).
+        timeout=0 checks once without waiting.
+        """
+        specs: List[dict] = [_selector_spec(s) for s in selectors]
+        stops: List[dict] = [_selector_spec(s) for s in stop_selectors]
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                if timeout <= 0:
+                    match = self.page.evaluate(_FIRST_MATCH_JS, [specs, stops])
+                else:
+                    remaining = int((deadline - time.monotonic()) * 1000)
+                    if remaining <= 0:
+                        return None
+                    handle = self.page.wait_for_function(_FIRST_MATCH_JS, arg=[specs, stops], timeout=remaining)
+                    match = handle.json_value()
+            except PlaywrightTimeoutError:
+                return None
+            except Error as e:
+                # A navigation replaced the document mid-wait: probe the new one instead
+                if "context was destroyed" not in str(e) and "navigat" not in str(e):
+                    raise
+                self.page.wait_for_load_state("domcontentloaded")
+                continue
+            if not match or match["selector"] is None:
+                return None
+            return match["selector"], match["text"]
+
+    def extract_rows(
+        self,
+        row_selector: str,
+        cells: Dict[str, Union[str, List[str]]],
+        model: Callable[..., Any] = dict,
+        start: int = 0,
+        count: Optional[int] = None,
+    ) -> list:
+        """
+        Read a whole table / card list in one browser call instead of a round trip per cell
+
+        cells maps row fields to CSS selectors relative to the row (':scope' = the row
+        itself); wrap a selector in a list to collect all matches, e.g. role badges:
+
+            self.extract_rows(".card", {"name": ".name", "roles": [".badge"]}, UserRow)
+        """
+        rows = self.page.locator(row_selector).evaluate_all(_EXTRACT_ROWS_JS, [cells, start, count])
+        return [model(**row) for row in rows]
+
+    def stream_rows(
+        self,
+        row_selector: str,
+        cells: Dict[str, Union[str, List[str]]],
+        model: Callable[..., Any] = dict,
+        chunk_size: int = 100,
+    ) -> Iterator[Any]:
+        """extract_rows in chunks of `chunk_size` rows, for lists too long to pull at once"""
+        start = 0
+        while True:
+            chunk = self.extract_rows(row_selector, cells, model, start, chunk_size)
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
@@ -3,28 +3,56 @@ Page object for the contact form page (/contacts/new and /contacts/edit)
 """
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.readiness import SpinnerHidden, Visible
 
-class ContactFormPage(BasePage):
-    """Page Object for Contact Form Page (both new and edit)"""
+class ContactFormSelectors:
+    """Selectors and locators of the contact form, shared by ContactFormPage and AsyncContactFormPage"""
+    
+    ready = Visible("_first_name_input") & SpinnerHidden("_loading_spinner")
+    
+    # Locators
+    _page_title_new = 'h1:has-text("New Contact")'
+    _page_title_edit = 'h1:has-text("Edit Contact")'
+    _back_button = 'svg.lucide-chevron-left'
+    _first_name_input = 'input[name="FirstName"]'
+    _last_name_input = 'input[name="LastName"]'
+    _email_input = 'input[name="Email"]'
+    _phone_input = 'input[name="PhoneNumber"]'
+    _save_button = 'button[type="submit"]:has-text("Save")'
+    _cancel_button = 'button:has-text("Cancel")'
+    _delete_button = 'button:has-text("Delete")'
+    _loading_spinner = '.animate-spin'
+    _delete_alert = '[role="alertdialog"]'
+    _confirm_delete = 'button:has-text("Continue")'
+    _success_message = 'text=/success/i'
+    
+    def get_first_name_input(self):
+        """Get first name input locator"""
+        return self.page.locator(self._first_name_input)
+    
+    def get_last_name_input(self):
+        """Get last name input locator"""
+        return self.page.locator(self._last_name_input)
+    
+    def get_email_input(self):
+        """Get email input locator"""
+        return self.page.locator(self._email_input)
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # Locators
-        self._page_title_new = 'h1:has-text("New Contact")'
-        self._page_title_edit = 'h1:has-text("Edit Contact")'
-        self._back_button = 'svg.lucide-chevron-left'
-        self._first_name_input = 'input[name="FirstName"]'
-        self._last_name_input = 'input[name="LastName"]'
-        self._email_input = 'input[name="Email"]'
-        self._phone_input = 'input[name="PhoneNumber"]'
-        self._save_button = 'button[type="submit"]:has-text("Save")'
-        self._cancel_button = 'button:has-text("Cancel")'
-        self._delete_button = 'button:has-text("Delete")'
-        self._loading_spinner = '.animate-spin'
-        self._delete_alert = '[role="alertdialog"]'
-        self._confirm_delete = 'button:has-text("Continue")'
-        self._success_message = 'text=/success/i'
+    def get_phone_input(self):
+        """Get phone input locator"""
+        return self.page.locator(self._phone_input)
+    
+    def get_save_button(self):
+        """Get save button locator"""
+        return self.page.locator(self._save_button)
+    
+    def get_delete_button(self):
+        """Get delete button locator"""
+        return self.page.locator(self._delete_button)
+
+
+class ContactFormPage(ContactFormSelectors, BasePage):
+    """Page Object for Contact Form Page (both new and edit)"""
     
     def navigate_to_new_contact(self, base_url: str):
         """Navigate to new contact page"""
@@ -57,30 +85,6 @@ class ContactFormPage(BasePage):
         self.page.locator(self._back_button).click()
         return self
     
-    def get_first_name_input(self):
-        """Get first name input locator"""
-        return self.page.locator(self._first_name_input)
-    
-    def get_last_name_input(self):
-        """Get last name input locator"""
-        return self.page.locator(self._last_name_input)
-    
-    def get_email_input(self):
-        """Get email input locator"""
-        return self.page.locator(self._email_input)
-    
-    def get_phone_input(self):
-        """Get phone input locator"""
-        return self.page.locator(self._phone_input)
-    
-    def get_save_button(self):
-        """Get save button locator"""
-        return self.page.locator(self._save_button)
-    
-    def get_delete_button(self):
-        """Get delete button locator"""
-        return self.page.locator(self._delete_button)
-    
     def fill_first_name(self, first_name: str):
         """Fill first name field"""
         self.get_first_name_input().fill(first_name)
@@ -121,6 +125,10 @@ class ContactFormPage(BasePage):
         self.page.locator(self._confirm_delete).click(force=True)
         return self
     
+    def wait_for_delete_alert(self, timeout: int = 3000) -> bool:
+        """Wait for the delete alert dialog; False if it doesn't open"""
+        return self.wait_for_any_visible([self._delete_alert], timeout=timeout)
+    
     def is_delete_alert_visible(self) -> bool:
         """Check if delete alert dialog is visible"""
         return self.page.locator(self._delete_alert).is_visible()
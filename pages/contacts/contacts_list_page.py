@@ -1,23 +1,52 @@
 """
 Page object for the contacts list page (/contacts)
 """
+from dataclasses import dataclass
+from typing import Iterator, List
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.readiness import SpinnerHidden, Visible
 
-class ContactsListPage(BasePage):
-    """Page Object for Contacts List Page"""
+
+@dataclass
+class ContactRow:
+    """One contact as listed in the contacts table"""
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+
+
+class ContactsListSelectors:
+    """Selectors and locators of the contacts list, shared by ContactsListPage and AsyncContactsListPage"""
+    
+    ready = Visible("_page_title") & SpinnerHidden("_loading_spinner")
+    
+    # Locators
+    _page_title = 'h1:has-text("Contacts")'
+    _add_contact_button = 'button:has-text("Add Contact")'
+    _contacts_table = 'table'
+    _table_rows = 'table tbody tr'
+    _empty_state = 'text=/no contacts found/i'
+    _loading_spinner = '.animate-spin'
+    _first_contact_button = 'button:has-text("Add your first contact")'
+    # Name, email and phone are the second to fourth columns
+    _row_cells = {"name": 'td:nth-child(2)', "email": 'td:nth-child(3)', "phone": 'td:nth-child(4)'}
+    
+    def get_add_contact_button(self):
+        """Get add contact button locator"""
+        return self.page.locator(self._add_contact_button)
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # Locators
-        self._page_title = 'h1:has-text("Contacts")'
-        self._add_contact_button = 'button:has-text("Add Contact")'
-        self._contacts_table = 'table'
-        self._table_rows = 'table tbody tr'
-        self._empty_state = 'text=/no contacts found/i'
-        self._loading_spinner = '.animate-spin'
-        self._first_contact_button = 'button:has-text("Add your first contact")'
+    def get_contacts_table(self):
+        """Get contacts table locator"""
+        return self.page.locator(self._contacts_table)
+    
+    def get_table_rows(self):
+        """Get all table rows"""
+        return self.page.locator(self._table_rows)
+
+
+class ContactsListPage(ContactsListSelectors, BasePage):
+    """Page Object for Contacts List Page"""
     
     def navigate_to_contacts(self, base_url: str):
         """Navigate to contacts page"""
@@ -32,26 +61,15 @@ class ContactsListPage(BasePage):
         except:
             return False
     
-    def get_add_contact_button(self):
-        """Get add contact button locator"""
-        return self.page.locator(self._add_contact_button)
-    
     def click_add_contact(self):
         """Click add contact button"""
         self.get_add_contact_button().click()
         return self
     
-    def get_contacts_table(self):
-        """Get contacts table locator"""
-        return self.page.locator(self._contacts_table)
-    
-    def get_table_rows(self):
-        """Get all table rows"""
-        return self.page.locator(self._table_rows)
-    
     def get_contact_count(self) -> int:
         """Get number of contacts in the table"""
-        self.wait_for_timeout(1000)  # Wait for table to render
+        self.wait_for_spinner_hidden(self._loading_spinner)
+        self.wait_for_dom_stable()  # Rows render right after the spinner goes away
         return self.get_table_rows().count()
     
     def click_contact_by_index(self, index: int):
@@ -75,6 +93,14 @@ class ContactsListPage(BasePage):
             pass  # Spinner might not appear if loading is fast
         return self
     
+    def get_contacts(self) -> List[ContactRow]:
+        """Get name, email and phone of every listed contact in one browser call"""
+        return self.extract_rows(self._table_rows, self._row_cells, ContactRow)
+    
+    def iter_contacts(self, chunk_size: int = 100) -> Iterator[ContactRow]:
+        """Stream contacts in chunks (for very long lists)"""
+        return self.stream_rows(self._table_rows, self._row_cells, ContactRow, chunk_size)
+    
     def get_contact_name_by_index(self, index: int) -> str:
         """Get contact name by index"""
         row = self.get_table_rows().nth(index)
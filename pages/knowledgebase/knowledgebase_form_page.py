@@ -6,48 +6,65 @@ from playwright.sync_api import Page, expect
 import allure
 import re
 from config.env import BASE_URL
+from pages.base_page import BasePage
+from pages.readiness import SpinnerHidden, Visible
 
 
-class KnowledgeBaseFormPage:
+class KnowledgeBaseFormSelectors:
+    """Selectors and locators of the knowledge base form, shared by the sync and async page objects"""
+    
+    ready = Visible("_title_input") & SpinnerHidden("_loading_indicator")
+    
+    # Locators
+    _title_input = 'input[placeholder*="title"], input[placeholder*="Title"]'
+    _section_name_inputs = 'input[placeholder*="section name"], input[placeholder*="Section name"]'
+    _save_button = 'button:has-text("save"), button:has-text("saving")'
+    _back_button = 'button.p-2:has(svg)'  # Button with ChevronLeft icon
+    _add_section_button = 'button:has-text("Create New")'  # Translated from create_new
+    _remove_section_buttons = 'button:has-text("Remove Section")'  # Translated from Remove_section
+    _delete_button = 'button:has-text("Delete")'
+    _loading_indicator = '[data-testid="loading"], .animate-spin'
+    _editor = '.ProseMirror, [contenteditable="true"]'
+    _sections = '.border.p-4.rounded-md'
+    _title_error = 'text=Title is required'
+    _section_name_error = 'text=Section name is required'
+    _content_error = 'text=Content cannot be empty'
+    
+    # URL type specific fields
+    _url_input = 'input[placeholder*="url"], input[placeholder*="URL"]'
+    _frequency_select = 'select'
+    _prompt_textarea = 'textarea[placeholder*="prompt"], textarea[placeholder*="AI"]'
+    _last_checked_badge = 'text=Last Checked'
+    
+    # Delete confirmation
+    _confirm_delete = 'button:has-text("Continue")'
+    _cancel_delete = 'button:has-text("Cancel")'
+    
+    @allure.step("Get save button")
+    def get_save_button(self):
+        """Get the save button element"""
+        return self.page.locator(self._save_button)
+        
+    @allure.step("Get delete button")
+    def get_delete_button(self):
+        """Get the delete button element"""
+        return self.page.locator(self._delete_button)
+
+
+class KnowledgeBaseFormPage(KnowledgeBaseFormSelectors, BasePage):
     """Page object for knowledge base create/edit form page"""
     
     def __init__(self, page: Page):
-        self.page = page
+        super().__init__(page)
         self.base_url = BASE_URL
-        
-        # Locators
-        self._title_input = 'input[placeholder*="title"], input[placeholder*="Title"]'
-        self._section_name_inputs = 'input[placeholder*="section name"], input[placeholder*="Section name"]'
-        self._save_button = 'button:has-text("save"), button:has-text("saving")'
-        self._back_button = 'button.p-2:has(svg)'  # Button with ChevronLeft icon
-        self._add_section_button = 'button:has-text("Create New")'  # Translated from create_new
-        self._remove_section_buttons = 'button:has-text("Remove Section")'  # Translated from Remove_section
-        self._delete_button = 'button:has-text("Delete")'
-        self._loading_indicator = '[data-testid="loading"], .animate-spin'
-        self._editor = '.ProseMirror, [contenteditable="true"]'
-        self._sections = '.border.p-4.rounded-md'
-        self._title_error = 'text=Title is required'
-        self._section_name_error = 'text=Section name is required'
-        self._content_error = 'text=Content cannot be empty'
-        
-        # URL type specific fields
-        self._url_input = 'input[placeholder*="url"], input[placeholder*="URL"]'
-        self._frequency_select = 'select'
-        self._prompt_textarea = 'textarea[placeholder*="prompt"], textarea[placeholder*="AI"]'
-        self._last_checked_badge = 'text=Last Checked'
-        
-        # Delete confirmation
-        self._confirm_delete = 'button:has-text("Continue")'
-        self._cancel_delete = 'button:has-text("Cancel")'
-        
+    
     @allure.step("Navigate to create knowledge base page")
     def navigate_to_create(self, base_url: str = None, type: str = "article"):
         """Navigate to the create knowledge base page"""
         if base_url is None:
             base_url = self.base_url
         url = f"{base_url}/knowledgebase/create?type={type}"
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+        self.navigate(url)
         
     @allure.step("Navigate to edit knowledge base page: {entry_id}")
     def navigate_to_edit(self, entry_id: str, base_url: str = None):
@@ -55,8 +72,7 @@ class KnowledgeBaseFormPage:
         if base_url is None:
             base_url = self.base_url
         url = f"{base_url}/knowledgebase/edit/{entry_id}"
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+        self.navigate(url)
         
     @allure.step("Wait for page to load")
     def wait_for_page_load(self):
@@ -101,10 +117,13 @@ class KnowledgeBaseFormPage:
             editors[index].fill(content)
             
     @allure.step("Click save button")
-    def click_save_button(self):
-        """Click the save button"""
-        self.page.click(self._save_button)
-        self.page.wait_for_timeout(1000)  # Wait for save to complete
+    def click_save_button(self, wait_for_save: bool = True):
+        """Click the save button and wait for the API to store the entry"""
+        if not wait_for_save:
+            self.page.click(self._save_button)
+            return
+        with self.wait_for_api_response():
+            self.page.click(self._save_button)
         
     @allure.step("Click back button")
     def click_back_button(self):
@@ -113,15 +132,21 @@ class KnowledgeBaseFormPage:
         
     @allure.step("Click add section button")
     def click_add_section_button(self):
-        """Click the add new section button"""
+        """Click the add new section button and wait for the new section"""
+        sections = self.page.locator(self._section_name_inputs)
+        count = sections.count()
         self.page.click(self._add_section_button)
+        expect(sections).to_have_count(count + 1)
         
     @allure.step("Click remove section button at index {index}")
     def click_remove_section_button(self, index: int = 0):
-        """Click remove section button"""
+        """Click remove section button and wait for the section to go away"""
+        sections = self.page.locator(self._section_name_inputs)
         remove_buttons = self.page.locator(self._remove_section_buttons).all()
         if len(remove_buttons) > index:
+            count = sections.count()
             remove_buttons[index].click()
+            expect(sections).to_have_count(count - 1)
             
     @allure.step("Get section count")
     def get_section_count(self):
@@ -137,14 +162,23 @@ class KnowledgeBaseFormPage:
     def confirm_delete(self):
         """Confirm deletion in the alert dialog"""
         self.page.wait_for_selector(self._confirm_delete, state="visible", timeout=5000)
-        self.page.click(self._confirm_delete, force=True)
-        self.page.wait_for_timeout(1000)
+        with self.wait_for_api_response():
+            self.page.click(self._confirm_delete, force=True)
         
     @allure.step("Cancel delete")
     def cancel_delete(self):
         """Cancel deletion in the alert dialog"""
         self.page.click(self._cancel_delete)
         
+    @allure.step("Wait for validation errors")
+    def wait_for_validation_errors(self, timeout: int = 3000) -> bool:
+        """Wait for any validation error to show up; False if none does"""
+        return self.first_validation_error(timeout=timeout) is not None
+        
+    def first_validation_error(self, timeout: int = 3000):
+        """Wait for the first visible validation error; returns (selector, text) or None"""
+        return self.first_match([self._title_error, self._section_name_error, self._content_error], timeout=timeout)
+        
     @allure.step("Check if title error is visible")
     def is_title_error_visible(self):
         """Check if title validation error is visible"""
@@ -196,16 +230,6 @@ class KnowledgeBaseFormPage:
         """Check if last checked badge is visible (URL type only)"""
         return self.page.locator(self._last_checked_badge).is_visible()
         
-    @allure.step("Get save button")
-    def get_save_button(self):
-        """Get the save button element"""
-        return self.page.locator(self._save_button)
-        
-    @allure.step("Get delete button")
-    def get_delete_button(self):
-        """Get the delete button element"""
-        return self.page.locator(self._delete_button)
-        
     @allure.step("Verify URL is on create page")
     def verify_on_create_page(self):
         """Verify that we're on the create page"""
@@ -2,40 +2,65 @@
 Page Object Model for Knowledge Base List Page
 Handles all interactions with the knowledge base list page
 """
+from dataclasses import dataclass
+from typing import Iterator, List
 from playwright.sync_api import Page, expect
 import allure
 from config.env import BASE_URL
+from pages.base_page import BasePage
+from pages.readiness import AnyVisible, SpinnerHidden
 
 
-class KnowledgeBaseListPage:
+@dataclass
+class KnowledgeBaseRow:
+    """One entry as listed in the knowledge base table"""
+    title: str = ""
+    type: str = ""
+
+
+class KnowledgeBaseListSelectors:
+    """Selectors and locators of the knowledge base list, shared by the sync and async page objects"""
+    
+    ready = AnyVisible("_table", 'h3:has-text("not_found")') & SpinnerHidden("_loading_indicator")
+    
+    # Locators
+    _create_button = 'button:has-text("create_new"), button >> text=/create.*new/i'
+    _create_dropdown_trigger = 'button:has-text("create_new"), button >> text=/create.*new/i'
+    _article_option = 'a[href*="/knowledgebase/create?type=article"]'
+    _web_content_option = 'button:has-text("dynamic_web_content"), button:has-text("Dynamic Web Content")'
+    _url_option = 'button:has-text("url"), button:has-text("URL")'
+    _table = 'table'
+    _table_rows = 'table tbody tr'
+    _empty_state = 'text=/not.*found/i, text=/no.*knowledge.*base.*entries/i, h3:has-text("not_found")'
+    _loading_indicator = 'svg.animate-spin, [data-testid="loading"]'
+    _search_input = 'input[placeholder*="Search"]'
+    _row_cells = {"title": 'td:first-child .font-medium', "type": 'td:nth-child(2) span'}
+    
+    @allure.step("Get table element")
+    def get_table(self):
+        """Get the knowledge base table element"""
+        return self.page.locator(self._table)
+        
+    @allure.step("Get create button")
+    def get_create_button(self):
+        """Get the create button element"""
+        return self.page.locator(self._create_button)
+
+
+class KnowledgeBaseListPage(KnowledgeBaseListSelectors, BasePage):
     """Page object for knowledge base list page"""
     
     def __init__(self, page: Page):
-        self.page = page
+        super().__init__(page)
         self.base_url = BASE_URL
-        
-        # Locators
-        self._create_button = 'button:has-text("create_new"), button >> text=/create.*new/i'
-        self._create_dropdown_trigger = 'button:has-text("create_new"), button >> text=/create.*new/i'
-        self._article_option = 'a[href*="/knowledgebase/create?type=article"]'
-        self._web_content_option = 'button:has-text("dynamic_web_content"), button:has-text("Dynamic Web Content")'
-        self._url_option = 'button:has-text("url"), button:has-text("URL")'
-        self._table = 'table'
-        self._table_rows = 'table tbody tr'
-        self._empty_state = 'text=/not.*found/i, text=/no.*knowledge.*base.*entries/i, h3:has-text("not_found")'
-        self._loading_indicator = 'svg.animate-spin, [data-testid="loading"]'
-        self._search_input = 'input[placeholder*="Search"]'
-        self._title_cells = 'table tbody tr td:first-child .font-medium'
-        self._type_cells = 'table tbody tr td:nth-child(2) span'
-        
+    
     @allure.step("Navigate to knowledge base list page")
     def navigate(self, base_url: str = None):
         """Navigate to the knowledge base list page"""
         if base_url is None:
             base_url = self.base_url
         url = f"{base_url}/knowledgebase"
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+        super().navigate(url)
         
     @allure.step("Wait for page to load")
     def wait_for_page_load(self):
@@ -63,11 +88,6 @@ class KnowledgeBaseListPage:
         """Select URL option from create dropdown"""
         self.page.click(self._url_option)
         
-    @allure.step("Get table element")
-    def get_table(self):
-        """Get the knowledge base table element"""
-        return self.page.locator(self._table)
-        
     @allure.step("Get all table rows")
     def get_all_rows(self):
         """Get all knowledge base entries from the table"""
@@ -93,7 +113,8 @@ class KnowledgeBaseListPage:
         """Search for knowledge base entries"""
         if self.page.locator(self._search_input).is_visible():
             self.page.fill(self._search_input, search_text)
-            self.page.wait_for_timeout(500)  # Wait for search to filter
+            self.wait_for_spinner_hidden(self._loading_indicator)
+            self.wait_for_dom_stable(self._table)  # Wait for search to filter
             
     @allure.step("Click on entry with title: {title}")
     def click_entry_by_title(self, title: str):
@@ -101,17 +122,24 @@ class KnowledgeBaseListPage:
         row = self.page.locator(f'table tbody tr:has(.font-medium:has-text("{title}"))')
         row.click()
             
+    @allure.step("Get entries")
+    def get_entries(self) -> List[KnowledgeBaseRow]:
+        """Get title and type of every entry in one browser call"""
+        return self.extract_rows(self._table_rows, self._row_cells, KnowledgeBaseRow)
+        
+    def iter_entries(self, chunk_size: int = 100) -> Iterator[KnowledgeBaseRow]:
+        """Stream entries in chunks (for very long lists)"""
+        return self.stream_rows(self._table_rows, self._row_cells, KnowledgeBaseRow, chunk_size)
+        
     @allure.step("Get entry titles")
     def get_entry_titles(self):
         """Get all entry titles from the table"""
-        title_elements = self.page.locator(self._title_cells).all()
-        return [elem.text_content().strip() for elem in title_elements]
+        return [entry.title for entry in self.get_entries() if entry.title]
         
     @allure.step("Get entry types")
     def get_entry_types(self):
         """Get all entry types from the table"""
-        type_elements = self.page.locator(self._type_cells).all()
-        return [elem.text_content().strip() for elem in type_elements]
+        return [entry.type for entry in self.get_entries() if entry.type]
         
     @allure.step("Click on entry with title: {title}")
     def click_entry_by_title(self, title: str):
@@ -125,11 +153,6 @@ class KnowledgeBaseListPage:
         entry = self.page.locator(f'.font-medium:has-text("{title}")')
         return entry.is_visible()
         
-    @allure.step("Get create button")
-    def get_create_button(self):
-        """Get the create button element"""
-        return self.page.locator(self._create_button)
-        
     @allure.step("Wait for table to be visible")
     def wait_for_table(self):
         """Wait for the table to be visible"""
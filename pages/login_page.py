@@ -1,35 +1,30 @@
 # pages/login_page.py
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.readiness import Visible
+from pages.otp_page import OTP_FIELD_SELECTOR
 from config.env import BASE_URL
 
 
-class LoginPage(BasePage):
-    """Page Object for Login Page"""
+class LoginSelectors:
+    """Selectors and locators of the login page, shared by LoginPage and AsyncLoginPage"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.url = f"{BASE_URL}/login"
-        
-        # Locators
-        self._email_field = 'input[name="email"], input[type="email"]'
-        self._submit_button = 'button[type="submit"]'
-        
-        # Error message selectors
-        self._error_selectors = [
-            'text=/invalid|error|incorrect|failed|not found/i',
-            '.text-red-500',           # Tailwind errors
-            '.text-destructive',       # ShadCN errors
-            '[data-error]',            # Custom errors
-            '#email-error',            # Common pattern
-            'section.Toastify',        # Toastify popup container
-            'section.Toastify *',      # Any child of Toastify popup
-        ]
+    ready = Visible("_email_field")
     
-    def navigate(self):
-        """Navigate to login page"""
-        super().navigate(self.url)
-        return self
+    # Locators
+    _email_field = 'input[name="email"], input[type="email"]'
+    _submit_button = 'button[type="submit"]'
+    
+    # Error message selectors
+    _error_selectors = [
+        'text=/invalid|error|incorrect|failed|not found/i',
+        '.text-red-500',           # Tailwind errors
+        '.text-destructive',       # ShadCN errors
+        '[data-error]',            # Custom errors
+        '#email-error',            # Common pattern
+        'section.Toastify',        # Toastify popup container
+        'section.Toastify *',      # Any child of Toastify popup
+    ]
     
     def get_email_field(self):
         """Get email input field locator"""
@@ -38,6 +33,19 @@ class LoginPage(BasePage):
     def get_submit_button(self):
         """Get submit button locator"""
         return self.page.get_by_role("button")
+
+
+class LoginPage(LoginSelectors, BasePage):
+    """Page Object for Login Page"""
+    
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{BASE_URL}/login"
+    
+    def navigate(self):
+        """Navigate to login page"""
+        super().navigate(self.url)
+        return self
     
     def fill_email(self, email: str):
         """Fill email field"""
@@ -56,15 +64,13 @@ class LoginPage(BasePage):
         Check if any error messages are visible on the page
         Returns: (has_error: bool, error_text: str)
         """
-        self.wait_for_timeout(1500)  # Wait for error to appear
-        for selector in self._error_selectors:
-            locator = self.page.locator(selector)
-            if locator.count() > 0:
-                error_text = locator.first.text_content()
-                if error_text and error_text.strip():  # Only return if text is not empty
-                    print(f"DEBUG: Found error with selector {selector}: {error_text}")
-                    return True, error_text.strip()
-        return False, ""
+        # Either an error shows up or the OTP step does, whichever comes first
+        match = self.first_match(self._error_selectors, timeout=5000, stop_selectors=[OTP_FIELD_SELECTOR])
+        if match is None:
+            return False, ""
+        selector, error_text = match
+        print(f"DEBUG: Found error with selector {selector}: {error_text}")
+        return True, error_text
     
     def submit_email(self, email: str):
         """Complete email submission flow"""
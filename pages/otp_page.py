@@ -1,18 +1,21 @@
 # pages/otp_page.py
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError, expect
 from pages.base_page import BasePage
+from pages.readiness import Visible
+from config.env import NAVIGATION_MODE
 import re
 
+OTP_FIELD_SELECTOR = 'input[inputmode="numeric"], input[name="pin"], input[data-input-otp="true"]'
 
-class OTPPage(BasePage):
-    """Page Object for OTP Page"""
+
+class OTPSelectors:
+    """Selectors and locators of the OTP page, shared by OTPPage and AsyncOTPPage"""
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # Locators
-        self._otp_field = 'input[inputmode="numeric"], input[name="pin"], input[data-input-otp="true"]'
-        self._submit_button = 'button[type="submit"]'
+    ready = Visible("_otp_field")
+    
+    # Locators
+    _otp_field = OTP_FIELD_SELECTOR
+    _submit_button = 'button[type="submit"]'
     
     def get_otp_field(self):
         """Get OTP input field locator"""
@@ -25,6 +28,10 @@ class OTPPage(BasePage):
     def is_on_otp_page(self) -> bool:
         """Check if currently on OTP page"""
         return bool(re.search(r".*/login/otp.*", self.page.url))
+
+
+class OTPPage(OTPSelectors, BasePage):
+    """Page Object for OTP Page"""
     
     def fill_otp(self, otp_code: str):
         """Fill OTP field"""
@@ -46,12 +53,16 @@ class OTPPage(BasePage):
         
         Args:
             otp_code: OTP code to enter
-            auto_submit_wait: Wait time for auto-submit (some forms auto-submit)
+            auto_submit_wait: Max wait for auto-submit (some forms auto-submit)
         """
         self.fill_otp(otp_code)
         
-        # Wait for potential auto-submit
-        self.wait_for_timeout(auto_submit_wait)
+        # Done as soon as an auto-submit leaves the OTP page
+        try:
+            self.page.wait_for_url(lambda url: "/login/otp" not in url, timeout=auto_submit_wait)
+            return self
+        except PlaywrightTimeoutError:
+            pass
         
         # Submit if button is still visible
         self.click_submit()
@@ -69,5 +80,10 @@ class OTPPage(BasePage):
     
     def wait_for_dashboard(self):
         """Wait for dashboard to load after successful OTP"""
-        self.wait_for_load_state("networkidle")
+        if NAVIGATION_MODE == "networkidle":
+            self.wait_for_load_state("networkidle")
+            return self
+        self.page.wait_for_url(lambda url: "/login/otp" not in url)
+        self.wait_for_load_state("domcontentloaded")
+        self.wait_for_spinner_hidden()
         return self
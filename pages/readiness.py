@@ -0,0 +1,214 @@
+# pages/readiness.py
+"""
+Readiness strategies for page objects.
+
+After `goto(..., wait_until="domcontentloaded")` a page object waits for its
+own ready condition instead of network idle, which never settles on pages
+that poll or load analytics. Each page class declares its default:
+
+    class UsersListPage(BasePage):
+        ready = Visible("_page_title") & SpinnerHidden("_loading_spinner")
+
+Selectors starting with "_" are looked up on the page object, so strategies
+can reuse the page's selectors. Readiness is best effort: a condition that
+times out prints a warning and the test carries on, since assertions
+auto-wait anyway.
+
+Strategies serve both page layers: `around` / `wait` for BasePage, and
+`around_async` / `wait_async` for the asyncio pages in pages/aio.
+"""
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Iterable, Union
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+if TYPE_CHECKING:
+    from pages.aio.base_page import AsyncBasePage
+    from pages.base_page import BasePage
+
+SPINNER_SELECTOR = '.animate-spin, [data-testid="loading"]'
+
+
+def _resolve(page_object: "BasePage", selector: str) -> str:
+    return getattr(page_object, selector) if selector.startswith("_") else selector
+
+
+class ReadyStrategy:
+    """Decides when a page object is ready after navigation"""
+
+    def __init__(self, timeout: int = 10000):
+        self.timeout = timeout
+
+    @contextmanager
+    def around(self, page_object: "BasePage"):
+        """Wrap the navigation; listeners that must be armed before goto go here"""
+        yield
+        self.wait(page_object)
+
+    def wait(self, page_object: "BasePage"):
+        try:
+            self._wait(page_object)
+        except PlaywrightTimeoutError:
+            print(f"⚠ {type(page_object).__name__} not ready after {self.timeout} ms: {self}")
+
+    def _wait(self, page_object: "BasePage"):
+        pass
+
+    @asynccontextmanager
+    async def around_async(self, page_object: "AsyncBasePage"):
+        yield
+        await self.wait_async(page_object)
+
+    async def wait_async(self, page_object: "AsyncBasePage"):
+        try:
+            await self._wait_async(page_object)
+        except PlaywrightTimeoutError:
+            print(f"⚠ {type(page_object).__name__} not ready after {self.timeout} ms: {self}")
+
+    async def _wait_async(self, page_object: "AsyncBasePage"):
+        pass
+
+    def __and__(self, other: "ReadyStrategy") -> "ReadyStrategy":
+        return AllOf(self, other)
+
+    def __repr__(self) -> str:
+        return type(self).__name__
+
+
+class Visible(ReadyStrategy):
+    """Ready once a selector is visible"""
+
+    def __init__(self, selector: str, timeout: int = 10000):
+        super().__init__(timeout)
+        self.selector = selector
+
+    def _wait(self, page_object: "BasePage"):
+        locator = page_object.page.locator(_resolve(page_object, self.selector)).first
+        locator.wait_for(state="visible", timeout=self.timeout)
+
+    async def _wait_async(self, page_object: "AsyncBasePage"):
+        locator = page_object.page.locator(_resolve(page_object, self.selector)).first
+        await locator.wait_for(state="visible", timeout=self.timeout)
+
+    def __repr__(self) -> str:
+        return f"Visible({self.selector!r})"
+
+
+class AnyVisible(ReadyStrategy):
+    """Ready once any of the selectors is visible (e.g. a table or its empty state)"""
+
+    def __init__(self, *selectors: str, timeout: int = 10000):
+        super().__init__(timeout)
+        self.selectors = selectors
+
+    def _wait(self, page_object: "BasePage"):
+        selectors = [_resolve(page_object, s) for s in self.selectors]
+        if not page_object.wait_for_any_visible(selectors, timeout=self.timeout):
+            raise PlaywrightTimeoutError(f"none of {selectors} became visible")
+
+    async def _wait_async(self, page_object: "AsyncBasePage"):
+        selectors = [_resolve(page_object, s) for s in self.selectors]
+        if not await page_object.wait_for_any_visible(selectors, timeout=self.timeout):
+            raise PlaywrightTimeoutError(f"none of {selectors} became visible")
+
+    def __repr__(self) -> str:
+        return f"AnyVisible{self.selectors!r}"
+
+
+class SpinnerHidden(ReadyStrategy):
+    """Ready once loading spinners are gone"""
+
+    def __init__(self, selector: str = SPINNER_SELECTOR, timeout: int = 10000):
+        super().__init__(timeout)
+        self.selector = selector
+
+    def _wait(self, page_object: "BasePage"):
+        page_object.page.wait_for_selector(
+            _resolve(page_object, self.selector), state="hidden", timeout=self.timeout
+        )
+
+    async def _wait_async(self, page_object: "AsyncBasePage"):
+        await page_object.page.wait_for_selector(
+            _resolve(page_object, self.selector), state="hidden", timeout=self.timeout
+        )
+
+
+class DomStable(ReadyStrategy):
+    """Ready once the DOM stops changing for `quiet_ms`"""
+
+    def __init__(self, quiet_ms: int = 300, timeout: int = 5000):
+        super().__init__(timeout)
+        self.quiet_ms = quiet_ms
+
+    def _wait(self, page_object: "BasePage"):
+        if not page_object.wait_for_dom_stable(quiet_ms=self.quiet_ms, timeout=self.timeout):
+            raise PlaywrightTimeoutError("DOM still changing")
+
+    async def _wait_async(self, page_object: "AsyncBasePage"):
+        if not await page_object.wait_for_dom_stable(quiet_ms=self.quiet_ms, timeout=self.timeout):
+            raise PlaywrightTimeoutError("DOM still changing")
+
+
+class ApiResponse(ReadyStrategy):
+    """Ready once the page's first data response (e.g. GET /assistants/{id}) arrives"""
+
+    def __init__(self, url: str, methods: Union[str, Iterable[str]] = "GET", timeout: int = 10000):
+        super().__init__(timeout)
+        self.url = url
+        self.methods = methods
+
+    @contextmanager
+    def around(self, page_object: "BasePage"):
+        navigated = False
+        try:
+            with page_object.wait_for_api_response(self.url, methods=self.methods, timeout=self.timeout):
+                yield
+                navigated = True
+        except PlaywrightTimeoutError:
+            # Only the response wait is best effort, a failing goto still raises
+            if not navigated:
+                raise
+            print(f"⚠ {type(page_object).__name__} not ready after {self.timeout} ms: {self}")
+
+    @asynccontextmanager
+    async def around_async(self, page_object: "AsyncBasePage"):
+        navigated = False
+        try:
+            async with page_object.wait_for_api_response(self.url, methods=self.methods, timeout=self.timeout):
+                yield
+                navigated = True
+        except PlaywrightTimeoutError:
+            if not navigated:
+                raise
+            print(f"⚠ {type(page_object).__name__} not ready after {self.timeout} ms: {self}")
+
+    def __repr__(self) -> str:
+        return f"ApiResponse({self.url!r})"
+
+
+class AllOf(ReadyStrategy):
+    """Ready once every strategy is"""
+
+    def __init__(self, *strategies: ReadyStrategy):
+        super().__init__()
+        self.strategies = strategies
+
+    @contextmanager
+    def around(self, page_object: "BasePage"):
+        with ExitStack() as stack:
+            for strategy in self.strategies:
+                stack.enter_context(strategy.around(page_object))
+            yield
+
+    @asynccontextmanager
+    async def around_async(self, page_object: "AsyncBasePage"):
+        async with AsyncExitStack() as stack:
+            for strategy in self.strategies:
+                await stack.enter_async_context(strategy.around_async(page_object))
+            yield
+
+    def __and__(self, other: ReadyStrategy) -> ReadyStrategy:
+        return AllOf(*self.strategies, other)
+
+    def __repr__(self) -> str:
+        return " & ".join(repr(s) for s in self.strategies)
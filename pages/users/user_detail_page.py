@@ -3,46 +3,28 @@ Page object for the user detail page (/users/[id])
 """
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.readiness import SpinnerHidden, Visible
 
-class UserDetailPage(BasePage):
-    """Page Object for User Detail Page"""
-    
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # Locators
-        self._page_title = 'h1:has-text("User Detail")'
-        self._back_button = 'svg.lucide-chevron-left'
-        self._first_name_input = 'input[name="first_name"]'
-        self._last_name_input = 'input[name="last_name"]'
-        self._email_input = 'input[name="email"]'
-        self._role_select = 'button:has-text("Select roles")'
-        self._save_button = 'button[type="submit"]:has-text("Save")'
-        self._delete_button = 'button.bg-destructive:has-text("Delete"), button:has-text("Delete User")'
-        self._loading_spinner = '.animate-spin'
-        self._user_avatar = r'.bg-\[#E2F3FF\]'
-        self._delete_alert = '[role="alertdialog"]'
-        self._confirm_delete = 'button:has-text("Continue")'  # The "Continue" button in the confirmation dialog
-        self._success_message = 'text=/saved|success/i'
-        self._error_message = 'text=/error|failed/i'
-    
-    def navigate_to_user_detail(self, base_url: str, user_id: str):
-        """Navigate to user detail page"""
-        self.navigate(f"{base_url}/users/{user_id}")
-        return self
-    
-    def is_page_loaded(self) -> bool:
-        """Check if user detail page is loaded"""
-        try:
-            expect(self.page.locator(self._page_title)).to_be_visible(timeout=5000)
-            return True
-        except:
-            return False
-    
-    def click_back(self):
-        """Click back button"""
-        self.page.locator(self._back_button).click()
-        return self
+class UserDetailSelectors:
+    """Selectors and locators of the user detail page, shared by UserDetailPage and AsyncUserDetailPage"""
+    
+    ready = Visible("_first_name_input") & SpinnerHidden("_loading_spinner")
+    
+    # Locators
+    _page_title = 'h1:has-text("User Detail")'
+    _back_button = 'svg.lucide-chevron-left'
+    _first_name_input = 'input[name="first_name"]'
+    _last_name_input = 'input[name="last_name"]'
+    _email_input = 'input[name="email"]'
+    _role_select = 'button:has-text("Select roles")'
+    _save_button = 'button[type="submit"]:has-text("Save")'
+    _delete_button = 'button.bg-destructive:has-text("Delete"), button:has-text("Delete User")'
+    _loading_spinner = '.animate-spin'
+    _user_avatar = r'.bg-\[#E2F3FF\]'
+    _delete_alert = '[role="alertdialog"]'
+    _confirm_delete = 'button:has-text("Continue")'  # The "Continue" button in the confirmation dialog
+    _success_message = 'text=/saved|success/i'
+    _error_message = 'text=/error|failed/i'
     
     def get_first_name_input(self):
         """Get first name input locator"""
@@ -63,6 +45,28 @@ class UserDetailPage(BasePage):
     def get_delete_button(self):
         """Get delete button locator"""
         return self.page.locator(self._delete_button)
+
+
+class UserDetailPage(UserDetailSelectors, BasePage):
+    """Page Object for User Detail Page"""
+    
+    def navigate_to_user_detail(self, base_url: str, user_id: str):
+        """Navigate to user detail page"""
+        self.navigate(f"{base_url}/users/{user_id}")
+        return self
+    
+    def is_page_loaded(self) -> bool:
+        """Check if user detail page is loaded"""
+        try:
+            expect(self.page.locator(self._page_title)).to_be_visible(timeout=5000)
+            return True
+        except:
+            return False
+    
+    def click_back(self):
+        """Click back button"""
+        self.page.locator(self._back_button).click()
+        return self
     
     def fill_first_name(self, first_name: str):
         """Fill first name field"""
@@ -105,6 +109,10 @@ class UserDetailPage(BasePage):
         self.page.locator(self._confirm_delete).click(force=True)
         return self
     
+    def wait_for_delete_alert(self, timeout: int = 3000) -> bool:
+        """Wait for the delete alert dialog; False if it doesn't open"""
+        return self.wait_for_any_visible([self._delete_alert], timeout=timeout)
+    
     def is_delete_alert_visible(self) -> bool:
         """Check if delete alert dialog is visible"""
         return self.page.locator(self._delete_alert).is_visible()
@@ -141,6 +149,10 @@ class UserDetailPage(BasePage):
         except:
             return False
     
+    def wait_for_delete_button(self, timeout: int = 5000) -> bool:
+        """Wait for the delete button; False if it doesn't show (admin users)"""
+        return self.wait_for_any_visible([self._delete_button], timeout=timeout)
+    
     def is_delete_button_visible(self) -> bool:
         """Check if delete button is visible (not visible for admin users)"""
         try:
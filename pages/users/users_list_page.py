@@ -1,25 +1,49 @@
 """
 Page object for the users list page (/users)
 """
+from dataclasses import dataclass, field
+from typing import Iterator, List
 from playwright.sync_api import Page, expect
 from pages.base_page import BasePage
+from pages.readiness import SpinnerHidden, Visible
 
-class UsersListPage(BasePage):
-    """Page Object for Users List Page"""
+
+@dataclass
+class UserRow:
+    """One user as shown on the users list cards"""
+    name: str = ""
+    email: str = ""
+    roles: List[str] = field(default_factory=list)
+
+
+class UsersListSelectors:
+    """Selectors and locators of the users list, shared by UsersListPage and AsyncUsersListPage"""
+    
+    ready = Visible("_page_title") & SpinnerHidden("_loading_spinner")
+    
+    # Locators
+    _page_title = 'h1:has-text("Users")'
+    _create_new_button = 'button:has-text("Create New")'
+    _user_cards = '.shadow-sm.border.rounded-lg'
+    _empty_state = 'text=/no users/i'
+    _loading_spinner = '.animate-spin'
+    _add_user_modal = '[role="dialog"]'
+    _user_name = '.font-bold.text-sm'
+    _user_email = '.text-\[\#666666\].break-all.text-sm'
+    _role_badge = '.px-2.py-1.rounded-md'
+    _card_cells = {"name": _user_name, "email": _user_email, "roles": [_role_badge]}
+    
+    def get_create_new_button(self):
+        """Get create new button locator"""
+        return self.page.locator(self._create_new_button)
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # Locators
-        self._page_title = 'h1:has-text("Users")'
-        self._create_new_button = 'button:has-text("Create New")'
-        self._user_cards = '.shadow-sm.border.rounded-lg'
-        self._empty_state = 'text=/no users/i'
-        self._loading_spinner = '.animate-spin'
-        self._add_user_modal = '[role="dialog"]'
-        self._user_name = '.font-bold.text-sm'
-        self._user_email = '.text-\[\#666666\].break-all.text-sm'
-        self._role_badge = '.px-2.py-1.rounded-md'
+    def get_user_cards(self):
+        """Get all user cards"""
+        return self.page.locator(self._user_cards)
+
+
+class UsersListPage(UsersListSelectors, BasePage):
+    """Page Object for Users List Page"""
     
     def navigate_to_users(self, base_url: str):
         """Navigate to users page"""
@@ -34,26 +58,24 @@ class UsersListPage(BasePage):
         except:
             return False
     
-    def get_create_new_button(self):
-        """Get create new button locator"""
-        return self.page.locator(self._create_new_button)
-    
     def click_create_new(self):
         """Click create new button"""
         self.get_create_new_button().click()
         return self
     
+    def wait_for_add_user_modal(self, timeout: int = 5000):
+        """Wait for the add user modal to open"""
+        self.page.locator(self._add_user_modal).wait_for(state="visible", timeout=timeout)
+        return self
+    
     def is_add_user_modal_visible(self) -> bool:
         """Check if add user modal is visible"""
         return self.page.locator(self._add_user_modal).is_visible()
     
-    def get_user_cards(self):
-        """Get all user cards"""
-        return self.page.locator(self._user_cards)
-    
     def get_user_count(self) -> int:
         """Get number of user cards"""
-        self.wait_for_timeout(1000)  # Wait for cards to render
+        self.wait_for_spinner_hidden(self._loading_spinner)
+        self.wait_for_dom_stable()  # Cards render right after the spinner goes away
         return self.get_user_cards().count()
     
     def click_user_by_index(self, index: int):
@@ -77,6 +99,14 @@ class UsersListPage(BasePage):
             pass  # Spinner might not appear if loading is fast
         return self
     
+    def get_users(self) -> List[UserRow]:
+        """Get name, email and roles of every user card in one browser call"""
+        return self.extract_rows(self._user_cards, self._card_cells, UserRow)
+    
+    def iter_users(self, chunk_size: int = 100) -> Iterator[UserRow]:
+        """Stream user cards in chunks (for very long lists)"""
+        return self.stream_rows(self._user_cards, self._card_cells, UserRow, chunk_size)
+    
     def get_user_name_by_index(self, index: int) -> str:
         """Get user name by index"""
         return self.get_user_cards().nth(index).locator(self._user_name).text_content()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Manage the shared assistant pool.
+
+Usage:
+    python scripts/assistant_pool.py status                 # free / leased per type
+    python scripts/assistant_pool.py provision              # top up every type to ASSISTANT_POOL_SIZE
+    python scripts/assistant_pool.py provision voice sms
+    python scripts/assistant_pool.py gc --min-age 0         # delete all orphaned Auto-* assistants
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.env import ASSISTANT_GC_MIN_AGE, ASSISTANT_GC_PREFIX
+from core.api.assistant_pool import get_assistant_pool
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Provision, inspect and clean up test assistants")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status")
+    provision = commands.add_parser("provision")
+    provision.add_argument("types", nargs="*", help="Assistant types (default: ASSISTANT_POOL_TYPES)")
+    gc = commands.add_parser("gc")
+    gc.add_argument("--prefix", default=ASSISTANT_GC_PREFIX)
+    gc.add_argument("--min-age", type=int, default=ASSISTANT_GC_MIN_AGE, help="Seconds")
+    args = parser.parse_args()
+
+    pool = get_assistant_pool()
+    if args.command == "status":
+        status = pool.status()
+        if not status:
+            print("Assistant pool is empty")
+        for assistant_type, counts in sorted(status.items()):
+            print(f"{assistant_type:10} {counts['free']} free, {counts['leased']} leased")
+    elif args.command == "provision":
+        pool.provision(args.types or None)
+    else:
+        if not pool.collect_garbage(args.prefix, args.min_age):
+            print(f"✓ No orphaned '{args.prefix}*' assistants")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Create (or refresh) the pre-authenticated storage_state snapshot.
+
+The `context` fixture does this lazily on first use; run this script to warm
+the snapshot before a run or to write one for another credential/domain.
+
+Usage:
+    python scripts/create_storage_state.py
+    python scripts/create_storage_state.py --email qa@example.com --code 1234 --company-id company1_id
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.env import DOMAIN, LOGIN_CODE, LOGIN_COMPANY_ID, LOGIN_EMAIL
+from core.playwright.context import get_storage_state_manager
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a pre-authenticated storage_state snapshot")
+    parser.add_argument("--email", default=LOGIN_EMAIL)
+    parser.add_argument("--code", default=LOGIN_CODE)
+    parser.add_argument("--company-id", default=LOGIN_COMPANY_ID)
+    parser.add_argument("--domain", default=DOMAIN)
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the snapshot is still valid")
+    args = parser.parse_args()
+
+    if not args.email or not args.company_id or not args.domain:
+        print("❌ LOGIN_EMAIL, LOGIN_COMPANY_ID and DOMAIN must be set (in .env or via arguments)")
+        return 1
+
+    manager = get_storage_state_manager()
+    if args.force:
+        manager.auth.invalidate(args.email, args.company_id)
+        path = manager.create(args.email, args.code, args.company_id, args.domain)
+    else:
+        path = manager.get_state_path(args.email, args.code, args.company_id, args.domain)
+
+    print(f"✅ Storage state ready: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Backend latency per API endpoint, from the requests recorded during test runs.
+
+Usage:
+    python scripts/latency_report.py                  # p50/p95/p99 of the last run
+    python scripts/latency_report.py --all            # every recorded run
+    python scripts/latency_report.py --regressions    # last run vs earlier runs, exit 1 on regression
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.env import LATENCY_MIN_SAMPLES, LATENCY_REGRESSION_THRESHOLD
+from core.playwright.network_latency import latency_regressions, latency_report
+
+
+def print_report(run) -> int:
+    rows = latency_report(run=run)
+    if not rows:
+        print("⚠ No API requests recorded yet")
+        return 1
+    print(f"{'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'wait p50':>9} {'wait p95':>9}  endpoint")
+    for row in rows:
+        wait_p50 = "-" if row["wait_p50_ms"] is None else f"{row['wait_p50_ms']:.0f}"
+        wait_p95 = "-" if row["wait_p95_ms"] is None else f"{row['wait_p95_ms']:.0f}"
+        print(
+            f"{row['count']:>6} {row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f} "
+            f"{wait_p50:>9} {wait_p95:>9}  {row['endpoint']}"
+        )
+    return 0
+
+
+def print_regressions(threshold: float, min_samples: int) -> int:
+    regressions = latency_regressions(threshold=threshold, min_samples=min_samples)
+    if not regressions:
+        print(f"✓ No endpoint's p95 grew by more than {threshold:.0%}")
+        return 0
+    for row in regressions:
+        print(
+            f"✗ {row['endpoint']}: p95 {row['p95_ms']:.0f} ms "
+            f"(was {row['baseline_p95_ms']:.0f} ms, {row['change']:+.0%})"
+        )
+    return 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backend latency per API endpoint")
+    parser.add_argument("--run", default="last", help="Run id (default: the last run)")
+    parser.add_argument("--all", action="store_true", help="Aggregate every recorded run")
+    parser.add_argument("--regressions", action="store_true", help="Compare the last run to earlier runs")
+    parser.add_argument("--threshold", type=float, default=LATENCY_REGRESSION_THRESHOLD)
+    parser.add_argument("--min-samples", type=int, default=LATENCY_MIN_SAMPLES)
+    args = parser.parse_args()
+
+    if args.regressions:
+        return print_regressions(args.threshold, args.min_samples)
+    return print_report(None if args.all else args.run)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
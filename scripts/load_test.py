@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Run the regression flows as concurrent virtual users and report throughput and latency.
+
+Usage:
+    python scripts/load_test.py                                   # LOAD_* settings from .env
+    python scripts/load_test.py -u 20 -d 600 --ramp-up 120
+    python scripts/load_test.py --mix browse=3,login=1 --think-time 500
+    MOCK_API=true python scripts/load_test.py -u 10               # against the local mock API
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.env import LOAD_DURATION, LOAD_MIX, LOAD_RAMP_UP, LOAD_THINK_TIME_MS, LOAD_USERS
+from core.runner.load import LoadRunner
+
+
+def print_report(report: dict):
+    print(
+        f"\n{report['iterations']} scenarios in {report['duration_s']:.0f}s "
+        f"({report['throughput_per_min']:.1f}/min), {report['errors']} errors"
+    )
+    print(f"\n{'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  scenario")
+    for name, row in report["scenarios"].items():
+        print(
+            f"{row['count']:>6} {row['errors']:>6} {row['p50_ms']:>8.0f} "
+            f"{row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f}  {name}"
+        )
+    for name, row in report["failed_scenarios"].items():
+        print(f"✗ {name}: every run failed ({row['errors']}x), last: {row['last_error']}")
+    print(f"\n{'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  step")
+    for name, row in list(report["steps"].items())[:20]:
+        print(f"{row['count']:>6} {row['p50_ms']:>8.0f} {row['p95_ms']:>8.0f} {row['p99_ms']:>8.0f}  {name}")
+    print(f"\n✓ Load report: {report['path']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Browser load test from the regression flows")
+    parser.add_argument("-u", "--users", type=int, default=LOAD_USERS, help="Concurrent virtual users")
+    parser.add_argument("-d", "--duration", type=float, default=LOAD_DURATION, help="Seconds to run")
+    parser.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP, help="Seconds until all users run")
+    parser.add_argument("--mix", default=LOAD_MIX, help="Scenario weights, e.g. browse=4,login=1")
+    parser.add_argument(
+        "--think-time", type=int, default=LOAD_THINK_TIME_MS, help="Mean pause between scenarios in ms"
+    )
+    args = parser.parse_args()
+
+    try:
+        runner = LoadRunner(args.users, args.duration, args.ramp_up, args.mix, args.think_time)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 2
+    report = runner.run()
+    print_report(report)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Show the average navigation time per page object for each navigation mode.
+
+Run the suite once with NAVIGATION_MODE=networkidle and once with the default
+(ready) to see the time saved per navigation.
+
+Usage:
+    python scripts/navigation_report.py
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.playwright.navigation_timing import get_navigation_timings
+
+
+def main() -> int:
+    report = get_navigation_timings().report()
+    if not report:
+        print("⚠ No navigation timings recorded yet")
+        return 1
+
+    print(f"{'Page':<28} {'ready ms':>10} {'networkidle ms':>15} {'saved ms':>10}")
+    for page_name, row in report.items():
+        print(
+            f"{page_name:<28} {row.get('ready', '-'):>10} "
+            f"{row.get('networkidle', '-'):>15} {row.get('saved_ms', '-'):>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Run the suite in parallel: N pytest workers sharing one Chromium server.
+
+Allure results from all workers end up in allure-results/.
+
+Usage:
+    python scripts/run_parallel.py                      # whole suite, one worker per core
+    python scripts/run_parallel.py -n 4 tests/users/    # 4 workers, users tests only
+    python scripts/run_parallel.py -n 2 -- -k "contact and not delete"
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.runner.parallel import ParallelExecutor, RESULTS_DIR, default_worker_count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run pytest across parallel workers sharing one browser")
+    parser.add_argument("-n", "--workers", type=int, default=default_worker_count())
+    parser.add_argument("--alluredir", default=RESULTS_DIR)
+    parser.add_argument("pytest_args", nargs="*", help="Paths / options passed to pytest")
+    args = parser.parse_args()
+
+    executor = ParallelExecutor(workers=args.workers, results_dir=args.alluredir)
+    return executor.run(args.pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,39 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from subprocess import Popen, run
+from subprocess import run
 from pathlib import Path
 import shutil
 import os
+from typing import Optional
+from fastapi import HTTPException
 from google.cloud import storage
 from dotenv import load_dotenv
+from core.runner.jobs import QUEUED, RUNNING, Job, JobManager
+from core.runner.parallel import collect_node_ids
+from core.runner.shards import load_shard_history, parse_shard, plan_shards, shard_loads
+from core.runner.worker_pool import WorkerPool
+from core.utils.gcs_cleanup import ReportCleaner
+from core.utils.report_publisher import ReportPublisher
+from config.env import REPORT_KEEP_DAYS, REPORT_KEEP_LAST, RUNNER_WARM_WORKERS, SHARD_HISTORY_PATH
 
 load_dotenv()
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm workers (imports done, browser launched) replace a fresh pytest process per job
+    global worker_pool
+    if RUNNER_WARM_WORKERS:
+        worker_pool = WorkerPool(size=jobs.max_concurrent)
+        jobs.runner = worker_pool.run
+    try:
+        yield
+    finally:
+        if worker_pool:
+            worker_pool.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 TEST_PATHS = {
     "test-login": "tests/login/test_login.py",
@@ -38,110 +64,138 @@ TEST_PATHS = {
 # Additional endpoints for missing tests
 @app.post("/test-create-assistant-all-types")
 def test_create_assistant_all_types():
-    run_pytest(TEST_PATHS["test-create-assistant-all-types"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-create-assistant-all-types"])
+    return job_response(job)
 
 @app.post("/test-update-assistant-basic")
 def test_update_assistant_basic():
-    run_pytest(TEST_PATHS["test-update-assistant-basic"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-update-assistant-basic"])
+    return job_response(job)
 
 @app.post("/test-delete-assistant")
 def test_delete_assistant():
-    run_pytest(TEST_PATHS["test-delete-assistant"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-delete-assistant"])
+    return job_response(job)
 
 @app.post("/test-whatsapp-general-tab")
 def test_whatsapp_general_tab():
-    run_pytest(TEST_PATHS["test-whatsapp-general-tab"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-whatsapp-general-tab"])
+    return job_response(job)
 
 @app.post("/test-chatbot-general-tab")
 def test_chatbot_general_tab():
-    run_pytest(TEST_PATHS["test-chatbot-general-tab"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-chatbot-general-tab"])
+    return job_response(job)
 
 @app.post("/test-sms-general-tab")
 def test_sms_general_tab():
-    run_pytest(TEST_PATHS["test-sms-general-tab"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-sms-general-tab"])
+    return job_response(job)
 
 # Users Management Tests
 @app.post("/test-users-list")
 def test_users_list():
-    run_pytest(TEST_PATHS["test-users-list"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-users-list"])
+    return job_response(job)
 
 @app.post("/test-user-detail")
 def test_user_detail():
-    run_pytest(TEST_PATHS["test-user-detail"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-user-detail"])
+    return job_response(job)
 
 @app.post("/test-users")
 def test_users():
     """Run all users tests"""
-    run_pytest(TEST_PATHS["test-users"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-users"])
+    return job_response(job)
 
 # Contacts Management Tests
 @app.post("/test-contacts-list")
 def test_contacts_list():
-    run_pytest(TEST_PATHS["test-contacts-list"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-contacts-list"])
+    return job_response(job)
 
 @app.post("/test-contact-form")
 def test_contact_form():
-    run_pytest(TEST_PATHS["test-contact-form"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-contact-form"])
+    return job_response(job)
 
 @app.post("/test-contacts")
 def test_contacts():
     """Run all contacts tests"""
-    run_pytest(TEST_PATHS["test-contacts"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-contacts"])
+    return job_response(job)
 
 # Knowledge Base Management Tests
 @app.post("/test-knowledgebase-list")
 def test_knowledgebase_list():
-    run_pytest(TEST_PATHS["test-knowledgebase-list"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-knowledgebase-list"])
+    return job_response(job)
 
 @app.post("/test-knowledgebase-form")
 def test_knowledgebase_form():
-    run_pytest(TEST_PATHS["test-knowledgebase-form"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-knowledgebase-form"])
+    return job_response(job)
 
 @app.post("/test-knowledgebase")
 def test_knowledgebase():
     """Run all knowledge base tests"""
-    run_pytest(TEST_PATHS["test-knowledgebase"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-knowledgebase"])
+    return job_response(job)
 
 # Endpoint to run all voice assistant tab tests
 @app.post("/test-voice-type")
 def test_voice_type():
-    run_pytest(TEST_PATHS["test-voice-type"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-voice-type"])
+    return job_response(job)
 
 RESULTS_DIR = "allure-results"
 REPORT_DIR = "allure-report"
 GCS_BUCKET = os.getenv("GCS_BUCKET_NAME")  # Set in your .env
 GCS_REPORT_PREFIX = os.getenv("GCS_REPORT_PREFIX", "allure-report/")  # Optional prefix
 
-# Helper to start pytest for a given file
-def run_pytest(test_file: str):
+# Every run is a queued job with its own results dir under RESULTS_DIR
+jobs = JobManager(results_root=RESULTS_DIR)
+worker_pool: Optional[WorkerPool] = None
+
+# Helper to queue pytest for a given file
+def run_pytest(test_file: str, shard: Optional[str] = None) -> Job:
     # Ensure results directory exists
     Path(RESULTS_DIR).mkdir(exist_ok=True)
-    # Start pytest in background
-    Popen([
-        "pytest", test_file, f"--alluredir={RESULTS_DIR}"
-    ])
+    args = []
+    # Only run this container's share of the tests (e.g. "2/4")
+    if shard:
+        args.append(f"--shard={shard}")
+    return jobs.submit(test_file, args)
+
+def job_response(job: Job) -> dict:
+    return {"test_started": True, "job_id": job.id, "status": job.state}
+
+@app.get("/jobs")
+def list_jobs():
+    return {"counts": jobs.counts(), "jobs": [job.to_dict() for job in jobs.list()]}
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job.to_dict()
 
 # Helper to delete local report folders
 def delete_local_reports():
-    for folder in [RESULTS_DIR, REPORT_DIR]:
-        if Path(folder).exists():
-            shutil.rmtree(folder)
+    # Keep the results of jobs that are still queued or running
+    active = {Path(job.results_dir) for job in jobs.list() if job.state in (QUEUED, RUNNING)}
+    if Path(RESULTS_DIR).exists():
+        for entry in Path(RESULTS_DIR).iterdir():
+            if entry in active:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+    if Path(REPORT_DIR).exists():
+        shutil.rmtree(REPORT_DIR)
 
 # Helper to delete previous report from GCS
 def delete_gcs_report_folder(report_folder):
@@ -152,9 +206,7 @@ def delete_gcs_report_folder(report_folder):
     try:
         client = storage.Client()
         bucket = client.bucket(GCS_BUCKET)
-        blobs = bucket.list_blobs(prefix=report_folder)
-        for blob in blobs:
-            blob.delete()
+        ReportCleaner(bucket).delete_folders([report_folder])
         return True
     except Exception as e:
         print(f"GCS delete error: {e}")
@@ -162,47 +214,42 @@ def delete_gcs_report_folder(report_folder):
 
 # Helper to generate allure report
 def generate_allure_report():
+    # Results of every job live in their own sub-directory
+    result_dirs = [RESULTS_DIR]
+    if Path(RESULTS_DIR).exists():
+        result_dirs += sorted(str(d) for d in Path(RESULTS_DIR).iterdir() if d.is_dir())
     result = run([
-        "allure", "generate", RESULTS_DIR, "-o", REPORT_DIR, "--clean"
+        "allure", "generate", *result_dirs, "-o", REPORT_DIR, "--clean"
     ], capture_output=True)
     return result.returncode == 0
 
 # Helper to upload allure report to GCS
 def upload_report_to_gcs(report_folder):
-    """Upload Allure report to a timestamped folder in GCS."""
+    """Publish Allure report to a timestamped folder in GCS (only changed files are transferred)."""
     if not GCS_BUCKET or not report_folder:
         return False
     try:
         client = storage.Client()
         bucket = client.bucket(GCS_BUCKET)
-        for root, _, files in os.walk(REPORT_DIR):
-            for file in files:
-                local_path = os.path.join(root, file)
-                rel_path = os.path.relpath(local_path, REPORT_DIR)
-                blob = bucket.blob(f"{report_folder}/{rel_path}")
-                blob.upload_from_filename(local_path)
-        return True
+        summary = ReportPublisher(bucket).publish(REPORT_DIR, report_folder)
+        return not summary["failed"]
     except Exception as e:
         print(f"GCS upload error: {e}")
         return False
 
-def delete_all_previous_reports():
+def delete_all_previous_reports(keep=None, keep_last=REPORT_KEEP_LAST, keep_days=REPORT_KEEP_DAYS):
+    """Apply the report retention policy; the `keep` folder is never deleted."""
     if not GCS_BUCKET:
         return False
     try:
         client = storage.Client()
         bucket = client.bucket(GCS_BUCKET)
-
-        # Prefix for all reports (based on your structure)
-        prefix = "allure-reports/"
-        blobs = bucket.list_blobs(prefix=prefix)
-
-        deleted_any = False
-        for blob in blobs:
-            blob.delete()
-            deleted_any = True
-
-        return deleted_any
+        result = ReportCleaner(bucket).apply_retention(
+            keep_last=keep_last,
+            keep_days=keep_days,
+            protect=[keep] if keep else [],
+        )
+        return bool(result["deleted_folders"])
     except Exception as e:
         print(f"GCS delete ALL reports error: {e}")
         return False
@@ -210,18 +257,50 @@ def delete_all_previous_reports():
 
 @app.post("/test-login")
 def test_login():
-    run_pytest(TEST_PATHS["test-login"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-login"])
+    return job_response(job)
 
 @app.post("/test-assistant-creation")
 def test_assistant_creation():
-    run_pytest(TEST_PATHS["test-assistant-creation"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-assistant-creation"])
+    return job_response(job)
 
 @app.post("/test-dashboard")
 def test_dashboard():
-    run_pytest(TEST_PATHS["test-dashboard"])
-    return {"test_started": True}
+    job = run_pytest(TEST_PATHS["test-dashboard"])
+    return job_response(job)
+
+# Generic endpoint: run any TEST_PATHS entry, optionally only one shard of it
+@app.post("/run/{test_key}")
+def run_test_key(test_key: str, shard: Optional[str] = None):
+    if test_key not in TEST_PATHS:
+        raise HTTPException(status_code=404, detail=f"Unknown test key: {test_key}")
+    if shard:
+        try:
+            parse_shard(shard)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    job = run_pytest(TEST_PATHS[test_key], shard=shard)
+    return {**job_response(job), "shard": shard}
+
+# Show how a TEST_PATHS entry would be split into `total` shards (from the same snapshot as --shard)
+@app.get("/shard-plan/{test_key}")
+def shard_plan(test_key: str, total: int = 2):
+    if test_key not in TEST_PATHS:
+        raise HTTPException(status_code=404, detail=f"Unknown test key: {test_key}")
+    if total < 1:
+        raise HTTPException(status_code=400, detail="total must be >= 1")
+    history, digest = load_shard_history(SHARD_HISTORY_PATH)
+    shards = plan_shards(collect_node_ids([TEST_PATHS[test_key]]), total, history)
+    loads = shard_loads(shards, history)
+    return {
+        "total": total,
+        "history": digest,
+        "shards": [
+            {"shard": f"{i + 1}/{total}", "estimated_seconds": round(load, 1), "tests": tests}
+            for i, (tests, load) in enumerate(zip(shards, loads))
+        ],
+    }
 
 # Endpoint to generate, upload, and clean up Allure report
 @app.post("/upload-report")
@@ -230,17 +309,18 @@ def upload_report():
     # Generate timestamped folder name
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_folder = f"allure-reports/{timestamp}"
-    delete_all_previous_reports()
-    # Optionally: delete previous report folder in GCS (not implemented here, can be added)
 
     # Generate new report
     if not generate_allure_report():
         return {"success": False, "error": "Allure report generation failed"}
 
-    # Upload to GCS (timestamped folder)
+    # Upload to GCS (timestamped folder); unchanged files are copied from the previous report
     if not upload_report_to_gcs(report_folder):
         return {"success": False, "error": "GCS upload failed"}
 
+    # Old reports are pruned (REPORT_KEEP_LAST / REPORT_KEEP_DAYS) once the new one is complete
+    delete_all_previous_reports(keep=report_folder)
+
     # Clean up local reports
     delete_local_reports()
 
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Show where a run spent its time: the slowest steps, fixtures, navigations or
+logins from the timing ledger, by total wall time.
+
+Usage:
+    python scripts/timing_report.py                         # steps of the last run
+    python scripts/timing_report.py --kind fixture --top 10
+    python scripts/timing_report.py --kind all --all        # everything, every run
+    python scripts/timing_report.py --run 20261017-101500-4242
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils.timing_ledger import KINDS, get_timing_ledger
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aggregate the timing ledger")
+    parser.add_argument("--kind", default="step", choices=[*KINDS, "all"])
+    parser.add_argument("--run", default="last", help="Run id (default: the last run)")
+    parser.add_argument("--all", action="store_true", help="Aggregate every run in the ledger")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    ledger = get_timing_ledger()
+    rows = ledger.report(
+        kind=None if args.kind == "all" else args.kind,
+        run=None if args.all else args.run,
+        top=args.top,
+    )
+    if not rows:
+        print(f"⚠ No timings recorded in {ledger.path}")
+        return 1
+
+    print(f"{'total ms':>10} {'count':>6} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}  {'kind':<10} name")
+    for row in rows:
+        print(
+            f"{row['total_ms']:>10.0f} {row['count']:>6} {row['mean_ms']:>9.0f} "
+            f"{row['p95_ms']:>9.0f} {row['max_ms']:>9.0f}  {row['kind']:<10} {row['name']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
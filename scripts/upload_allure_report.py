@@ -12,6 +12,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.utils.gcs_uploader import get_gcs_uploader
+from core.utils.report_publisher import ReportPublisher
 
 
 def upload_allure_report(report_dir: str = "allure-report"):
@@ -53,36 +54,15 @@ def upload_allure_report(report_dir: str = "allure-report"):
     print(f"Uploading to: gs://{gcs.bucket_name}/{report_folder}/")
     print()
     
-    # Upload all files in the report directory
-    uploaded_files = []
-    failed_files = []
-    
-    for file_path in report_path.rglob("*"):
-        if file_path.is_file():
-            # Get relative path from report_dir
-            relative_path = file_path.relative_to(report_path)
-            blob_name = f"{report_folder}/{relative_path}"
-            
-            print(f"Uploading: {relative_path}...", end=" ")
-            
-            url = gcs.upload_file(
-                str(file_path),
-                blob_name=blob_name,
-                folder="",  # Don't add extra folder, we have full path in blob_name
-                make_public=False
-            )
-            
-            if url:
-                uploaded_files.append(str(relative_path))
-                print("✓")
-            else:
-                failed_files.append(str(relative_path))
-                print("✗")
+    # Publish the report; files unchanged since the previous report are copied server-side
+    summary = ReportPublisher(gcs.bucket).publish(str(report_path), report_folder)
+    failed_files = summary["failed"]
     
     print()
     print("=" * 60)
     print(f"✅ Upload Complete!")
-    print(f"   Uploaded: {len(uploaded_files)} files")
+    print(f"   Uploaded: {summary['uploaded']} files")
+    print(f"   Copied (unchanged): {summary['copied']} files")
     if failed_files:
         print(f"   Failed: {len(failed_files)} files")
     print("=" * 60)
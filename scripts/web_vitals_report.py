@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Render metrics per page object (p75 by default), from runs with
+WEB_VITALS_MODE=collect or enforce.
+
+Usage:
+    python scripts/web_vitals_report.py               # last run
+    python scripts/web_vitals_report.py --all --pct 95
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.playwright.web_vitals import METRICS, get_web_vitals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Web Vitals per page object")
+    parser.add_argument("--run", default="last", help="Run id (default: the last run)")
+    parser.add_argument("--all", action="store_true", help="Aggregate every recorded run")
+    parser.add_argument("--pct", type=float, default=75, help="Percentile to show")
+    args = parser.parse_args()
+
+    report = get_web_vitals().report(run=None if args.all else args.run, pct=args.pct)
+    if not report:
+        print("⚠ No Web Vitals recorded yet (run with WEB_VITALS_MODE=collect)")
+        return 1
+
+    columns = [metric for metric in METRICS if any(metric in row for row in report.values())]
+    print(f"p{args.pct:g} per page")
+    print(f"{'Page':<28} {'count':>6} " + " ".join(f"{metric:>22}" for metric in columns))
+    for page_name, row in report.items():
+        values = " ".join(f"{row.get(metric, '-'):>22}" for metric in columns)
+        print(f"{page_name:<28} {row['count']:>6} {values}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
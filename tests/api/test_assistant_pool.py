@@ -0,0 +1,156 @@
+"""
+Tests for the assistant pool, using an in-memory fake client and a temporary pool file
+"""
+import fcntl
+import time
+
+import allure
+
+from core.api.assistant_pool import AssistantPool
+from core.api.client import ApiError
+from core.utils.file_lock import locked_json, read_json
+
+
+class FakeAssistantClient:
+    """Stands in for ApiClient on /assistants; unknown records answer 404"""
+
+    def __init__(self):
+        self.records = {}
+        self.deleted = []
+        self._next_id = 0
+
+    def _record(self, method, path):
+        record_id = path.split("/")[-1]
+        if record_id not in self.records:
+            raise ApiError(method, path, 404, "not found")
+        return self.records[record_id]
+
+    def post(self, path, json=None):
+        self._next_id += 1
+        record = {**json, "ID": f"a{self._next_id}"}
+        self.records[record["ID"]] = record
+        return dict(record)
+
+    def get(self, path, params=None):
+        if "/" not in path:
+            return [dict(record) for record in self.records.values()]
+        return dict(self._record("GET", path))
+
+    def put(self, path, json=None):
+        record = self._record("PUT", path)
+        record.update(json)
+        return dict(record)
+
+    def delete(self, path):
+        self._record("DELETE", path)
+        record_id = path.split("/")[-1]
+        del self.records[record_id]
+        self.deleted.append(record_id)
+
+
+def make_pool(tmp_path, client=None):
+    return AssistantPool(client or FakeAssistantClient(), path=str(tmp_path / "pool.json"), size=2, lease_ttl=60)
+
+
+@allure.feature("API Test Data")
+class TestAssistantPool:
+
+    @allure.title("Concurrent leases never share an assistant")
+    def test_exclusive_leases(self, tmp_path):
+        pool = make_pool(tmp_path)
+        pool.provision(["voice"])
+
+        first = pool.lease("voice", holder="host:1")
+        second = pool.lease("voice", holder="host:2")
+        third = pool.lease("voice", holder="host:3")
+
+        assert len({first.id, second.id, third.id}) == 3
+        assert pool.status() == {"voice": {"free": 0, "leased": 3}}
+
+    @allure.title("Release restores the baseline and frees the assistant")
+    def test_release_resets(self, tmp_path):
+        client = FakeAssistantClient()
+        pool = make_pool(tmp_path, client)
+        assistant = pool.lease("sms")
+        client.records[assistant.id]["Name"] = "renamed by a test"
+
+        pool.release(assistant)
+
+        assert client.records[assistant.id]["Name"] == assistant.name
+        assert pool.lease("sms").id == assistant.id
+
+    @allure.title("Assistants deleted by a test are dropped from the pool")
+    def test_release_after_delete(self, tmp_path):
+        client = FakeAssistantClient()
+        pool = make_pool(tmp_path, client)
+        assistant = pool.lease("voice")
+
+        client.delete(f"assistants/{assistant.id}")
+        pool.release(assistant)
+
+        assert pool.status() == {}
+        assert pool.lease("voice").id != assistant.id
+
+    @allure.title("A new assistant is created outside the pool lock, in a reserved slot")
+    def test_create_outside_lock(self, tmp_path):
+        pool_path = tmp_path / "pool.json"
+        seen = []
+
+        class ProbingClient(FakeAssistantClient):
+            def post(self, path, json=None):
+                with open(f"{pool_path}.lock", "a+") as lock_file:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                seen.append([entry.get("pending") for entry in read_json(pool_path)["assistants"].values()])
+                return super().post(path, json)
+
+        pool = make_pool(tmp_path, ProbingClient())
+        assistant = pool.lease("voice", holder="host:1")
+
+        assert seen == [[True]]
+        assert pool.status() == {"voice": {"free": 0, "leased": 1}}
+        assert assistant.name.startswith("Pool-voice-")
+
+    @allure.title("Reserved slots of a process that died are dropped")
+    def test_dead_reservation_dropped(self, tmp_path):
+        pool = make_pool(tmp_path)
+        pool.provision(["voice"])
+        with locked_json(pool.path) as data:
+            data["assistants"]["pending-x"] = {
+                "type": "voice", "pending": True, "lease": {"holder": "host:1", "since": time.time() - 3600},
+            }
+
+        pool.lease("voice")
+
+        assert "pending-x" not in read_json(pool.path)["assistants"]
+
+    @allure.title("Release by a holder whose lease was taken over leaves the new lease alone")
+    def test_release_after_takeover(self, tmp_path):
+        client = FakeAssistantClient()
+        pool = make_pool(tmp_path, client)
+        stale = pool.lease("voice", holder="host:1")
+        with locked_json(pool.path) as data:
+            data["assistants"][stale.id]["lease"]["since"] = time.time() - 3600
+        client.records[stale.id]["Name"] = "edited by host:1"
+        # The expired lease is taken over: host:2 gets the assistant host:1 still thinks it holds
+        assert pool.lease("voice", holder="host:2").id == stale.id
+        client.records[stale.id]["Name"] = "edited by host:2"
+
+        pool.release(stale, holder="host:1")
+
+        assert client.records[stale.id]["Name"] == "edited by host:2"
+        assert read_json(pool.path)["assistants"][stale.id]["lease"]["holder"] == "host:2"
+
+    @allure.title("Garbage collection deletes only old orphaned Auto-* assistants")
+    def test_collect_garbage(self, tmp_path):
+        client = FakeAssistantClient()
+        pool = make_pool(tmp_path, client)
+        pooled = pool.lease("voice")
+        old = client.post("assistants", json={"Name": "Auto-old", "CreatedAt": time.time() - 7200})
+        young = client.post("assistants", json={"Name": "Auto-young", "CreatedAt": time.time()})
+        undated = client.post("assistants", json={"Name": "Auto-undated"})
+        other = client.post("assistants", json={"Name": "Production bot"})
+
+        assert pool.collect_garbage(prefix="Auto-", min_age=3600) == 1
+        assert client.deleted == [old["ID"]]
+        assert {pooled.id, young["ID"], undated["ID"], other["ID"]} <= set(client.records)
@@ -0,0 +1,156 @@
+"""
+Tests for the API test data layer, using an in-memory fake client
+"""
+import re
+
+import allure
+import pytest
+
+from core.api.client import ApiError
+from core.api.resources import Assistant, Contact, DataFactory, KnowledgeBaseEntry, User
+from fixtures.api_fixtures import skip_if_refused
+from pages.contacts.contact_form_page import ContactFormPage
+from pages.users.user_detail_page import UserDetailPage
+
+
+def form_field_names(page_class) -> set:
+    """The `name` attributes of a page object's input selectors"""
+    return {
+        match
+        for value in (getattr(page_class, attr) for attr in dir(page_class)) if isinstance(value, str)
+        for match in re.findall(r'input\[name="(\w+)"\]', value)
+    }
+
+
+class FakeClient:
+    """Stands in for ApiClient: stores posted payloads, answers like the API"""
+
+    def __init__(self):
+        self.records = {}
+        self.deleted = []
+        self._next_id = 0
+
+    def post(self, path, json=None):
+        self._next_id += 1
+        record = {**json, "ID": f"{path}-{self._next_id}"}
+        self.records[record["ID"]] = record
+        return record
+
+    def get(self, path, params=None):
+        return self.records[path.split("/")[-1]]
+
+    def put(self, path, json=None):
+        record_id = path.split("/")[-1]
+        self.records[record_id].update(json)
+        return self.records[record_id]
+
+    def delete(self, path):
+        record_id = path.split("/")[-1]
+        if record_id not in self.records:
+            raise ApiError("DELETE", path, 404, "not found")
+        del self.records[record_id]
+        self.deleted.append(record_id)
+
+
+@allure.feature("API Test Data")
+class TestDataFactory:
+
+    @allure.title("Records map to the API's field names and back")
+    def test_payload_mapping(self):
+        contact = Contact(first_name="Ada", last_name="Lovelace", phone="+491234567890")
+
+        assert contact.to_payload()["FirstName"] == "Ada"
+        assert contact.to_payload()["PhoneNumber"] == "+491234567890"
+        assert Contact.from_api({"ID": "c1", "FirstName": "Ada"}) == Contact(first_name="Ada", id="c1")
+
+        article = KnowledgeBaseEntry(title="Article", type="article").to_payload()
+        assert "Sections" in article and "URL" not in article
+
+    @allure.title("Factory creates unique records and deletes them newest first")
+    def test_create_and_cleanup(self):
+        client = FakeClient()
+        factory = DataFactory(client)
+
+        first = factory.contact()
+        second = factory.contact(first_name="Grace")
+        article = factory.kb_article()
+
+        assert first.id and first.last_name != second.last_name
+        assert second.first_name == "Grace"
+        assert client.records[article.id]["Type"] == "article"
+
+        factory.cleanup()
+
+        assert client.deleted == [article.id, second.id, first.id]
+        assert client.records == {}
+
+    @allure.title("Cleanup ignores records the test already deleted")
+    def test_cleanup_after_delete(self):
+        client = FakeClient()
+        factory = DataFactory(client)
+        user = factory.user()
+
+        factory.users.delete(user.id)
+        factory.cleanup()
+
+        assert client.records == {}
+
+    @allure.title("Update merges changes into the current record")
+    def test_update(self):
+        client = FakeClient()
+        factory = DataFactory(client)
+        contact = factory.contact(email="old@example.com")
+
+        updated = factory.contacts.update(contact.id, email="new@example.com")
+
+        assert updated.email == "new@example.com"
+        assert updated.first_name == contact.first_name
+
+
+@allure.feature("API Test Data")
+class TestPayloadContract:
+
+    @allure.title("Contact payloads carry exactly the contact form's fields")
+    def test_contact_payload(self):
+        payload = DataFactory(FakeClient()).contact(email="ada@example.com").to_payload()
+
+        assert set(payload) == form_field_names(ContactFormPage) == {"FirstName", "LastName", "Email", "PhoneNumber"}
+        assert re.fullmatch(r"\+49151\d{7}", payload["PhoneNumber"])
+
+    @allure.title("User payloads carry exactly the user form's fields and no role")
+    def test_user_payload(self):
+        client = FakeClient()
+        user = DataFactory(client).user()
+
+        assert set(user.to_payload()) == form_field_names(UserDetailPage) == {"first_name", "last_name", "email"}
+        assert User.from_api(client.records[user.id]) == user
+
+    @allure.title("Knowledge base payloads carry only the fields of their entry type")
+    def test_knowledgebase_payload(self):
+        factory = DataFactory(FakeClient())
+
+        article = factory.kb_article().to_payload()
+        url = factory.kb_url().to_payload()
+
+        assert set(article) == {"Title", "Type", "Sections"} and article["Type"] == "article"
+        assert all(set(section) == {"Name", "Content"} for section in article["Sections"])
+        assert set(url) == {"Title", "Type", "URL", "Frequency", "Prompt"} and url["Type"] == "url"
+
+    @allure.title("Assistant payloads carry a name and one of the pool's types")
+    def test_assistant_payload(self):
+        payload = DataFactory(FakeClient()).assistant(type="sms").to_payload()
+
+        assert payload == {"Name": payload["Name"], "Type": "sms"}
+        assert payload["Name"].startswith("Auto-")
+        assert Assistant.from_api({**payload, "ID": "a1"}).id == "a1"
+
+    @allure.title("A record the API refuses to create skips the test instead of failing it")
+    def test_refused_create_skips(self):
+        class RefusingClient(FakeClient):
+            def post(self, path, json=None):
+                raise ApiError("POST", path, 422, "unknown field")
+
+        make_contact = skip_if_refused(DataFactory(RefusingClient()).contact)
+
+        with pytest.raises(pytest.skip.Exception, match="422"):
+            make_contact()
@@ -1,37 +1,27 @@
 import allure
 import pytest
-import re
-from flows.assistant.create_assistant_flow import CreateAssistantFlow
-from core.playwright.auth import AuthService
-from playwright.sync_api import expect
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID
+from flows.aio.create_assistant_flow import AsyncCreateAssistantFlow
+from pages.aio.assistants_page import AsyncAssistantsPage
+from playwright.async_api import expect
+from config.env import BASE_URL
 
 @allure.story("Assistant Creation")
 @allure.title("Create assistant of each type")
+@pytest.mark.concurrent
 @pytest.mark.parametrize(
     "type_name",
     ["voice", "whatsapp", "chatbot", "sms"],
     ids=["voice", "whatsapp", "chatbot", "sms"]
 )
-def test_create_assistant_all_types(page, type_name):
-
-    # Login
-    auth = AuthService()
-    
-    token = auth.login(
-        email=LOGIN_EMAIL,
-        code=LOGIN_CODE,
-        company_id=LOGIN_COMPANY_ID
-    )
-    auth.inject_token(page, token)
+async def test_create_assistant_all_types(concurrent_page, api_data, type_name):
 
     # Flow
-    flow = CreateAssistantFlow(page)
-    random_name = flow.create_assistant(BASE_URL, type_name=type_name)
+    flow = AsyncCreateAssistantFlow(concurrent_page)
+    random_name = await flow.create_assistant(BASE_URL, type_name=type_name)
+    api_data.adopt(api_data.assistants, flow.created_id)
 
     # Validate navigation
-    pattern = re.compile(r".*/assistants/[A-Za-z0-9]+$")
-    expect(page).to_have_url(pattern)
+    await expect(concurrent_page).to_have_url(AsyncAssistantsPage.DETAIL_URL)
 
     # Validate name
-    expect(page.locator("input[name='name']")).to_have_value(random_name)
+    await expect(concurrent_page.locator(AsyncAssistantsPage.DETAIL_NAME_INPUT)).to_have_value(random_name)
@@ -2,14 +2,11 @@ import time
 import allure
 from playwright.sync_api import expect
 from fixtures.page_fixtures import *
-from core.playwright.auth import AuthService
 from config.env import (
     BASE_URL,
-    LOGIN_EMAIL,
-    LOGIN_CODE,
-    LOGIN_COMPANY_ID,
     ASSISTANT_CHAT_ID,
 )
+from pages.assistant.assistants_page import AssistantsPage
 
 # ───────────────────────────────────────────────────────────────
 # Locators
@@ -71,13 +68,8 @@ def wait_for_chatbot_hydration(page):
 
 @allure.title("Chatbot: Update all chatbot fields and verify persistence (Hydration Safe)")
 def test_chatbot_general_tab_update(page):
-    # Authenticate
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
     # Open Chatbot General Tab
-    page.goto(f"{BASE_URL}/assistants/{ASSISTANT_CHAT_ID}?tab=general")
+    AssistantsPage(page).open_detail(BASE_URL, ASSISTANT_CHAT_ID, tab="general")
     page.wait_for_selector("form#myForm")
 
     # ⭐ CRITICAL: wait for hydration BEFORE filling any inputs
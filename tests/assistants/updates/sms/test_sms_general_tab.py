@@ -1,7 +1,7 @@
 import allure, time
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID, ASSISTANT_SMS_ID
+from config.env import BASE_URL, ASSISTANT_SMS_ID
+from pages.assistant.assistants_page import AssistantsPage
 
 
 def sms_dropdown(page):
@@ -11,11 +11,7 @@ def sms_dropdown(page):
 # ───────────────────────────────────────────────────────────────
 @allure.title("Save SMS number + vibe then verify persistence after reload")
 def test_sms_general_tab_update(page):
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
-    page.goto(f"{BASE_URL}/assistants/{ASSISTANT_SMS_ID}?tab=general")
+    AssistantsPage(page).open_detail(BASE_URL, ASSISTANT_SMS_ID, tab="general")
     time.sleep(0.5)
     page.wait_for_selector("form#myForm")
 
@@ -42,11 +38,7 @@ def test_sms_general_tab_update(page):
 # ───────────────────────────────────────────────────────────────
 @allure.title("Switch SMS number and verify persistence after reload")
 def test_sms_switch_number(page):
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
-    page.goto(f"{BASE_URL}/assistants/{ASSISTANT_SMS_ID}?tab=general")
+    AssistantsPage(page).open_detail(BASE_URL, ASSISTANT_SMS_ID, tab="general")
     time.sleep(0.5)
     page.wait_for_selector("form#myForm")
 
@@ -77,11 +69,7 @@ def test_sms_switch_number(page):
 # ───────────────────────────────────────────────────────────────
 @allure.title("Ensure SMS dropdown list renders all numbers from backend")
 def test_sms_dropdown_list(page):
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
-    page.goto(f"{BASE_URL}/assistants/{ASSISTANT_SMS_ID}?tab=general")
+    AssistantsPage(page).open_detail(BASE_URL, ASSISTANT_SMS_ID, tab="general")
     page.wait_for_selector("form#myForm")
 
     sms_dropdown(page).click()
@@ -1,8 +1,8 @@
 import allure
 import re
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID, ASSISTANT_VOICE_ID, ASSISTANT_NAME, ASSISTANT_TYPE_VOICE_ID, BASE_API
+from config.env import BASE_URL, ASSISTANT_VOICE_ID, ASSISTANT_NAME, ASSISTANT_TYPE_VOICE_ID, BASE_API
+from pages.assistant.assistants_page import AssistantsPage
 import time
 
 @allure.story("Assistant - Voice - General Tab")
@@ -12,18 +12,9 @@ def test_update_voice_assistant_general_tab(page):
     assistant_id = ASSISTANT_TYPE_VOICE_ID
     assistant_name = ASSISTANT_NAME
 
-    # 1. Login via API
-    auth = AuthService()
-    token = auth.login(
-        email=LOGIN_EMAIL,
-        code=LOGIN_CODE,
-        company_id=LOGIN_COMPANY_ID
-    )
-    auth.inject_token(page, token)
-
-    # 2. Navigate directly to general tab
+    # 1. Navigate directly to general tab
     with allure.step("Open assistant general tab"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=general")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="general")
         # Wait for form to load (data must be fetched first)
         page.wait_for_selector("form#myForm", timeout=15000)
         name_input = page.locator("input[name='name']")
@@ -2,17 +2,14 @@ import re
 import allure
 import time
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
 from config.env import (
     BASE_URL,
-    LOGIN_EMAIL,
-    LOGIN_CODE,
-    LOGIN_COMPANY_ID,
     ASSISTANT_TYPE_VOICE_ID,
     CALENDAR_SECONDARY_ID_1,
     CALENDAR_SECONDARY_ID_2,
     PRIMARY_CAL_ID,
 )
+from pages.assistant.assistants_page import AssistantsPage
 
 
 @allure.story("Assistant - Voice - Calendar Tab")
@@ -21,18 +18,11 @@ def test_voice_assistant_calendar_tab_full_flow(page):
 
     assistant_id = ASSISTANT_TYPE_VOICE_ID
 
-    # -----------------------------------------------------------
-    # LOGIN
-    # -----------------------------------------------------------
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
     # -----------------------------------------------------------
     # OPEN CALENDAR TAB
     # -----------------------------------------------------------
     with allure.step("Open Calendar tab"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=calendar")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="calendar")
         page.wait_for_selector("form#myForm", timeout=15000)
         time.sleep(0.6)
         calendar_tab = page.locator(
@@ -2,15 +2,12 @@ import re
 import allure
 import time
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
 from config.env import (
     BASE_URL,
-    LOGIN_EMAIL,
-    LOGIN_CODE,
-    LOGIN_COMPANY_ID,
     ASSISTANT_TYPE_VOICE_ID,
     ASSISTANT_NAME
 )
+from pages.assistant.assistants_page import AssistantsPage
 
 
 @allure.story("Assistant - Voice - Forwarder Tab")
@@ -19,18 +16,11 @@ def test_voice_assistant_forwarder_tab_full_flow(page):
 
     assistant_id = ASSISTANT_TYPE_VOICE_ID
 
-    # -----------------------------------------------------------
-    # LOGIN
-    # -----------------------------------------------------------
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
     # -----------------------------------------------------------
     # OPEN FORWARDER TAB
     # -----------------------------------------------------------
     with allure.step("Open Forwarder tab"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=forwarder")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="forwarder")
         page.wait_for_selector("form#myForm", timeout=15000)
         time.sleep(0.6)
 
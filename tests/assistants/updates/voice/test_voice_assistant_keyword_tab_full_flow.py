@@ -2,14 +2,11 @@ import re
 import allure
 import time
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
 from config.env import (
     BASE_URL,
-    LOGIN_EMAIL,
-    LOGIN_CODE,
-    LOGIN_COMPANY_ID,
     ASSISTANT_TYPE_VOICE_ID,
 )
+from pages.assistant.assistants_page import AssistantsPage
 
 
 @allure.story("Assistant - Voice - Keywords Tab")
@@ -18,18 +15,11 @@ def test_voice_assistant_keywords_tab_full_flow(page):
 
     assistant_id = ASSISTANT_TYPE_VOICE_ID
 
-    # -----------------------------------------------------------
-    # LOGIN
-    # -----------------------------------------------------------
-    auth = AuthService()
-    token = auth.login(LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID)
-    auth.inject_token(page, token)
-
     # -----------------------------------------------------------
     # OPEN KEYWORDS TAB
     # -----------------------------------------------------------
     with allure.step("Open Keywords tab"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=keywords")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="keywords")
         page.wait_for_selector("form#myForm", timeout=15000)
         time.sleep(0.6)
         keywords_tab = page.locator("div[data-state='active'][id*='content-keywords']")
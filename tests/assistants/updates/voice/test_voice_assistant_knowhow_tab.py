@@ -2,16 +2,13 @@ import time
 import allure
 import re
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
 from config.env import (
     BASE_URL,
-    LOGIN_EMAIL,
-    LOGIN_CODE,
-    LOGIN_COMPANY_ID,
     ASSISTANT_TYPE_VOICE_ID,
     ASSISTANT_NAME,
     ASSISTANT_KNOWHOW_NAME
 )
+from pages.assistant.assistants_page import AssistantsPage
 
 
 @allure.story("Assistant - Voice - KnowHow Tab")
@@ -21,22 +18,11 @@ def test_voice_assistant_knowhow_tab_full_flow(page):
     assistant_id = ASSISTANT_TYPE_VOICE_ID
     assistant_name = ASSISTANT_NAME
 
-    # -----------------------------------------------------------
-    # LOGIN
-    # -----------------------------------------------------------
-    auth = AuthService()
-    token = auth.login(
-        email=LOGIN_EMAIL,
-        code=LOGIN_CODE,
-        company_id=LOGIN_COMPANY_ID
-    )
-    auth.inject_token(page, token)
-
     # -----------------------------------------------------------
     # OPEN KNOW-HOW TAB
     # -----------------------------------------------------------
     with allure.step("Open Know-How tab"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=know")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="know")
         page.wait_for_selector("form#myForm", timeout=20000)
         time.sleep(0.6)
 
@@ -1,8 +1,8 @@
 import allure
 import time
 from playwright.sync_api import expect
-from core.playwright.auth import AuthService
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID, ASSISTANT_WHATSAPP_ID   # <--- new ID
+from config.env import BASE_URL, ASSISTANT_WHATSAPP_ID   # <--- new ID
+from pages.assistant.assistants_page import AssistantsPage
 
 @allure.story("Assistant - WhatsApp - General Tab")
 @allure.title("Update WhatsApp Channel & Vibe and Validate Persistence")
@@ -10,18 +10,9 @@ def test_update_whatsapp_general_tab(page):
 
     assistant_id = ASSISTANT_WHATSAPP_ID
 
-    # ----------------- LOGIN SETUP (same as voice test) -----------------
-    auth = AuthService()
-    token = auth.login(
-        email=LOGIN_EMAIL,
-        code=LOGIN_CODE,
-        company_id=LOGIN_COMPANY_ID
-    )
-    auth.inject_token(page, token)
-
     # ----------------- PAGE OPEN -----------------
     with allure.step("Navigate to General tab for WhatsApp assistant"):
-        page.goto(f"{BASE_URL}/assistants/{assistant_id}?tab=general")
+        AssistantsPage(page).open_detail(BASE_URL, assistant_id, tab="general")
         page.wait_for_selector("form#myForm", timeout=15000)
         time.sleep(0.6)
 
@@ -0,0 +1,36 @@
+"""
+Contact edits from several users at once, driven through the async page objects
+"""
+import asyncio
+import time
+
+import allure
+
+from config.env import BASE_URL
+from flows.aio.contact_form_flow import AsyncContactFormFlow
+
+
+@allure.feature("Contacts Management")
+@allure.story("Concurrent Editing")
+class TestContactsConcurrent:
+
+    @allure.title("Test contacts edited concurrently in separate sessions are all saved")
+    @allure.severity(allure.severity_level.NORMAL)
+    async def test_concurrent_contact_edits(self, async_pages, make_contact, api_data):
+        """Five sessions each edit their own contact at the same time"""
+        contacts = [make_contact() for _ in range(5)]
+        pages = await async_pages(len(contacts))
+        stamp = int(time.time())
+
+        async def edit(page, contact, index):
+            flow = AsyncContactFormFlow(page)
+            await flow.navigate_to_edit_contact(BASE_URL, contact.id)
+            await flow.edit_contact(email=f"concurrent.{stamp}.{index}@example.com")
+
+        with allure.step(f"Edit {len(contacts)} contacts concurrently"):
+            await asyncio.gather(*(edit(page, contact, i) for i, (page, contact) in enumerate(zip(pages, contacts))))
+
+        with allure.step("Verify every edit was stored"):
+            for i, contact in enumerate(contacts):
+                stored = api_data.contacts.get(contact.id)
+                assert stored.email == f"concurrent.{stamp}.{i}@example.com", f"Edit of {contact.full_name} was lost"
@@ -10,8 +10,7 @@ from flows.knowledgebase.knowledgebase_form_flow import KnowledgeBaseFormFlow
 from flows.knowledgebase.knowledgebase_list_flow import KnowledgeBaseListFlow
 from pages.knowledgebase.knowledgebase_form_page import KnowledgeBaseFormPage
 from fixtures.knowledgebase_fixtures import *
-from core.playwright.auth import AuthService
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID
+from config.env import BASE_URL
 
 
 @allure.feature("Knowledge Base")
@@ -24,16 +23,6 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.CRITICAL)
     def test_create_article_page_renders(self, page: Page):
         """Test that the create article page renders correctly"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_form_page = KnowledgeBaseFormPage(page)
         knowledgebase_form_page.navigate_to_create(type="article")
         knowledgebase_form_page.wait_for_page_load()
@@ -50,16 +39,6 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.NORMAL)
     def test_article_validation_errors(self, page: Page):
         """Test that validation errors are shown for empty required fields"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_form_flow = KnowledgeBaseFormFlow(page)
         knowledgebase_form_flow.form_page.navigate_to_create(type="article")
         knowledgebase_form_flow.form_page.wait_for_page_load()
@@ -76,16 +55,6 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.NORMAL)
     def test_add_section(self, page: Page):
         """Test adding a new section to an article"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_form_page = KnowledgeBaseFormPage(page)
         knowledgebase_form_page.navigate_to_create(type="article")
         knowledgebase_form_page.wait_for_page_load()
@@ -95,7 +64,6 @@ class TestKnowledgeBaseForm:
         
         # Add a new section
         knowledgebase_form_page.click_add_section_button()
-        knowledgebase_form_page.page.wait_for_timeout(500)
         
         # Verify section count increased
         new_count = knowledgebase_form_page.get_section_count()
@@ -108,23 +76,12 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.NORMAL)
     def test_remove_section(self, page: Page):
         """Test removing a section from an article"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_form_page = KnowledgeBaseFormPage(page)
         knowledgebase_form_page.navigate_to_create(type="article")
         knowledgebase_form_page.wait_for_page_load()
         
         # Add a section first
         knowledgebase_form_page.click_add_section_button()
-        knowledgebase_form_page.page.wait_for_timeout(500)
         
         # Get section count
         count_before = knowledgebase_form_page.get_section_count()
@@ -132,7 +89,6 @@ class TestKnowledgeBaseForm:
         # Remove a section (if more than 1)
         if count_before > 1:
             knowledgebase_form_page.click_remove_section_button(1)
-            knowledgebase_form_page.page.wait_for_timeout(500)
             
             # Verify section count decreased
             count_after = knowledgebase_form_page.get_section_count()
@@ -145,16 +101,6 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.MINOR)
     def test_back_button_navigation(self, page: Page):
         """Test that back button navigates to the list page"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         # First navigate to list page to establish browser history
         knowledgebase_list_page = KnowledgeBaseListPage(page)
         knowledgebase_list_page.navigate()
@@ -167,7 +113,6 @@ class TestKnowledgeBaseForm:
         
         # Click back button
         knowledgebase_form_page.click_back_button()
-        knowledgebase_form_page.page.wait_for_timeout(1000)
         
         # Verify navigation to list page
         knowledgebase_form_page.verify_on_list_page()
@@ -178,16 +123,6 @@ class TestKnowledgeBaseForm:
     @allure.severity(allure.severity_level.CRITICAL)
     def test_create_and_delete_article_flow(self, page: Page):
         """Test complete flow: create an article, verify it exists, then delete it"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_form_flow = KnowledgeBaseFormFlow(page)
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         
@@ -218,7 +153,6 @@ class TestKnowledgeBaseForm:
         
         # Step 3: Open the article for editing
         knowledgebase_list_flow.open_entry_by_title(article_title)
-        knowledgebase_form_flow.page.wait_for_timeout(2000)
         
         # Verify we're on edit page
         knowledgebase_form_flow.form_page.verify_on_edit_page()
@@ -227,8 +161,8 @@ class TestKnowledgeBaseForm:
         knowledgebase_form_flow.form_page.click_delete_button()
         knowledgebase_form_flow.form_page.confirm_delete()
         
-        # Wait for deletion and navigation
-        knowledgebase_form_flow.page.wait_for_timeout(2000)
+        # Wait for navigation after the deletion
+        knowledgebase_form_flow.form_page.wait_for_dom_stable()
         
         # Step 5: Verify article is removed from list
         knowledgebase_list_flow.navigate_and_wait()
@@ -9,8 +9,7 @@ from playwright.sync_api import Page
 from flows.knowledgebase.knowledgebase_list_flow import KnowledgeBaseListFlow
 from pages.knowledgebase.knowledgebase_list_page import KnowledgeBaseListPage
 from fixtures.knowledgebase_fixtures import *
-from core.playwright.auth import AuthService
-from config.env import BASE_URL, LOGIN_EMAIL, LOGIN_CODE, LOGIN_COMPANY_ID
+from config.env import BASE_URL
 
 
 @allure.feature("Knowledge Base")
@@ -23,16 +22,6 @@ class TestKnowledgeBaseList:
     @allure.severity(allure.severity_level.CRITICAL)
     def test_knowledgebase_list_renders(self, page: Page):
         """Test that the knowledge base list page renders correctly"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         knowledgebase_list_flow.navigate_and_wait()
         
@@ -46,16 +35,6 @@ class TestKnowledgeBaseList:
     @allure.severity(allure.severity_level.NORMAL)
     def test_knowledgebase_empty_state(self, page: Page):
         """Test that empty state is shown when no knowledge base entries exist"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         knowledgebase_list_flow.navigate_and_wait()
         
@@ -73,16 +52,6 @@ class TestKnowledgeBaseList:
     @allure.severity(allure.severity_level.MINOR)
     def test_knowledgebase_loading_state(self, page: Page):
         """Test that loading state is shown while fetching entries"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_list_page = KnowledgeBaseListPage(page)
         knowledgebase_list_page.navigate()
         
@@ -100,22 +69,12 @@ class TestKnowledgeBaseList:
     @allure.severity(allure.severity_level.NORMAL)
     def test_knowledgebase_create_dropdown(self, page: Page):
         """Test that create dropdown shows all entry type options"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         knowledgebase_list_flow.navigate_and_wait()
         
         # Click create button to open dropdown
         knowledgebase_list_flow.list_page.click_create_button()
-        knowledgebase_list_flow.page.wait_for_timeout(1000)
+        knowledgebase_list_flow.list_page.wait_for_dom_stable()
         
         # Verify clicking create button works (no error)
         # The dropdown structure might vary, so just verify the button is functional
@@ -127,16 +86,6 @@ class TestKnowledgeBaseList:
     @allure.severity(allure.severity_level.CRITICAL)
     def test_navigate_to_create_article(self, page: Page, knowledgebase_form_page):
         """Test navigation to create article page"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
-        
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         knowledgebase_list_flow.navigate_and_wait()
         
@@ -150,31 +99,25 @@ class TestKnowledgeBaseList:
     @allure.story("List Page")
     @allure.title("Test entry type display")
     @allure.severity(allure.severity_level.NORMAL)
-    def test_knowledgebase_entry_types(self, page: Page):
+    def test_knowledgebase_entry_types(self, page: Page, make_kb_article, make_kb_url):
         """Test that entry types are displayed correctly"""
-        # Login via API
-        with allure.step("Login via API"):
-            auth = AuthService()
-            token = auth.login(
-                email=LOGIN_EMAIL,
-                code=LOGIN_CODE,
-                company_id=LOGIN_COMPANY_ID
-            )
-            auth.inject_token(page, token)
+        # One entry of each kind, created through the API
+        make_kb_article()
+        make_kb_url()
         
         knowledgebase_list_flow = KnowledgeBaseListFlow(page)
         knowledgebase_list_flow.navigate_and_wait()
         
         row_count = knowledgebase_list_flow.list_page.get_row_count()
+        assert row_count > 0, "The entries created for this test should be listed"
+        
+        # Get entry types
+        types = knowledgebase_list_flow.list_page.get_entry_types()
         
-        if row_count > 0:
-            # Get entry types
-            types = knowledgebase_list_flow.list_page.get_entry_types()
-            
-            # Verify types are valid
-            valid_types = ["Text", "PDF", "Document", "Web Content", "Web Crawl"]
-            for entry_type in types:
-                assert any(valid_type in entry_type for valid_type in valid_types), \
-                    f"Entry type '{entry_type}' should be one of {valid_types}"
+        # Verify types are valid
+        valid_types = ["Text", "PDF", "Document", "Web Content", "Web Crawl"]
+        for entry_type in types:
+            assert any(valid_type in entry_type for valid_type in valid_types), \
+                f"Entry type '{entry_type}' should be one of {valid_types}"
 
 
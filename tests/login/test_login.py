@@ -6,6 +6,9 @@ import pytest
 import allure
 from fixtures.test_data import TEST_USERS, OTP_CODES
 
+# The login UI must be exercised from a logged-out browser
+pytestmark = pytest.mark.unauthenticated
+
 
 @allure.feature("Authentication")
 @allure.story("Login Flow")
@@ -0,0 +1,59 @@
+"""
+Tests for the local mock API's store and tokens (no server, no browser)
+"""
+import time
+
+import allure
+
+from config.env import ASSISTANT_VOICE_ID
+from core.mock_api.app import issue_token, verify_token
+from core.mock_api.store import RESOURCES, MockStore
+from core.playwright.token_cache import decode_jwt_exp
+
+
+@allure.feature("Mock API")
+class TestMockApi:
+
+    @allure.title("Store is seeded for every resource")
+    def test_seed(self):
+        store = MockStore()
+
+        assert all(store.counts()[resource] > 0 for resource in RESOURCES)
+        if ASSISTANT_VOICE_ID:
+            assert store.get("assistants", ASSISTANT_VOICE_ID)["ID"] == ASSISTANT_VOICE_ID
+
+    @allure.title("Create, merge update, delete and reset")
+    def test_crud(self):
+        store = MockStore()
+        seeded = store.counts()["contacts"]
+
+        created = store.create("contacts", {"FirstName": "Max", "LastName": "Muster"})
+        updated = store.update("contacts", created["ID"], {"LastName": "Meier"})
+
+        assert updated["FirstName"] == "Max" and updated["LastName"] == "Meier"
+        assert store.update("contacts", "missing", {}) is None
+        assert store.delete("contacts", created["ID"])
+        assert not store.delete("contacts", created["ID"])
+
+        store.create("contacts", {"FirstName": "Temp"})
+        store.reset()
+        assert store.counts()["contacts"] == seeded
+
+    @allure.title("Returned records are copies")
+    def test_records_are_copies(self):
+        store = MockStore()
+        record = store.list("assistants")[0]
+
+        record["Keywords"].append({"Keyword": "changed"})
+
+        assert store.get("assistants", record["ID"])["Keywords"] == []
+
+    @allure.title("Tokens carry exp and are rejected once expired or tampered with")
+    def test_tokens(self):
+        token = issue_token("qa@example.com", "company", ttl=60)
+
+        assert verify_token(token)
+        assert abs(decode_jwt_exp(token) - (time.time() + 60)) < 5
+        assert not verify_token(issue_token("qa@example.com", "company", ttl=-1))
+        assert not verify_token(token[:-2] + "xx")
+        assert not verify_token("not-a-jwt")
@@ -0,0 +1,147 @@
+"""
+Tests for HAR record-and-replay, using fake Playwright routes and contexts
+"""
+import json
+from pathlib import Path
+
+import allure
+import pytest
+
+from core.playwright import har
+from core.playwright.har import HarSession, api_url_pattern, har_path_for
+
+
+class FakeNode:
+
+    def __init__(self, nodeid="tests/assistants/test_x.py::TestX::test_save[voice]", marks=()):
+        self.nodeid = nodeid
+        self.name = nodeid.split("::")[-1]
+        self.marks = [mark.mark for mark in marks]
+
+    def iter_markers(self, name):
+        return (mark for mark in self.marks if mark.name == name)
+
+
+class FakeRequest:
+
+    def __init__(self, method, url, payload=None):
+        self.method = method
+        self.url = url
+        self.post_data_json = payload
+
+
+class FakeRoute:
+
+    def __init__(self, method, url, payload=None):
+        self.request = FakeRequest(method, url, payload)
+        self.outcome = None
+        self.fulfilled = None
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+    def continue_(self):
+        self.outcome = "continue"
+
+    def fulfill(self, status, content_type, body):
+        self.outcome = "fulfill"
+        self.fulfilled = (status, json.loads(body))
+
+
+class FakeContext:
+
+    def __init__(self):
+        self.calls = []
+
+    def route_from_har(self, path, **options):
+        self.calls.append(("route_from_har", Path(path), options))
+
+    def route(self, url, handler):
+        self.calls.append(("route", url, handler))
+
+
+def replaying(tmp_path, node=None, mutations="passthrough"):
+    """A replay session with an existing (empty) recording"""
+    session = HarSession(node or FakeNode(), mode="replay", mutations=mutations, har_dir=str(tmp_path))
+    session.path.parent.mkdir(parents=True)
+    session.path.write_text("{}")
+    session.install(FakeContext())
+    return session
+
+
+@allure.feature("HAR Replay")
+class TestHar:
+
+    @allure.title("API traffic is matched by HAR_URL_PATTERN, else by everything under BASE_API")
+    def test_url_pattern(self, monkeypatch):
+        monkeypatch.setattr(har, "HAR_URL_PATTERN", "")
+        monkeypatch.setattr(har, "BASE_API", "https://api.example.com/v1/")
+        assert api_url_pattern() == "https://api.example.com/v1/**"
+
+        monkeypatch.setattr(har, "HAR_URL_PATTERN", "**/graphql")
+        assert api_url_pattern() == "**/graphql"
+
+        monkeypatch.setattr(har, "HAR_URL_PATTERN", "")
+        monkeypatch.setattr(har, "BASE_API", "")
+        assert api_url_pattern() == "**/api/**"
+
+    @allure.title("Each test, parameters included, gets its own HAR file under its module")
+    def test_har_path(self):
+        path = har_path_for(FakeNode(), har_dir="har")
+
+        assert path == Path("har/tests/assistants/test_x/test_save_voice_.har")
+
+    @allure.title("Replay without a recording falls back to the live API")
+    def test_replay_without_recording(self, tmp_path):
+        context = FakeContext()
+        session = HarSession(FakeNode(), mode="replay", har_dir=str(tmp_path))
+
+        session.install(context)
+
+        assert context.calls == [] and session.mode == "off" and session.summary() is None
+
+    @allure.title("Replay answers from the recording and lets GETs missing from it through")
+    def test_replay_misses_fall_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(har, "HAR_URL_PATTERN", "**/api/**")
+        context = FakeContext()
+        session = HarSession(FakeNode(), mode="replay", har_dir=str(tmp_path))
+        session.path.parent.mkdir(parents=True)
+        session.path.write_text("{}")
+
+        session.install(context)
+
+        (_, path, options), (_, url, handler) = context.calls
+        assert path == session.path and options == {"url": "**/api/**", "not_found": "fallback"}
+        route = FakeRoute("GET", "https://app.example.com/api/assistants/1")
+        handler(route)
+        assert url == "**/api/**" and route.outcome == "fallback"
+
+    @allure.title("HAR_MUTATIONS decides whether mutating calls are stubbed or sent to the live API")
+    def test_mutation_modes(self, tmp_path):
+        stub = replaying(tmp_path / "stub", mutations="stub")
+        passthrough = replaying(tmp_path / "passthrough")
+
+        stubbed = FakeRoute("PUT", "https://app.example.com/api/assistants/1", {"Name": "Renamed"})
+        stub._handle_mutation(stubbed)
+        live = FakeRoute("DELETE", "https://app.example.com/api/assistants/1")
+        passthrough._handle_mutation(live)
+
+        assert stubbed.fulfilled == (200, {"Name": "Renamed"}) and stub.stubbed == 1
+        assert live.outcome == "continue" and passthrough.stubbed == 0
+
+    @allure.title("A har_mutations mark overrides HAR_MUTATIONS for a test, or only for matching URLs")
+    def test_mutation_overrides(self, tmp_path):
+        node = FakeNode(marks=[
+            pytest.mark.har_mutations("passthrough", "**/assistants/*/publish"),
+            pytest.mark.har_mutations("stub"),
+        ])
+        session = replaying(tmp_path, node, mutations="passthrough")
+
+        assert session.mutation_mode("https://app.example.com/api/assistants/1/publish") == "passthrough"
+        assert session.mutation_mode("https://app.example.com/api/assistants/1") == "stub"
+        assert replaying(tmp_path / "plain").mutation_mode("https://app.example.com/api/assistants/1") == "passthrough"
+
+    @allure.title("A har_mutations mark without a valid mode is rejected")
+    def test_invalid_override(self, tmp_path):
+        with pytest.raises(ValueError, match="har_mutations"):
+            HarSession(FakeNode(marks=[pytest.mark.har_mutations("**/publish")]), mode="replay", har_dir=str(tmp_path))
@@ -0,0 +1,109 @@
+"""
+Tests for the backend latency recorder, using fake Playwright events and a temporary ledger
+"""
+import allure
+
+from core.playwright.network_latency import (
+    NetworkRecorder,
+    latency_regressions,
+    latency_report,
+    parse_server_timing,
+    timing_phases,
+    url_template,
+)
+from core.utils.timing_ledger import TimingLedger
+
+TIMING = {
+    "startTime": 1000.0, "domainLookupStart": -1, "domainLookupEnd": -1, "connectStart": -1,
+    "secureConnectionStart": -1, "connectEnd": -1, "requestStart": 2.5, "responseStart": 182.5,
+    "responseEnd": 190.0,
+}
+
+
+class FakeRequest:
+    def __init__(self, method, url, resource_type="fetch", timing=TIMING):
+        self.method = method
+        self.url = url
+        self.resource_type = resource_type
+        self.timing = timing
+
+
+class FakeResponse:
+    def __init__(self, request, status=200, headers=None):
+        self.request = request
+        self.status = status
+        self.headers = headers or {}
+
+
+def ledger_with(tmp_path, runs):
+    """Ledger holding `runs`: {run_id: {endpoint: [ms, ...]}}"""
+    path = str(tmp_path / "ledger.jsonl")
+    for run_id, endpoints in runs.items():
+        ledger = TimingLedger(path=path, run_id=run_id, enabled=True)
+        for endpoint, values in endpoints.items():
+            for ms in values:
+                ledger.record("request", endpoint, ms, phases={"wait": ms - 10, "total": ms})
+        ledger.flush()
+    return TimingLedger(path=path, enabled=True)
+
+
+@allure.feature("Network Latency")
+class TestNetworkLatency:
+
+    @allure.title("URLs collapse to endpoint templates")
+    def test_url_template(self):
+        assert url_template("https://api.example.com/assistants/65f0c1e2a3b4c5d6e7f80912?tab=1") == "/assistants/{id}"
+        assert url_template("https://api.example.com/users/42/roles/") == "/users/{id}/roles"
+        assert url_template(
+            "https://api.example.com/contacts/0b4e7c2a-1f5d-4c8e-9a3b-2d6f8e1c7a90"
+        ) == "/contacts/{id}"
+        assert url_template("https://api.example.com/knowledgebase") == "/knowledgebase"
+
+    @allure.title("Server-Timing and request timing phases are parsed")
+    def test_parsing(self):
+        assert parse_server_timing('db;dur=53, app;desc="App";dur=47.2, miss') == {"db": 53.0, "app": 47.2}
+        assert parse_server_timing(None) == {}
+        assert timing_phases(TIMING) == {"wait": 180.0, "download": 7.5, "total": 190.0}
+
+    @allure.title("Recorder logs API requests only, with status and phases")
+    def test_recorder(self, tmp_path):
+        ledger = TimingLedger(path=str(tmp_path / "ledger.jsonl"), run_id="run", enabled=True)
+        recorder = NetworkRecorder(ledger)
+        api = FakeRequest("PUT", "https://api.example.com/assistants/65f0c1e2a3b4c5d6e7f80912")
+        image = FakeRequest("GET", "https://app.example.com/logo.png", resource_type="image")
+        routed = FakeRequest("GET", "https://api.example.com/users", timing={"responseEnd": -1})
+
+        for request in (api, image, routed):
+            recorder._on_response(FakeResponse(request, headers={"server-timing": "db;dur=120"}))
+            recorder._on_finished(request)
+
+        assert recorder.recorded == 1
+        entry = ledger._pending[0]
+        assert (entry["kind"], entry["name"], entry["status"]) == ("request", "PUT /assistants/{id}", 200)
+        assert entry["ms"] == 190.0
+        assert entry["server_timing"] == {"db": 120.0}
+
+    @allure.title("Report gives percentiles per endpoint for the last run")
+    def test_report(self, tmp_path):
+        ledger = ledger_with(tmp_path, {
+            "old": {"GET /contacts": [5000]},
+            "new": {"GET /contacts": list(range(1, 101)), "PUT /assistants/{id}": [300, 400]},
+        })
+
+        rows = latency_report(ledger)
+
+        assert [row["endpoint"] for row in rows] == ["PUT /assistants/{id}", "GET /contacts"]
+        contacts = rows[1]
+        assert (contacts["count"], contacts["p50_ms"], contacts["p95_ms"], contacts["p99_ms"]) == (100, 50, 95, 99)
+        assert contacts["wait_p50_ms"] == 40
+
+    @allure.title("Endpoints whose p95 grew past the threshold are flagged")
+    def test_regressions(self, tmp_path):
+        ledger = ledger_with(tmp_path, {
+            "old": {"GET /contacts": [100] * 10, "GET /users": [100] * 10, "GET /rare": [100] * 10},
+            "new": {"GET /contacts": [200] * 10, "GET /users": [110] * 10, "GET /rare": [900]},
+        })
+
+        regressions = latency_regressions(ledger, threshold=0.25, min_samples=5)
+
+        assert regressions == [{"endpoint": "GET /contacts", "p95_ms": 200, "baseline_p95_ms": 100, "change": 1.0}]
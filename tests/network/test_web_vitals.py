@@ -0,0 +1,63 @@
+"""
+Tests for Web Vitals budgets and the metrics file, using a fake page
+"""
+import allure
+import pytest
+from playwright.sync_api import Error
+
+from core.playwright.web_vitals import WebVitals, budget_for, check_budget
+
+BUDGETS = {
+    "default": {"lcp_ms": {"warn": 2500, "fail": 4000}, "cls": {"warn": 0.1, "fail": 0.25}},
+    "KnowledgeBaseListPage": {"lcp_ms": {"warn": 3000}},
+}
+
+
+class FakePage:
+    """Answers the Web Vitals script; CDP is unavailable (like a non-Chromium browser)"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.context = self
+
+    def evaluate(self, script):
+        return dict(self.metrics)
+
+    def new_cdp_session(self, page):
+        raise Error("CDP session is only available in Chromium")
+
+
+@allure.feature("Web Vitals")
+class TestWebVitals:
+
+    @allure.title("Page budgets override the default metric by metric")
+    def test_budgets(self):
+        budget = budget_for(BUDGETS, "KnowledgeBaseListPage")
+
+        assert budget["lcp_ms"] == {"warn": 3000}
+        assert budget["cls"] == {"warn": 0.1, "fail": 0.25}
+        assert check_budget({"lcp_ms": 3500, "cls": 0.3}, budget) == [
+            {"metric": "lcp_ms", "value": 3500, "limit": 3000, "level": "warn"},
+            {"metric": "cls", "value": 0.3, "limit": 0.25, "level": "fail"},
+        ]
+
+    @allure.title("Collect mode records and only warns on a fail budget")
+    def test_collect(self, tmp_path):
+        vitals = WebVitals(path=str(tmp_path / "vitals.jsonl"), mode="collect", budgets=BUDGETS)
+
+        page = FakePage({"lcp_ms": 4500.04, "cls": 0.01234, "load_ms": None})
+        metrics = vitals.measure(page, "ContactsListPage", "https://app/contacts", 812.26)
+
+        assert metrics == {"lcp_ms": 4500.0, "cls": 0.012, "ready_ms": 812.3}
+        assert vitals.flush() == 1
+        report = vitals.report()
+        assert report["ContactsListPage"]["lcp_ms"] == 4500.0
+        assert report["ContactsListPage"]["count"] == 1
+
+    @allure.title("Enforce mode fails on a fail budget")
+    def test_enforce(self, tmp_path):
+        vitals = WebVitals(path=str(tmp_path / "vitals.jsonl"), mode="enforce", budgets=BUDGETS)
+
+        with pytest.raises(AssertionError, match="lcp_ms 4500"):
+            vitals.measure(FakePage({"lcp_ms": 4500}), "ContactsListPage", "https://app/contacts", 900)
+        vitals.measure(FakePage({"lcp_ms": 2600}), "ContactsListPage", "https://app/contacts", 900)
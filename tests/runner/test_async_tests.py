@@ -0,0 +1,82 @@
+"""
+Tests for async tests on their own loop thread, run in a pytest subprocess
+"""
+import json
+from pathlib import Path
+
+import allure
+
+pytest_plugins = ["pytester"]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CONFTEST = f"""
+import sys
+sys.path.insert(0, {str(REPO_ROOT)!r})
+import pytest
+from playwright.sync_api import sync_playwright
+from core.runner.async_tests import get_async_loop, install_async_tests
+
+def pytest_configure(config):
+    install_async_tests(config)
+
+@pytest.fixture(scope="session")
+def sync_driver():
+    p = sync_playwright().start()
+    yield p
+    p.stop()
+
+@pytest.fixture(scope="session")
+def async_loop():
+    return get_async_loop()
+"""
+
+TESTS = """
+import asyncio
+import allure
+from playwright.async_api import async_playwright
+from core.utils.async_step import async_step
+
+def test_sync_first(sync_driver):
+    sync_driver.selectors.set_test_id_attribute("data-qa")
+
+async def test_async_after_sync(sync_driver):
+    p = await async_playwright().start()
+    p.selectors.set_test_id_attribute("data-qa")
+    await p.stop()
+
+def test_fixture_drives_loop(sync_driver, async_loop):
+    assert async_loop.run(asyncio.sleep(0, result=42)) == 42
+
+@async_step("Edit {name}")
+async def edit(name):
+    await asyncio.sleep(0.05)
+    with allure.step(f"Save {name}"):
+        await asyncio.sleep(0.05)
+
+async def test_gathered_steps():
+    await asyncio.gather(edit("a"), edit("b"))
+"""
+
+
+@allure.feature("Async Tests")
+class TestAsyncTests:
+
+    @allure.title("Async tests run in a session that already started sync Playwright, with steps per task")
+    def test_async_after_sync_playwright(self, pytester):
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(test_mixed=TESTS)
+        allure_dir = pytester.path / "allure"
+
+        result = pytester.runpytest_subprocess(f"--alluredir={allure_dir}", "-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=4)
+        results = {}
+        for path in allure_dir.glob("*-result.json"):
+            data = json.loads(path.read_text())
+            results[data["name"]] = data
+        steps = results["test_gathered_steps"]["steps"]
+        assert sorted(step["name"] for step in steps) == ["Edit a", "Edit b"]
+        for step in steps:
+            name = step["name"][-1]
+            assert [inner["name"] for inner in step["steps"]] == [f"Save {name}"]
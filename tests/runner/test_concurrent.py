@@ -0,0 +1,74 @@
+"""
+Tests for concurrent parametrizations, run in a pytest subprocess without a browser
+"""
+import json
+from pathlib import Path
+
+import allure
+
+pytest_plugins = ["pytester"]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CONFTEST = f"""
+import sys
+sys.path.insert(0, {str(REPO_ROOT)!r})
+from core.runner.concurrent import install_concurrent
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "concurrent: run the parametrizations at the same time")
+    install_concurrent(config)
+"""
+
+TESTS = """
+import asyncio
+import allure
+import pytest
+
+running = []
+peak = []
+
+@pytest.mark.concurrent
+@pytest.mark.parametrize("name", ["a", "b", "c"])
+async def test_case(api_client, name):
+    running.append(name)
+    peak.append(len(running))
+    with allure.step(f"Case {name}"):
+        await asyncio.sleep(0.2)
+        allure.attach(name, name="attached", attachment_type=allure.attachment_type.TEXT)
+    running.remove(name)
+    assert name != "c", f"case {name} failed"
+
+@pytest.fixture
+def api_client():
+    return object()
+
+def test_overlap():
+    assert max(peak) == 3
+"""
+
+
+@allure.feature("Concurrent Parametrizations")
+class TestConcurrentParametrizations:
+
+    @allure.title("Cases of a concurrent test overlap and keep their own outcome and Allure steps")
+    def test_cases_run_together(self, pytester):
+        pytester.makeconftest(CONFTEST)
+        pytester.makepyfile(test_matrix=TESTS)
+        allure_dir = pytester.path / "allure"
+
+        result = pytester.runpytest_subprocess(f"--alluredir={allure_dir}", "-p", "no:cacheprovider")
+
+        result.assert_outcomes(passed=3, failed=1)
+        result.stdout.fnmatch_lines(["*case c failed*"])
+        results = {}
+        for path in allure_dir.glob("*-result.json"):
+            data = json.loads(path.read_text())
+            results[data["name"]] = data
+        for name in "abc":
+            case = results[f"test_case[{name}]"]
+            assert [step["name"] for step in case["steps"]] == [f"Case {name}"]
+            attachment = case["steps"][0]["attachments"][0]
+            assert (allure_dir / attachment["source"]).read_text() == name
+        assert results["test_case[c]"]["status"] == "failed"
+        assert results["test_case[a]"]["status"] == "passed"
@@ -0,0 +1,65 @@
+"""
+Tests for the test runner API job queue, using an in-process fake runner
+"""
+import threading
+import time
+
+import allure
+
+from core.runner.jobs import FAILED, PASSED, QUEUED, JobManager
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@allure.feature("Runner Jobs")
+class TestJobManager:
+
+    @allure.title("Exit code decides passed / failed")
+    def test_job_states(self, tmp_path):
+        manager = JobManager(results_root=str(tmp_path), max_concurrent=2, runner=lambda job: int("fail" in job.test_path))
+
+        ok = manager.submit("tests/ok.py")
+        bad = manager.submit("tests/fail.py")
+
+        assert wait_for(lambda: ok.state == PASSED and bad.state == FAILED)
+        assert bad.exit_code == 1
+        assert (tmp_path / ok.id).is_dir()
+
+    @allure.title("No more than max_concurrent jobs run at once")
+    def test_concurrency_limit(self, tmp_path):
+        release = threading.Event()
+        running = []
+        peak = []
+
+        def runner(job):
+            running.append(job.id)
+            peak.append(len(running))
+            release.wait(5)
+            running.remove(job.id)
+            return 0
+
+        manager = JobManager(results_root=str(tmp_path), max_concurrent=2, runner=runner)
+        submitted = [manager.submit(f"tests/t{i}.py") for i in range(4)]
+
+        assert wait_for(lambda: len(running) == 2)
+        assert manager.counts()[QUEUED] == 2
+        release.set()
+        assert wait_for(lambda: all(job.state == PASSED for job in submitted))
+        assert max(peak) == 2
+
+    @allure.title("Runner errors mark the job failed")
+    def test_runner_error(self, tmp_path):
+        def runner(job):
+            raise RuntimeError("pytest not found")
+
+        job = JobManager(results_root=str(tmp_path), max_concurrent=1, runner=runner).submit("tests/x.py")
+
+        assert wait_for(lambda: job.state == FAILED)
+        assert job.error == "pytest not found"
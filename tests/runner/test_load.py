@@ -0,0 +1,55 @@
+"""
+Tests for the load mode's scenario mix and statistics, without a browser
+"""
+import threading
+
+import allure
+import pytest
+
+from core.runner.load import LoadStats, parse_mix, start_delays
+
+
+@allure.feature("Load Mode")
+class TestLoadMode:
+
+    @allure.title("The mix is parsed into weights and rejects unknown scenarios")
+    def test_parse_mix(self):
+        assert parse_mix("browse=4, login=1,edit_contact") == {"browse": 4.0, "login": 1.0, "edit_contact": 1.0}
+        with pytest.raises(ValueError, match="Unknown scenario 'checkout'"):
+            parse_mix("browse=1,checkout=2")
+        with pytest.raises(ValueError):
+            parse_mix("browse=0")
+
+    @allure.title("Users start evenly spread over the ramp-up")
+    def test_start_delays(self):
+        assert start_delays(4, 60) == [0, 15, 30, 45]
+        assert start_delays(3, 0) == [0, 0, 0]
+
+    @allure.title("Steps from concurrent users are grouped by title and reported with percentiles")
+    def test_stats_report(self):
+        stats = LoadStats()
+
+        def user(index):
+            for i in range(50):
+                step = f"{index}-{i}"
+                stats.start_step(uuid=step, title=f"Navigate to edit contact page: {step}", params={})
+                stats.stop_step(uuid=step, exc_type=None, exc_val=None, exc_tb=None)
+                stats.record("edit_contact", 100 + i)
+            stats.record("login", 0, error="TimeoutError: OTP field not visible")
+
+        threads = [threading.Thread(target=user, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        report = stats.report()
+        assert (report["iterations"], report["errors"]) == (200, 4)
+        assert report["scenarios"]["edit_contact"] == {
+            "count": 200, "p50_ms": 124, "p95_ms": 147, "p99_ms": 149, "errors": 0,
+        }
+        assert report["failed_scenarios"] == {
+            "login": {"errors": 4, "last_error": "TimeoutError: OTP field not visible"},
+        }
+        assert list(report["steps"]) == ["Navigate to edit contact page"]
+        assert report["steps"]["Navigate to edit contact page"]["count"] == 200
@@ -0,0 +1,38 @@
+"""
+Tests for the parallel executor's test collection, against this repo's pytest.ini
+"""
+from pathlib import Path
+
+import allure
+
+from core.runner.parallel import collect_node_ids
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@allure.feature("Parallel Runner")
+class TestCollectNodeIds:
+
+    @allure.title("Collection returns node ids despite the -q in pytest.ini's addopts")
+    def test_collects_node_ids(self, monkeypatch):
+        monkeypatch.chdir(REPO_ROOT)
+
+        node_ids = collect_node_ids(["tests/runner/test_load.py"])
+
+        assert "tests/runner/test_load.py::TestLoadMode::test_parse_mix" in node_ids
+        assert len(node_ids) == 3
+
+    @allure.title("The runner API's shard plan lists every collected test")
+    def test_shard_plan_endpoint(self, monkeypatch):
+        from scripts.test_runner_api import shard_plan
+
+        monkeypatch.chdir(REPO_ROOT)
+
+        plan = shard_plan("test-create-assistant-all-types", total=2)
+
+        tests = [test for shard in plan["shards"] for test in shard["tests"]]
+        assert sorted(tests) == [
+            f"tests/assistants/test_create_assistant_all_types.py::test_create_assistant_all_types[{type_name}]"
+            for type_name in ("chatbot", "sms", "voice", "whatsapp")
+        ]
+        assert all(shard["tests"] for shard in plan["shards"])
@@ -0,0 +1,41 @@
+"""
+Tests for duration-aware shard planning
+"""
+import json
+
+import allure
+
+from core.runner.shards import DurationHistory, load_shard_history, plan_shards
+
+NODE_IDS = [f"tests/test_x.py::test_{i}" for i in range(7)]
+
+
+@allure.feature("Parallel Execution")
+class TestShardPlanning:
+
+    @allure.title("Shards planned from a pinned snapshot agree even after the live history changed")
+    def test_pinned_snapshot(self, tmp_path):
+        live = tmp_path / "durations.json"
+        live.write_text(json.dumps({node_id: float(i) for i, node_id in enumerate(NODE_IDS)}))
+        snapshot = tmp_path / "snapshot.json"
+        snapshot.write_text(live.read_text())
+
+        first, digest = load_shard_history(str(snapshot))
+        plan = plan_shards(NODE_IDS, 3, first)
+        # Shard 1 finishes and rewrites the live history before shard 2 plans
+        finished = DurationHistory(str(live))
+        finished.record(NODE_IDS[0], 100.0)
+        finished.flush()
+        second, second_digest = load_shard_history(str(snapshot))
+
+        assert plan_shards(NODE_IDS, 3, second) == plan and second_digest == digest
+        assert plan_shards(NODE_IDS, 3, DurationHistory(str(live))) != plan
+        assert sorted(node_id for shard in plan for node_id in shard) == sorted(NODE_IDS)
+
+    @allure.title("Without a snapshot tests are split by node id alone")
+    def test_missing_snapshot(self, tmp_path):
+        history, digest = load_shard_history(str(tmp_path / "missing.json"))
+
+        assert digest is None
+        assert plan_shards(NODE_IDS, 2, history) == [sorted(NODE_IDS)[0::2], sorted(NODE_IDS)[1::2]]
+        assert plan_shards(NODE_IDS, 2, load_shard_history(None)[0]) == plan_shards(NODE_IDS, 2, history)
@@ -0,0 +1,72 @@
+"""
+Tests for the warm worker pool, with a stand-in worker process instead of pytest and a browser
+"""
+import os
+from types import SimpleNamespace
+
+import allure
+
+from core.runner.worker_pool import INTERNAL_ERROR, WorkerPool
+
+
+def fake_worker(conn, worker_id):
+    """Answers each job with its process id; the "die" job kills the process"""
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        test_path, _, _ = message
+        if test_path == "die":
+            os._exit(1)
+        conn.send(os.getpid())
+
+
+def job(test_path="tests/ok.py"):
+    return SimpleNamespace(id="job", test_path=test_path, results_dir="results", args=[])
+
+
+@allure.feature("Runner Jobs")
+class TestWorkerPool:
+
+    @allure.title("The pool spawns one warm process per slot and hands jobs to idle ones")
+    def test_spawn(self):
+        pool = WorkerPool(size=2, max_jobs=5, target=fake_worker)
+        try:
+            pids = {pool.run(job()) for _ in range(4)}
+        finally:
+            pool.close()
+
+        assert len(pids) == 2 and os.getpid() not in pids
+
+    @allure.title("A worker is replaced by a fresh process after max_jobs jobs")
+    def test_recycle(self):
+        pool = WorkerPool(size=1, max_jobs=2, target=fake_worker)
+        try:
+            pids = [pool.run(job()) for _ in range(5)]
+        finally:
+            pool.close()
+
+        assert pids[0] == pids[1] and pids[2] == pids[3]
+        assert len(set(pids)) == 3
+
+    @allure.title("By default every job runs in a process of its own")
+    def test_one_job_per_worker_by_default(self):
+        pool = WorkerPool(size=1, target=fake_worker)
+        try:
+            pids = [pool.run(job()) for _ in range(3)]
+        finally:
+            pool.close()
+
+        assert len(set(pids)) == 3
+
+    @allure.title("A worker that dies during a job fails that job and is replaced")
+    def test_dead_worker_replaced(self):
+        pool = WorkerPool(size=1, max_jobs=5, target=fake_worker)
+        try:
+            before = pool.run(job())
+            assert pool.run(job("die")) == INTERNAL_ERROR
+            after = pool.run(job())
+        finally:
+            pool.close()
+
+        assert isinstance(after, int) and after != before
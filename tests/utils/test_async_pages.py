@@ -0,0 +1,97 @@
+"""
+Tests for the async page layer against an in-memory fake page
+"""
+import asyncio
+
+from contextlib import contextmanager
+
+import allure
+
+from config.env import NAVIGATION_MODE
+from core.utils.async_step import async_step
+from pages.aio.contact_form_page import AsyncContactFormPage
+from pages.contacts.contact_form_page import ContactFormPage
+
+
+class FakeLocator:
+
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    async def wait_for(self, state, timeout):
+        self.page.calls.append(("wait_for", self.selector, state))
+
+    async def fill(self, value):
+        self.page.calls.append(("fill", self.selector, value))
+
+
+class FakeAsyncPage:
+    url = "about:blank"
+
+    def __init__(self):
+        self.calls = []
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    async def goto(self, url, wait_until):
+        self.calls.append(("goto", url, wait_until))
+
+    async def wait_for_selector(self, selector, state, timeout):
+        self.calls.append(("wait_for_selector", selector, state))
+
+
+@allure.feature("Async Pages")
+class TestAsyncPages:
+
+    @allure.title("Async and sync page objects share one selector definition")
+    def test_shared_selectors(self):
+        assert AsyncContactFormPage._first_name_input == ContactFormPage._first_name_input
+        assert AsyncContactFormPage.ready is ContactFormPage.ready
+
+    @allure.title("Navigation waits for the page's readiness strategy")
+    async def test_navigate_waits_until_ready(self):
+        page = FakeAsyncPage()
+        form = AsyncContactFormPage(page)
+
+        await form.navigate_to_edit_contact("https://app.example.com", "42")
+        await form.fill_first_name("Ada")
+
+        goto = ("goto", "https://app.example.com/contacts/edit?id=42", "domcontentloaded")
+        if NAVIGATION_MODE != "networkidle":
+            assert page.calls[0] == goto
+            assert set(page.calls[1:3]) == {
+                ("wait_for", ContactFormPage._first_name_input, "visible"),
+                ("wait_for_selector", ContactFormPage._loading_spinner, "hidden"),
+            }
+        assert page.calls[-1] == ("fill", ContactFormPage._first_name_input, "Ada")
+
+    @allure.title("async_step keeps the Allure step open across the await and formats its title")
+    async def test_async_step(self, monkeypatch):
+        events = []
+
+        @contextmanager
+        def step(title):
+            events.append(("start", title))
+            yield
+            events.append(("stop", title))
+
+        monkeypatch.setattr(allure, "step", step)
+
+        @async_step("Edit contact: {first_name} {last_name}")
+        async def edit(first_name, last_name="Lovelace"):
+            await asyncio.sleep(0)
+            events.append(("body", first_name))
+            return first_name
+
+        assert await edit("Ada") == "Ada"
+        assert events == [
+            ("start", "Edit contact: Ada Lovelace"),
+            ("body", "Ada"),
+            ("stop", "Edit contact: Ada Lovelace"),
+        ]
@@ -0,0 +1,54 @@
+"""
+Tests for the selector specs first_match hands to the browser
+"""
+import re
+
+import allure
+import pytest
+
+from pages.base_page import _selector_spec
+
+
+def matches(spec: dict, text: str) -> bool:
+    """Mirror of the browser-side test for a text spec (JS and Python agree on these patterns)"""
+    flags = re.I if "i" in spec["flags"] else 0
+    return re.search(spec["pattern"], text, flags) is not None
+
+
+@allure.feature("Page Objects")
+class TestSelectorSpec:
+
+    @allure.title("CSS selectors pass through unchanged")
+    def test_css(self):
+        assert _selector_spec(".text-red-500") == {"selector": ".text-red-500", "css": ".text-red-500"}
+        assert _selector_spec('input[name="pin"], #email-error')["css"] == 'input[name="pin"], #email-error'
+
+    @allure.title("Bare text= matches a substring, case-insensitively, with regex characters escaped")
+    def test_bare_text(self):
+        spec = _selector_spec("text=Title is required (1.0)")
+
+        assert spec["flags"] == "i"
+        assert matches(spec, "Error: title IS REQUIRED (1.0)!")
+        assert not matches(spec, "Title is required (100)")
+
+    @allure.title("Quoted text= matches the whole trimmed text, case-sensitively")
+    def test_quoted_text(self):
+        for selector in ('text="Save"', "text='Save'"):
+            spec = _selector_spec(selector)
+            assert spec["flags"] == ""
+            assert matches(spec, "  Save \n")
+            assert not matches(spec, "Save draft") and not matches(spec, "save")
+
+    @allure.title("text=/regex/flags keeps the pattern and its flags")
+    def test_regex_text(self):
+        spec = _selector_spec("text=/invalid|not found/i")
+
+        assert spec == {"selector": "text=/invalid|not found/i", "pattern": "invalid|not found", "flags": "i"}
+        assert matches(spec, "User NOT FOUND")
+        assert _selector_spec("text=/^Done$/")["flags"] == ""
+
+    @allure.title("Playwright-only selector syntax is rejected instead of never matching")
+    def test_playwright_only_syntax(self):
+        for selector in ('button:has-text("Save")', "div >> text=Save", "li:visible", ':text("Save")'):
+            with pytest.raises(ValueError, match="Playwright-only"):
+                _selector_spec(selector)
@@ -0,0 +1,122 @@
+"""
+Tests for batched GCS report cleanup, run against an in-memory fake bucket
+"""
+from contextlib import contextmanager
+from datetime import datetime
+
+import allure
+import pytest
+
+from core.utils.gcs_cleanup import ReportCleaner, select_expired
+
+
+class FakeIterator:
+    """Mimics google.api_core page iterators: prefixes fill in as pages are read"""
+
+    def __init__(self, names, prefix, delimiter):
+        self._items = []
+        self.prefixes = set()
+        for name in sorted(names):
+            if not name.startswith(prefix):
+                continue
+            rest = name[len(prefix):]
+            if delimiter and delimiter in rest:
+                self.prefixes.add(prefix + rest.split(delimiter)[0] + delimiter)
+            else:
+                self._items.append(FakeBlob(None, name))
+
+    @property
+    def pages(self):
+        yield self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    def delete(self):
+        batch = self.bucket.client.current_batch
+        assert batch is not None, "delete() must run inside a batch"
+        batch.append(self.name)
+
+
+class FakeClient:
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.current_batch = None
+        self.batches = []
+
+    @contextmanager
+    def batch(self, raise_exception=True):
+        self.current_batch = []
+        yield
+        self.batches.append(self.current_batch)
+        for name in self.current_batch:
+            self.bucket.objects.discard(name)
+        self.current_batch = None
+
+
+class FakeBucket:
+    def __init__(self, names):
+        self.objects = set(names)
+        self.client = FakeClient(self)
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+    def list_blobs(self, prefix="", delimiter=None):
+        return FakeIterator(self.objects, prefix, delimiter)
+
+
+def make_bucket(folders, files_per_folder=3):
+    names = [f"allure-reports/{folder}/file{i}.json" for folder in folders for i in range(files_per_folder)]
+    return FakeBucket(names + ["videos/keep-me.webm"])
+
+
+@allure.feature("Report Cleanup")
+class TestReportCleanup:
+
+    @allure.title("Retention keeps the newest N report folders")
+    def test_keep_last(self):
+        folders = ["20250101_000000", "20250102_000000", "20250103_000000", "20250104_000000"]
+        bucket = make_bucket(folders)
+
+        result = ReportCleaner(bucket).apply_retention(keep_last=2, keep_days=0)
+
+        assert result["deleted_folders"] == ["allure-reports/20250101_000000", "allure-reports/20250102_000000"]
+        assert result["deleted_objects"] == 6
+        assert {n.split("/")[1] for n in bucket.objects if n.startswith("allure-reports/")} == {
+            "20250103_000000",
+            "20250104_000000",
+        }
+        assert "videos/keep-me.webm" in bucket.objects
+
+    @allure.title("Deletes are grouped into batch requests")
+    def test_deletes_are_batched(self):
+        bucket = make_bucket(["20250101_000000", "20250102_000000"], files_per_folder=150)
+
+        ReportCleaner(bucket, batch_size=100).delete_folders(["allure-reports/20250101_000000"])
+
+        assert [len(batch) for batch in bucket.client.batches] == [100, 50]
+        assert not any(n.startswith("allure-reports/20250101_000000/") for n in bucket.objects)
+
+    @allure.title("Protected folder survives retention")
+    def test_protected_folder_is_kept(self):
+        bucket = make_bucket(["20250101_000000", "20250102_000000"])
+
+        result = ReportCleaner(bucket).apply_retention(
+            keep_last=1, keep_days=0, protect=["allure-reports/20250101_000000"]
+        )
+
+        assert result["deleted_folders"] == []
+
+    @allure.title("Age rule expires old folders, never undated ones")
+    @pytest.mark.parametrize("keep_days, expected", [(0, []), (10, ["allure-reports/20250101_000000"])])
+    def test_keep_days(self, keep_days, expected):
+        folders = ["allure-reports/20250101_000000", "allure-reports/20250120_000000", "allure-reports/manual"]
+
+        assert select_expired(folders, keep_days=keep_days, now=datetime(2025, 1, 25)) == expected
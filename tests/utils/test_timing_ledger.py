@@ -0,0 +1,77 @@
+"""
+Tests for the timing ledger, writing to a temporary JSONL file
+"""
+import json
+
+import allure
+
+from core.utils.timing_ledger import TimingLedger, TimingPlugin, percentile
+
+
+@allure.feature("Timing Ledger")
+class TestTimingLedger:
+
+    @allure.title("Records are appended as one JSON line each, tagged with run and test")
+    def test_flush_appends_jsonl(self, tmp_path):
+        ledger = TimingLedger(path=str(tmp_path / "timings" / "ledger.jsonl"), run_id="run-1", enabled=True)
+        ledger.current_test = "tests/x.py::test_y"
+        ledger.record("navigation", "ContactsListPage", 412.345, url="https://example.com/contacts")
+
+        assert ledger.flush() == 1
+        assert ledger.flush() == 0
+
+        lines = (tmp_path / "timings" / "ledger.jsonl").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [{
+            "run": "run-1", "kind": "navigation", "name": "ContactsListPage",
+            "test": "tests/x.py::test_y", "ms": 412.3, "url": "https://example.com/contacts",
+        }]
+
+    @allure.title("Report ranks names by total time within the last run")
+    def test_report_last_run(self, tmp_path):
+        path = str(tmp_path / "ledger.jsonl")
+        old_run = TimingLedger(path=path, run_id="old", enabled=True)
+        old_run.record("step", "Fill title", 9000)
+        old_run.flush()
+
+        ledger = TimingLedger(path=path, run_id="new", enabled=True)
+        for ms in (100, 300, 200):
+            ledger.record("step", "Click save button", ms)
+        ledger.record("step", "Fill title", 50)
+        ledger.record("fixture", "page", 5000)
+        ledger.flush()
+
+        rows = ledger.report(kind="step")
+        assert [row["name"] for row in rows] == ["Click save button", "Fill title"]
+        assert rows[0] == {
+            "kind": "step", "name": "Click save button", "count": 3,
+            "total_ms": 600.0, "mean_ms": 200.0, "p95_ms": 300, "max_ms": 300,
+        }
+        assert ledger.report(kind="step", run=None)[0]["name"] == "Fill title"
+        assert ledger.report(kind=None)[0]["name"] == "page"
+
+    @allure.title("Allure step hooks record duration, nesting depth and failures")
+    def test_step_hooks(self, tmp_path):
+        ledger = TimingLedger(path=str(tmp_path / "ledger.jsonl"), run_id="run", enabled=True)
+        plugin = TimingPlugin(ledger)
+
+        plugin.start_step(uuid="outer", title="Complete login", params={})
+        plugin.start_step(uuid="inner", title="Fill email", params={})
+        plugin.stop_step(uuid="inner", exc_type=None, exc_val=None, exc_tb=None)
+        plugin.stop_step(uuid="outer", exc_type=AssertionError, exc_val=None, exc_tb=None)
+
+        inner, outer = ledger._pending
+        assert (inner["name"], inner["depth"], "failed" in inner) == ("Fill email", 1, False)
+        assert (outer["name"], outer["depth"], outer["failed"]) == ("Complete login", 0, True)
+
+    @allure.title("A disabled ledger records nothing")
+    def test_disabled(self, tmp_path):
+        ledger = TimingLedger(path=str(tmp_path / "ledger.jsonl"), enabled=False)
+        ledger.record("step", "Anything", 1)
+
+        assert ledger.flush() == 0
+        assert not (tmp_path / "ledger.jsonl").exists()
+
+    @allure.title("Percentiles use the nearest rank")
+    def test_percentile(self):
+        assert percentile([5, 1, 3, 2, 4], 50) == 3
+        assert percentile(list(range(1, 101)), 95) == 95
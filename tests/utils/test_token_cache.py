@@ -0,0 +1,64 @@
+"""
+Tests for the token cache and storage_state keys, writing to a temporary directory
+"""
+import base64
+import json
+import os
+import time
+
+import allure
+
+from core.playwright import token_cache
+from core.playwright.context import StorageStateManager, build_storage_state
+from core.playwright.token_cache import TokenCache
+
+
+def make_jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@allure.feature("Token Cache")
+class TestTokenCache:
+
+    @allure.title("Tokens minted by one backend are not reused against another")
+    def test_tokens_are_kept_per_backend(self, tmp_path, monkeypatch):
+        cache = TokenCache(path=str(tmp_path / "tokens.json"), enabled=True)
+        minted = []
+
+        def fetch():
+            minted.append(make_jwt(time.time() + 3600))
+            return minted[-1]
+
+        monkeypatch.setattr(token_cache, "BASE_API", "https://api.example.com")
+        real = cache.get_or_refresh("qa@example.com", "c1", fetch)
+        monkeypatch.setattr(token_cache, "BASE_API", "http://127.0.0.1:8090")
+        mock = cache.get_or_refresh("qa@example.com", "c1", fetch)
+        assert cache.get_or_refresh("qa@example.com", "c1", fetch) == mock
+
+        assert real != mock
+        assert len(minted) == 2
+
+    @allure.title("storage_state files are kept per backend")
+    def test_state_path_per_backend(self, tmp_path, monkeypatch):
+        manager = StorageStateManager(state_dir=str(tmp_path))
+
+        monkeypatch.setattr(token_cache, "BASE_API", "https://api.example.com")
+        real = manager.path_for("qa@example.com", "c1", "app.example.com")
+        monkeypatch.setattr(token_cache, "BASE_API", "http://127.0.0.1:8090")
+        mock = manager.path_for("qa@example.com", "c1", "app.example.com")
+
+        assert real != mock
+        assert real.name.endswith("_app.example.com.json")
+
+    @allure.title("A snapshot whose token has no exp stays fresh until the fallback TTL runs out")
+    def test_snapshot_without_exp(self, tmp_path):
+        manager = StorageStateManager(state_dir=str(tmp_path), refresh_margin=120, fallback_ttl=900)
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps(build_storage_state("opaque-token", "app.example.com")))
+
+        assert manager._is_fresh(path)
+
+        written = time.time() - 800
+        os.utime(path, (written, written))
+        assert not manager._is_fresh(path)
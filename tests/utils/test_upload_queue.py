@@ -0,0 +1,122 @@
+"""
+Tests for the background upload queue, with an in-memory fake uploader
+"""
+import json
+import threading
+
+import allure
+
+from core.utils import upload_queue
+from core.utils.gcs_uploader import GCSUploader
+from core.utils.upload_queue import UploadQueue
+
+
+class FakeUploader:
+    enabled = True
+
+    def __init__(self, fail=False, gate=None):
+        self.fail = fail
+        self.gate = gate
+        self.uploaded = []
+
+    video_blob_name = staticmethod(GCSUploader.video_blob_name)
+
+    def upload_file(self, local_path, blob_name):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.fail:
+            return None
+        self.uploaded.append(blob_name)
+        return f"https://storage.googleapis.com/bucket/test-artifacts/{blob_name}"
+
+
+class FakeAttach:
+
+    def __init__(self):
+        self.urls = []
+        self.files = []
+
+    def __call__(self, body, name=None, attachment_type=None):
+        self.urls.append(body)
+
+    def file(self, source, name=None, attachment_type=None):
+        self.files.append(source)
+
+
+@allure.feature("Upload Queue")
+class TestUploadQueue:
+
+    @allure.title("The GCS link of a finished upload is attached right away")
+    def test_attaches_url_after_upload(self, tmp_path, monkeypatch):
+        attach = FakeAttach()
+        monkeypatch.setattr(allure, "attach", attach)
+        monkeypatch.setattr(upload_queue, "DELETE_LOCAL_AFTER_GCS_UPLOAD", False)
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"webm")
+        queue = UploadQueue(uploader=FakeUploader(), workers=1, max_retries=1, backoff=0)
+        upload = queue.submit_video(str(video), "test_x")
+        upload.result()
+
+        url = queue.attach_video(upload, str(video), "test_x")
+
+        assert attach.urls == [url] and attach.files == []
+        assert url.endswith(".webm") and "videos/test_x-" in url
+        queue.drain()
+
+    @allure.title("A video whose upload failed is embedded from disk instead of linked")
+    def test_embeds_local_file_when_upload_fails(self, tmp_path, monkeypatch):
+        attach = FakeAttach()
+        monkeypatch.setattr(allure, "attach", attach)
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"webm")
+        queue = UploadQueue(uploader=FakeUploader(fail=True), workers=1, max_retries=2, backoff=0)
+        upload = queue.submit_video(str(video), "test_x")
+        upload.result()
+
+        assert queue.attach_video(upload, str(video), "test_x") is None
+
+        assert attach.urls == [] and attach.files == [str(video)]
+        assert queue.drain()["failed"] == [str(video)]
+
+    @allure.title("Each upload of a test's video gets its own blob")
+    def test_video_blob_names_are_unique(self):
+        assert GCSUploader.video_blob_name("test_x") != GCSUploader.video_blob_name("test_x")
+
+    @allure.title("Teardown does not wait for a running upload; its link lands in the test's result at drain")
+    def test_running_upload_attached_at_drain(self, tmp_path, monkeypatch):
+        attach = FakeAttach()
+        monkeypatch.setattr(allure, "attach", attach)
+        monkeypatch.setattr(upload_queue, "DELETE_LOCAL_AFTER_GCS_UPLOAD", False)
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"webm")
+        result_file = tmp_path / "1234-result.json"
+        result_file.write_text(json.dumps({"name": "test_x", "attachments": []}))
+        gate = threading.Event()
+        queue = UploadQueue(uploader=FakeUploader(gate=gate), workers=1, max_retries=1, backoff=0)
+        upload = queue.submit_video(str(video), "test_x")
+
+        assert queue.attach_video(upload, str(video), "test_x", result_file) is None
+        assert not upload.done() and attach.urls == [] and attach.files == []
+        gate.set()
+        queue.drain()
+
+        [attachment] = json.loads(result_file.read_text())["attachments"]
+        assert attachment["type"] == "text/uri-list"
+        assert (tmp_path / attachment["source"]).read_text() == upload.result()
+
+    @allure.title("A video whose running upload then failed is embedded into the test's result at drain")
+    def test_failed_pending_upload_embedded_at_drain(self, tmp_path):
+        video = tmp_path / "video.webm"
+        video.write_bytes(b"webm")
+        result_file = tmp_path / "1234-result.json"
+        result_file.write_text(json.dumps({"name": "test_x"}))
+        gate = threading.Event()
+        queue = UploadQueue(uploader=FakeUploader(fail=True, gate=gate), workers=1, max_retries=1, backoff=0)
+
+        queue.attach_video(queue.submit_video(str(video), "test_x"), str(video), "test_x", result_file)
+        gate.set()
+        queue.drain()
+
+        [attachment] = json.loads(result_file.read_text())["attachments"]
+        assert attachment["type"] == "video/webm"
+        assert (tmp_path / attachment["source"]).read_bytes() == b"webm"
@@ -0,0 +1,39 @@
+"""
+Tests for the VIDEO_MODE startup check, with a stand-in pytest config
+"""
+import allure
+import pytest
+
+from core.playwright.video import check_video_mode
+
+
+class FakePluginManager:
+
+    def __init__(self, *plugins):
+        self.plugins = set(plugins)
+
+    def hasplugin(self, name):
+        return name in self.plugins
+
+
+class FakeConfig:
+
+    def __init__(self, *plugins):
+        self.pluginmanager = FakePluginManager(*plugins)
+
+
+@allure.feature("Video Capture")
+class TestVideoMode:
+
+    @allure.title("on-first-retry is rejected when pytest-rerunfailures is not loaded")
+    def test_on_first_retry_needs_rerunfailures(self):
+        with pytest.raises(pytest.UsageError, match="pytest-rerunfailures"):
+            check_video_mode(FakeConfig(), "on-first-retry")
+        check_video_mode(FakeConfig("rerunfailures"), "on-first-retry")
+
+    @allure.title("Other modes need no plugin; unknown modes are rejected")
+    def test_other_modes(self):
+        for mode in ("off", "on", "retain-on-failure"):
+            check_video_mode(FakeConfig(), mode)
+        with pytest.raises(pytest.UsageError, match="Unknown VIDEO_MODE"):
+            check_video_mode(FakeConfig(), "sometimes")